@@ -0,0 +1,177 @@
+"""
+Benchmark FastMCP argument validation: per-call field mapping versus the precomputed plan.
+
+Validates the arguments of a tool with 30 parameters, three of them nested models,
+and extracts its keyword arguments. "per call" rebuilds the alias mapping, pre-parses
+a copy of the arguments and dumps the validated model on every call, as
+`FuncMetadata` did before it precomputed its validation plan; "plan" is
+`FuncMetadata.validate_arguments`. Arguments are given once as JSON values and once
+with the nested models sent as JSON strings, which must be pre-parsed.
+
+Usage:
+    uv run python benchmarks/bench_argument_validation.py [--duration 2]
+"""
+
+import argparse
+import json
+import time
+from collections.abc import Callable
+from typing import Any, Literal
+
+from pydantic import BaseModel
+from pydantic.fields import FieldInfo
+
+from mcp.server.fastmcp.utilities.func_metadata import FuncMetadata, func_metadata
+
+
+class Coordinates(BaseModel):
+    lat: float
+    lon: float
+
+
+class Address(BaseModel):
+    street: str
+    city: str
+    postcode: str
+    coordinates: Coordinates
+
+
+class Filter(BaseModel):
+    field: str
+    operator: Literal["eq", "lt", "gt"]
+    value: str | int | float
+
+
+class Paging(BaseModel):
+    page: int = 1
+    size: int = 20
+
+
+def search(  # noqa: PLR0913, PLR0917 - a tool with many parameters is what is being measured
+    query: str,
+    locale: str,
+    timezone: str,
+    currency: str,
+    user_id: str,
+    session_id: str,
+    sort: Literal["asc", "desc"],
+    sort_by: str,
+    category: str,
+    brand: str,
+    limit: int,
+    offset: int,
+    min_price: float,
+    max_price: float,
+    min_rating: float,
+    radius_km: float,
+    max_results: int,
+    include_out_of_stock: bool,
+    include_drafts: bool,
+    exact: bool,
+    highlight: bool,
+    tags: list[str],
+    ids: list[int],
+    weights: dict[str, float],
+    metadata: dict[str, str],
+    colours: list[str],
+    sizes: list[str],
+    address: Address,
+    filters: list[Filter],
+    paging: Paging,
+) -> str:
+    return query
+
+
+ARGUMENTS: dict[str, Any] = {
+    "query": "running shoes",
+    "locale": "en-GB",
+    "timezone": "Europe/London",
+    "currency": "GBP",
+    "user_id": "user-123",
+    "session_id": "session-456",
+    "sort": "desc",
+    "sort_by": "price",
+    "category": "footwear",
+    "brand": "acme",
+    "limit": 50,
+    "offset": 100,
+    "min_price": 10.0,
+    "max_price": 150.5,
+    "min_rating": 4.0,
+    "radius_km": 25.0,
+    "max_results": 500,
+    "include_out_of_stock": False,
+    "include_drafts": False,
+    "exact": True,
+    "highlight": True,
+    "tags": ["trail", "waterproof", "lightweight"],
+    "ids": list(range(20)),
+    "weights": {"price": 0.5, "rating": 0.3, "distance": 0.2},
+    "metadata": {"source": "web", "campaign": "spring"},
+    "colours": ["red", "black"],
+    "sizes": ["9", "10", "11"],
+    "address": {
+        "street": "1 High Street",
+        "city": "London",
+        "postcode": "N1 1AA",
+        "coordinates": {"lat": 51.5, "lon": -0.1},
+    },
+    "filters": [{"field": f"f{i}", "operator": "eq", "value": i} for i in range(5)],
+    "paging": {"page": 3, "size": 25},
+}
+
+STRINGIFIED_ARGUMENTS: dict[str, Any] = ARGUMENTS | {
+    key: json.dumps(ARGUMENTS[key]) for key in ("address", "filters", "paging")
+}
+
+
+def validate_per_call(meta: FuncMetadata, arguments: dict[str, Any]) -> dict[str, Any]:
+    key_to_field_info: dict[str, FieldInfo] = {}
+    for field_name, field_info in meta.arg_model.model_fields.items():
+        key_to_field_info[field_name] = field_info
+        if field_info.alias:
+            key_to_field_info[field_info.alias] = field_info
+    pre_parsed = arguments.copy()
+    for key, value in arguments.items():
+        field_info = key_to_field_info.get(key)
+        if field_info is not None and isinstance(value, str) and field_info.annotation is not str:
+            try:
+                parsed = json.loads(value)
+            except json.JSONDecodeError:
+                continue
+            if not isinstance(parsed, str | int | float):
+                pre_parsed[key] = parsed
+    validated = meta.arg_model.model_validate(pre_parsed)
+    return {
+        field_info.alias or field_name: getattr(validated, field_name)
+        for field_name, field_info in meta.arg_model.model_fields.items()
+    }
+
+
+def run(label: str, fn: Callable[[], object], duration: float) -> float:
+    iterations = 0
+    start = time.perf_counter()
+    deadline = start + duration
+    while time.perf_counter() < deadline:
+        for _ in range(100):
+            fn()
+        iterations += 100
+    rate = iterations / (time.perf_counter() - start)
+    print(f"{label:<32} {rate:>12,.0f} validations/sec")
+    return rate
+
+
+def main(duration: float) -> None:
+    meta = func_metadata(search)
+    for name, arguments in (("JSON values", ARGUMENTS), ("JSON strings", STRINGIFIED_ARGUMENTS)):
+        assert validate_per_call(meta, arguments) == meta.validate_arguments(arguments)
+        before = run(f"per call, {name}", lambda: validate_per_call(meta, arguments), duration)
+        after = run(f"plan, {name}", lambda: meta.validate_arguments(arguments), duration)
+        print(f"speedup: {after / before:.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--duration", type=float, default=2.0, help="Seconds to run each variant")
+    args = parser.parse_args()
+    main(args.duration)
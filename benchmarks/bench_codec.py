@@ -0,0 +1,126 @@
+"""
+Benchmark wire codecs on realistic MCP payloads.
+
+Compares the default `PydanticCodec` with `JSONLibraryCodec` backed by the stdlib
+`json` module and, if it is installed, orjson. Each payload is encoded and decoded
+the way transports do it: encoded to bytes, and decoded from bytes.
+
+Usage:
+    uv run python benchmarks/bench_codec.py
+    uv run --with orjson python benchmarks/bench_codec.py
+"""
+
+import argparse
+import base64
+import json
+import os
+import time
+from collections.abc import Callable
+
+from mcp.shared.codec import Codec, JSONLibraryCodec, PydanticCodec
+from mcp.types import (
+    BlobResourceContents,
+    CallToolResult,
+    JSONRPCMessage,
+    JSONRPCRequest,
+    JSONRPCResponse,
+    ListToolsResult,
+    ReadResourceResult,
+    TextContent,
+    Tool,
+)
+
+
+def response(result: CallToolResult | ListToolsResult | ReadResourceResult) -> JSONRPCMessage:
+    return JSONRPCMessage(
+        JSONRPCResponse(jsonrpc="2.0", id=1, result=result.model_dump(by_alias=True, mode="json", exclude_none=True))
+    )
+
+
+PAYLOADS = {
+    "tools/call request": JSONRPCMessage(
+        JSONRPCRequest(
+            jsonrpc="2.0",
+            id=1,
+            method="tools/call",
+            params={"name": "search", "arguments": {"query": "weather in paris", "limit": 10}, "_meta": {}},
+        )
+    ),
+    "CallToolResult (200 text blocks)": response(
+        CallToolResult(content=[TextContent(type="text", text=f"line {i} " * 20) for i in range(200)])
+    ),
+    "ListToolsResult (100 tools)": response(
+        ListToolsResult(
+            tools=[
+                Tool(
+                    name=f"tool_{i}",
+                    description="Looks something up. " * 5,
+                    inputSchema={
+                        "type": "object",
+                        "properties": {f"arg_{j}": {"type": "string", "description": "An argument"} for j in range(8)},
+                        "required": ["arg_0"],
+                    },
+                )
+                for i in range(100)
+            ]
+        )
+    ),
+    "ReadResourceResult (4 MiB base64 blob)": response(
+        ReadResourceResult(
+            contents=[
+                BlobResourceContents(
+                    uri="file:///data.bin",  # type: ignore[arg-type]
+                    mimeType="application/octet-stream",
+                    blob=base64.b64encode(os.urandom(4 * 1024 * 1024)).decode(),
+                )
+            ]
+        )
+    ),
+}
+
+
+def codecs() -> dict[str, Codec]:
+    result: dict[str, Codec] = {
+        "pydantic": PydanticCodec(),
+        "json": JSONLibraryCodec(json.loads, json.dumps),
+    }
+    try:
+        import orjson  # type: ignore[import-not-found]
+    except ImportError:
+        print("orjson is not installed; skipping it\n")
+    else:
+        result["orjson"] = JSONLibraryCodec(orjson.loads, orjson.dumps)  # type: ignore[reportUnknownMemberType]
+    return result
+
+
+def measure(fn: Callable[[], object], min_time: float) -> float:
+    fn()
+    iterations = 0
+    start = time.perf_counter()
+    while (elapsed := time.perf_counter() - start) < min_time:
+        fn()
+        iterations += 1
+    return elapsed / iterations
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--min-time", type=float, default=0.5, help="Seconds to spend on each measurement")
+    args = parser.parse_args()
+
+    available = codecs()
+    for name, message in PAYLOADS.items():
+        size = len(PydanticCodec().encode(message))
+        print(f"{name} ({size:,} bytes)")
+        print(f"  {'codec':<10} {'encode':>12} {'decode':>12}")
+        for codec_name, codec in available.items():
+            encoded = codec.encode(message)
+            assert codec.decode(encoded) == message
+            encode_time = measure(lambda: codec.encode(message), args.min_time)
+            decode_time = measure(lambda: codec.decode(encoded), args.min_time)
+            print(f"  {codec_name:<10} {encode_time * 1e6:>9.1f} us {decode_time * 1e6:>9.1f} us")
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Benchmark storing and replaying events in `MemoryEventStore` or `SQLiteEventStore`.
+
+Stores `--events` notifications spread over `--streams` streams of one session, each
+stream written by its own task, then resumes each stream `--resumes` times in total
+from the event `--tail` events before its end, as a client reconnecting shortly after
+a dropped connection does. Replay throughput is in resumes per second; each resume
+replays `--tail` events. `--store sqlite` uses a database in a temporary directory.
+
+Usage:
+    uv run python benchmarks/bench_event_store.py [--store memory|sqlite] [--events 100000] [--streams 10] \
+        [--tail 10] [--resumes 2000]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import anyio
+
+from mcp.server.event_store import MemoryEventStore, SQLiteEventStore
+from mcp.server.streamable_http import EventMessage, EventStore
+from mcp.types import JSONRPCMessage, JSONRPCNotification
+
+
+async def main(store_type: str, events: int, streams: int, tail: int, resumes: int) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        if store_type == "sqlite":
+            sqlite_store = SQLiteEventStore(os.path.join(directory, "events.db"), max_age=None, max_bytes=None)
+            try:
+                await bench(sqlite_store.for_session("bench"), events, streams, tail, resumes)
+            finally:
+                sqlite_store.close()
+        else:
+            memory_store = MemoryEventStore(max_bytes=1 << 40, max_bytes_per_session=1 << 40, ttl=None)
+            await bench(memory_store.for_session("bench"), events, streams, tail, resumes)
+
+
+async def bench(store: EventStore, events: int, streams: int, tail: int, resumes: int) -> None:
+    messages = [
+        JSONRPCMessage(
+            JSONRPCNotification(
+                jsonrpc="2.0",
+                method="notifications/progress",
+                params={"progressToken": i, "progress": i, "total": events},
+            )
+        )
+        for i in range(100)
+    ]
+
+    event_ids: dict[str, list[str]] = {str(stream): [] for stream in range(streams)}
+
+    async def write(stream_id: str) -> None:
+        for i in range(events // streams):
+            event_ids[stream_id].append(await store.store_event(stream_id, messages[i % len(messages)]))
+
+    start = time.perf_counter()
+    async with anyio.create_task_group() as tg:
+        for stream_id in event_ids:
+            tg.start_soon(write, stream_id)
+    elapsed = time.perf_counter() - start
+    print(f"store  {events / elapsed:>12,.0f} events/s")
+
+    replayed = 0
+
+    async def send(event: EventMessage) -> None:
+        nonlocal replayed
+        replayed += 1
+
+    resume_from = [ids[-tail - 1] for ids in event_ids.values() for _ in range(resumes // streams)]
+    start = time.perf_counter()
+    for event_id in resume_from:
+        await store.replay_events_after(event_id, send)
+    elapsed = time.perf_counter() - start
+    print(f"replay {len(resume_from) / elapsed:>12,.0f} resumes/s ({replayed / elapsed:,.0f} events/s)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--store", choices=["memory", "sqlite"], default="memory")
+    parser.add_argument("--events", type=int, default=100_000)
+    parser.add_argument("--streams", type=int, default=10)
+    parser.add_argument("--tail", type=int, default=10, help="Events replayed on each resume")
+    parser.add_argument("--resumes", type=int, default=2_000)
+    args = parser.parse_args()
+    anyio.run(main, args.store, args.events, args.streams, args.tail, args.resumes)
@@ -0,0 +1,123 @@
+"""
+Benchmark peak memory while answering a request with a large result over streamable HTTP.
+
+Reads a resource of `--size` MB from a `StreamableHTTPSessionManager` by calling its
+ASGI app directly, with a `send` that counts and discards the response body, so the
+client side holds no copy. Peak memory is traced with `tracemalloc` while the request
+is handled, and reported in multiples of the payload size. The handler builds the
+resource text, which accounts for one copy; encoding the result accounts for another.
+
+Usage:
+    uv run python benchmarks/bench_large_response.py [--size 50] [--json-response] [--stateful]
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+
+import anyio
+from pydantic import AnyUrl
+from starlette.types import Message
+
+from mcp.server.lowlevel import Server
+from mcp.server.lowlevel.helper_types import ReadResourceContents
+from mcp.server.streamable_http import MCP_SESSION_ID_HEADER
+from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
+from mcp.types import LATEST_PROTOCOL_VERSION
+
+
+def create_server(size: int) -> Server:
+    server = Server("bench")
+
+    @server.read_resource()
+    async def read_resource(uri: AnyUrl) -> list[ReadResourceContents]:
+        return [ReadResourceContents(content="x" * size, mime_type="text/plain")]
+
+    return server
+
+
+async def post(
+    manager: StreamableHTTPSessionManager, body: object, session_id: str | None
+) -> tuple[int, dict[str, str], int]:
+    """POST a JSON-RPC message, returning the status, the headers and the size of the body."""
+    headers = [
+        (b"content-type", b"application/json"),
+        (b"accept", b"application/json, text/event-stream"),
+        (b"mcp-protocol-version", LATEST_PROTOCOL_VERSION.encode()),
+    ]
+    if session_id:
+        headers.append((MCP_SESSION_ID_HEADER.encode(), session_id.encode()))
+    scope = {"type": "http", "method": "POST", "path": "/mcp", "headers": headers, "query_string": b""}
+    request_body = json.dumps(body).encode()
+    received = False
+    done = anyio.Event()
+    status = 0
+    response_headers: dict[str, str] = {}
+    size = 0
+
+    async def receive() -> Message:
+        nonlocal received
+        if not received:
+            received = True
+            return {"type": "http.request", "body": request_body, "more_body": False}
+        await done.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: Message) -> None:
+        nonlocal status, size
+        if message["type"] == "http.response.start":
+            status = message["status"]
+            response_headers.update((name.decode(), value.decode()) for name, value in message["headers"])
+        elif message["type"] == "http.response.body":
+            size += len(message.get("body", b""))
+            if not message.get("more_body", False):
+                done.set()
+
+    await manager.handle_request(scope, receive, send)
+    return status, response_headers, size
+
+
+async def main(size_mb: int, json_response: bool, stateful: bool) -> None:
+    size = size_mb * 1024 * 1024
+    manager = StreamableHTTPSessionManager(app=create_server(size), json_response=json_response, stateless=not stateful)
+    read = {"jsonrpc": "2.0", "id": 1, "method": "resources/read", "params": {"uri": "file:///large.txt"}}
+
+    async with manager.run():
+        session_id = None
+        if stateful:
+            initialize = {
+                "jsonrpc": "2.0",
+                "id": 0,
+                "method": "initialize",
+                "params": {
+                    "protocolVersion": LATEST_PROTOCOL_VERSION,
+                    "capabilities": {},
+                    "clientInfo": {"name": "bench", "version": "0"},
+                },
+            }
+            _, headers, _ = await post(manager, initialize, None)
+            session_id = headers[MCP_SESSION_ID_HEADER]
+            await post(manager, {"jsonrpc": "2.0", "method": "notifications/initialized"}, session_id)
+
+        tracemalloc.start()
+        baseline = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        status, _, body_size = await post(manager, read, session_id)
+        elapsed = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1] - baseline
+        tracemalloc.stop()
+
+    assert status == 200, status
+    assert body_size > size
+    mode = ("stateful " if stateful else "stateless ") + ("json" if json_response else "sse")
+    print(f"{mode:<15} peak {peak / 1024 / 1024:>8,.1f} MB ({peak / size:.2f}x payload) in {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=50, help="Size of the resource in MB")
+    parser.add_argument("--json-response", action="store_true", help="Answer with JSON instead of SSE")
+    parser.add_argument("--stateful", action="store_true", help="Read the resource in a session")
+    args = parser.parse_args()
+    anyio.run(main, args.size, args.json_response, args.stateful)
@@ -0,0 +1,78 @@
+"""
+Benchmark outbound message encoding for large results.
+
+Compares the previous path (dump the result, validate it into a JSON-RPC envelope,
+then `model_dump_json()` the envelope) with the current one (dump the result,
+construct the envelope without validation, then encode it once with
+`SessionMessage.encode()`).
+
+Usage:
+    uv run python benchmarks/bench_outbound_encoding.py
+"""
+
+import base64
+import os
+import time
+from collections.abc import Callable
+
+from mcp.shared.message import SessionMessage
+from mcp.types import (
+    BlobResourceContents,
+    CallToolResult,
+    JSONRPCMessage,
+    JSONRPCResponse,
+    ReadResourceResult,
+    TextContent,
+)
+
+RESULTS = {
+    "CallToolResult (2,000 text blocks)": CallToolResult(
+        content=[TextContent(type="text", text=f"line {i} " * 20) for i in range(2_000)]
+    ),
+    "ReadResourceResult (4 MiB blob)": ReadResourceResult(
+        contents=[
+            BlobResourceContents(
+                uri="file:///data.bin",  # type: ignore[arg-type]
+                mimeType="application/octet-stream",
+                blob=base64.b64encode(os.urandom(4 * 1024 * 1024)).decode(),
+            )
+        ]
+    ),
+}
+
+
+def before(result: CallToolResult | ReadResourceResult) -> bytes:
+    response = JSONRPCResponse(
+        jsonrpc="2.0", id=1, result=result.model_dump(by_alias=True, mode="json", exclude_none=True)
+    )
+    return JSONRPCMessage(response).model_dump_json(by_alias=True, exclude_none=True).encode()
+
+
+def after(result: CallToolResult | ReadResourceResult) -> bytes:
+    response = JSONRPCResponse.model_construct(
+        jsonrpc="2.0", id=1, result=result.model_dump(by_alias=True, mode="json", exclude_none=True)
+    )
+    return SessionMessage(JSONRPCMessage(response)).encode()
+
+
+def run(label: str, fn: Callable[[], bytes], iterations: int = 20) -> float:
+    fn()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    elapsed = (time.perf_counter() - start) / iterations
+    print(f"  {label:<8} {elapsed * 1000:>8.2f} ms/message")
+    return elapsed
+
+
+def main() -> None:
+    for name, result in RESULTS.items():
+        assert before(result) == after(result)
+        print(name)
+        old = run("before", lambda: before(result))
+        new = run("after", lambda: after(result))
+        print(f"  speedup: {old / new:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
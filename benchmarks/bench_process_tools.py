@@ -0,0 +1,65 @@
+"""
+Benchmark a CPU-bound FastMCP tool run on worker threads and in worker processes.
+
+Calls a tool that computes in pure Python `--calls` times at once through a
+`ToolManager`, first with `executor="thread"`, then with `executor="process"` and
+1, 2, 4, ... up to `--processes` worker processes. Threads are capped at one core by
+the GIL, so process throughput should grow with the number of processes up to the
+number of cores. Worker processes are started before timing.
+
+Usage:
+    uv run python benchmarks/bench_process_tools.py [--calls 32] [--work 2000000] [--processes <cpus>]
+"""
+
+import argparse
+import os
+import time
+
+import anyio
+
+from mcp.server.fastmcp.tools import ToolExecutor, ToolManager
+from mcp.server.fastmcp.utilities.process_pool import WorkerProcessPool
+from mcp.server.fastmcp.utilities.thread_pool import WorkerThreadPool
+
+
+def checksum(n: int) -> int:
+    total = 0
+    for i in range(n):
+        total = (total + i * i) % 1_000_003
+    return total
+
+
+async def bench(manager: ToolManager, executor: ToolExecutor, calls: int, work: int) -> float:
+    manager.add_tool(checksum, name=executor, executor=executor)
+    start = time.perf_counter()
+    async with anyio.create_task_group() as tg:
+        for _ in range(calls):
+            tg.start_soon(manager.call_tool, executor, {"n": work})
+    return calls / (time.perf_counter() - start)
+
+
+async def main(calls: int, work: int, max_processes: int) -> None:
+    threads = await bench(ToolManager(thread_pool=WorkerThreadPool()), "thread", calls, work)
+    print(f"threads        {threads:>8,.2f} calls/s")
+
+    processes = 1
+    while processes <= max_processes:
+        pool = WorkerProcessPool(processes)
+        try:
+            # Start every worker before timing
+            warm_up = ToolManager(process_pool=pool)
+            await bench(warm_up, "process", processes, 1)
+            rate = await bench(ToolManager(process_pool=pool), "process", calls, work)
+        finally:
+            pool.close()
+        print(f"{processes:>2} processes   {rate:>8,.2f} calls/s ({rate / threads:.2f}x threads)")
+        processes *= 2
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=32, help="Calls made at once")
+    parser.add_argument("--work", type=int, default=2_000_000, help="Loop iterations per call")
+    parser.add_argument("--processes", type=int, default=os.cpu_count() or 1, help="Most worker processes to try")
+    args = parser.parse_args()
+    anyio.run(main, args.calls, args.work, args.processes)
@@ -0,0 +1,68 @@
+"""
+Benchmark request/response throughput over an in-memory client/server session.
+
+Issues requests from many concurrent tasks through a single `ClientSession`, which
+exercises per-request bookkeeping in `BaseSession.send_request` (request ids,
+response slots, timeouts). With `--metrics`, the server records request metrics, to
+measure their overhead.
+
+Usage:
+    uv run python benchmarks/bench_request_throughput.py [--concurrency 100] [--requests 20000] [--metrics]
+"""
+
+import argparse
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import anyio
+
+from mcp.server.lowlevel import Server
+from mcp.server.metrics import MetricsRegistry
+from mcp.shared.memory import create_connected_server_and_client_session
+from mcp.types import TextContent, Tool
+
+
+def create_server(metrics: bool) -> Server:
+    server = Server("bench", metrics=MetricsRegistry() if metrics else None)
+
+    @server.list_tools()
+    async def list_tools() -> list[Tool]:
+        return [Tool(name="echo", inputSchema={"type": "object", "properties": {"value": {"type": "integer"}}})]
+
+    @server.call_tool()
+    async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
+        return [TextContent(type="text", text=str(arguments["value"]))]
+
+    return server
+
+
+async def bench(label: str, concurrency: int, requests: int, call: Callable[[int], Awaitable[object]]) -> None:
+    per_task = requests // concurrency
+
+    async def worker() -> None:
+        for i in range(per_task):
+            await call(i)
+
+    start = time.perf_counter()
+    async with anyio.create_task_group() as tg:
+        for _ in range(concurrency):
+            tg.start_soon(worker)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<12} {per_task * concurrency / elapsed:>10,.0f} req/s")
+
+
+async def main(concurrency: int, requests: int, metrics: bool) -> None:
+    async with create_connected_server_and_client_session(create_server(metrics)) as client:
+        await client.list_tools()
+        await bench("ping", concurrency, requests, lambda i: client.send_ping())
+        await bench("tools/call", concurrency, requests, lambda i: client.call_tool("echo", {"value": i}))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--requests", type=int, default=20_000)
+    parser.add_argument("--metrics", action="store_true", help="Record request metrics on the server")
+    args = parser.parse_args()
+    anyio.run(main, args.concurrency, args.requests, args.metrics)
@@ -0,0 +1,65 @@
+"""
+Benchmark tool schema validation: `jsonschema.validate()` versus cached validators.
+
+Usage:
+    uv run python benchmarks/bench_schema_validation.py
+"""
+
+import time
+from collections.abc import Callable
+from typing import Any
+
+import jsonschema
+
+from mcp.shared.schema_validation import SchemaValidatorCache, validate_instance
+
+INPUT_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "query": {"type": "string", "minLength": 1},
+        "limit": {"type": "integer", "minimum": 1, "maximum": 1000},
+        "filters": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {"field": {"type": "string"}, "value": {"type": ["string", "number", "boolean"]}},
+                "required": ["field", "value"],
+            },
+        },
+        "sort": {"type": "string", "enum": ["asc", "desc"]},
+    },
+    "required": ["query"],
+    "additionalProperties": False,
+}
+
+ARGUMENTS: dict[str, Any] = {
+    "query": "weather in paris",
+    "limit": 50,
+    "filters": [{"field": f"f{i}", "value": i} for i in range(10)],
+    "sort": "desc",
+}
+
+
+def run(label: str, fn: Callable[[], None], duration: float = 2.0) -> float:
+    iterations = 0
+    start = time.perf_counter()
+    deadline = start + duration
+    while time.perf_counter() < deadline:
+        for _ in range(100):
+            fn()
+        iterations += 100
+    rate = iterations / (time.perf_counter() - start)
+    print(f"{label:<32} {rate:>12,.0f} validations/sec")
+    return rate
+
+
+def main() -> None:
+    cache = SchemaValidatorCache()
+
+    before = run("jsonschema.validate", lambda: jsonschema.validate(instance=ARGUMENTS, schema=INPUT_SCHEMA))
+    after = run("SchemaValidatorCache", lambda: validate_instance(cache.get("search", INPUT_SCHEMA), ARGUMENTS))
+    print(f"speedup: {after / before:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
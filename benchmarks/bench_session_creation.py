@@ -0,0 +1,77 @@
+"""
+Benchmark how many new streamable HTTP sessions per second the session manager accepts.
+
+Simulates a reconnect storm: many concurrent clients each POST an initialize request
+without a session ID to a stateful `StreamableHTTPSessionManager`, through httpx's
+in-process ASGI transport. A session counts once its initialize response has been
+received. `--init-delay` adds a per-session lifespan that sleeps, standing in for
+per-session setup such as opening a connection or loading per-user state.
+
+Usage:
+    uv run python benchmarks/bench_session_creation.py [--concurrency 100] [--sessions 2000] [--init-delay 0.005]
+"""
+
+import argparse
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+import anyio
+import httpx
+
+from mcp.server.lowlevel import Server
+from mcp.server.streamable_http import MCP_SESSION_ID_HEADER
+from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
+from mcp.types import LATEST_PROTOCOL_VERSION
+
+HEADERS = {"Accept": "application/json, text/event-stream"}
+INITIALIZE = {
+    "jsonrpc": "2.0",
+    "id": 0,
+    "method": "initialize",
+    "params": {
+        "protocolVersion": LATEST_PROTOCOL_VERSION,
+        "capabilities": {},
+        "clientInfo": {"name": "bench", "version": "0"},
+    },
+}
+
+
+async def main(concurrency: int, sessions: int, init_delay: float) -> None:
+    @asynccontextmanager
+    async def session_setup(server: Server) -> AsyncIterator[dict[str, Any]]:
+        await anyio.sleep(init_delay)
+        yield {}
+
+    server = Server("bench", lifespan=session_setup, lifespan_per_session=True)
+    manager = StreamableHTTPSessionManager(app=server, json_response=True)
+    per_task = sessions // concurrency
+
+    async with (
+        manager.run(),
+        httpx.AsyncClient(transport=httpx.ASGITransport(app=manager.handle_request), base_url="http://bench") as client,
+    ):
+
+        async def worker() -> None:
+            for _ in range(per_task):
+                response = await client.post("/mcp", json=INITIALIZE, headers=HEADERS)
+                assert response.status_code == 200, response.text
+                assert MCP_SESSION_ID_HEADER in response.headers
+
+        start = time.perf_counter()
+        async with anyio.create_task_group() as tg:
+            for _ in range(concurrency):
+                tg.start_soon(worker)
+        elapsed = time.perf_counter() - start
+
+    print(f"new sessions {per_task * concurrency / elapsed:>10,.0f} sessions/s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--sessions", type=int, default=2_000)
+    parser.add_argument("--init-delay", type=float, default=0.0, help="Seconds of setup for each session")
+    args = parser.parse_args()
+    anyio.run(main, args.concurrency, args.sessions, args.init_delay)
@@ -0,0 +1,81 @@
+"""
+Benchmark stateless streamable HTTP request throughput.
+
+Sends tools/call requests from many concurrent tasks to a `StreamableHTTPSessionManager`
+running with `stateless=True`, through httpx's in-process ASGI transport, so no sockets
+or HTTP server are involved. Each request is answered with an SSE response, or with a
+JSON response when `--json-response` is given.
+
+Usage:
+    uv run python benchmarks/bench_stateless_http.py [--concurrency 50] [--requests 5000] [--json-response]
+"""
+
+import argparse
+import time
+from typing import Any
+
+import anyio
+import httpx
+
+from mcp.server.lowlevel import Server
+from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
+from mcp.types import TextContent, Tool
+
+HEADERS = {"Accept": "application/json, text/event-stream"}
+
+
+def create_server() -> Server:
+    server = Server("bench")
+
+    @server.list_tools()
+    async def list_tools() -> list[Tool]:
+        return [Tool(name="echo", inputSchema={"type": "object", "properties": {"value": {"type": "integer"}}})]
+
+    @server.call_tool()
+    async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
+        return [TextContent(type="text", text=str(arguments["value"]))]
+
+    return server
+
+
+async def main(concurrency: int, requests: int, json_response: bool) -> None:
+    manager = StreamableHTTPSessionManager(app=create_server(), stateless=True, json_response=json_response)
+    per_task = requests // concurrency
+
+    async with (
+        manager.run(),
+        httpx.AsyncClient(transport=httpx.ASGITransport(app=manager.handle_request), base_url="http://bench") as client,
+    ):
+
+        async def call(i: int) -> None:
+            body = {
+                "jsonrpc": "2.0",
+                "id": i,
+                "method": "tools/call",
+                "params": {"name": "echo", "arguments": {"value": i}},
+            }
+            response = await client.post("/mcp", json=body, headers=HEADERS)
+            assert response.status_code == 200, response.text
+
+        async def worker() -> None:
+            for i in range(per_task):
+                await call(i)
+
+        await call(0)
+        start = time.perf_counter()
+        async with anyio.create_task_group() as tg:
+            for _ in range(concurrency):
+                tg.start_soon(worker)
+        elapsed = time.perf_counter() - start
+
+    mode = "json" if json_response else "sse"
+    print(f"stateless tools/call ({mode}) {per_task * concurrency / elapsed:>10,.0f} req/s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=5_000)
+    parser.add_argument("--json-response", action="store_true", help="Answer with JSON instead of SSE")
+    args = parser.parse_args()
+    anyio.run(main, args.concurrency, args.requests, args.json_response)
@@ -1,16 +1,18 @@
 import logging
+from collections.abc import Sequence
 from datetime import timedelta
 from typing import Any, Protocol, overload
 
 import anyio.lowlevel
 from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
-from jsonschema import SchemaError, ValidationError, validate
+from jsonschema import SchemaError, ValidationError
 from pydantic import AnyUrl, TypeAdapter
 from typing_extensions import deprecated
 
 import mcp.types as types
 from mcp.shared.context import RequestContext
-from mcp.shared.message import SessionMessage
+from mcp.shared.message import SessionMessage, SessionMessageBatch
+from mcp.shared.schema_validation import SchemaValidatorCache, validate_instance
 from mcp.shared.session import BaseSession, ProgressFnT, RequestResponder
 from mcp.shared.version import SUPPORTED_PROTOCOL_VERSIONS
 
@@ -110,7 +112,7 @@ class ClientSession(
 ):
     def __init__(
         self,
-        read_stream: MemoryObjectReceiveStream[SessionMessage | Exception],
+        read_stream: MemoryObjectReceiveStream[SessionMessage | SessionMessageBatch | Exception],
         write_stream: MemoryObjectSendStream[SessionMessage],
         read_timeout_seconds: timedelta | None = None,
         sampling_callback: SamplingFnT | None = None,
@@ -119,6 +121,7 @@ class ClientSession(
         logging_callback: LoggingFnT | None = None,
         message_handler: MessageHandlerFnT | None = None,
         client_info: types.Implementation | None = None,
+        supports_batches: bool = False,
     ) -> None:
         super().__init__(
             read_stream,
@@ -126,6 +129,7 @@ class ClientSession(
             types.ServerRequest,
             types.ServerNotification,
             read_timeout_seconds=read_timeout_seconds,
+            supports_batches=supports_batches,
         )
         self._client_info = client_info or DEFAULT_CLIENT_INFO
         self._sampling_callback = sampling_callback or _default_sampling_callback
@@ -134,6 +138,7 @@ class ClientSession(
         self._logging_callback = logging_callback or _default_logging_callback
         self._message_handler = message_handler or _default_message_handler
         self._tool_output_schemas: dict[str, dict[str, Any] | None] = {}
+        self._tool_output_validators = SchemaValidatorCache()
 
     async def initialize(self) -> types.InitializeResult:
         sampling = types.SamplingCapability() if self._sampling_callback is not _default_sampling_callback else None
@@ -353,6 +358,33 @@ class ClientSession(
 
         return result
 
+    async def call_tools_batch(
+        self,
+        calls: Sequence[tuple[str, dict[str, Any] | None]],
+        read_timeout_seconds: timedelta | None = None,
+    ) -> list[types.CallToolResult | types.ErrorData]:
+        """Send several tools/call requests as a single JSON-RPC batch.
+
+        Takes (name, arguments) pairs and returns, in the same order, each tool's result,
+        or the error the server responded with for that call.
+        """
+        results = await self.send_batch(
+            [
+                types.ClientRequest(
+                    types.CallToolRequest(params=types.CallToolRequestParams(name=name, arguments=arguments))
+                )
+                for name, arguments in calls
+            ],
+            types.CallToolResult,
+            request_read_timeout_seconds=read_timeout_seconds,
+        )
+
+        for (name, _), result in zip(calls, results):
+            if isinstance(result, types.CallToolResult) and not result.isError:
+                await self._validate_tool_result(name, result)
+
+        return results
+
     async def _validate_tool_result(self, name: str, result: types.CallToolResult) -> None:
         """Validate the structured content of a tool result against its output schema."""
         if name not in self._tool_output_schemas:
@@ -369,7 +401,7 @@ class ClientSession(
             if result.structuredContent is None:
                 raise RuntimeError(f"Tool {name} has an output schema but did not return structured content")
             try:
-                validate(result.structuredContent, output_schema)
+                validate_instance(self._tool_output_validators.get(name, output_schema), result.structuredContent)
             except ValidationError as e:
                 raise RuntimeError(f"Invalid structured content returned by tool {name}: {e}")
             except SchemaError as e:
@@ -488,6 +520,7 @@ class ClientSession(
         # Note: don't clear the cache, as we may be using a cursor
         for tool in result.tools:
             self._tool_output_schemas[tool.name] = tool.outputSchema
+            self._tool_output_validators.invalidate(tool.name)
 
         return result
 
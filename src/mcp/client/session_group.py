@@ -259,7 +259,7 @@ class ClientSessionGroup:
                 )
                 read, write, _ = await session_stack.enter_async_context(client)
 
-            session = await session_stack.enter_async_context(mcp.ClientSession(read, write))
+            session = await session_stack.enter_async_context(mcp.ClientSession(read, write, supports_batches=True))
             result = await session.initialize()
 
             # Session successfully initialized.
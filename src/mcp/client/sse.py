@@ -10,9 +10,9 @@ from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStre
 from httpx_sse import aconnect_sse
 from httpx_sse._exceptions import SSEError
 
-import mcp.types as types
 from mcp.shared._httpx_utils import McpHttpClientFactory, create_mcp_http_client
-from mcp.shared.message import SessionMessage
+from mcp.shared.codec import DEFAULT_CODEC, Codec
+from mcp.shared.message import SessionMessage, SessionMessageBatch
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +29,7 @@ async def sse_client(
     sse_read_timeout: float = 60 * 5,
     httpx_client_factory: McpHttpClientFactory = create_mcp_http_client,
     auth: httpx.Auth | None = None,
+    codec: Codec = DEFAULT_CODEC,
 ):
     """
     Client transport for SSE.
@@ -42,12 +43,13 @@ async def sse_client(
         timeout: HTTP timeout for regular operations.
         sse_read_timeout: Timeout for SSE read operations.
         auth: Optional HTTPX authentication handler.
+        codec: Codec used to encode and decode messages.
     """
     read_stream: MemoryObjectReceiveStream[SessionMessage | Exception]
     read_stream_writer: MemoryObjectSendStream[SessionMessage | Exception]
 
-    write_stream: MemoryObjectSendStream[SessionMessage]
-    write_stream_reader: MemoryObjectReceiveStream[SessionMessage]
+    write_stream: MemoryObjectSendStream[SessionMessage | SessionMessageBatch]
+    write_stream_reader: MemoryObjectReceiveStream[SessionMessage | SessionMessageBatch]
 
     read_stream_writer, read_stream = anyio.create_memory_object_stream(0)
     write_stream, write_stream_reader = anyio.create_memory_object_stream(0)
@@ -93,17 +95,15 @@ async def sse_client(
 
                                     case "message":
                                         try:
-                                            message = types.JSONRPCMessage.model_validate_json(  # noqa: E501
-                                                sse.data
-                                            )
-                                            logger.debug(f"Received server message: {message}")
+                                            decoded = codec.decode(sse.data)
+                                            logger.debug(f"Received server message: {decoded}")
                                         except Exception as exc:
                                             logger.exception("Error parsing server message")
                                             await read_stream_writer.send(exc)
                                             continue
 
-                                        session_message = SessionMessage(message)
-                                        await read_stream_writer.send(session_message)
+                                        for message in decoded if isinstance(decoded, list) else [decoded]:
+                                            await read_stream_writer.send(SessionMessage(message))
                                     case _:
                                         logger.warning(f"Unknown SSE event: {sse.event}")
                         except SSEError as sse_exc:
@@ -122,11 +122,8 @@ async def sse_client(
                                     logger.debug(f"Sending client message: {session_message}")
                                     response = await client.post(
                                         endpoint_url,
-                                        json=session_message.message.model_dump(
-                                            by_alias=True,
-                                            mode="json",
-                                            exclude_none=True,
-                                        ),
+                                        content=session_message.encode(codec),
+                                        headers={"Content-Type": "application/json"},
                                     )
                                     response.raise_for_status()
                                     logger.debug(f"Client message sent successfully: {response.status_code}")
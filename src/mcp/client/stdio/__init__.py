@@ -1,3 +1,4 @@
+import codecs
 import logging
 import os
 import sys
@@ -12,7 +13,6 @@ from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStre
 from anyio.streams.text import TextReceiveStream
 from pydantic import BaseModel, Field
 
-import mcp.types as types
 from mcp.os.posix.utilities import terminate_posix_process_tree
 from mcp.os.win32.utilities import (
     FallbackProcess,
@@ -20,7 +20,8 @@ from mcp.os.win32.utilities import (
     get_windows_executable_command,
     terminate_windows_process_tree,
 )
-from mcp.shared.message import SessionMessage
+from mcp.shared.codec import DEFAULT_CODEC, Codec
+from mcp.shared.message import SessionMessage, SessionMessageBatch
 
 logger = logging.getLogger(__name__)
 
@@ -103,16 +104,17 @@ class StdioServerParameters(BaseModel):
 
 
 @asynccontextmanager
-async def stdio_client(server: StdioServerParameters, errlog: TextIO = sys.stderr):
+async def stdio_client(server: StdioServerParameters, errlog: TextIO = sys.stderr, codec: Codec = DEFAULT_CODEC):
     """
     Client transport for stdio: this will connect to a server by spawning a
-    process and communicating with it over stdin/stdout.
+    process and communicating with it over stdin/stdout. Messages are encoded and
+    decoded with `codec`.
     """
     read_stream: MemoryObjectReceiveStream[SessionMessage | Exception]
     read_stream_writer: MemoryObjectSendStream[SessionMessage | Exception]
 
-    write_stream: MemoryObjectSendStream[SessionMessage]
-    write_stream_reader: MemoryObjectReceiveStream[SessionMessage]
+    write_stream: MemoryObjectSendStream[SessionMessage | SessionMessageBatch]
+    write_stream_reader: MemoryObjectReceiveStream[SessionMessage | SessionMessageBatch]
 
     read_stream_writer, read_stream = anyio.create_memory_object_stream(0)
     write_stream, write_stream_reader = anyio.create_memory_object_stream(0)
@@ -152,30 +154,33 @@ async def stdio_client(server: StdioServerParameters, errlog: TextIO = sys.stder
 
                     for line in lines:
                         try:
-                            message = types.JSONRPCMessage.model_validate_json(line)
+                            decoded = codec.decode(line)
                         except Exception as exc:
                             logger.exception("Failed to parse JSONRPC message from server")
                             await read_stream_writer.send(exc)
                             continue
 
-                        session_message = SessionMessage(message)
-                        await read_stream_writer.send(session_message)
+                        for message in decoded if isinstance(decoded, list) else [decoded]:
+                            await read_stream_writer.send(SessionMessage(message))
         except anyio.ClosedResourceError:
             await anyio.lowlevel.checkpoint()
 
+    # Encoded messages are UTF-8 already, so they only need transcoding for other encodings
+    is_utf8 = codecs.lookup(server.encoding).name == "utf-8"
+
     async def stdin_writer():
         assert process.stdin, "Opened process is missing stdin"
 
         try:
             async with write_stream_reader:
                 async for session_message in write_stream_reader:
-                    json = session_message.message.model_dump_json(by_alias=True, exclude_none=True)
-                    await process.stdin.send(
-                        (json + "\n").encode(
+                    data = session_message.encode(codec) + b"\n"
+                    if not is_utf8:
+                        data = data.decode().encode(
                             encoding=server.encoding,
                             errors=server.encoding_error_handler,
                         )
-                    )
+                    await process.stdin.send(data)
         except anyio.ClosedResourceError:
             await anyio.lowlevel.checkpoint()
 
@@ -19,7 +19,8 @@ from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStre
 from httpx_sse import EventSource, ServerSentEvent, aconnect_sse
 
 from mcp.shared._httpx_utils import McpHttpClientFactory, create_mcp_http_client
-from mcp.shared.message import ClientMessageMetadata, SessionMessage
+from mcp.shared.codec import DEFAULT_CODEC, Codec
+from mcp.shared.message import ClientMessageMetadata, SessionMessage, SessionMessageBatch
 from mcp.types import (
     ErrorData,
     InitializeResult,
@@ -36,7 +37,7 @@ logger = logging.getLogger(__name__)
 
 SessionMessageOrError = SessionMessage | Exception
 StreamWriter = MemoryObjectSendStream[SessionMessageOrError]
-StreamReader = MemoryObjectReceiveStream[SessionMessage]
+StreamReader = MemoryObjectReceiveStream[SessionMessage | SessionMessageBatch]
 GetSessionIdCallback = Callable[[], str | None]
 
 MCP_SESSION_ID = "mcp-session-id"
@@ -81,6 +82,7 @@ class StreamableHTTPTransport:
         timeout: float | timedelta = 30,
         sse_read_timeout: float | timedelta = 60 * 5,
         auth: httpx.Auth | None = None,
+        codec: Codec = DEFAULT_CODEC,
     ) -> None:
         """Initialize the StreamableHTTP transport.
 
@@ -90,6 +92,7 @@ class StreamableHTTPTransport:
             timeout: HTTP timeout for regular operations.
             sse_read_timeout: Timeout for SSE read operations.
             auth: Optional HTTPX authentication handler.
+            codec: Codec used to encode and decode messages.
         """
         self.url = url
         self.headers = headers or {}
@@ -98,6 +101,7 @@ class StreamableHTTPTransport:
             sse_read_timeout.total_seconds() if isinstance(sse_read_timeout, timedelta) else sse_read_timeout
         )
         self.auth = auth
+        self.codec = codec
         self.session_id = None
         self.protocol_version = None
         self.request_headers = {
@@ -106,6 +110,13 @@ class StreamableHTTPTransport:
             **self.headers,
         }
 
+    def _decode_message(self, data: str | bytes) -> JSONRPCMessage:
+        """Decode a single message, where the server may not send a batch."""
+        decoded = self.codec.decode(data)
+        if isinstance(decoded, list):
+            raise ValueError("Expected a single JSON-RPC message, got a batch")
+        return decoded
+
     def _prepare_request_headers(self, base_headers: dict[str, str]) -> dict[str, str]:
         """Update headers with session ID and protocol version if available."""
         headers = base_headers.copy()
@@ -159,7 +170,7 @@ class StreamableHTTPTransport:
         """Handle an SSE event, returning True if the response is complete."""
         if sse.event == "message":
             try:
-                message = JSONRPCMessage.model_validate_json(sse.data)
+                message = self._decode_message(sse.data)
                 logger.debug(f"SSE message: {message}")
 
                 # Extract protocol version from initialization response
@@ -260,7 +271,7 @@ class StreamableHTTPTransport:
         async with ctx.client.stream(
             "POST",
             self.url,
-            json=message.model_dump(by_alias=True, mode="json", exclude_none=True),
+            content=ctx.session_message.encode(self.codec),
             headers=headers,
         ) as response:
             if response.status_code == 202:
@@ -293,6 +304,55 @@ class StreamableHTTPTransport:
                         ctx.read_stream_writer,
                     )
 
+    async def _handle_batch_post_request(
+        self,
+        client: httpx.AsyncClient,
+        batch: SessionMessageBatch,
+        read_stream_writer: StreamWriter,
+    ) -> None:
+        """Handle a POST request carrying a JSON-RPC batch."""
+        headers = self._prepare_request_headers(self.request_headers)
+        request_ids = [
+            session_message.message.root.id
+            for session_message in batch.messages
+            if isinstance(session_message.message.root, JSONRPCRequest)
+        ]
+
+        try:
+            async with client.stream("POST", self.url, content=batch.encode(self.codec), headers=headers) as response:
+                if response.status_code == 202:
+                    logger.debug("Received 202 Accepted")
+                    return
+
+                if response.status_code == 404:
+                    for request_id in request_ids:
+                        await self._send_session_terminated_error(read_stream_writer, request_id)
+                    return
+
+                response.raise_for_status()
+                if not request_ids:
+                    return
+
+                content_type = response.headers.get(CONTENT_TYPE, "").lower()
+                if content_type.startswith(JSON):
+                    decoded = self.codec.decode(await response.aread())
+                    for message in decoded if isinstance(decoded, list) else [decoded]:
+                        await read_stream_writer.send(SessionMessage(message))
+                elif content_type.startswith(SSE):
+                    # The stream is complete once every request in the batch has been answered
+                    remaining = len(request_ids)
+                    async for sse in EventSource(response).aiter_sse():
+                        if await self._handle_sse_event(sse, read_stream_writer):
+                            remaining -= 1
+                            if remaining == 0:
+                                await response.aclose()
+                                break
+                else:
+                    await self._handle_unexpected_content_type(content_type, read_stream_writer)
+        except Exception as exc:
+            logger.exception("Error sending JSON-RPC batch")
+            await read_stream_writer.send(exc)
+
     async def _handle_json_response(
         self,
         response: httpx.Response,
@@ -302,7 +362,7 @@ class StreamableHTTPTransport:
         """Handle JSON response from the server."""
         try:
             content = await response.aread()
-            message = JSONRPCMessage.model_validate_json(content)
+            message = self._decode_message(content)
 
             # Extract protocol version from initialization response
             if is_initialization:
@@ -368,7 +428,7 @@ class StreamableHTTPTransport:
         client: httpx.AsyncClient,
         write_stream_reader: StreamReader,
         read_stream_writer: StreamWriter,
-        write_stream: MemoryObjectSendStream[SessionMessage],
+        write_stream: MemoryObjectSendStream[SessionMessage | SessionMessageBatch],
         start_get_stream: Callable[[], None],
         tg: TaskGroup,
     ) -> None:
@@ -376,6 +436,10 @@ class StreamableHTTPTransport:
         try:
             async with write_stream_reader:
                 async for session_message in write_stream_reader:
+                    if isinstance(session_message, SessionMessageBatch):
+                        tg.start_soon(self._handle_batch_post_request, client, session_message, read_stream_writer)
+                        continue
+
                     message = session_message.message
                     metadata = (
                         session_message.metadata
@@ -450,6 +514,7 @@ async def streamablehttp_client(
     terminate_on_close: bool = True,
     httpx_client_factory: McpHttpClientFactory = create_mcp_http_client,
     auth: httpx.Auth | None = None,
+    codec: Codec = DEFAULT_CODEC,
 ) -> AsyncGenerator[
     tuple[
         MemoryObjectReceiveStream[SessionMessage | Exception],
@@ -463,6 +528,7 @@ async def streamablehttp_client(
 
     `sse_read_timeout` determines how long (in seconds) the client will wait for a new
     event before disconnecting. All other HTTP operations are controlled by `timeout`.
+    Messages are encoded and decoded with `codec`.
 
     Yields:
         Tuple containing:
@@ -470,10 +536,10 @@ async def streamablehttp_client(
             - write_stream: Stream for sending messages to the server
             - get_session_id_callback: Function to retrieve the current session ID
     """
-    transport = StreamableHTTPTransport(url, headers, timeout, sse_read_timeout, auth)
+    transport = StreamableHTTPTransport(url, headers, timeout, sse_read_timeout, auth, codec)
 
     read_stream_writer, read_stream = anyio.create_memory_object_stream[SessionMessage | Exception](0)
-    write_stream, write_stream_reader = anyio.create_memory_object_stream[SessionMessage](0)
+    write_stream, write_stream_reader = anyio.create_memory_object_stream[SessionMessage | SessionMessageBatch](0)
 
     async with anyio.create_task_group() as tg:
         try:
@@ -1,4 +1,3 @@
-import json
 import logging
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
@@ -9,8 +8,8 @@ from pydantic import ValidationError
 from websockets.asyncio.client import connect as ws_connect
 from websockets.typing import Subprotocol
 
-import mcp.types as types
-from mcp.shared.message import SessionMessage
+from mcp.shared.codec import DEFAULT_CODEC, Codec
+from mcp.shared.message import SessionMessage, SessionMessageBatch
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +17,7 @@ logger = logging.getLogger(__name__)
 @asynccontextmanager
 async def websocket_client(
     url: str,
+    codec: Codec = DEFAULT_CODEC,
 ) -> AsyncGenerator[
     tuple[MemoryObjectReceiveStream[SessionMessage | Exception], MemoryObjectSendStream[SessionMessage]],
     None,
@@ -32,6 +32,8 @@ async def websocket_client(
       JSONRPCMessage objects or Exception objects (when validation fails).
     - write_stream: Write JSONRPCMessage objects to this stream to send them
       over the WebSocket to the server.
+
+    Messages are encoded and decoded with `codec`.
     """
 
     # Create two in-memory streams:
@@ -39,8 +41,8 @@ async def websocket_client(
     # - One for outgoing messages (write_stream, read by ws_writer)
     read_stream: MemoryObjectReceiveStream[SessionMessage | Exception]
     read_stream_writer: MemoryObjectSendStream[SessionMessage | Exception]
-    write_stream: MemoryObjectSendStream[SessionMessage]
-    write_stream_reader: MemoryObjectReceiveStream[SessionMessage]
+    write_stream: MemoryObjectSendStream[SessionMessage | SessionMessageBatch]
+    write_stream_reader: MemoryObjectReceiveStream[SessionMessage | SessionMessageBatch]
 
     read_stream_writer, read_stream = anyio.create_memory_object_stream(0)
     write_stream, write_stream_reader = anyio.create_memory_object_stream(0)
@@ -56,12 +58,14 @@ async def websocket_client(
             async with read_stream_writer:
                 async for raw_text in ws:
                     try:
-                        message = types.JSONRPCMessage.model_validate_json(raw_text)
-                        session_message = SessionMessage(message)
-                        await read_stream_writer.send(session_message)
+                        decoded = codec.decode(raw_text)
                     except ValidationError as exc:
                         # If JSON parse or model validation fails, send the exception
                         await read_stream_writer.send(exc)
+                        continue
+
+                    for message in decoded if isinstance(decoded, list) else [decoded]:
+                        await read_stream_writer.send(SessionMessage(message))
 
         async def ws_writer():
             """
@@ -70,9 +74,7 @@ async def websocket_client(
             """
             async with write_stream_reader:
                 async for session_message in write_stream_reader:
-                    # Convert to a dict, then to JSON
-                    msg_dict = session_message.message.model_dump(by_alias=True, mode="json", exclude_none=True)
-                    await ws.send(json.dumps(msg_dict))
+                    await ws.send(session_message.encode(codec), text=True)
 
         async with anyio.create_task_group() as tg:
             # Start reader and writer tasks
@@ -1,4 +1,5 @@
 import contextvars
+import hashlib
 
 from starlette.types import ASGIApp, Receive, Scope, Send
 
@@ -21,6 +22,23 @@ def get_access_token() -> AccessToken | None:
     return auth_user.access_token if auth_user else None
 
 
+def get_principal_id() -> str | None:
+    """
+    Identify who the current request is authenticated as.
+
+    Results computed for one request may be shared only with requests with the same
+    principal ID. The ID is the client ID and a hash of the access token, so that it
+    can be kept without keeping the token.
+
+    Returns:
+        The principal ID if an authenticated user is available, None otherwise.
+    """
+    access_token = get_access_token()
+    if access_token is None:
+        return None
+    return f"{access_token.client_id}:{hashlib.sha256(access_token.token.encode()).hexdigest()}"
+
+
 class AuthContextMiddleware:
     """
     Middleware that extracts the authenticated user from the request
@@ -0,0 +1,545 @@
+"""
+Event stores for resumable streamable HTTP sessions.
+
+`MemoryEventStore` keeps the events of every stream in memory as encoded JSON,
+numbered by a per-stream sequence. An event ID names its stream and sequence number,
+so resuming after an event is a dictionary lookup and an offset into the stream,
+however many events the store holds. Memory is bounded in three ways: a byte budget
+for the whole store, a byte budget for each session, and a time to live. When a
+budget is exceeded, the oldest events (of the store, or of the session) are dropped
+first.
+
+`SQLiteEventStore` appends events to an SQLite database instead, so they survive a
+restart and can be shared by several processes on one host.
+
+Both stores keep the events of each session apart, and drop them at once when the
+session manager terminates the session:
+
+```
+    event_store = MemoryEventStore(max_bytes=256 * 1024 * 1024, ttl=600)
+    session_manager = StreamableHTTPSessionManager(app, event_store=event_store)
+```
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import os
+import sqlite3
+import time
+from abc import abstractmethod
+from collections import deque
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from itertools import islice
+
+import anyio
+import anyio.to_thread
+
+from mcp.server.streamable_http import EventCallback, EventId, EventMessage, EventStore, StreamId
+from mcp.shared.codec import DEFAULT_CODEC, Codec
+from mcp.types import JSONRPCMessage
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+"""Default budget in bytes of encoded events for the whole store."""
+
+DEFAULT_MAX_BYTES_PER_SESSION = 4 * 1024 * 1024
+"""Default budget in bytes of encoded events for each session."""
+
+DEFAULT_TTL = 300.0
+"""Default time in seconds events are kept for."""
+
+
+@dataclass(frozen=True)
+class EventStoreStats:
+    """Counts describing the contents of a `MemoryEventStore`."""
+
+    events: int
+    """Events currently stored."""
+    bytes: int
+    """Size of the currently stored events, encoded."""
+    streams: int
+    """Streams with at least one stored event."""
+    sessions: int
+    """Sessions with at least one stored event."""
+    evicted: int
+    """Events dropped to stay within a byte budget."""
+    expired: int
+    """Events dropped because they outlived the time to live."""
+
+
+class _Stream:
+    """The events of one stream of one session, numbered from `first_seq`."""
+
+    __slots__ = ("key", "session_id", "stream_id", "first_seq", "events")
+
+    def __init__(self, key: int, session_id: str | None, stream_id: StreamId) -> None:
+        self.key = key
+        self.session_id = session_id
+        self.stream_id = stream_id
+        self.first_seq = 0
+        self.events: deque[bytes] = deque()
+
+    @property
+    def next_seq(self) -> int:
+        return self.first_seq + len(self.events)
+
+
+_Entry = tuple[float, _Stream, int]
+"""When an event was stored, its stream, and its sequence number."""
+
+
+class _PerSessionEventStore(EventStore):
+    """An event store keeping the events of each session apart, using `_SessionEventStore` views."""
+
+    async def store_event(self, stream_id: StreamId, message: JSONRPCMessage) -> EventId:
+        return await self._store(None, stream_id, message)
+
+    async def replay_events_after(self, last_event_id: EventId, send_callback: EventCallback) -> StreamId | None:
+        return await self._replay(None, last_event_id, send_callback)
+
+    async def store_events(self, events: Sequence[tuple[StreamId, JSONRPCMessage]]) -> list[EventId]:
+        return await self._store_events(None, events)
+
+    def for_session(self, session_id: str) -> EventStore:
+        return _SessionEventStore(self, session_id)
+
+    @abstractmethod
+    async def _store(self, session_id: str | None, stream_id: StreamId, message: JSONRPCMessage) -> EventId:
+        """Store an event of a session, or of no session if None."""
+        ...
+
+    async def _store_events(
+        self, session_id: str | None, events: Sequence[tuple[StreamId, JSONRPCMessage]]
+    ) -> list[EventId]:
+        """Store several events of a session, in order."""
+        return [await self._store(session_id, stream_id, message) for stream_id, message in events]
+
+    @abstractmethod
+    async def _replay(
+        self, session_id: str | None, last_event_id: EventId, send_callback: EventCallback
+    ) -> StreamId | None:
+        """Replay the events after an event of a session, or of no session if None."""
+        ...
+
+
+class MemoryEventStore(_PerSessionEventStore):
+    """
+    An event store keeping encoded events in memory, within byte budgets and a TTL.
+
+    Pass it as the `event_store` of `StreamableHTTPSessionManager` or `FastMCP`. The
+    session manager binds it to each session with `for_session()`, so events are
+    budgeted per session, are only replayed to the session that produced them, and
+    are dropped when the session is terminated.
+
+    Args:
+        max_bytes: Budget in bytes of encoded events for the whole store.
+        max_bytes_per_session: Budget in bytes of encoded events for each session.
+        ttl: Seconds an event is kept for, or None to keep events until a budget or
+            the end of their session drops them.
+        codec: Codec used to encode stored events.
+        clock: Monotonic clock the TTL is measured with.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_bytes_per_session: int = DEFAULT_MAX_BYTES_PER_SESSION,
+        ttl: float | None = DEFAULT_TTL,
+        codec: Codec = DEFAULT_CODEC,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_bytes <= 0:
+            raise ValueError(f"max_bytes must be positive, got {max_bytes}")
+        if max_bytes_per_session <= 0:
+            raise ValueError(f"max_bytes_per_session must be positive, got {max_bytes_per_session}")
+        if ttl is not None and ttl <= 0:
+            raise ValueError(f"ttl must be positive, got {ttl}")
+        self.max_bytes = max_bytes
+        self.max_bytes_per_session = max_bytes_per_session
+        self.ttl = ttl
+        self._codec = codec
+        self._clock = clock
+        self._next_key = 0
+        self._streams: dict[int, _Stream] = {}
+        self._stream_keys: dict[tuple[str | None, StreamId], _Stream] = {}
+        self._session_streams: dict[str | None, dict[int, _Stream]] = {}
+        # Events in the order they were stored, for the whole store and for each
+        # session. Entries of events already dropped through the other order are
+        # skipped when they reach the front.
+        self._order: deque[_Entry] = deque()
+        self._session_order: dict[str | None, deque[_Entry]] = {}
+        self._session_bytes: dict[str | None, int] = {}
+        self._events = 0
+        self._bytes = 0
+        self._evicted = 0
+        self._expired = 0
+
+    async def remove_session(self, session_id: str) -> None:
+        self._remove_session(session_id)
+
+    def stats(self) -> EventStoreStats:
+        """Return the current contents of the store."""
+        return EventStoreStats(
+            events=self._events,
+            bytes=self._bytes,
+            streams=len(self._streams),
+            sessions=len(self._session_streams),
+            evicted=self._evicted,
+            expired=self._expired,
+        )
+
+    async def _store(self, session_id: str | None, stream_id: StreamId, message: JSONRPCMessage) -> EventId:
+        now = self._clock()
+        self._expire(now)
+        stream = self._stream_keys.get((session_id, stream_id))
+        if stream is None:
+            stream = _Stream(self._next_key, session_id, stream_id)
+            self._next_key += 1
+            self._streams[stream.key] = stream
+            self._stream_keys[(session_id, stream_id)] = stream
+            self._session_streams.setdefault(session_id, {})[stream.key] = stream
+
+        data = self._codec.encode(message)
+        seq = stream.next_seq
+        stream.events.append(data)
+        entry = (now, stream, seq)
+        self._order.append(entry)
+        session_order = self._session_order.get(session_id)
+        if session_order is None:
+            session_order = self._session_order[session_id] = deque()
+        session_order.append(entry)
+        self._events += 1
+        self._bytes += len(data)
+        self._session_bytes[session_id] = self._session_bytes.get(session_id, 0) + len(data)
+
+        while self._session_bytes.get(session_id, 0) > self.max_bytes_per_session:
+            self._evicted += self._drop(session_order.popleft())
+        while self._bytes > self.max_bytes:
+            self._evicted += self._drop(self._order.popleft())
+        self._compact()
+        return f"{stream.key}-{seq}"
+
+    async def _replay(
+        self, session_id: str | None, last_event_id: EventId, send_callback: EventCallback
+    ) -> StreamId | None:
+        self._expire(self._clock())
+        key, _, seq = last_event_id.partition("-")
+        try:
+            stream = self._streams.get(int(key))
+            last_seq = int(seq)
+        except ValueError:
+            stream = None
+            last_seq = -1
+        if stream is None or stream.session_id != session_id or not 0 <= last_seq < stream.next_seq:
+            logger.warning(f"Event ID {last_event_id} not found in store")
+            return None
+
+        first_seq = last_seq + 1
+        if first_seq < stream.first_seq:
+            logger.warning(f"Events after {last_event_id} were dropped from the store, replaying the rest")
+            first_seq = stream.first_seq
+        # Copy the events to send first, as more may be stored while the callback runs
+        count = stream.next_seq - first_seq
+        events = list(islice(reversed(stream.events), count))
+        events.reverse()
+        for seq, data in enumerate(events, start=first_seq):
+            await send_callback(EventMessage.from_encoded(data, f"{stream.key}-{seq}", self._codec))
+        return stream.stream_id
+
+    def _remove_session(self, session_id: str | None) -> None:
+        for stream in self._session_streams.pop(session_id, {}).values():
+            del self._streams[stream.key]
+            del self._stream_keys[(session_id, stream.stream_id)]
+            # Leaves the entries of its events in the store order stale
+            self._events -= len(stream.events)
+            stream.first_seq = stream.next_seq
+            stream.events.clear()
+        self._session_order.pop(session_id, None)
+        self._bytes -= self._session_bytes.pop(session_id, 0)
+        self._compact()
+
+    def _expire(self, now: float) -> None:
+        if self.ttl is None:
+            return
+        deadline = now - self.ttl
+        while self._order and self._order[0][0] <= deadline:
+            self._expired += self._drop(self._order.popleft())
+
+    def _drop(self, entry: _Entry) -> int:
+        """Drop the event of an entry, if still stored, returning how many events were dropped.
+
+        Both orders list the events of a stream in sequence, so an event still stored is
+        always the first of its stream, and of its session.
+        """
+        _, stream, seq = entry
+        if seq != stream.first_seq:
+            return 0
+        data = stream.events.popleft()
+        stream.first_seq += 1
+        self._events -= 1
+        self._bytes -= len(data)
+        self._session_bytes[stream.session_id] -= len(data)
+        # Only stale entries can be in front of the event in the session order
+        session_order = self._session_order[stream.session_id]
+        while session_order and _is_stale(session_order[0]):
+            session_order.popleft()
+        if not stream.events:
+            self._forget(stream)
+        return 1
+
+    def _forget(self, stream: _Stream) -> None:
+        """Forget a stream whose events were all dropped, and its session if it has no other."""
+        del self._streams[stream.key]
+        del self._stream_keys[(stream.session_id, stream.stream_id)]
+        session_streams = self._session_streams[stream.session_id]
+        del session_streams[stream.key]
+        if not session_streams:
+            del self._session_streams[stream.session_id]
+            del self._session_order[stream.session_id]
+            del self._session_bytes[stream.session_id]
+
+    def _compact(self) -> None:
+        """Remove stale entries from the store order once they make up most of it."""
+        if len(self._order) > 2 * self._events + 1024:
+            self._order = deque(entry for entry in self._order if not _is_stale(entry))
+
+
+def _is_stale(entry: _Entry) -> bool:
+    """Whether the event of an entry was already dropped."""
+    _, stream, seq = entry
+    return seq < stream.first_seq
+
+
+class _Batch:
+    """Events waiting to be written to a `SQLiteEventStore` in one transaction."""
+
+    __slots__ = ("rows", "ids")
+
+    def __init__(self) -> None:
+        self.rows: list[tuple[str, StreamId, float, int, bytes]] = []
+        self.ids: list[int] | None = None
+
+
+_SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    session_id TEXT NOT NULL,
+    stream_id TEXT NOT NULL,
+    created REAL NOT NULL,
+    size INTEGER NOT NULL,
+    data BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS events_by_stream ON events (session_id, stream_id, id);
+"""
+
+
+class SQLiteEventStore(_PerSessionEventStore):
+    """
+    An event store keeping encoded events in an SQLite database, so they survive restarts.
+
+    Events are appended to a table in write-ahead log mode. Events stored while a
+    write is in progress are written together in the next transaction (group
+    commit), so the cost of a commit is shared by every concurrent writer. Event IDs
+    are the row IDs of the events, which SQLite never reuses; replaying after an
+    event is an index lookup followed by a range scan of its stream, read through
+    memory-mapped I/O, and replayed events are sent as stored, without decoding them.
+
+    Several processes on one host, e.g. the workers of `run_workers()`, may share a
+    database file; each opens its own connections on first use, so the store can be
+    created before the workers are forked.
+
+    At most every `compact_interval` seconds, a write also drops events older than
+    `max_age` and, oldest first, the events exceeding `max_bytes`. Space freed this
+    way is reused by later events rather than returned to the file system.
+
+    Commits use `PRAGMA synchronous=NORMAL`: events survive a crash or restart of the
+    process, but the last commits may be lost if the host itself loses power.
+
+    Args:
+        path: Path of the database file, created if it does not exist.
+        max_age: Seconds an event is kept for, or None to keep events until the
+            byte budget or the end of their session drops them.
+        max_bytes: Budget in bytes of encoded events, or None for no budget.
+        compact_interval: Minimum seconds between two compactions.
+        mmap_size: Bytes of the database file memory-mapped for reading.
+        busy_timeout: Seconds to wait for another process holding the database lock.
+        codec: Codec used to encode stored events.
+        clock: Wall clock the age of events is measured with; it has to agree
+            between the processes and restarts sharing the database.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        max_age: float | None = 24 * 60 * 60,
+        max_bytes: int | None = 1024 * 1024 * 1024,
+        compact_interval: float = 60.0,
+        mmap_size: int = 256 * 1024 * 1024,
+        busy_timeout: float = 5.0,
+        codec: Codec = DEFAULT_CODEC,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if max_age is not None and max_age <= 0:
+            raise ValueError(f"max_age must be positive, got {max_age}")
+        if max_bytes is not None and max_bytes <= 0:
+            raise ValueError(f"max_bytes must be positive, got {max_bytes}")
+        self.path = os.fspath(path)
+        self.max_age = max_age
+        self.max_bytes = max_bytes
+        self.compact_interval = compact_interval
+        self._mmap_size = mmap_size
+        self._busy_timeout = busy_timeout
+        self._codec = codec
+        self._clock = clock
+        # One connection writes and one reads, each used by one thread at a time
+        self._writer: sqlite3.Connection | None = None
+        self._reader: sqlite3.Connection | None = None
+        self._write_lock = anyio.Lock()
+        self._read_lock = anyio.Lock()
+        self._pending = _Batch()
+        self._last_compaction = -math.inf
+
+    async def remove_session(self, session_id: str) -> None:
+        async with self._write_lock:
+            await anyio.to_thread.run_sync(self._delete_session, session_id)
+
+    def close(self) -> None:
+        """Close the connections to the database. They are reopened if the store is used again."""
+        for connection in (self._writer, self._reader):
+            if connection is not None:
+                connection.close()
+        self._writer = self._reader = None
+
+    async def _store(self, session_id: str | None, stream_id: StreamId, message: JSONRPCMessage) -> EventId:
+        return (await self._store_events(session_id, [(stream_id, message)]))[0]
+
+    async def _store_events(
+        self, session_id: str | None, events: Sequence[tuple[StreamId, JSONRPCMessage]]
+    ) -> list[EventId]:
+        batch = self._pending
+        start = len(batch.rows)
+        created = self._clock()
+        for stream_id, message in events:
+            data = self._codec.encode(message)
+            batch.rows.append((session_id or "", stream_id, created, len(data), data))
+        # Whoever acquires the lock first writes every event stored until then
+        async with self._write_lock:
+            if batch.ids is None:
+                self._pending = _Batch()
+                batch.ids = await anyio.to_thread.run_sync(self._write, batch.rows)
+        return [str(event_id) for event_id in batch.ids[start : start + len(events)]]
+
+    async def _replay(
+        self, session_id: str | None, last_event_id: EventId, send_callback: EventCallback
+    ) -> StreamId | None:
+        try:
+            last_id = int(last_event_id)
+        except ValueError:
+            last_id = None
+        async with self._read_lock:
+            found = None if last_id is None else await anyio.to_thread.run_sync(self._read, session_id or "", last_id)
+        if found is None:
+            logger.warning(f"Event ID {last_event_id} not found in store")
+            return None
+
+        stream_id, events = found
+        for event_id, data in events:
+            await send_callback(EventMessage.from_encoded(data, str(event_id), self._codec))
+        return stream_id
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path, timeout=self._busy_timeout, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute(f"PRAGMA mmap_size={int(self._mmap_size)}")
+        connection.executescript(_SQLITE_SCHEMA)
+        return connection
+
+    def _write(self, rows: list[tuple[str, StreamId, float, int, bytes]]) -> list[int]:
+        if self._writer is None:
+            self._writer = self._connect()
+        ids: list[int] = []
+        with self._writer:
+            for row in rows:
+                cursor = self._writer.execute(
+                    "INSERT INTO events (session_id, stream_id, created, size, data) VALUES (?, ?, ?, ?, ?)", row
+                )
+                assert cursor.lastrowid is not None
+                ids.append(cursor.lastrowid)
+
+        now = self._clock()
+        if now - self._last_compaction >= self.compact_interval:
+            self._last_compaction = now
+            self._compact(self._writer, now)
+        return ids
+
+    def _compact(self, connection: sqlite3.Connection, now: float) -> None:
+        with connection:
+            if self.max_age is not None:
+                connection.execute("DELETE FROM events WHERE created < ?", (now - self.max_age,))
+            if self.max_bytes is not None:
+                (total,) = connection.execute("SELECT COALESCE(SUM(size), 0) FROM events").fetchone()
+                excess = total - self.max_bytes
+                if excess > 0:
+                    cutoff = 0
+                    for event_id, size in connection.execute("SELECT id, size FROM events ORDER BY id"):
+                        excess -= size
+                        cutoff = event_id
+                        if excess <= 0:
+                            break
+                    connection.execute("DELETE FROM events WHERE id <= ?", (cutoff,))
+
+    def _delete_session(self, session_id: str) -> None:
+        if self._writer is None:
+            self._writer = self._connect()
+        with self._writer:
+            self._writer.execute("DELETE FROM events WHERE session_id = ?", (session_id,))
+
+    def _read(self, session_id: str, last_id: int) -> tuple[StreamId, list[tuple[int, bytes]]] | None:
+        if self._reader is None:
+            self._reader = self._connect()
+        # Both queries run in one read transaction, so they see the same events
+        with self._reader:
+            self._reader.execute("BEGIN")
+            row = self._reader.execute(
+                "SELECT stream_id FROM events WHERE id = ? AND session_id = ?", (last_id, session_id)
+            ).fetchone()
+            if row is None:
+                return None
+            (stream_id,) = row
+            events = self._reader.execute(
+                "SELECT id, data FROM events WHERE session_id = ? AND stream_id = ? AND id > ? ORDER BY id",
+                (session_id, stream_id, last_id),
+            ).fetchall()
+        return stream_id, events
+
+
+class _SessionEventStore(EventStore):
+    """An event store bound to the events of one session."""
+
+    def __init__(self, store: _PerSessionEventStore, session_id: str) -> None:
+        self._store = store
+        self._session_id = session_id
+
+    async def store_event(self, stream_id: StreamId, message: JSONRPCMessage) -> EventId:
+        return await self._store._store(self._session_id, stream_id, message)  # pyright: ignore[reportPrivateUsage]
+
+    async def replay_events_after(self, last_event_id: EventId, send_callback: EventCallback) -> StreamId | None:
+        return await self._store._replay(  # pyright: ignore[reportPrivateUsage]
+            self._session_id, last_event_id, send_callback
+        )
+
+    async def store_events(self, events: Sequence[tuple[StreamId, JSONRPCMessage]]) -> list[EventId]:
+        return await self._store._store_events(self._session_id, events)  # pyright: ignore[reportPrivateUsage]
+
+    def for_session(self, session_id: str) -> EventStore:
+        return self._store.for_session(session_id)
+
+    async def remove_session(self, session_id: str) -> None:
+        await self._store.remove_session(session_id)
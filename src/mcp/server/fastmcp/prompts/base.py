@@ -9,8 +9,13 @@ from typing import TYPE_CHECKING, Any, Literal
 import pydantic_core
 from pydantic import BaseModel, Field, TypeAdapter, validate_call
 
-from mcp.server.fastmcp.utilities.context_injection import find_context_parameter, inject_context
+from mcp.server.fastmcp.utilities.context_injection import (
+    check_context_parameter,
+    find_context_parameter,
+    inject_context,
+)
 from mcp.server.fastmcp.utilities.func_metadata import func_metadata
+from mcp.server.fastmcp.utilities.thread_pool import WorkerThreadPool
 from mcp.types import ContentBlock, Icon, TextContent
 
 if TYPE_CHECKING:
@@ -100,6 +105,7 @@ class Prompt(BaseModel):
         # Find context parameter if it exists
         if context_kwarg is None:
             context_kwarg = find_context_parameter(fn)
+        check_context_parameter(fn, context_kwarg, f"Prompt {func_name}")
 
         # Get schema from func_metadata, excluding context parameter
         func_arg_metadata = func_metadata(
@@ -138,8 +144,9 @@ class Prompt(BaseModel):
         self,
         arguments: dict[str, Any] | None = None,
         context: Context[ServerSessionT, LifespanContextT, RequestT] | None = None,
+        thread_pool: WorkerThreadPool | None = None,
     ) -> list[Message]:
-        """Render the prompt with arguments."""
+        """Render the prompt with arguments, on a thread of `thread_pool` if it is synchronous."""
         # Validate required arguments
         if self.arguments:
             required = {arg.name for arg in self.arguments if arg.required}
@@ -153,7 +160,10 @@ class Prompt(BaseModel):
             call_args = inject_context(self.fn, arguments or {}, context, self.context_kwarg)
 
             # Call function and check if result is a coroutine
-            result = self.fn(**call_args)
+            if thread_pool is not None and not inspect.iscoroutinefunction(self.fn):
+                result = await thread_pool.run_sync(self.fn, **call_args)
+            else:
+                result = self.fn(**call_args)
             if inspect.iscoroutine(result):
                 result = await result
 
@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING, Any
 
 from mcp.server.fastmcp.prompts.base import Message, Prompt
 from mcp.server.fastmcp.utilities.logging import get_logger
+from mcp.server.fastmcp.utilities.thread_pool import WorkerThreadPool
 
 if TYPE_CHECKING:
     from mcp.server.fastmcp.server import Context
@@ -18,9 +19,10 @@ logger = get_logger(__name__)
 class PromptManager:
     """Manages FastMCP prompts."""
 
-    def __init__(self, warn_on_duplicate_prompts: bool = True):
+    def __init__(self, warn_on_duplicate_prompts: bool = True, thread_pool: WorkerThreadPool | None = None):
         self._prompts: dict[str, Prompt] = {}
         self.warn_on_duplicate_prompts = warn_on_duplicate_prompts
+        self.thread_pool = thread_pool
 
     def get_prompt(self, name: str) -> Prompt | None:
         """Get prompt by name."""
@@ -57,4 +59,4 @@ class PromptManager:
         if not prompt:
             raise ValueError(f"Unknown prompt: {name}")
 
-        return await prompt.render(arguments, context=context)
+        return await prompt.render(arguments, context=context, thread_pool=self.thread_pool)
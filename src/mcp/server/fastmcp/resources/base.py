@@ -32,6 +32,7 @@ class Resource(BaseModel, abc.ABC):
     )
     icons: list[Icon] | None = Field(default=None, description="Optional list of icons for this resource")
     annotations: Annotations | None = Field(default=None, description="Optional annotations for the resource")
+    coalesce: bool = Field(default=True, description="Whether identical concurrent reads share one read")
 
     @field_validator("name", mode="before")
     @classmethod
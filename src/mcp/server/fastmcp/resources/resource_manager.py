@@ -10,6 +10,8 @@ from pydantic import AnyUrl
 from mcp.server.fastmcp.resources.base import Resource
 from mcp.server.fastmcp.resources.templates import ResourceTemplate
 from mcp.server.fastmcp.utilities.logging import get_logger
+from mcp.server.fastmcp.utilities.single_flight import SingleFlight
+from mcp.server.fastmcp.utilities.thread_pool import WorkerThreadPool
 from mcp.types import Annotations, Icon
 
 if TYPE_CHECKING:
@@ -23,10 +25,17 @@ logger = get_logger(__name__)
 class ResourceManager:
     """Manages FastMCP resources."""
 
-    def __init__(self, warn_on_duplicate_resources: bool = True):
+    def __init__(
+        self,
+        warn_on_duplicate_resources: bool = True,
+        thread_pool: WorkerThreadPool | None = None,
+        single_flight: SingleFlight[tuple[str, str | None]] | None = None,
+    ):
         self._resources: dict[str, Resource] = {}
         self._templates: dict[str, ResourceTemplate] = {}
         self.warn_on_duplicate_resources = warn_on_duplicate_resources
+        self.thread_pool = thread_pool
+        self.single_flight = single_flight
 
     def add_resource(self, resource: Resource) -> Resource:
         """Add a resource to the manager.
@@ -64,6 +73,7 @@ class ResourceManager:
         mime_type: str | None = None,
         icons: list[Icon] | None = None,
         annotations: Annotations | None = None,
+        coalesce: bool | None = None,
     ) -> ResourceTemplate:
         """Add a template from a function."""
         template = ResourceTemplate.from_function(
@@ -75,6 +85,7 @@ class ResourceManager:
             mime_type=mime_type,
             icons=icons,
             annotations=annotations,
+            coalesce=coalesce,
         )
         self._templates[template.uri_template] = template
         return template
@@ -96,12 +107,24 @@ class ResourceManager:
         for template in self._templates.values():
             if params := template.matches(uri_str):
                 try:
-                    return await template.create_resource(uri_str, params, context=context)
+                    return await template.create_resource(
+                        uri_str, params, context=context, thread_pool=self.thread_pool
+                    )
                 except Exception as e:
                     raise ValueError(f"Error creating resource from template: {e}")
 
         raise ValueError(f"Unknown resource: {uri}")
 
+    def coalesces(self, uri: AnyUrl | str) -> bool:
+        """Whether identical concurrent reads of a URI should share one read."""
+        uri_str = str(uri)
+        if resource := self._resources.get(uri_str):
+            return resource.coalesce
+        for template in self._templates.values():
+            if template.matches(uri_str) is not None:
+                return template.coalesce
+        return False
+
     def list_resources(self) -> list[Resource]:
         """List all registered resources."""
         logger.debug("Listing resources", extra={"count": len(self._resources)})
@@ -10,8 +10,13 @@ from typing import TYPE_CHECKING, Any
 from pydantic import BaseModel, Field, validate_call
 
 from mcp.server.fastmcp.resources.types import FunctionResource, Resource
-from mcp.server.fastmcp.utilities.context_injection import find_context_parameter, inject_context
+from mcp.server.fastmcp.utilities.context_injection import (
+    check_context_parameter,
+    find_context_parameter,
+    inject_context,
+)
 from mcp.server.fastmcp.utilities.func_metadata import func_metadata
+from mcp.server.fastmcp.utilities.thread_pool import WorkerThreadPool
 from mcp.types import Annotations, Icon
 
 if TYPE_CHECKING:
@@ -33,6 +38,7 @@ class ResourceTemplate(BaseModel):
     fn: Callable[..., Any] = Field(exclude=True)
     parameters: dict[str, Any] = Field(description="JSON schema for function parameters")
     context_kwarg: str | None = Field(None, description="Name of the kwarg that should receive context")
+    coalesce: bool = Field(default=True, description="Whether identical concurrent reads share one read")
 
     @classmethod
     def from_function(
@@ -46,8 +52,13 @@ class ResourceTemplate(BaseModel):
         icons: list[Icon] | None = None,
         annotations: Annotations | None = None,
         context_kwarg: str | None = None,
+        coalesce: bool | None = None,
     ) -> ResourceTemplate:
-        """Create a template from a function."""
+        """Create a template from a function.
+
+        If `coalesce` is None, identical concurrent reads are coalesced only if the
+        function takes no Context.
+        """
         func_name = name or fn.__name__
         if func_name == "<lambda>":
             raise ValueError("You must provide a name for lambda functions")
@@ -55,6 +66,7 @@ class ResourceTemplate(BaseModel):
         # Find context parameter if it exists
         if context_kwarg is None:
             context_kwarg = find_context_parameter(fn)
+        check_context_parameter(fn, context_kwarg, f"Resource template {func_name}")
 
         # Get schema from func_metadata, excluding context parameter
         func_arg_metadata = func_metadata(
@@ -77,6 +89,7 @@ class ResourceTemplate(BaseModel):
             fn=fn,
             parameters=parameters,
             context_kwarg=context_kwarg,
+            coalesce=context_kwarg is None if coalesce is None else coalesce,
         )
 
     def matches(self, uri: str) -> dict[str, Any] | None:
@@ -93,17 +106,28 @@ class ResourceTemplate(BaseModel):
         uri: str,
         params: dict[str, Any],
         context: Context[ServerSessionT, LifespanContextT, RequestT] | None = None,
+        thread_pool: WorkerThreadPool | None = None,
     ) -> Resource:
-        """Create a resource from the template with the given parameters."""
+        """Create a resource from the template with the given parameters.
+
+        A synchronous function runs on a thread of `thread_pool` if given.
+        """
         try:
             # Add context to params if needed
             params = inject_context(self.fn, params, context, self.context_kwarg)
 
             # Call function and check if result is a coroutine
-            result = self.fn(**params)
+            if thread_pool is not None and not inspect.iscoroutinefunction(self.fn):
+                result = await thread_pool.run_sync(self.fn, **params)
+            else:
+                result = self.fn(**params)
             if inspect.iscoroutine(result):
                 result = await result
 
+            # The result is already there, so reading it needs no worker thread
+            async def read_result() -> Any:
+                return result
+
             return FunctionResource(
                 uri=uri,  # type: ignore
                 name=self.name,
@@ -112,7 +136,7 @@ class ResourceTemplate(BaseModel):
                 mime_type=self.mime_type,
                 icons=self.icons,
                 annotations=self.annotations,
-                fn=lambda: result,  # Capture result in closure
+                fn=read_result,
             )
         except Exception as e:
             raise ValueError(f"Error creating resource from template: {e}")
@@ -14,6 +14,7 @@ import pydantic_core
 from pydantic import AnyUrl, Field, ValidationInfo, validate_call
 
 from mcp.server.fastmcp.resources.base import Resource
+from mcp.server.fastmcp.utilities.thread_pool import WorkerThreadPool
 from mcp.types import Annotations, Icon
 
 
@@ -52,11 +53,17 @@ class FunctionResource(Resource):
 
     fn: Callable[[], Any] = Field(exclude=True)
 
-    async def read(self) -> str | bytes:
-        """Read the resource by calling the wrapped function."""
+    async def read(self, thread_pool: WorkerThreadPool | None = None) -> str | bytes:
+        """Read the resource by calling the wrapped function.
+
+        A synchronous function runs on a thread of `thread_pool` if given.
+        """
         try:
             # Call the function first to see if it returns a coroutine
-            result = self.fn()
+            if thread_pool is not None and not inspect.iscoroutinefunction(self.fn):
+                result = await thread_pool.run_sync(self.fn)
+            else:
+                result = self.fn()
             # If it's a coroutine, await it
             if inspect.iscoroutine(result):
                 result = await result
@@ -83,6 +90,7 @@ class FunctionResource(Resource):
         mime_type: str | None = None,
         icons: list[Icon] | None = None,
         annotations: Annotations | None = None,
+        coalesce: bool = True,
     ) -> "FunctionResource":
         """Create a FunctionResource from a function."""
         func_name = name or fn.__name__
@@ -101,6 +109,7 @@ class FunctionResource(Resource):
             fn=fn,
             icons=icons,
             annotations=annotations,
+            coalesce=coalesce,
         )
 
 
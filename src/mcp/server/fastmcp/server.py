@@ -13,7 +13,7 @@ from collections.abc import (
     Sequence,
 )
 from contextlib import AbstractAsyncContextManager, asynccontextmanager
-from typing import Any, Generic, Literal
+from typing import TYPE_CHECKING, Any, Generic, Literal
 
 import anyio
 import pydantic_core
@@ -25,10 +25,10 @@ from starlette.middleware import Middleware
 from starlette.middleware.authentication import AuthenticationMiddleware
 from starlette.requests import Request
 from starlette.responses import Response
-from starlette.routing import Mount, Route
-from starlette.types import Receive, Scope, Send
+from starlette.routing import Mount, Route, request_response
+from starlette.types import ASGIApp, Receive, Scope, Send
 
-from mcp.server.auth.middleware.auth_context import AuthContextMiddleware
+from mcp.server.auth.middleware.auth_context import AuthContextMiddleware, get_principal_id
 from mcp.server.auth.middleware.bearer_auth import (
     BearerAuthBackend,
     RequireAuthMiddleware,
@@ -47,27 +47,38 @@ from mcp.server.elicitation import (
 from mcp.server.fastmcp.exceptions import ResourceError
 from mcp.server.fastmcp.prompts import Prompt, PromptManager
 from mcp.server.fastmcp.resources import FunctionResource, Resource, ResourceManager
-from mcp.server.fastmcp.tools import Tool, ToolManager
+from mcp.server.fastmcp.tools import Tool, ToolExecutor, ToolManager, ToolResultCache
 from mcp.server.fastmcp.utilities.context_injection import find_context_parameter
 from mcp.server.fastmcp.utilities.logging import configure_logging, get_logger
+from mcp.server.fastmcp.utilities.process_pool import WorkerProcessPool
+from mcp.server.fastmcp.utilities.single_flight import SingleFlight
+from mcp.server.fastmcp.utilities.thread_pool import WorkerThreadPool
+from mcp.server.lowlevel.admission import ConcurrencyLimits
 from mcp.server.lowlevel.helper_types import ReadResourceContents
 from mcp.server.lowlevel.server import LifespanResultT
 from mcp.server.lowlevel.server import Server as MCPServer
 from mcp.server.lowlevel.server import lifespan as default_lifespan
+from mcp.server.metrics import PROMETHEUS_CONTENT_TYPE, MetricsRegistry, render_metric
 from mcp.server.session import ServerSession, ServerSessionT
 from mcp.server.sse import SseServerTransport
 from mcp.server.stdio import stdio_server
-from mcp.server.streamable_http import EventStore
+from mcp.server.streamable_http import EventStore, SlowConsumerPolicy
 from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
+from mcp.server.streamable_http_workers import WorkerInfo, run_workers
 from mcp.server.transport_security import TransportSecuritySettings
+from mcp.shared.codec import DEFAULT_CODEC, Codec
 from mcp.shared.context import LifespanContextT, RequestContext, RequestT
-from mcp.types import Annotations, AnyFunction, ContentBlock, GetPromptResult, Icon, ToolAnnotations
+from mcp.shared.progress import ProgressThrottle
+from mcp.types import Annotations, AnyFunction, ContentBlock, GetPromptResult, Icon, LoggingLevel, ToolAnnotations
 from mcp.types import Prompt as MCPPrompt
 from mcp.types import PromptArgument as MCPPromptArgument
 from mcp.types import Resource as MCPResource
 from mcp.types import ResourceTemplate as MCPResourceTemplate
 from mcp.types import Tool as MCPTool
 
+if TYPE_CHECKING:
+    import uvicorn
+
 logger = get_logger(__name__)
 
 
@@ -98,16 +109,70 @@ class Settings(BaseSettings, Generic[LifespanResultT]):
     message_path: str
     streamable_http_path: str
 
+    # HTTP server settings
+    workers: int
+    """Worker processes serving the streamable HTTP transport. Sessions stay with the worker that created them."""
+    backlog: int
+    """Maximum number of connections waiting to be accepted."""
+    limit_concurrency: int | None
+    """Maximum concurrent connections and tasks per worker before responding 503. None means unlimited."""
+    timeout_keep_alive: int
+    """Seconds to keep an idle HTTP connection open for further requests."""
+
     # StreamableHTTP settings
     json_response: bool
     stateless_http: bool
     """Define if the server should create a new transport per request."""
+    event_store_queue_size: int | None
+    """Messages each session may queue for storing in the event store write-behind. None stores inline."""
+    request_stream_buffer_size: int
+    """Messages buffered for each streamable HTTP response or GET stream."""
+    slow_consumer_policy: SlowConsumerPolicy
+    """Policy for a stream whose buffer is full: block, drop_notifications or disconnect (needs an event store)."""
+
+    # Session settings
+    session_idle_timeout: float | None
+    """Seconds a streamable HTTP session may go without requests before it is terminated. None keeps it."""
+    session_ttl: float | None
+    """Seconds after which a streamable HTTP session is terminated regardless of activity. None keeps it."""
+    max_sessions: int | None
+    """Maximum streamable HTTP sessions; the least recently used idle session is evicted. None means unlimited."""
+
+    # Concurrency settings
+    max_concurrent_requests: int | None
+    """Maximum requests handled at once across all sessions. None means unlimited."""
+    max_concurrent_requests_per_session: int | None
+    """Maximum requests handled at once within one session. None means unlimited."""
+    max_queued_requests_per_session: int
+    """Requests of one session that may wait for a slot before the server reports it is busy."""
+
+    # Progress settings
+    progress_min_interval: float
+    """Minimum seconds between progress notifications for one progress token. 0 sends every update."""
+    progress_min_delta: float
+    """Minimum change in progress between notifications for one progress token. 0 sends every update."""
+
+    # Metrics settings
+    metrics_enabled: bool
+    """Record request counts, errors, latencies and response sizes per method and tool."""
+    metrics_path: str | None
+    """Path of the Prometheus metrics route added to the HTTP apps when metrics are enabled. None omits it."""
 
     # resource settings
     warn_on_duplicate_resources: bool
 
     # tool settings
     warn_on_duplicate_tools: bool
+    sync_worker_threads: int
+    """Worker threads running synchronous tools, resource templates and prompts off the event loop."""
+    process_workers: int | None
+    """Worker processes running tools registered with `executor="process"`. None means one per CPU."""
+    tool_cache_max_entries: int
+    """Results of cached tools kept at most."""
+    tool_cache_max_bytes: int
+    """Encoded size of the results of cached tools kept at most."""
+    tool_cache_ttl: float | None
+    """Seconds a cached tool result is served. None keeps results until evicted or invalidated."""
 
     # prompt settings
     warn_on_duplicate_prompts: bool
@@ -118,6 +183,8 @@ class Settings(BaseSettings, Generic[LifespanResultT]):
 
     lifespan: Callable[[FastMCP[LifespanResultT]], AbstractAsyncContextManager[LifespanResultT]] | None
     """A async context manager that will be called when the server is started."""
+    lifespan_per_session: bool
+    """Run the lifespan for every session instead of once for all sessions of the HTTP apps."""
 
     auth: AuthSettings | None
 
@@ -159,15 +226,39 @@ class FastMCP(Generic[LifespanResultT]):
         sse_path: str = "/sse",
         message_path: str = "/messages/",
         streamable_http_path: str = "/mcp",
+        workers: int = 1,
+        backlog: int = 2048,
+        limit_concurrency: int | None = None,
+        timeout_keep_alive: int = 5,
         json_response: bool = False,
         stateless_http: bool = False,
+        event_store_queue_size: int | None = None,
+        request_stream_buffer_size: int = 32,
+        slow_consumer_policy: SlowConsumerPolicy = "block",
+        session_idle_timeout: float | None = None,
+        session_ttl: float | None = None,
+        max_sessions: int | None = None,
+        max_concurrent_requests: int | None = None,
+        max_concurrent_requests_per_session: int | None = None,
+        max_queued_requests_per_session: int = 100,
+        progress_min_interval: float = 0.0,
+        progress_min_delta: float = 0.0,
+        metrics_enabled: bool = False,
+        metrics_path: str | None = "/metrics",
         warn_on_duplicate_resources: bool = True,
         warn_on_duplicate_tools: bool = True,
         warn_on_duplicate_prompts: bool = True,
+        sync_worker_threads: int = 40,
+        process_workers: int | None = None,
+        tool_cache_max_entries: int = 1024,
+        tool_cache_max_bytes: int = 64 * 1024 * 1024,
+        tool_cache_ttl: float | None = 300.0,
         dependencies: Collection[str] = (),
         lifespan: (Callable[[FastMCP[LifespanResultT]], AbstractAsyncContextManager[LifespanResultT]] | None) = None,
+        lifespan_per_session: bool = False,
         auth: AuthSettings | None = None,
         transport_security: TransportSecuritySettings | None = None,
+        codec: Codec = DEFAULT_CODEC,
     ):
         self.settings = Settings(
             debug=debug,
@@ -178,13 +269,36 @@ class FastMCP(Generic[LifespanResultT]):
             sse_path=sse_path,
             message_path=message_path,
             streamable_http_path=streamable_http_path,
+            workers=workers,
+            backlog=backlog,
+            limit_concurrency=limit_concurrency,
+            timeout_keep_alive=timeout_keep_alive,
             json_response=json_response,
             stateless_http=stateless_http,
+            event_store_queue_size=event_store_queue_size,
+            request_stream_buffer_size=request_stream_buffer_size,
+            slow_consumer_policy=slow_consumer_policy,
+            session_idle_timeout=session_idle_timeout,
+            session_ttl=session_ttl,
+            max_sessions=max_sessions,
+            max_concurrent_requests=max_concurrent_requests,
+            max_concurrent_requests_per_session=max_concurrent_requests_per_session,
+            max_queued_requests_per_session=max_queued_requests_per_session,
+            progress_min_interval=progress_min_interval,
+            progress_min_delta=progress_min_delta,
+            metrics_enabled=metrics_enabled,
+            metrics_path=metrics_path,
             warn_on_duplicate_resources=warn_on_duplicate_resources,
             warn_on_duplicate_tools=warn_on_duplicate_tools,
             warn_on_duplicate_prompts=warn_on_duplicate_prompts,
+            sync_worker_threads=sync_worker_threads,
+            process_workers=process_workers,
+            tool_cache_max_entries=tool_cache_max_entries,
+            tool_cache_max_bytes=tool_cache_max_bytes,
+            tool_cache_ttl=tool_cache_ttl,
             dependencies=list(dependencies),
             lifespan=lifespan,
+            lifespan_per_session=lifespan_per_session,
             auth=auth,
             transport_security=transport_security,
         )
@@ -197,10 +311,34 @@ class FastMCP(Generic[LifespanResultT]):
             # TODO(Marcelo): It seems there's a type mismatch between the lifespan type from an FastMCP and Server.
             # We need to create a Lifespan type that is a generic on the server type, like Starlette does.
             lifespan=(lifespan_wrapper(self, self.settings.lifespan) if self.settings.lifespan else default_lifespan),  # type: ignore
+            concurrency_limits=self._concurrency_limits(),
+            progress_throttle=self._progress_throttle(),
+            metrics=MetricsRegistry(codec=codec) if self.settings.metrics_enabled else None,
+            lifespan_per_session=self.settings.lifespan_per_session,
+        )
+        self._thread_pool = WorkerThreadPool(self.settings.sync_worker_threads)
+        # Processes are started when a tool first needs one
+        self._process_pool = WorkerProcessPool(self.settings.process_workers)
+        self._tool_manager = ToolManager(
+            tools=tools,
+            warn_on_duplicate_tools=self.settings.warn_on_duplicate_tools,
+            thread_pool=self._thread_pool,
+            process_pool=self._process_pool,
+            cache=ToolResultCache(
+                max_entries=self.settings.tool_cache_max_entries,
+                max_bytes=self.settings.tool_cache_max_bytes,
+                ttl=self.settings.tool_cache_ttl,
+            ),
+            single_flight=SingleFlight(),
+        )
+        self._resource_manager = ResourceManager(
+            warn_on_duplicate_resources=self.settings.warn_on_duplicate_resources,
+            thread_pool=self._thread_pool,
+            single_flight=SingleFlight(),
+        )
+        self._prompt_manager = PromptManager(
+            warn_on_duplicate_prompts=self.settings.warn_on_duplicate_prompts, thread_pool=self._thread_pool
         )
-        self._tool_manager = ToolManager(tools=tools, warn_on_duplicate_tools=self.settings.warn_on_duplicate_tools)
-        self._resource_manager = ResourceManager(warn_on_duplicate_resources=self.settings.warn_on_duplicate_resources)
-        self._prompt_manager = PromptManager(warn_on_duplicate_prompts=self.settings.warn_on_duplicate_prompts)
         # Validate auth configuration
         if self.settings.auth is not None:
             if auth_server_provider and token_verifier:
@@ -209,6 +347,8 @@ class FastMCP(Generic[LifespanResultT]):
                 raise ValueError("Must specify either auth_server_provider or token_verifier when auth is enabled")
         elif auth_server_provider or token_verifier:
             raise ValueError("Cannot specify auth_server_provider or token_verifier without auth settings")
+        if self.settings.slow_consumer_policy == "disconnect" and event_store is None:
+            raise ValueError('slow_consumer_policy "disconnect" requires an event store')
 
         self._auth_server_provider = auth_server_provider
         self._token_verifier = token_verifier
@@ -217,6 +357,7 @@ class FastMCP(Generic[LifespanResultT]):
         if auth_server_provider and not token_verifier:
             self._token_verifier = ProviderTokenVerifier(auth_server_provider)
         self._event_store = event_store
+        self._codec = codec
         self._custom_starlette_routes: list[Route] = []
         self.dependencies = self.settings.dependencies
         self._session_manager: StreamableHTTPSessionManager | None = None
@@ -227,6 +368,25 @@ class FastMCP(Generic[LifespanResultT]):
         # Configure logging
         configure_logging(self.settings.log_level)
 
+    def _concurrency_limits(self) -> ConcurrencyLimits | None:
+        """Build the low-level server's concurrency limits from settings, if any are set."""
+        if self.settings.max_concurrent_requests is None and self.settings.max_concurrent_requests_per_session is None:
+            return None
+        return ConcurrencyLimits(
+            max_concurrent_requests=self.settings.max_concurrent_requests,
+            max_concurrent_requests_per_session=self.settings.max_concurrent_requests_per_session,
+            max_queued_requests_per_session=self.settings.max_queued_requests_per_session,
+        )
+
+    def _progress_throttle(self) -> ProgressThrottle | None:
+        """Build the progress throttle from settings, if throttling is enabled."""
+        if not self.settings.progress_min_interval and not self.settings.progress_min_delta:
+            return None
+        return ProgressThrottle(
+            min_interval=self.settings.progress_min_interval,
+            min_delta=self.settings.progress_min_delta,
+        )
+
     @property
     def name(self) -> str:
         return self._mcp_server.name
@@ -262,6 +422,83 @@ class FastMCP(Generic[LifespanResultT]):
             )
         return self._session_manager
 
+    @property
+    def metrics(self) -> MetricsRegistry | None:
+        """Request metrics, if enabled with `metrics_enabled`."""
+        return self._mcp_server.metrics
+
+    @property
+    def thread_pool(self) -> WorkerThreadPool:
+        """Worker threads running synchronous tools, resource templates and prompts."""
+        return self._thread_pool
+
+    @property
+    def process_pool(self) -> WorkerProcessPool:
+        """Worker processes running tools registered with `executor="process"`."""
+        return self._process_pool
+
+    @asynccontextmanager
+    async def _app_lifespan(self, lifespan: AbstractAsyncContextManager[None]) -> AsyncIterator[None]:
+        """Run the lifespan of an HTTP app, then stop the worker processes."""
+        try:
+            async with lifespan:
+                yield
+        finally:
+            await self._process_pool.aclose()
+
+    def _metrics_routes(self) -> list[Route]:
+        """Build the Prometheus metrics route, if metrics and the route are enabled."""
+        metrics = self.metrics
+        if metrics is None or self.settings.metrics_path is None:
+            return []
+
+        async def metrics_endpoint(request: Request) -> Response:
+            text = (
+                metrics.render_prometheus()
+                + self._thread_pool.stats().render_prometheus()
+                + self._process_pool.stats().render_prometheus()
+            )
+            if self._tool_manager.cache is not None:
+                text += self._tool_manager.cache.stats().render_prometheus()
+            coalesced = [
+                ({"kind": kind}, single_flight.coalesced)
+                for kind, single_flight in (
+                    ("tool", self._tool_manager.single_flight),
+                    ("resource", self._resource_manager.single_flight),
+                )
+                if single_flight is not None
+            ]
+            text += render_metric(
+                "mcp_coalesced_calls_total",
+                "Calls given the result of an identical concurrent call.",
+                "counter",
+                coalesced,
+            )
+            if self._session_manager is not None and not self._session_manager.stateless:
+                text += self._session_manager.session_stats().render_prometheus()
+            return Response(text, media_type=PROMETHEUS_CONTENT_TYPE)
+
+        if self._token_verifier is None:
+            return [Route(self.settings.metrics_path, endpoint=metrics_endpoint, methods=["GET"])]
+
+        # With auth, the metrics require the same authentication as the MCP endpoints
+        auth = self.settings.auth
+        required_scopes = (auth.required_scopes if auth else None) or []
+        resource_metadata_url = None
+        if auth and auth.resource_server_url:
+            from mcp.server.auth.routes import build_resource_metadata_url
+
+            resource_metadata_url = build_resource_metadata_url(auth.resource_server_url)
+        return [
+            Route(
+                self.settings.metrics_path,
+                endpoint=RequireAuthMiddleware(
+                    request_response(metrics_endpoint), required_scopes, resource_metadata_url
+                ),
+                methods=["GET"],
+            )
+        ]
+
     def run(
         self,
         transport: Literal["stdio", "sse", "streamable-http"] = "stdio",
@@ -283,7 +520,10 @@ class FastMCP(Generic[LifespanResultT]):
             case "sse":
                 anyio.run(lambda: self.run_sse_async(mount_path))
             case "streamable-http":
-                anyio.run(self.run_streamable_http_async)
+                if self.settings.workers > 1:
+                    self.run_streamable_http_workers()
+                else:
+                    anyio.run(self.run_streamable_http_async)
 
     def _setup_handlers(self) -> None:
         """Set up core MCP protocol handlers."""
@@ -297,6 +537,7 @@ class FastMCP(Generic[LifespanResultT]):
         self._mcp_server.list_prompts()(self.list_prompts)
         self._mcp_server.get_prompt()(self.get_prompt)
         self._mcp_server.list_resource_templates()(self.list_resource_templates)
+        self._mcp_server.set_logging_level()(self.set_logging_level)
 
     async def list_tools(self) -> list[MCPTool]:
         """List all available tools."""
@@ -348,6 +589,12 @@ class FastMCP(Generic[LifespanResultT]):
             for resource in resources
         ]
 
+    async def set_logging_level(self, level: LoggingLevel) -> None:
+        """Accept a client's minimum log level.
+
+        The session records the level and drops less severe log messages itself.
+        """
+
     async def list_resource_templates(self) -> list[MCPResourceTemplate]:
         templates = self._resource_manager.list_templates()
         return [
@@ -367,16 +614,27 @@ class FastMCP(Generic[LifespanResultT]):
         """Read a resource by URI."""
 
         context = self.get_context()
-        resource = await self._resource_manager.get_resource(uri, context=context)
-        if not resource:
-            raise ResourceError(f"Unknown resource: {uri}")
 
-        try:
-            content = await resource.read()
-            return [ReadResourceContents(content=content, mime_type=resource.mime_type)]
-        except Exception as e:
-            logger.exception(f"Error reading resource {uri}")
-            raise ResourceError(str(e))
+        async def read() -> Iterable[ReadResourceContents]:
+            resource = await self._resource_manager.get_resource(uri, context=context)
+            if not resource:
+                raise ResourceError(f"Unknown resource: {uri}")
+
+            try:
+                if isinstance(resource, FunctionResource):
+                    content = await resource.read(thread_pool=self._thread_pool)
+                else:
+                    content = await resource.read()
+                return [ReadResourceContents(content=content, mime_type=resource.mime_type)]
+            except Exception as e:
+                logger.exception(f"Error reading resource {uri}")
+                raise ResourceError(str(e))
+
+        # Identical concurrent reads by the same principal share one read
+        single_flight = self._resource_manager.single_flight
+        if single_flight is not None and self._resource_manager.coalesces(uri):
+            return await single_flight.run((str(uri), get_principal_id()), read)
+        return await read()
 
     def add_tool(
         self,
@@ -388,6 +646,9 @@ class FastMCP(Generic[LifespanResultT]):
         icons: list[Icon] | None = None,
         meta: dict[str, Any] | None = None,
         structured_output: bool | None = None,
+        executor: ToolExecutor = "thread",
+        cache: bool | None = None,
+        coalesce: bool | None = None,
     ) -> None:
         """Add a tool to the server.
 
@@ -404,6 +665,20 @@ class FastMCP(Generic[LifespanResultT]):
                 - If None, auto-detects based on the function's return type annotation
                 - If True, creates a structured tool (return type annotation permitting)
                 - If False, unconditionally creates an unstructured tool
+            executor: Where a synchronous tool runs
+                - "thread" (default) runs it on a worker thread, see `sync_worker_threads`
+                - "event_loop" calls it on the event loop, for trivially fast functions
+                - "process" runs it in a worker process, for CPU-bound functions, see
+                  `process_workers`. The function must be picklable, and takes a
+                  `ProcessContext` in place of a `Context`
+            cache: Whether results are cached, see `tool_cache_max_entries`, `tool_cache_max_bytes`
+                and `tool_cache_ttl`. Calls with the same validated arguments are then answered
+                from the cache. None caches the results of tools annotated with both
+                readOnlyHint and idempotentHint that take no Context
+            coalesce: Whether identical concurrent calls share one execution. Calls with the same
+                validated arguments made while one is running wait for it and receive its result.
+                None coalesces the calls of tools annotated with both readOnlyHint and
+                idempotentHint that take no Context
         """
         self._tool_manager.add_tool(
             fn,
@@ -414,6 +689,9 @@ class FastMCP(Generic[LifespanResultT]):
             icons=icons,
             meta=meta,
             structured_output=structured_output,
+            executor=executor,
+            cache=cache,
+            coalesce=coalesce,
         )
 
     def remove_tool(self, name: str) -> None:
@@ -436,6 +714,9 @@ class FastMCP(Generic[LifespanResultT]):
         icons: list[Icon] | None = None,
         meta: dict[str, Any] | None = None,
         structured_output: bool | None = None,
+        executor: ToolExecutor = "thread",
+        cache: bool | None = None,
+        coalesce: bool | None = None,
     ) -> Callable[[AnyFunction], AnyFunction]:
         """Decorator to register a tool.
 
@@ -452,6 +733,20 @@ class FastMCP(Generic[LifespanResultT]):
                 - If None, auto-detects based on the function's return type annotation
                 - If True, creates a structured tool (return type annotation permitting)
                 - If False, unconditionally creates an unstructured tool
+            executor: Where a synchronous tool runs
+                - "thread" (default) runs it on a worker thread, see `sync_worker_threads`
+                - "event_loop" calls it on the event loop, for trivially fast functions
+                - "process" runs it in a worker process, for CPU-bound functions, see
+                  `process_workers`. The function must be picklable, and takes a
+                  `ProcessContext` in place of a `Context`
+            cache: Whether results are cached, see `tool_cache_max_entries`, `tool_cache_max_bytes`
+                and `tool_cache_ttl`. Calls with the same validated arguments are then answered
+                from the cache. None caches the results of tools annotated with both
+                readOnlyHint and idempotentHint that take no Context
+            coalesce: Whether identical concurrent calls share one execution. Calls with the same
+                validated arguments made while one is running wait for it and receive its result.
+                None coalesces the calls of tools annotated with both readOnlyHint and
+                idempotentHint that take no Context
 
         Example:
             @server.tool()
@@ -484,6 +779,9 @@ class FastMCP(Generic[LifespanResultT]):
                 icons=icons,
                 meta=meta,
                 structured_output=structured_output,
+                executor=executor,
+                cache=cache,
+                coalesce=coalesce,
             )
             return fn
 
@@ -525,6 +823,7 @@ class FastMCP(Generic[LifespanResultT]):
         mime_type: str | None = None,
         icons: list[Icon] | None = None,
         annotations: Annotations | None = None,
+        coalesce: bool | None = None,
     ) -> Callable[[AnyFunction], AnyFunction]:
         """Decorator to register a function as a resource.
 
@@ -543,6 +842,9 @@ class FastMCP(Generic[LifespanResultT]):
             title: Optional human-readable title for the resource
             description: Optional description of the resource
             mime_type: Optional MIME type for the resource
+            coalesce: Whether identical concurrent reads share one read. Reads of the same URI
+                made while one is running wait for it and receive its contents. None coalesces
+                the reads of resources whose function takes no Context
 
         Example:
             @server.resource("resource://my-resource")
@@ -601,6 +903,7 @@ class FastMCP(Generic[LifespanResultT]):
                     mime_type=mime_type,
                     icons=icons,
                     annotations=annotations,
+                    coalesce=coalesce,
                 )
             else:
                 # Register as regular resource
@@ -613,6 +916,7 @@ class FastMCP(Generic[LifespanResultT]):
                     mime_type=mime_type,
                     icons=icons,
                     annotations=annotations,
+                    coalesce=coalesce is not False,
                 )
                 self.add_resource(resource)
             return fn
@@ -728,12 +1032,16 @@ class FastMCP(Generic[LifespanResultT]):
 
     async def run_stdio_async(self) -> None:
         """Run the server using stdio transport."""
-        async with stdio_server() as (read_stream, write_stream):
-            await self._mcp_server.run(
-                read_stream,
-                write_stream,
-                self._mcp_server.create_initialization_options(),
-            )
+        try:
+            async with stdio_server(codec=self._codec) as (read_stream, write_stream):
+                await self._mcp_server.run(
+                    read_stream,
+                    write_stream,
+                    self._mcp_server.create_initialization_options(),
+                    supports_batches=True,
+                )
+        finally:
+            await self._process_pool.aclose()
 
     async def run_sse_async(self, mount_path: str | None = None) -> None:
         """Run the server using SSE transport."""
@@ -741,13 +1049,7 @@ class FastMCP(Generic[LifespanResultT]):
 
         starlette_app = self.sse_app(mount_path)
 
-        config = uvicorn.Config(
-            starlette_app,
-            host=self.settings.host,
-            port=self.settings.port,
-            log_level=self.settings.log_level.lower(),
-        )
-        server = uvicorn.Server(config)
+        server = uvicorn.Server(self._uvicorn_config(starlette_app))
         await server.serve()
 
     async def run_streamable_http_async(self) -> None:
@@ -756,14 +1058,45 @@ class FastMCP(Generic[LifespanResultT]):
 
         starlette_app = self.streamable_http_app()
 
-        config = uvicorn.Config(
-            starlette_app,
+        server = uvicorn.Server(self._uvicorn_config(starlette_app))
+        await server.serve()
+
+    def run_streamable_http_workers(self) -> None:
+        """Run the server using StreamableHTTP transport in `workers` pre-forked processes.
+
+        Requests for a session that reach a worker other than the one that created it
+        are forwarded to that worker. Note this is a synchronous function.
+        """
+        run_workers(
+            self._serve_streamable_http_worker,
+            host=self.settings.host,
+            port=self.settings.port,
+            workers=self.settings.workers,
+            backlog=self.settings.backlog,
+        )
+
+    def _serve_streamable_http_worker(self, worker: WorkerInfo) -> None:
+        import uvicorn
+
+        starlette_app = self.streamable_http_app()
+        self.session_manager.session_id_prefix = worker.session_id_prefix
+
+        server = uvicorn.Server(self._uvicorn_config(worker.affinity_middleware(starlette_app)))
+        server.run(sockets=worker.sockets)
+
+    def _uvicorn_config(self, app: ASGIApp) -> uvicorn.Config:
+        """Build the uvicorn configuration for an HTTP app from settings."""
+        import uvicorn
+
+        return uvicorn.Config(
+            app,
             host=self.settings.host,
             port=self.settings.port,
             log_level=self.settings.log_level.lower(),
+            backlog=self.settings.backlog,
+            limit_concurrency=self.settings.limit_concurrency,
+            timeout_keep_alive=self.settings.timeout_keep_alive,
         )
-        server = uvicorn.Server(config)
-        await server.serve()
 
     def _normalize_path(self, mount_path: str, endpoint: str) -> str:
         """
@@ -808,6 +1141,7 @@ class FastMCP(Generic[LifespanResultT]):
         sse = SseServerTransport(
             normalized_message_endpoint,
             security_settings=self.settings.transport_security,
+            codec=self._codec,
         )
 
         async def handle_sse(scope: Scope, receive: Receive, send: Send):
@@ -822,6 +1156,7 @@ class FastMCP(Generic[LifespanResultT]):
                     streams[0],
                     streams[1],
                     self._mcp_server.create_initialization_options(),
+                    supports_batches=True,
                 )
             return Response()
 
@@ -918,10 +1253,16 @@ class FastMCP(Generic[LifespanResultT]):
             )
 
         # mount these routes last, so they have the lowest route matching precedence
+        routes.extend(self._metrics_routes())
         routes.extend(self._custom_starlette_routes)
 
         # Create Starlette app with routes and middleware
-        return Starlette(debug=self.settings.debug, routes=routes, middleware=middleware)
+        return Starlette(
+            debug=self.settings.debug,
+            routes=routes,
+            middleware=middleware,
+            lifespan=lambda app: self._app_lifespan(self._mcp_server.app_lifespan()),
+        )
 
     def streamable_http_app(self) -> Starlette:
         """Return an instance of the StreamableHTTP server app."""
@@ -935,6 +1276,13 @@ class FastMCP(Generic[LifespanResultT]):
                 json_response=self.settings.json_response,
                 stateless=self.settings.stateless_http,  # Use the stateless setting
                 security_settings=self.settings.transport_security,
+                codec=self._codec,
+                session_idle_timeout=self.settings.session_idle_timeout,
+                session_ttl=self.settings.session_ttl,
+                max_sessions=self.settings.max_sessions,
+                event_store_queue_size=self.settings.event_store_queue_size,
+                request_stream_buffer_size=self.settings.request_stream_buffer_size,
+                slow_consumer_policy=self.settings.slow_consumer_policy,
             )
 
         # Create the ASGI handler
@@ -1010,13 +1358,14 @@ class FastMCP(Generic[LifespanResultT]):
                 )
             )
 
+        routes.extend(self._metrics_routes())
         routes.extend(self._custom_starlette_routes)
 
         return Starlette(
             debug=self.settings.debug,
             routes=routes,
             middleware=middleware,
-            lifespan=lambda app: self.session_manager.run(),
+            lifespan=lambda app: self._app_lifespan(self.session_manager.run()),
         )
 
     async def list_prompts(self) -> list[MCPPrompt]:
@@ -1,4 +1,5 @@
-from .base import Tool
+from .base import Tool, ToolExecutor
+from .cache import ToolCacheStats, ToolResultCache
 from .tool_manager import ToolManager
 
-__all__ = ["Tool", "ToolManager"]
+__all__ = ["Tool", "ToolCacheStats", "ToolExecutor", "ToolManager", "ToolResultCache"]
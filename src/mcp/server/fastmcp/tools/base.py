@@ -4,13 +4,18 @@ import functools
 import inspect
 from collections.abc import Callable
 from functools import cached_property
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Literal
 
 from pydantic import BaseModel, Field
 
+from mcp.server.auth.middleware.auth_context import get_principal_id
 from mcp.server.fastmcp.exceptions import ToolError
-from mcp.server.fastmcp.utilities.context_injection import find_context_parameter
+from mcp.server.fastmcp.tools.cache import ToolCacheKey, ToolResultCache
+from mcp.server.fastmcp.utilities.context_injection import check_context_parameter, find_context_parameter
 from mcp.server.fastmcp.utilities.func_metadata import FuncMetadata, func_metadata
+from mcp.server.fastmcp.utilities.process_pool import WorkerProcessPool
+from mcp.server.fastmcp.utilities.single_flight import SingleFlight
+from mcp.server.fastmcp.utilities.thread_pool import WorkerThreadPool
 from mcp.types import Icon, ToolAnnotations
 
 if TYPE_CHECKING:
@@ -19,6 +24,10 @@ if TYPE_CHECKING:
     from mcp.shared.context import LifespanContextT, RequestT
 
 
+ToolExecutor = Literal["thread", "event_loop", "process"]
+"""Where a synchronous tool runs: on a worker thread, on the event loop, or in a worker process."""
+
+
 class Tool(BaseModel):
     """Internal tool registration info."""
 
@@ -31,6 +40,9 @@ class Tool(BaseModel):
         description="Metadata about the function including a pydantic model for tool arguments"
     )
     is_async: bool = Field(description="Whether the tool is async")
+    executor: ToolExecutor = Field(default="thread", description="Where a synchronous tool runs")
+    cache: bool = Field(default=False, description="Whether the tool's results are cached by its tool manager")
+    coalesce: bool = Field(default=False, description="Whether identical concurrent calls share one execution")
     context_kwarg: str | None = Field(None, description="Name of the kwarg that should receive context")
     annotations: ToolAnnotations | None = Field(None, description="Optional annotations for the tool")
     icons: list[Icon] | None = Field(default=None, description="Optional list of icons for this tool")
@@ -52,8 +64,16 @@ class Tool(BaseModel):
         icons: list[Icon] | None = None,
         meta: dict[str, Any] | None = None,
         structured_output: bool | None = None,
+        executor: ToolExecutor = "thread",
+        cache: bool | None = None,
+        coalesce: bool | None = None,
     ) -> Tool:
-        """Create a Tool from a function."""
+        """Create a Tool from a function.
+
+        If `cache` or `coalesce` is None, results are cached, or identical concurrent
+        calls coalesced, only if the tool is annotated as read-only and idempotent,
+        and takes no Context.
+        """
         func_name = name or fn.__name__
 
         if func_name == "<lambda>":
@@ -61,9 +81,14 @@ class Tool(BaseModel):
 
         func_doc = description or fn.__doc__ or ""
         is_async = _is_async_callable(fn)
+        if is_async and executor == "process":
+            raise ValueError(f"Tool {func_name} runs in a worker process, so it must be synchronous")
 
         if context_kwarg is None:
             context_kwarg = find_context_parameter(fn)
+        check_context_parameter(
+            fn, context_kwarg, f"Tool {func_name} with executor={executor!r}", in_process=executor == "process"
+        )
 
         func_arg_metadata = func_metadata(
             fn,
@@ -72,6 +97,14 @@ class Tool(BaseModel):
         )
         parameters = func_arg_metadata.arg_model.model_json_schema(by_alias=True)
 
+        # The result of such a tool depends on its arguments alone
+        reusable = (
+            annotations is not None
+            and annotations.readOnlyHint is True
+            and annotations.idempotentHint is True
+            and context_kwarg is None
+        )
+
         return cls(
             fn=fn,
             name=func_name,
@@ -80,6 +113,9 @@ class Tool(BaseModel):
             parameters=parameters,
             fn_metadata=func_arg_metadata,
             is_async=is_async,
+            executor=executor,
+            cache=reusable if cache is None else cache,
+            coalesce=reusable if coalesce is None else coalesce,
             context_kwarg=context_kwarg,
             annotations=annotations,
             icons=icons,
@@ -91,20 +127,48 @@ class Tool(BaseModel):
         arguments: dict[str, Any],
         context: Context[ServerSessionT, LifespanContextT, RequestT] | None = None,
         convert_result: bool = False,
+        thread_pool: WorkerThreadPool | None = None,
+        process_pool: WorkerProcessPool | None = None,
+        cache: ToolResultCache | None = None,
+        single_flight: SingleFlight[ToolCacheKey] | None = None,
     ) -> Any:
-        """Run the tool with arguments."""
-        try:
-            result = await self.fn_metadata.call_fn_with_arg_validation(
-                self.fn,
-                self.is_async,
-                arguments,
-                {self.context_kwarg: context} if self.context_kwarg is not None else None,
-            )
+        """Run the tool with arguments.
 
-            if convert_result:
-                result = self.fn_metadata.convert_result(result)
-
-            return result
+        A synchronous tool runs in the pool its executor names, if that pool is given,
+        and on the event loop otherwise. The converted results of a cached tool are
+        served from `cache`, and identical concurrent calls of a coalesced tool share
+        one execution through `single_flight`, if given.
+        """
+        try:
+            arguments_parsed = self.fn_metadata.parse_arguments(arguments)
+            cache = cache if self.cache and convert_result else None
+            single_flight = single_flight if self.coalesce and convert_result else None
+            key = None
+            if cache is not None or single_flight is not None:
+                key = ToolResultCache.key(self.name, arguments_parsed, get_principal_id())
+                if key is not None and cache is not None and (cached := cache.get(key)) is not None:
+                    return cached
+
+            async def execute() -> Any:
+                kwargs = arguments_parsed.model_dump_one_level()
+                if self.executor == "process" and process_pool is not None:
+                    result = await process_pool.run(self.fn, kwargs, context=context, context_kwarg=self.context_kwarg)
+                else:
+                    if self.context_kwarg is not None:
+                        kwargs[self.context_kwarg] = context
+                    result = await self.fn_metadata.call_fn(
+                        self.fn, self.is_async, kwargs, thread_pool if self.executor == "thread" else None
+                    )
+
+                if convert_result:
+                    result = self.fn_metadata.convert_result(result)
+                if cache is not None and key is not None:
+                    cache.put(key, result)
+                return result
+
+            if single_flight is not None and key is not None:
+                return await single_flight.run(key, execute)
+            return await execute()
         except Exception as e:
             raise ToolError(f"Error executing tool {self.name}: {e}") from e
 
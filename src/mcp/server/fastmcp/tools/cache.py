@@ -0,0 +1,190 @@
+"""
+Result caching for FastMCP tools.
+
+Clients often call lookup tools again with the same arguments. A tool registered with
+caching enabled has its results stored in the `ToolResultCache` of its tool manager,
+keyed on the tool name and its validated arguments, so that equivalent calls, e.g.
+`{"n": "1"}` and `{"n": 1}`, share an entry. When the server requires authentication,
+the key also holds the principal the request is authenticated as, so that a result
+is never served to another user. Results are stored after conversion to content and
+structured output, so a cache hit skips both the call and the conversion.
+
+Entries expire after `ttl` seconds, and the least recently used entries are evicted
+to keep the cache within `max_entries` entries and `max_bytes` bytes of encoded
+results. Errors are never cached.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+import pydantic_core
+from pydantic import BaseModel
+
+from mcp.server.metrics import render_metric
+
+ToolCacheKey = tuple[str, str, str | None]
+"""The name of a tool, the JSON of its validated arguments and the principal ID of the caller."""
+
+
+@dataclass(frozen=True)
+class ToolCacheStats:
+    """Point-in-time contents and counters of a `ToolResultCache`."""
+
+    entries: int
+    """Results currently cached."""
+    bytes: int
+    """Encoded size of the results currently cached."""
+    hits: Mapping[str, int] = field(default_factory=dict[str, int])
+    """Calls answered from the cache, by tool name."""
+    misses: Mapping[str, int] = field(default_factory=dict[str, int])
+    """Calls of cached tools that ran the tool, by tool name."""
+    evicted: int = 0
+    """Results dropped to stay within `max_entries` and `max_bytes`."""
+    expired: int = 0
+    """Results dropped because they were older than `ttl`."""
+
+    def render_prometheus(self) -> str:
+        """Render the cache contents and counters in the Prometheus text exposition format."""
+        return (
+            render_metric("mcp_tool_cache_entries", "Tool results cached.", "gauge", [({}, self.entries)])
+            + render_metric(
+                "mcp_tool_cache_bytes", "Encoded size of the tool results cached.", "gauge", [({}, self.bytes)]
+            )
+            + render_metric(
+                "mcp_tool_cache_hits_total",
+                "Tool calls answered from the cache.",
+                "counter",
+                [({"tool": tool}, hits) for tool, hits in self.hits.items()],
+            )
+            + render_metric(
+                "mcp_tool_cache_misses_total",
+                "Calls of cached tools that ran the tool.",
+                "counter",
+                [({"tool": tool}, misses) for tool, misses in self.misses.items()],
+            )
+            + render_metric(
+                "mcp_tool_cache_dropped_total",
+                "Tool results dropped from the cache.",
+                "counter",
+                [({"reason": "evicted"}, self.evicted), ({"reason": "expired"}, self.expired)],
+            )
+        )
+
+
+@dataclass
+class _Entry:
+    value: Any
+    size: int
+    expires_at: float
+
+
+class ToolResultCache:
+    """
+    A size-bounded LRU cache of converted tool results.
+
+    Args:
+        max_entries: Results kept at most.
+        max_bytes: Encoded size of the results kept at most. A result larger than
+            this is not cached.
+        ttl: Seconds a result is served from the cache. None keeps results until they
+            are evicted or invalidated.
+        clock: Returns the current time in seconds, for expiry.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_bytes: int = 64 * 1024 * 1024,
+        ttl: float | None = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_entries < 1 or max_bytes < 1:
+            raise ValueError("max_entries and max_bytes must be positive")
+        if ttl is not None and ttl <= 0:
+            raise ValueError(f"ttl must be positive or None, got {ttl}")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: OrderedDict[ToolCacheKey, _Entry] = OrderedDict()
+        self._bytes = 0
+        self._hits: dict[str, int] = {}
+        self._misses: dict[str, int] = {}
+        self._evicted = 0
+        self._expired = 0
+
+    @staticmethod
+    def key(tool: str, arguments: BaseModel, principal: str | None = None) -> ToolCacheKey | None:
+        """
+        Return the key of a call with validated arguments, or None if they cannot be serialized.
+
+        `principal` identifies the authenticated caller, see `get_principal_id()`.
+        """
+        try:
+            return tool, arguments.model_dump_json(), principal
+        except pydantic_core.PydanticSerializationError:
+            return None
+
+    def get(self, key: ToolCacheKey) -> Any | None:
+        """Return the cached result of a call, or None, counting the hit or miss."""
+        entry = self._entries.get(key)
+        if entry is not None and entry.expires_at <= self._clock():
+            self._remove(key)
+            self._expired += 1
+            entry = None
+        counter = self._misses if entry is None else self._hits
+        counter[key[0]] = counter.get(key[0], 0) + 1
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        return entry.value
+
+    def put(self, key: ToolCacheKey, value: Any) -> None:
+        """Cache the converted result of a call, evicting the least recently used results as needed."""
+        size = len(pydantic_core.to_json(value, fallback=str))
+        if size > self.max_bytes:
+            return
+        if key in self._entries:
+            self._remove(key)
+        expires_at = self._clock() + self.ttl if self.ttl is not None else float("inf")
+        self._entries[key] = _Entry(value, size, expires_at)
+        self._bytes += size
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+            self._evicted += 1
+
+    def invalidate(self, tool: str | None = None, key: ToolCacheKey | None = None) -> int:
+        """
+        Drop cached results, returning how many were dropped.
+
+        Drops the results of the call `key` for every principal if given, else every
+        result of `tool` if given, else every result.
+        """
+        if key is not None:
+            keys = [cached for cached in self._entries if cached[:2] == key[:2]]
+        elif tool is not None:
+            keys = [cached for cached in self._entries if cached[0] == tool]
+        else:
+            keys = list(self._entries)
+        for cached in keys:
+            self._remove(cached)
+        return len(keys)
+
+    def stats(self) -> ToolCacheStats:
+        """Return the current contents and counters of the cache."""
+        return ToolCacheStats(
+            entries=len(self._entries),
+            bytes=self._bytes,
+            hits=dict(self._hits),
+            misses=dict(self._misses),
+            evicted=self._evicted,
+            expired=self._expired,
+        )
+
+    def _remove(self, key: ToolCacheKey) -> None:
+        self._bytes -= self._entries.pop(key).size
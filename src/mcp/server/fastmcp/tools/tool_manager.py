@@ -4,8 +4,12 @@ from collections.abc import Callable
 from typing import TYPE_CHECKING, Any
 
 from mcp.server.fastmcp.exceptions import ToolError
-from mcp.server.fastmcp.tools.base import Tool
+from mcp.server.fastmcp.tools.base import Tool, ToolExecutor
+from mcp.server.fastmcp.tools.cache import ToolCacheKey, ToolResultCache
 from mcp.server.fastmcp.utilities.logging import get_logger
+from mcp.server.fastmcp.utilities.process_pool import WorkerProcessPool
+from mcp.server.fastmcp.utilities.single_flight import SingleFlight
+from mcp.server.fastmcp.utilities.thread_pool import WorkerThreadPool
 from mcp.shared.context import LifespanContextT, RequestT
 from mcp.types import Icon, ToolAnnotations
 
@@ -24,6 +28,10 @@ class ToolManager:
         warn_on_duplicate_tools: bool = True,
         *,
         tools: list[Tool] | None = None,
+        thread_pool: WorkerThreadPool | None = None,
+        process_pool: WorkerProcessPool | None = None,
+        cache: ToolResultCache | None = None,
+        single_flight: SingleFlight[ToolCacheKey] | None = None,
     ):
         self._tools: dict[str, Tool] = {}
         if tools is not None:
@@ -33,6 +41,10 @@ class ToolManager:
                 self._tools[tool.name] = tool
 
         self.warn_on_duplicate_tools = warn_on_duplicate_tools
+        self.thread_pool = thread_pool
+        self.process_pool = process_pool
+        self.cache = cache
+        self.single_flight = single_flight
 
     def get_tool(self, name: str) -> Tool | None:
         """Get tool by name."""
@@ -52,6 +64,9 @@ class ToolManager:
         icons: list[Icon] | None = None,
         meta: dict[str, Any] | None = None,
         structured_output: bool | None = None,
+        executor: ToolExecutor = "thread",
+        cache: bool | None = None,
+        coalesce: bool | None = None,
     ) -> Tool:
         """Add a tool to the server."""
         tool = Tool.from_function(
@@ -63,6 +78,9 @@ class ToolManager:
             icons=icons,
             meta=meta,
             structured_output=structured_output,
+            executor=executor,
+            cache=cache,
+            coalesce=coalesce,
         )
         existing = self._tools.get(tool.name)
         if existing:
@@ -77,6 +95,7 @@ class ToolManager:
         if name not in self._tools:
             raise ToolError(f"Unknown tool: {name}")
         del self._tools[name]
+        self.invalidate_cache(name)
 
     async def call_tool(
         self,
@@ -90,4 +109,28 @@ class ToolManager:
         if not tool:
             raise ToolError(f"Unknown tool: {name}")
 
-        return await tool.run(arguments, context=context, convert_result=convert_result)
+        return await tool.run(
+            arguments,
+            context=context,
+            convert_result=convert_result,
+            thread_pool=self.thread_pool,
+            process_pool=self.process_pool,
+            cache=self.cache,
+            single_flight=self.single_flight,
+        )
+
+    def invalidate_cache(self, name: str | None = None, arguments: dict[str, Any] | None = None) -> int:
+        """Drop cached tool results, returning how many were dropped.
+
+        Drops the result of calling tool `name` with `arguments` if both are given,
+        every result of tool `name` if only it is given, and every result otherwise.
+        """
+        if self.cache is None:
+            return 0
+        if name is None or arguments is None:
+            return self.cache.invalidate(name)
+        tool = self.get_tool(name)
+        if not tool:
+            raise ToolError(f"Unknown tool: {name}")
+        key = self.cache.key(name, tool.fn_metadata.parse_arguments(arguments))
+        return self.cache.invalidate(key=key) if key is not None else 0
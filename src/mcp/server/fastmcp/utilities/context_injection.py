@@ -12,7 +12,8 @@ def find_context_parameter(fn: Callable[..., Any]) -> str | None:
     """Find the parameter that should receive the Context object.
 
     Searches through the function's signature to find a parameter
-    with a Context type annotation.
+    with a Context type annotation, or a ProcessContext one for tools
+    run in worker processes.
 
     Args:
         fn: The function to inspect
@@ -21,6 +22,9 @@ def find_context_parameter(fn: Callable[..., Any]) -> str | None:
         The name of the context parameter, or None if not found
     """
     from mcp.server.fastmcp.server import Context
+    from mcp.server.fastmcp.utilities.process_pool import ProcessContext
+
+    context_types = (Context, ProcessContext)
 
     # Get type hints to properly resolve string annotations
     try:
@@ -31,17 +35,56 @@ def find_context_parameter(fn: Callable[..., Any]) -> str | None:
 
     # Check each parameter's type hint
     for param_name, annotation in hints.items():
-        # Handle direct Context type
-        if inspect.isclass(annotation) and issubclass(annotation, Context):
+        if _context_class(annotation, context_types) is not None:
             return param_name
 
-        # Handle generic types like Optional[Context]
-        origin = typing.get_origin(annotation)
-        if origin is not None:
-            args = typing.get_args(annotation)
-            for arg in args:
-                if inspect.isclass(arg) and issubclass(arg, Context):
-                    return param_name
+    return None
+
+
+def check_context_parameter(
+    fn: Callable[..., Any], context_kwarg: str | None, owner: str, in_process: bool = False
+) -> None:
+    """Check that the context parameter of a function takes the context it will receive.
+
+    Args:
+        fn: The function to inspect
+        context_kwarg: The name of the context parameter, if any
+        owner: Description of the tool, prompt or template, for the error message
+        in_process: Whether the function runs in a worker process, receiving a
+            ProcessContext rather than a Context
+
+    Raises:
+        ValueError: If the parameter is annotated with another context class
+    """
+    from mcp.server.fastmcp.server import Context
+    from mcp.server.fastmcp.utilities.process_pool import ProcessContext
+
+    if context_kwarg is None:
+        return
+    try:
+        annotation = typing.get_type_hints(fn).get(context_kwarg)
+    except Exception:
+        return
+    context_type = ProcessContext if in_process else Context
+    found = _context_class(annotation, (Context, ProcessContext))
+    if found is not None and not issubclass(found, context_type):
+        raise ValueError(
+            f"{owner} receives a {context_type.__name__}, "
+            f"but its parameter {context_kwarg!r} is annotated as a {found.__name__}"
+        )
+
+
+def _context_class(annotation: Any, context_types: tuple[type, ...]) -> type | None:
+    """Return the context class an annotation names, directly or in a generic such as Optional."""
+    # Handle direct Context type
+    if inspect.isclass(annotation) and issubclass(annotation, context_types):
+        return annotation
+
+    # Handle generic types like Optional[Context]
+    if typing.get_origin(annotation) is not None:
+        for arg in typing.get_args(annotation):
+            if inspect.isclass(arg) and issubclass(arg, context_types):
+                return arg
 
     return None
 
@@ -3,7 +3,7 @@ import json
 from collections.abc import Awaitable, Callable, Sequence
 from itertools import chain
 from types import GenericAlias
-from typing import Annotated, Any, ForwardRef, cast, get_args, get_origin, get_type_hints
+from typing import Annotated, Any, ClassVar, ForwardRef, cast, get_args, get_origin, get_type_hints
 
 import pydantic_core
 from pydantic import (
@@ -21,11 +21,16 @@ from pydantic_core import PydanticUndefined
 
 from mcp.server.fastmcp.exceptions import InvalidSignature
 from mcp.server.fastmcp.utilities.logging import get_logger
+from mcp.server.fastmcp.utilities.thread_pool import WorkerThreadPool
 from mcp.server.fastmcp.utilities.types import Audio, Image
 from mcp.types import ContentBlock, TextContent
 
 logger = get_logger(__name__)
 
+# After whitespace, JSON that parses to a list, dict or None, the values kept by
+# `FuncMetadata.pre_parse_json`, starts with one of these
+_PRE_PARSED_JSON_STARTS = frozenset("[{n")
+
 
 class StrictJsonSchema(GenerateJsonSchema):
     """A JSON schema generator that raises exceptions instead of emitting warnings.
@@ -41,18 +46,33 @@ class StrictJsonSchema(GenerateJsonSchema):
 class ArgModelBase(BaseModel):
     """A model representing the arguments to a function."""
 
+    # The validation plan of the model, built once when it is created rather than on every call
+    _pre_parse_keys: ClassVar[frozenset[str]] = frozenset()
+    """Argument names and aliases of the fields whose values may be pre-parsed from JSON."""
+    _output_names: ClassVar[tuple[tuple[str, str], ...]] = ()
+    """The field name and keyword argument name of each field."""
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        pre_parse_keys: set[str] = set()
+        for field_name, field_info in cls.model_fields.items():
+            if field_info.annotation is not str:
+                pre_parse_keys.add(field_name)
+                if field_info.alias:
+                    pre_parse_keys.add(field_info.alias)
+        cls._pre_parse_keys = frozenset(pre_parse_keys)
+        # Use the alias if it exists, otherwise use the field name
+        cls._output_names = tuple(
+            (field_name, field_info.alias or field_name) for field_name, field_info in cls.model_fields.items()
+        )
+
     def model_dump_one_level(self) -> dict[str, Any]:
         """Return a dict of the model's fields, one level deep.
 
         That is, sub-models etc are not dumped - they are kept as pydantic models.
         """
-        kwargs: dict[str, Any] = {}
-        for field_name, field_info in self.__class__.model_fields.items():
-            value = getattr(self, field_name)
-            # Use the alias if it exists, otherwise use the field name
-            output_name = field_info.alias if field_info.alias else field_name
-            kwargs[output_name] = value
-        return kwargs
+        return {output_name: getattr(self, field_name) for field_name, output_name in self._output_names}
 
     model_config = ConfigDict(
         arbitrary_types_allowed=True,
@@ -71,22 +91,48 @@ class FuncMetadata(BaseModel):
         fn_is_async: bool,
         arguments_to_validate: dict[str, Any],
         arguments_to_pass_directly: dict[str, Any] | None,
+        thread_pool: WorkerThreadPool | None = None,
     ) -> Any:
         """Call the given function with arguments validated and injected.
 
         Arguments are first attempted to be parsed from JSON, then validated against
-        the argument model, before being passed to the function.
+        the argument model, before being passed to the function. A synchronous
+        function runs on a thread of `thread_pool` if given, else on the event loop.
         """
-        arguments_pre_parsed = self.pre_parse_json(arguments_to_validate)
-        arguments_parsed_model = self.arg_model.model_validate(arguments_pre_parsed)
-        arguments_parsed_dict = arguments_parsed_model.model_dump_one_level()
-
+        arguments_parsed_dict = self.validate_arguments(arguments_to_validate)
         arguments_parsed_dict |= arguments_to_pass_directly or {}
+        return await self.call_fn(fn, fn_is_async, arguments_parsed_dict, thread_pool)
 
+    async def call_fn(
+        self,
+        fn: Callable[..., Any | Awaitable[Any]],
+        fn_is_async: bool,
+        arguments: dict[str, Any],
+        thread_pool: WorkerThreadPool | None = None,
+    ) -> Any:
+        """Call the given function with arguments that are already validated and injected."""
         if fn_is_async:
-            return await fn(**arguments_parsed_dict)
+            return await fn(**arguments)
+        elif thread_pool is not None:
+            return await thread_pool.run_sync(fn, **arguments)
         else:
-            return fn(**arguments_parsed_dict)
+            return fn(**arguments)
+
+    def parse_arguments(self, arguments_to_validate: dict[str, Any]) -> ArgModelBase:
+        """Pre-parse arguments from JSON and validate them against the argument model."""
+        arg_model = self.arg_model
+        pre_parse_keys = arg_model._pre_parse_keys  # pyright: ignore[reportPrivateUsage]
+        # Arguments are copied and pre-parsed only if one of them may be pre-parsed,
+        # otherwise they are validated as they are
+        for key, value in arguments_to_validate.items():
+            if isinstance(value, str) and key in pre_parse_keys and value.lstrip()[:1] in _PRE_PARSED_JSON_STARTS:
+                arguments_to_validate = self.pre_parse_json(arguments_to_validate)
+                break
+        return arg_model.model_validate(arguments_to_validate)
+
+    def validate_arguments(self, arguments_to_validate: dict[str, Any]) -> dict[str, Any]:
+        """Validate arguments against the argument model, returning the keyword arguments of the function."""
+        return self.parse_arguments(arguments_to_validate).model_dump_one_level()
 
     def convert_result(self, result: Any) -> Any:
         """
@@ -131,20 +177,12 @@ class FuncMetadata(BaseModel):
         """
         new_data = data.copy()  # Shallow copy
 
-        # Build a mapping from input keys (including aliases) to field info
-        key_to_field_info: dict[str, FieldInfo] = {}
-        for field_name, field_info in self.arg_model.model_fields.items():
-            # Map both the field name and its alias (if any) to the field info
-            key_to_field_info[field_name] = field_info
-            if field_info.alias:
-                key_to_field_info[field_info.alias] = field_info
-
+        pre_parse_keys = self.arg_model._pre_parse_keys  # pyright: ignore[reportPrivateUsage]
         for data_key, data_value in data.items():
-            if data_key not in key_to_field_info:
-                continue
-
-            field_info = key_to_field_info[data_key]
-            if isinstance(data_value, str) and field_info.annotation is not str:
+            # Only values of fields, by name or alias, that are not strings are pre-parsed
+            if isinstance(data_value, str) and data_key in pre_parse_keys:
+                if data_value.lstrip()[:1] not in _PRE_PARSED_JSON_STARTS:
+                    continue  # Not JSON, or JSON for a string, number or bool - skip
                 try:
                     pre_parsed = json.loads(data_value)
                 except json.JSONDecodeError:
@@ -0,0 +1,300 @@
+"""
+Worker processes for CPU-bound FastMCP tools.
+
+Worker threads do not help a tool that computes in Python, because the GIL runs one
+thread at a time. A tool registered with `executor="process"` runs in a worker
+process of a `WorkerProcessPool` instead, so that as many such tools as there are
+processes compute at once.
+
+The function and its validated arguments are pickled to the worker, so the function
+must be importable by name, e.g. defined at module level, and its arguments and result
+must be picklable. In place of a `Context`, the function takes a parameter annotated
+with `ProcessContext`, whose progress and log methods are synchronous and are forwarded
+to the request's `Context` in the server process. When the request is cancelled, the
+worker running it is terminated, and a new one is started when it is next needed.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import pickle
+import signal
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from multiprocessing.connection import Connection
+from multiprocessing.context import BaseContext
+from multiprocessing.process import BaseProcess
+from typing import TYPE_CHECKING, Any, Literal, cast
+
+import anyio
+import anyio.to_thread
+
+from mcp.server.metrics import render_metric
+
+if TYPE_CHECKING:
+    from mcp.server.fastmcp.server import Context
+
+
+class ProcessContext:
+    """
+    Stands in for `Context` in a worker process.
+
+    Progress and log messages are sent to the server process, which sends them to the
+    client through the `Context` of the request.
+    """
+
+    def __init__(self, connection: Connection) -> None:
+        self._connection = connection
+
+    def report_progress(self, progress: float, total: float | None = None, message: str | None = None) -> None:
+        """Report progress for the current operation."""
+        self._connection.send(("progress", (progress, total, message)))
+
+    def log(
+        self,
+        level: Literal["debug", "info", "warning", "error"],
+        message: str,
+        *,
+        logger_name: str | None = None,
+    ) -> None:
+        """Send a log message to the client."""
+        self._connection.send(("log", (level, message, logger_name)))
+
+    def debug(self, message: str) -> None:
+        """Send a debug log message."""
+        self.log("debug", message)
+
+    def info(self, message: str) -> None:
+        """Send an info log message."""
+        self.log("info", message)
+
+    def warning(self, message: str) -> None:
+        """Send a warning log message."""
+        self.log("warning", message)
+
+    def error(self, message: str) -> None:
+        """Send an error log message."""
+        self.log("error", message)
+
+
+@dataclass(frozen=True)
+class WorkerProcessPoolStats:
+    """Point-in-time usage of a `WorkerProcessPool`."""
+
+    max_processes: int
+    """Calls that may run at once."""
+    processes: int
+    """Worker processes started and not terminated."""
+    busy: int
+    """Calls running in a worker process."""
+    waiting: int
+    """Calls waiting for a worker process because the pool is saturated."""
+    completed: int
+    """Calls that have returned or raised."""
+    terminated: int
+    """Worker processes terminated because their call was cancelled or they exited."""
+
+    def render_prometheus(self) -> str:
+        """Render the pool usage in the Prometheus text exposition format."""
+        return (
+            render_metric("mcp_worker_processes", "Worker processes running tools.", "gauge", [({}, self.processes)])
+            + render_metric(
+                "mcp_worker_processes_busy", "Tool calls running in a worker process.", "gauge", [({}, self.busy)]
+            )
+            + render_metric(
+                "mcp_worker_processes_waiting",
+                "Tool calls waiting for a worker process.",
+                "gauge",
+                [({}, self.waiting)],
+            )
+            + render_metric(
+                "mcp_worker_process_calls_total",
+                "Tool calls completed in worker processes.",
+                "counter",
+                [({}, self.completed)],
+            )
+            + render_metric(
+                "mcp_worker_processes_terminated_total",
+                "Worker processes terminated by cancellation or exit.",
+                "counter",
+                [({}, self.terminated)],
+            )
+        )
+
+
+@dataclass
+class _Worker:
+    process: BaseProcess
+    connection: Connection
+    receiving: threading.Lock = field(default_factory=threading.Lock)
+    """Held by the thread reading the pipe, which may outlive a cancelled call."""
+
+
+class WorkerProcessPool:
+    """
+    A bounded pool of worker processes for CPU-bound functions.
+
+    Worker processes are started when first needed and reused afterwards. They are
+    daemon processes, so they exit with the server; `aclose()` or `close()` stops them
+    earlier. FastMCP closes its pool when its HTTP app or stdio server shuts down.
+
+    Args:
+        max_processes: Calls that may run at once, each in its own process. Defaults
+            to the number of CPUs.
+        mp_context: The multiprocessing context starting the workers. Defaults to the
+            "spawn" context, which is safe to use from a process running threads.
+    """
+
+    def __init__(self, max_processes: int | None = None, mp_context: BaseContext | None = None) -> None:
+        if max_processes is None:
+            max_processes = os.cpu_count() or 1
+        if max_processes < 1:
+            raise ValueError(f"max_processes must be at least 1, got {max_processes}")
+        self.max_processes = max_processes
+        self._mp_context = mp_context or multiprocessing.get_context("spawn")
+        self._limiter = anyio.CapacityLimiter(max_processes)
+        # Threads waiting on the pipes of busy workers
+        self._pipe_limiter = anyio.CapacityLimiter(max_processes)
+        self._idle: list[_Worker] = []
+        self._processes = 0
+        self._completed = 0
+        self._terminated = 0
+
+    async def run(
+        self,
+        fn: Callable[..., Any],
+        kwargs: dict[str, Any],
+        *,
+        context: Context[Any, Any, Any] | None = None,
+        context_kwarg: str | None = None,
+    ) -> Any:
+        """
+        Call a function with keyword arguments in a worker process.
+
+        If `context_kwarg` is given, the function receives a `ProcessContext` as that
+        argument, forwarding progress and log messages to `context`.
+        """
+        task = pickle.dumps((fn, kwargs, context_kwarg), protocol=pickle.HIGHEST_PROTOCOL)
+        async with self._limiter:
+            worker = self._idle.pop() if self._idle else await self._start_worker()
+            try:
+                kind, payload = await self._call(worker, task, context)
+            except BaseException:
+                # Cancelled, or the worker died: it may be in the middle of the call
+                with anyio.CancelScope(shield=True):
+                    await self._terminate(worker)
+                raise
+            finally:
+                self._completed += 1
+            self._idle.append(worker)
+        if kind == "error":
+            raise payload
+        return payload
+
+    def stats(self) -> WorkerProcessPoolStats:
+        """Return the current usage of the pool."""
+        limiter = self._limiter.statistics()
+        return WorkerProcessPoolStats(
+            max_processes=self.max_processes,
+            processes=self._processes,
+            busy=limiter.borrowed_tokens,
+            waiting=limiter.tasks_waiting,
+            completed=self._completed,
+            terminated=self._terminated,
+        )
+
+    def close(self) -> None:
+        """Stop the idle worker processes. Busy workers stop when their call ends or is cancelled."""
+        _stop_workers(self._take_idle())
+
+    async def aclose(self) -> None:
+        """Stop the idle worker processes like `close()`, waiting for them on a worker thread."""
+        await anyio.to_thread.run_sync(_stop_workers, self._take_idle())
+
+    def _take_idle(self) -> list[_Worker]:
+        idle, self._idle = self._idle, []
+        self._processes -= len(idle)
+        return idle
+
+    async def _start_worker(self) -> _Worker:
+        connection, child_connection = self._mp_context.Pipe()
+        process = cast(
+            BaseProcess,
+            self._mp_context.Process(  # type: ignore[attr-defined]
+                target=_worker_main, args=(child_connection,), name="mcp-tool-worker", daemon=True
+            ),
+        )
+        # Once started, the worker must be tracked even if the call is cancelled meanwhile
+        with anyio.CancelScope(shield=True):
+            await anyio.to_thread.run_sync(process.start)
+        child_connection.close()
+        self._processes += 1
+        return _Worker(process, connection)
+
+    async def _call(self, worker: _Worker, task: bytes, context: Context[Any, Any, Any] | None) -> tuple[str, Any]:
+        """Send a call to a worker, forwarding its messages until it returns the result or error."""
+        await anyio.to_thread.run_sync(worker.connection.send_bytes, task, limiter=self._pipe_limiter)
+
+        def receive() -> tuple[str, Any]:
+            with worker.receiving:
+                return worker.connection.recv()
+
+        while True:
+            try:
+                kind, payload = await anyio.to_thread.run_sync(
+                    receive, abandon_on_cancel=True, limiter=self._pipe_limiter
+                )
+            except EOFError:
+                raise RuntimeError("The worker process running the tool exited unexpectedly") from None
+            if kind == "progress":
+                if context is not None:
+                    await context.report_progress(*payload)
+            elif kind == "log":
+                if context is not None:
+                    level, message, logger_name = payload
+                    await context.log(level, message, logger_name=logger_name)
+            else:
+                return kind, payload
+
+    async def _terminate(self, worker: _Worker) -> None:
+        worker.process.terminate()
+        await anyio.to_thread.run_sync(worker.process.join)
+        # A read abandoned by a cancelled call sees EOF now that the worker has exited;
+        # closing the pipe under it could let a new pipe reuse its file descriptor
+        await anyio.to_thread.run_sync(worker.receiving.acquire)
+        worker.connection.close()
+        self._processes -= 1
+        self._terminated += 1
+
+
+def _stop_workers(workers: list[_Worker]) -> None:
+    for worker in workers:
+        # The worker exits once its end of the pipe is closed
+        worker.connection.close()
+        worker.process.join(timeout=5)
+        if worker.process.is_alive():
+            worker.process.terminate()
+
+
+def _worker_main(connection: Connection) -> None:
+    # Interrupting the server stops its workers; they do not handle the interrupt themselves
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    while True:
+        try:
+            task = connection.recv_bytes()
+        except EOFError:
+            return
+        try:
+            fn, kwargs, context_kwarg = pickle.loads(task)
+            if context_kwarg is not None:
+                kwargs[context_kwarg] = ProcessContext(connection)
+            result: tuple[str, Any] = ("result", fn(**kwargs))
+        except Exception as e:
+            result = ("error", e)
+        try:
+            connection.send(result)
+        except Exception as e:
+            # The result or the exception could not be pickled
+            connection.send(("error", RuntimeError(f"Could not send the {result[0]} of the tool: {e!r}")))
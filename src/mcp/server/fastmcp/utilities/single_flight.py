@@ -0,0 +1,82 @@
+"""
+Coalescing of identical concurrent calls.
+
+When many sessions call the same expensive tool with the same arguments, or read the
+same resource, at the same time, `SingleFlight` runs the call once and gives its
+result, or its exception, to every caller that asked while it was running.
+FastMCP keys calls on the principal the request is authenticated as too, so calls
+of different users are never coalesced.
+
+The call runs in a task of the caller that started it, shielded from that caller's
+cancellation: a caller that is cancelled stops waiting, but the call goes on while
+others wait for it. Only when every caller has been cancelled is the call cancelled
+too. The caller that started it returns once the call has finished or been cancelled.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass, field
+from typing import Any, Generic, TypeVar
+
+import anyio
+
+K = TypeVar("K", bound=Hashable)
+T = TypeVar("T")
+
+
+@dataclass
+class _Flight:
+    done: anyio.Event = field(default_factory=anyio.Event)
+    scope: anyio.CancelScope = field(default_factory=lambda: anyio.CancelScope(shield=True))
+    waiters: int = 0
+    result: Any = None
+    error: BaseException | None = None
+
+
+class SingleFlight(Generic[K]):
+    """Shares one execution of a call among the concurrent callers with the same key."""
+
+    def __init__(self) -> None:
+        self._flights: dict[K, _Flight] = {}
+        self.coalesced = 0
+        """Calls that were given the result of a call another caller started."""
+
+    async def run(self, key: K, fn: Callable[[], Awaitable[T]]) -> T:
+        """Call `fn`, unless a call with the same key is running, and return its result."""
+        flight = self._flights.get(key)
+        if flight is not None:
+            self.coalesced += 1
+            await self._wait(key, flight)
+        else:
+            flight = self._flights[key] = _Flight()
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(self._execute, key, flight, fn)
+                await self._wait(key, flight)
+        if flight.error is not None:
+            raise flight.error
+        return flight.result
+
+    async def _execute(self, key: K, flight: _Flight, fn: Callable[[], Awaitable[Any]]) -> None:
+        try:
+            with flight.scope:
+                flight.result = await fn()
+        except Exception as e:
+            flight.error = e
+        finally:
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+            flight.done.set()
+
+    async def _wait(self, key: K, flight: _Flight) -> None:
+        flight.waiters += 1
+        try:
+            await flight.done.wait()
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.done.is_set():
+                # Every caller was cancelled, so the result is no longer wanted. Later
+                # callers start a new call rather than joining the cancelled one.
+                if self._flights.get(key) is flight:
+                    del self._flights[key]
+                flight.scope.cancel()
@@ -0,0 +1,93 @@
+"""
+Worker threads for synchronous FastMCP tools, resource templates and prompts.
+
+A synchronous function called on the event loop blocks every session of the process
+until it returns. FastMCP runs them on worker threads instead, at most `max_threads`
+at once; further calls wait for a thread. The call runs in a copy of the caller's
+context, so context variables such as the current request are visible in the thread.
+A `Context` passed to the function can be used from the thread through
+`anyio.from_thread.run()`, e.g. `anyio.from_thread.run(ctx.info, "working")`.
+"""
+
+from __future__ import annotations
+
+import functools
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+import anyio
+import anyio.to_thread
+
+from mcp.server.metrics import render_metric
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class WorkerThreadPoolStats:
+    """Point-in-time usage of a `WorkerThreadPool`."""
+
+    max_threads: int
+    """Calls that may run at once."""
+    busy: int
+    """Calls running on a worker thread."""
+    waiting: int
+    """Calls waiting for a worker thread because the pool is saturated."""
+    completed: int
+    """Calls that have returned or raised."""
+
+    def render_prometheus(self) -> str:
+        """Render the pool usage in the Prometheus text exposition format."""
+        return (
+            render_metric(
+                "mcp_worker_threads", "Synchronous calls that may run at once.", "gauge", [({}, self.max_threads)]
+            )
+            + render_metric(
+                "mcp_worker_threads_busy", "Synchronous calls running on a worker thread.", "gauge", [({}, self.busy)]
+            )
+            + render_metric(
+                "mcp_worker_threads_waiting",
+                "Synchronous calls waiting for a worker thread.",
+                "gauge",
+                [({}, self.waiting)],
+            )
+            + render_metric(
+                "mcp_worker_thread_calls_total",
+                "Synchronous calls completed on worker threads.",
+                "counter",
+                [({}, self.completed)],
+            )
+        )
+
+
+class WorkerThreadPool:
+    """
+    A bounded pool of worker threads for synchronous functions.
+
+    Args:
+        max_threads: Calls that may run at once.
+    """
+
+    def __init__(self, max_threads: int = 40) -> None:
+        if max_threads < 1:
+            raise ValueError(f"max_threads must be at least 1, got {max_threads}")
+        self._limiter = anyio.CapacityLimiter(max_threads)
+        self._completed = 0
+
+    async def run_sync(self, fn: Callable[..., T], /, **kwargs: Any) -> T:
+        """Call a synchronous function with keyword arguments on a worker thread."""
+        try:
+            return await anyio.to_thread.run_sync(functools.partial(fn, **kwargs), limiter=self._limiter)
+        finally:
+            self._completed += 1
+
+    def stats(self) -> WorkerThreadPoolStats:
+        """Return the current usage of the pool."""
+        limiter = self._limiter.statistics()
+        return WorkerThreadPoolStats(
+            max_threads=int(limiter.total_tokens),
+            busy=limiter.borrowed_tokens,
+            waiting=limiter.tasks_waiting,
+            completed=self._completed,
+        )
@@ -0,0 +1,155 @@
+"""
+Buffered log notifications for a server session.
+
+`ServerSession.send_log_message()` serializes and writes a notification for every log
+message as it happens. A `LogSink` buffers messages instead and sends whatever has
+accumulated every `flush_interval` seconds, as one JSON-RPC batch per related request.
+
+A sink can also be attached to stdlib loggers with `LogSink.handler()`. The handler only
+appends to the buffer, so logging from a worker thread never waits for the event loop.
+
+Example:
+```
+    @server.call_tool()
+    async def handle_call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
+        ctx = server.request_context
+        async with LogSink(ctx.session) as sink:
+            logging.getLogger("my_tool").addHandler(sink.handler())
+            ...
+```
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import deque
+from dataclasses import dataclass
+from types import TracebackType
+from typing import Any
+
+import anyio
+from anyio.abc import TaskGroup
+from typing_extensions import Self
+
+import mcp.types as types
+from mcp.server.session import ServerSession
+
+# Stdlib levels mapped to the least severe MCP level they correspond to
+_STDLIB_LEVELS: list[tuple[int, types.LoggingLevel]] = [
+    (logging.CRITICAL, "critical"),
+    (logging.ERROR, "error"),
+    (logging.WARNING, "warning"),
+    (logging.INFO, "info"),
+]
+
+
+def _to_logging_level(levelno: int) -> types.LoggingLevel:
+    for threshold, level in _STDLIB_LEVELS:
+        if levelno >= threshold:
+            return level
+    return "debug"
+
+
+@dataclass
+class _BufferedLog:
+    level: types.LoggingLevel
+    data: Any
+    logger: str | None
+    related_request_id: types.RequestId | None
+
+
+class LogSink:
+    """Buffers log messages for a session and sends them in batches.
+
+    Messages below the level the client set with logging/setLevel are dropped when they
+    are emitted. When `max_buffered` messages are waiting, further messages are dropped
+    and counted in `dropped`. Use the sink as an async context manager; remaining
+    messages are sent on exit.
+    """
+
+    def __init__(self, session: ServerSession, *, flush_interval: float = 0.1, max_buffered: int = 10_000) -> None:
+        self.session = session
+        self.flush_interval = flush_interval
+        self.max_buffered = max_buffered
+        self.dropped = 0
+        # deque appends and pops are thread-safe, which the stdlib handler relies on
+        self._buffer: deque[_BufferedLog] = deque()
+        self._task_group: TaskGroup | None = None
+
+    def emit(
+        self,
+        level: types.LoggingLevel,
+        data: Any,
+        logger: str | None = None,
+        related_request_id: types.RequestId | None = None,
+    ) -> None:
+        """Buffer a log message. Never blocks, and may be called from any thread."""
+        if not self.session.is_log_level_enabled(level):
+            return
+        if len(self._buffer) >= self.max_buffered:
+            self.dropped += 1
+            return
+        self._buffer.append(_BufferedLog(level, data, logger, related_request_id))
+
+    async def flush(self) -> None:
+        """Send every buffered message, batching consecutive messages for the same request."""
+        while self._buffer:
+            first = self._buffer.popleft()
+            related_request_id = first.related_request_id
+            notifications = [self._notification(first)]
+            while self._buffer and self._buffer[0].related_request_id == related_request_id:
+                notifications.append(self._notification(self._buffer.popleft()))
+            await self.session.send_notifications(notifications, related_request_id)
+
+    def handler(self, level: int = logging.NOTSET) -> logging.Handler:
+        """Create a stdlib logging handler that emits records to this sink."""
+        return _LogSinkHandler(self, level)
+
+    async def __aenter__(self) -> Self:
+        task_group = anyio.create_task_group()
+        await task_group.__aenter__()
+        task_group.start_soon(self._flush_periodically)
+        self._task_group = task_group
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> bool | None:
+        assert self._task_group is not None
+        self._task_group.cancel_scope.cancel()
+        result = await self._task_group.__aexit__(exc_type, exc_val, exc_tb)
+        self._task_group = None
+        await self.flush()
+        return result
+
+    async def _flush_periodically(self) -> None:
+        while True:
+            await anyio.sleep(self.flush_interval)
+            await self.flush()
+
+    @staticmethod
+    def _notification(log: _BufferedLog) -> types.ServerNotification:
+        return types.ServerNotification(
+            types.LoggingMessageNotification(
+                params=types.LoggingMessageNotificationParams(level=log.level, data=log.data, logger=log.logger),
+            )
+        )
+
+
+class _LogSinkHandler(logging.Handler):
+    def __init__(self, sink: LogSink, level: int) -> None:
+        super().__init__(level)
+        self.sink = sink
+
+    def emit(self, record: logging.LogRecord) -> None:
+        level = _to_logging_level(record.levelno)
+        # Skip formatting records the client would never see
+        if not self.sink.session.is_log_level_enabled(level):
+            return
+        try:
+            self.sink.emit(level, self.format(record), logger=record.name)
+        except Exception:
+            self.handleError(record)
@@ -1,3 +1,4 @@
+from .admission import AdmissionStats, ConcurrencyLimits
 from .server import NotificationOptions, Server
 
-__all__ = ["Server", "NotificationOptions"]
+__all__ = ["Server", "NotificationOptions", "ConcurrencyLimits", "AdmissionStats"]
@@ -0,0 +1,195 @@
+"""
+Admission control for incoming requests.
+
+By default `Server.run()` starts a task for every incoming request. When concurrency
+limits are configured, requests beyond the limits wait in a bounded per-session
+queue, and requests that do not fit in the queue are rejected with a `SERVER_BUSY`
+error. Pings and notifications (including cancellations) never wait for a slot.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import anyio
+
+
+@dataclass
+class ConcurrencyLimits:
+    """Limits on how many requests a server handles at once.
+
+    Attributes:
+        max_concurrent_requests: Requests handled at once across every session run by
+            the server. None means unlimited.
+        max_concurrent_requests_per_session: Requests handled at once within a single
+            session. None means unlimited.
+        max_queued_requests_per_session: Requests of a single session allowed to wait for
+            a free slot. Requests beyond this are rejected with `SERVER_BUSY`.
+    """
+
+    max_concurrent_requests: int | None = None
+    max_concurrent_requests_per_session: int | None = None
+    max_queued_requests_per_session: int = 100
+
+    def __post_init__(self) -> None:
+        for name in ("max_concurrent_requests", "max_concurrent_requests_per_session"):
+            value = getattr(self, name)
+            if value is not None and value < 1:
+                raise ValueError(f"{name} must be at least 1, got {value}")
+        if self.max_queued_requests_per_session < 0:
+            raise ValueError(
+                f"max_queued_requests_per_session must not be negative, got {self.max_queued_requests_per_session}"
+            )
+
+
+@dataclass(frozen=True)
+class AdmissionStats:
+    """Point-in-time admission metrics for a server."""
+
+    active: int
+    """Requests currently holding a slot."""
+    queued: int
+    """Requests currently waiting for a slot."""
+    max_queued: int
+    """Highest number of requests that were waiting at the same time."""
+    admitted: int
+    """Requests that were given a slot, immediately or after waiting."""
+    rejected: int
+    """Requests rejected because their session's queue was full."""
+    wait_time_total: float
+    """Total seconds admitted requests spent waiting for a slot."""
+    wait_time_max: float
+    """Longest time in seconds a single request waited for a slot."""
+
+
+class AdmissionController:
+    """Process-wide admission state shared by every session a server runs."""
+
+    def __init__(self, limits: ConcurrencyLimits) -> None:
+        self.limits = limits
+        # Created lazily so the semaphore belongs to the running event loop's backend.
+        self._semaphore: anyio.Semaphore | None = None
+        self._active = 0
+        self._queued = 0
+        self._max_queued = 0
+        self._admitted = 0
+        self._rejected = 0
+        self._wait_time_total = 0.0
+        self._wait_time_max = 0.0
+
+    def session(self) -> SessionAdmission:
+        """Create the admission state for a new session."""
+        if self._semaphore is None and self.limits.max_concurrent_requests is not None:
+            self._semaphore = anyio.Semaphore(self.limits.max_concurrent_requests)
+        session_limit = self.limits.max_concurrent_requests_per_session
+        return SessionAdmission(
+            self,
+            anyio.Semaphore(session_limit) if session_limit is not None else None,
+            self._semaphore,
+        )
+
+    def stats(self) -> AdmissionStats:
+        return AdmissionStats(
+            active=self._active,
+            queued=self._queued,
+            max_queued=self._max_queued,
+            admitted=self._admitted,
+            rejected=self._rejected,
+            wait_time_total=self._wait_time_total,
+            wait_time_max=self._wait_time_max,
+        )
+
+    def record_enqueued(self) -> None:
+        self._queued += 1
+        self._max_queued = max(self._max_queued, self._queued)
+
+    def record_dequeued(self) -> None:
+        self._queued -= 1
+
+    def record_admitted(self, wait_time: float) -> None:
+        self._active += 1
+        self._admitted += 1
+        self._wait_time_total += wait_time
+        self._wait_time_max = max(self._wait_time_max, wait_time)
+
+    def record_rejected(self) -> None:
+        self._rejected += 1
+
+    def record_released(self) -> None:
+        self._active -= 1
+
+
+class SessionAdmission:
+    """Admission state for a single session.
+
+    A request is admitted with `try_acquire()`, or queued with `try_enqueue()` and then
+    admitted with `acquire_queued()`. Every admitted request must call `release()`.
+    Slots are always taken session-first, then process-wide, so waiters cannot deadlock.
+    """
+
+    def __init__(
+        self,
+        controller: AdmissionController,
+        session_semaphore: anyio.Semaphore | None,
+        process_semaphore: anyio.Semaphore | None,
+    ) -> None:
+        self._controller = controller
+        self._session_semaphore = session_semaphore
+        self._process_semaphore = process_semaphore
+        self.queued = 0
+
+    def try_acquire(self) -> bool:
+        """Take a slot without waiting. Returns False if none is free."""
+        if self._session_semaphore is not None:
+            try:
+                self._session_semaphore.acquire_nowait()
+            except anyio.WouldBlock:
+                return False
+
+        if self._process_semaphore is not None:
+            try:
+                self._process_semaphore.acquire_nowait()
+            except anyio.WouldBlock:
+                if self._session_semaphore is not None:
+                    self._session_semaphore.release()
+                return False
+
+        self._controller.record_admitted(0.0)
+        return True
+
+    def try_enqueue(self) -> bool:
+        """Reserve a place in the wait queue. Returns False if the queue is full."""
+        if self.queued >= self._controller.limits.max_queued_requests_per_session:
+            self._controller.record_rejected()
+            return False
+
+        self.queued += 1
+        self._controller.record_enqueued()
+        return True
+
+    async def acquire_queued(self) -> None:
+        """Wait for a slot for a request previously accepted by `try_enqueue()`."""
+        start = anyio.current_time()
+        try:
+            if self._session_semaphore is not None:
+                await self._session_semaphore.acquire()
+            if self._process_semaphore is not None:
+                try:
+                    await self._process_semaphore.acquire()
+                except BaseException:
+                    if self._session_semaphore is not None:
+                        self._session_semaphore.release()
+                    raise
+        finally:
+            self.queued -= 1
+            self._controller.record_dequeued()
+
+        self._controller.record_admitted(anyio.current_time() - start)
+
+    def release(self) -> None:
+        """Give back the slot held by an admitted request."""
+        self._controller.record_released()
+        if self._process_semaphore is not None:
+            self._process_semaphore.release()
+        if self._session_semaphore is not None:
+            self._session_semaphore.release()
@@ -70,6 +70,7 @@ from __future__ import annotations as _annotations
 import contextvars
 import json
 import logging
+import time
 import warnings
 from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
 from contextlib import AbstractAsyncContextManager, AsyncExitStack, asynccontextmanager
@@ -82,13 +83,17 @@ from pydantic import AnyUrl
 from typing_extensions import TypeVar
 
 import mcp.types as types
+from mcp.server.lowlevel.admission import AdmissionController, AdmissionStats, ConcurrencyLimits, SessionAdmission
 from mcp.server.lowlevel.func_inspection import create_call_wrapper
 from mcp.server.lowlevel.helper_types import ReadResourceContents
+from mcp.server.metrics import MetricsRegistry, is_error_response, request_labels
 from mcp.server.models import InitializationOptions
 from mcp.server.session import ServerSession
 from mcp.shared.context import RequestContext
 from mcp.shared.exceptions import McpError
-from mcp.shared.message import ServerMessageMetadata, SessionMessage
+from mcp.shared.message import ServerMessageMetadata, SessionMessage, SessionMessageBatch
+from mcp.shared.progress import ProgressThrottle
+from mcp.shared.schema_validation import SchemaValidatorCache, validate_instance
 from mcp.shared.session import RequestResponder
 
 logger = logging.getLogger(__name__)
@@ -101,6 +106,10 @@ StructuredContent: TypeAlias = dict[str, Any]
 UnstructuredContent: TypeAlias = Iterable[types.ContentBlock]
 CombinationContent: TypeAlias = tuple[UnstructuredContent, StructuredContent]
 
+# Requests that are never queued behind other requests when concurrency limits apply.
+# Cancellations and other notifications bypass admission control altogether.
+_FAST_LANE_REQUEST_TYPES = (types.PingRequest, types.InitializeRequest)
+
 # This will be properly typed in each Server instance's context
 request_ctx: contextvars.ContextVar[RequestContext[ServerSession, Any, Any]] = contextvars.ContextVar("request_ctx")
 
@@ -142,6 +151,10 @@ class Server(Generic[LifespanResultT, RequestT]):
             [Server[LifespanResultT, RequestT]],
             AbstractAsyncContextManager[LifespanResultT],
         ] = lifespan,
+        concurrency_limits: ConcurrencyLimits | None = None,
+        progress_throttle: ProgressThrottle | None = None,
+        metrics: MetricsRegistry | None = None,
+        lifespan_per_session: bool = False,
     ):
         self.name = name
         self.version = version
@@ -154,6 +167,14 @@ class Server(Generic[LifespanResultT, RequestT]):
         }
         self.notification_handlers: dict[type, Callable[..., Awaitable[None]]] = {}
         self._tool_cache: dict[str, types.Tool] = {}
+        self._input_validators = SchemaValidatorCache()
+        self._output_validators = SchemaValidatorCache()
+        self._admission = AdmissionController(concurrency_limits) if concurrency_limits is not None else None
+        self.progress_throttle = progress_throttle
+        self.metrics = metrics
+        self.lifespan_per_session = lifespan_per_session
+        # The context of the lifespan entered by app_lifespan(), wrapped so None can be a context
+        self._app_lifespan_context: tuple[LifespanResultT] | None = None
         logger.debug("Initializing server %r", name)
 
     def create_initialization_options(
@@ -228,6 +249,42 @@ class Server(Generic[LifespanResultT, RequestT]):
             completions=completions_capability,
         )
 
+    @asynccontextmanager
+    async def app_lifespan(self) -> AsyncIterator[None]:
+        """Run the lifespan once, for all sessions started while this context is active.
+
+        Transports that start many sessions, like the streamable HTTP session manager,
+        enter this once, so that resources opened by the lifespan (database pools,
+        loaded models) are shared by every session instead of being set up per session.
+        Sessions must treat the shared context as read-only. Does nothing if the
+        server was created with `lifespan_per_session=True`, or if the app lifespan
+        is already running.
+        """
+        if self.lifespan_per_session or self._app_lifespan_context is not None:
+            yield
+            return
+
+        async with self.lifespan(self) as lifespan_context:
+            self._app_lifespan_context = (lifespan_context,)
+            try:
+                yield
+            finally:
+                self._app_lifespan_context = None
+
+    @asynccontextmanager
+    async def _session_lifespan(self) -> AsyncIterator[LifespanResultT]:
+        """Yield the app lifespan context if it is running, or run the lifespan for one session."""
+        if self._app_lifespan_context is not None:
+            yield self._app_lifespan_context[0]
+            return
+
+        async with self.lifespan(self) as lifespan_context:
+            yield lifespan_context
+
+    def admission_stats(self) -> AdmissionStats | None:
+        """Queue depth, wait time and rejection counts, if concurrency limits are configured."""
+        return self._admission.stats() if self._admission is not None else None
+
     @property
     def request_context(
         self,
@@ -422,14 +479,16 @@ class Server(Generic[LifespanResultT, RequestT]):
                 if isinstance(result, types.ListToolsResult):
                     # Refresh the tool cache with returned tools
                     for tool in result.tools:
-                        self._tool_cache[tool.name] = tool
+                        self._cache_tool(tool)
                     return types.ServerResult(result)
                 else:
                     # Old style returns list[Tool]
                     # Clear and refresh the entire tool cache
                     self._tool_cache.clear()
+                    self._input_validators.clear()
+                    self._output_validators.clear()
                     for tool in result:
-                        self._tool_cache[tool.name] = tool
+                        self._cache_tool(tool)
                     return types.ServerResult(types.ListToolsResult(tools=result))
 
             self.request_handlers[types.ListToolsRequest] = handler
@@ -437,6 +496,12 @@ class Server(Generic[LifespanResultT, RequestT]):
 
         return decorator
 
+    def _cache_tool(self, tool: types.Tool) -> None:
+        """Cache a tool definition, dropping any validators compiled for a previous version."""
+        self._tool_cache[tool.name] = tool
+        self._input_validators.invalidate(tool.name)
+        self._output_validators.invalidate(tool.name)
+
     def _make_error_result(self, error_message: str) -> types.ServerResult:
         """Create a ServerResult with an error CallToolResult."""
         return types.ServerResult(
@@ -494,7 +559,7 @@ class Server(Generic[LifespanResultT, RequestT]):
                     # input validation
                     if validate_input and tool:
                         try:
-                            jsonschema.validate(instance=arguments, schema=tool.inputSchema)
+                            validate_instance(self._input_validators.get(tool_name, tool.inputSchema), arguments)
                         except jsonschema.ValidationError as e:
                             return self._make_error_result(f"Input validation error: {e.message}")
 
@@ -526,7 +591,8 @@ class Server(Generic[LifespanResultT, RequestT]):
                             )
                         else:
                             try:
-                                jsonschema.validate(instance=maybe_structured_content, schema=tool.outputSchema)
+                                validator = self._output_validators.get(tool_name, tool.outputSchema)
+                                validate_instance(validator, maybe_structured_content)
                             except jsonschema.ValidationError as e:
                                 return self._make_error_result(f"Output validation error: {e.message}")
 
@@ -597,7 +663,7 @@ class Server(Generic[LifespanResultT, RequestT]):
 
     async def run(
         self,
-        read_stream: MemoryObjectReceiveStream[SessionMessage | Exception],
+        read_stream: MemoryObjectReceiveStream[SessionMessage | SessionMessageBatch | Exception],
         write_stream: MemoryObjectSendStream[SessionMessage],
         initialization_options: InitializationOptions,
         # When False, exceptions are returned as messages to the client.
@@ -610,21 +676,51 @@ class Server(Generic[LifespanResultT, RequestT]):
         # the initialization lifecycle, but can do so with any available node
         # rather than requiring initialization for each connection.
         stateless: bool = False,
+        # When True, the write stream accepts SessionMessageBatch items, and
+        # notifications sent together are written as a single JSON-RPC batch.
+        supports_batches: bool = False,
     ):
         async with AsyncExitStack() as stack:
-            lifespan_context = await stack.enter_async_context(self.lifespan(self))
+            lifespan_context = await stack.enter_async_context(self._session_lifespan())
             session = await stack.enter_async_context(
                 ServerSession(
                     read_stream,
                     write_stream,
                     initialization_options,
                     stateless=stateless,
+                    progress_throttle=self.progress_throttle,
+                    metrics=self.metrics,
+                    supports_batches=supports_batches,
                 )
             )
 
+            admission = self._admission.session() if self._admission is not None else None
+
             async with anyio.create_task_group() as tg:
                 async for message in session.incoming_messages:
                     logger.debug("Received message: %s", message)
+                    received_at = time.perf_counter() if self.metrics is not None else None
+
+                    if (
+                        admission is not None
+                        and isinstance(message, RequestResponder)
+                        and not isinstance(message.request.root, _FAST_LANE_REQUEST_TYPES)
+                    ):
+                        queued = await self._admit(message, admission)
+                        if queued is None:
+                            continue
+
+                        tg.start_soon(
+                            self._handle_admitted_message,
+                            message,
+                            admission,
+                            queued,
+                            session,
+                            lifespan_context,
+                            raise_exceptions,
+                            received_at,
+                        )
+                        continue
 
                     tg.start_soon(
                         self._handle_message,
@@ -632,20 +728,112 @@ class Server(Generic[LifespanResultT, RequestT]):
                         session,
                         lifespan_context,
                         raise_exceptions,
+                        received_at,
                     )
 
+    async def handle_stateless_request(
+        self,
+        message: SessionMessage,
+        write_stream: MemoryObjectSendStream[SessionMessage],
+        initialization_options: InitializationOptions,
+        raise_exceptions: bool = False,
+    ) -> None:
+        """Handle a single JSON-RPC request without running a session.
+
+        This is the stateless counterpart of `run()` for transports that handle each
+        request on its own: no receive loop or task group is started. Notifications
+        sent while handling the request, and then the response, are written to
+        `write_stream`.
+
+        Args:
+            message: A message carrying a JSONRPCRequest.
+            write_stream: Stream the notifications and the response are written to.
+            initialization_options: Options used to answer an initialize request.
+            raise_exceptions: As for `run()`.
+        """
+        received_at = time.perf_counter() if self.metrics is not None else None
+        read_stream_writer, read_stream = anyio.create_memory_object_stream[
+            SessionMessage | SessionMessageBatch | Exception
+        ](0)
+        read_stream_writer.close()
+        session = ServerSession(
+            read_stream,
+            write_stream,
+            initialization_options,
+            stateless=True,
+            progress_throttle=self.progress_throttle,
+            metrics=self.metrics,
+        )
+        with read_stream:
+            responder = await session.receive_stateless_request(message)
+        if responder is None:
+            return
+
+        async with self._session_lifespan() as lifespan_context:
+            admission = self._admission.session() if self._admission is not None else None
+            if admission is None or isinstance(responder.request.root, _FAST_LANE_REQUEST_TYPES):
+                await self._handle_message(responder, session, lifespan_context, raise_exceptions, received_at)
+                return
+
+            queued = await self._admit(responder, admission)
+            if queued is not None:
+                await self._handle_admitted_message(
+                    responder, admission, queued, session, lifespan_context, raise_exceptions, received_at
+                )
+
+    async def _admit(
+        self,
+        message: RequestResponder[types.ClientRequest, types.ServerResult],
+        admission: SessionAdmission,
+    ) -> bool | None:
+        """Reserve a slot for a request, returning whether it has to queue for it.
+
+        Returns None, after answering the request with an error, if the server is busy.
+        """
+        if admission.try_acquire():
+            return False
+        if admission.try_enqueue():
+            return True
+        logger.warning("Rejecting request %s: server busy", message.request_id)
+        with message:
+            await message.respond(types.ErrorData(code=types.SERVER_BUSY, message="Server busy"))
+        return None
+
+    async def _handle_admitted_message(
+        self,
+        message: RequestResponder[types.ClientRequest, types.ServerResult],
+        admission: SessionAdmission,
+        queued: bool,
+        session: ServerSession,
+        lifespan_context: LifespanResultT,
+        raise_exceptions: bool,
+        received_at: float | None = None,
+    ):
+        if queued:
+            await admission.acquire_queued()
+        try:
+            # A request cancelled while queued has been answered already
+            if not message.cancelled:
+                await self._handle_message(message, session, lifespan_context, raise_exceptions, received_at)
+        finally:
+            admission.release()
+
     async def _handle_message(
         self,
         message: RequestResponder[types.ClientRequest, types.ServerResult] | types.ClientNotification | Exception,
         session: ServerSession,
         lifespan_context: LifespanResultT,
         raise_exceptions: bool = False,
+        # When metrics are enabled, when the message was received, to record its queue wait
+        received_at: float | None = None,
     ):
         with warnings.catch_warnings(record=True) as w:
             match message:
                 case RequestResponder(request=types.ClientRequest(root=req)) as responder:
                     with responder:
-                        await self._handle_request(message, req, session, lifespan_context, raise_exceptions)
+                        await self._handle_request(
+                            message, req, session, lifespan_context, raise_exceptions, received_at
+                        )
                 case types.ClientNotification(root=notify):
                     await self._handle_notification(notify)
                 case Exception():
@@ -668,8 +856,10 @@ class Server(Generic[LifespanResultT, RequestT]):
         session: ServerSession,
         lifespan_context: LifespanResultT,
         raise_exceptions: bool,
+        received_at: float | None = None,
     ):
         logger.info("Processing request of type %s", type(req).__name__)
+        started_at = time.perf_counter() if self.metrics is not None else 0.0
         if handler := self.request_handlers.get(type(req)):  # type: ignore
             logger.debug("Dispatching request of type %s", type(req).__name__)
 
@@ -708,15 +898,20 @@ class Server(Generic[LifespanResultT, RequestT]):
                 # Reset the global state after we are done
                 if token is not None:
                     request_ctx.reset(token)
-
-            await message.respond(response)
         else:
-            await message.respond(
-                types.ErrorData(
-                    code=types.METHOD_NOT_FOUND,
-                    message="Method not found",
-                )
+            response = types.ErrorData(
+                code=types.METHOD_NOT_FOUND,
+                message="Method not found",
+            )
+
+        if self.metrics is not None:
+            self.metrics.record_request(
+                request_labels(req),
+                started_at - received_at if received_at is not None else 0.0,
+                time.perf_counter() - started_at,
+                is_error_response(response),
             )
+        await message.respond(response)
 
         logger.debug("Response sent")
 
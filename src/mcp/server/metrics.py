@@ -0,0 +1,255 @@
+"""
+Request metrics for MCP servers.
+
+When a `MetricsRegistry` is passed to `Server`, every request is recorded by method
+and, for tools/call, by tool name. The registry records how many requests were
+handled and how many failed. It also records, as histograms, how long each request
+waited before its handler started, how long the handler ran, how long the response
+took to serialize, and how large the response was.
+
+`MetricsRegistry.snapshot()` returns the current values, and
+`MetricsRegistry.render_prometheus()` renders them in the Prometheus text format.
+Recording a request costs a dictionary lookup and a few bisections, so the registry
+can stay enabled in production.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+import mcp.types as types
+from mcp.shared.codec import DEFAULT_CODEC, Codec
+
+DEFAULT_LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+"""Upper bounds in seconds of the queue wait, handler and serialization time histograms."""
+
+DEFAULT_SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+"""Upper bounds in bytes of the response size histogram."""
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+"""Content type of the Prometheus text exposition format."""
+
+OVERFLOW_TOOL_LABEL = "__other__"
+"""Tool label used for new tool names once `max_label_sets` is reached."""
+
+MetricLabels = tuple[str, str | None]
+"""The method of a request and, for tools/call, the tool name."""
+
+
+def request_labels(request: Any) -> MetricLabels:
+    """Return the labels a client request is recorded under."""
+    if isinstance(request, types.CallToolRequest):
+        return request.method, request.params.name
+    return request.method, None
+
+
+def is_error_response(response: types.ServerResult | types.ErrorData) -> bool:
+    """Check whether a response is a JSON-RPC error or a tool result flagged as an error."""
+    if isinstance(response, types.ErrorData):
+        return True
+    return isinstance(response.root, types.CallToolResult) and response.root.isError
+
+
+@dataclass(frozen=True)
+class HistogramSnapshot:
+    """Point-in-time values of a histogram."""
+
+    buckets: tuple[float, ...]
+    """Upper bounds of the buckets, excluding +Inf."""
+    counts: tuple[int, ...]
+    """Observations per bucket (not cumulative). The last entry counts values above every bound."""
+    sum: float
+    count: int
+
+
+@dataclass(frozen=True)
+class RequestMetricsSnapshot:
+    """Point-in-time metrics for one method, or one tool of tools/call."""
+
+    method: str
+    tool: str | None
+    requests: int
+    """Requests whose handler finished, successfully or not."""
+    errors: int
+    """Requests answered with an error, including tool results with isError set."""
+    queue_wait: HistogramSnapshot
+    """Seconds between receiving a request and starting its handler."""
+    handler_time: HistogramSnapshot
+    """Seconds the handler ran."""
+    serialization_time: HistogramSnapshot
+    """Seconds spent serializing the response."""
+    response_size: HistogramSnapshot
+    """Size of the serialized response in bytes."""
+
+
+class Histogram:
+    """A histogram with fixed bucket bounds."""
+
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def snapshot(self) -> HistogramSnapshot:
+        return HistogramSnapshot(self.buckets, tuple(self.counts), self.sum, self.count)
+
+
+class _RequestMetrics:
+    __slots__ = ("requests", "errors", "queue_wait", "handler_time", "serialization_time", "response_size")
+
+    def __init__(self, latency_buckets: tuple[float, ...], size_buckets: tuple[float, ...]) -> None:
+        self.requests = 0
+        self.errors = 0
+        self.queue_wait = Histogram(latency_buckets)
+        self.handler_time = Histogram(latency_buckets)
+        self.serialization_time = Histogram(latency_buckets)
+        self.response_size = Histogram(size_buckets)
+
+
+class MetricsRegistry:
+    """Per-method and per-tool request metrics for a server.
+
+    Args:
+        codec: Codec that responses are serialized with to measure their size. The
+            transport reuses the serialized bytes, so this should match the codec the
+            transports use.
+        max_label_sets: Maximum number of distinct method/tool combinations. Further tool
+            names are recorded under `OVERFLOW_TOOL_LABEL`, so clients calling unknown
+            tools cannot grow the registry without bound.
+    """
+
+    def __init__(
+        self,
+        *,
+        codec: Codec = DEFAULT_CODEC,
+        latency_buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS,
+        size_buckets: tuple[float, ...] = DEFAULT_SIZE_BUCKETS,
+        max_label_sets: int = 1000,
+    ) -> None:
+        self.codec = codec
+        self.latency_buckets = latency_buckets
+        self.size_buckets = size_buckets
+        self.max_label_sets = max_label_sets
+        self._metrics: dict[MetricLabels, _RequestMetrics] = {}
+
+    def _get(self, labels: MetricLabels) -> _RequestMetrics:
+        metrics = self._metrics.get(labels)
+        if metrics is None:
+            if len(self._metrics) >= self.max_label_sets and labels[1] is not None:
+                labels = (labels[0], OVERFLOW_TOOL_LABEL)
+                metrics = self._metrics.get(labels)
+            if metrics is None:
+                metrics = self._metrics[labels] = _RequestMetrics(self.latency_buckets, self.size_buckets)
+        return metrics
+
+    def record_request(self, labels: MetricLabels, queue_wait: float, handler_time: float, error: bool) -> None:
+        """Record a request whose handler has finished."""
+        metrics = self._get(labels)
+        metrics.requests += 1
+        if error:
+            metrics.errors += 1
+        metrics.queue_wait.observe(queue_wait)
+        metrics.handler_time.observe(handler_time)
+
+    def record_response(self, labels: MetricLabels, serialization_time: float, size: int) -> None:
+        """Record the serialization of a response."""
+        metrics = self._get(labels)
+        metrics.serialization_time.observe(serialization_time)
+        metrics.response_size.observe(size)
+
+    def snapshot(self) -> list[RequestMetricsSnapshot]:
+        """Return the current metrics, ordered by method and tool."""
+        return [
+            RequestMetricsSnapshot(
+                method=method,
+                tool=tool,
+                requests=metrics.requests,
+                errors=metrics.errors,
+                queue_wait=metrics.queue_wait.snapshot(),
+                handler_time=metrics.handler_time.snapshot(),
+                serialization_time=metrics.serialization_time.snapshot(),
+                response_size=metrics.response_size.snapshot(),
+            )
+            for (method, tool), metrics in sorted(
+                self._metrics.items(), key=lambda item: (item[0][0], item[0][1] or "")
+            )
+        ]
+
+    def render_prometheus(self) -> str:
+        """Render the current metrics in the Prometheus text exposition format."""
+        return render_prometheus(self.snapshot())
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(snapshot: RequestMetricsSnapshot, extra: str = "") -> str:
+    labels = f'method="{_escape_label(snapshot.method)}"'
+    if snapshot.tool is not None:
+        labels += f',tool="{_escape_label(snapshot.tool)}"'
+    return "{" + labels + extra + "}"
+
+
+def _format_bound(bound: float) -> str:
+    return repr(float(bound))
+
+
+_INF_BUCKET = ',le="+Inf"'
+
+
+_COUNTERS = (
+    ("mcp_requests_total", "Requests handled, by method and tool.", "requests"),
+    ("mcp_request_errors_total", "Requests answered with an error, by method and tool.", "errors"),
+)
+
+_HISTOGRAMS = (
+    ("mcp_request_queue_wait_seconds", "Time between receiving a request and starting its handler.", "queue_wait"),
+    ("mcp_request_handler_seconds", "Time spent in request handlers.", "handler_time"),
+    ("mcp_response_serialization_seconds", "Time spent serializing responses.", "serialization_time"),
+    ("mcp_response_size_bytes", "Size of serialized responses.", "response_size"),
+)
+
+
+def render_prometheus(snapshots: list[RequestMetricsSnapshot]) -> str:
+    """Render metrics snapshots in the Prometheus text exposition format."""
+    lines: list[str] = []
+    for name, help_text, attribute in _COUNTERS:
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} counter")
+        lines.extend(f"{name}{_format_labels(snapshot)} {getattr(snapshot, attribute)}" for snapshot in snapshots)
+
+    for name, help_text, attribute in _HISTOGRAMS:
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} histogram")
+        for snapshot in snapshots:
+            histogram: HistogramSnapshot = getattr(snapshot, attribute)
+            cumulative = 0
+            for bound, count in zip(histogram.buckets, histogram.counts):
+                cumulative += count
+                le = f',le="{_format_bound(bound)}"'
+                lines.append(f"{name}_bucket{_format_labels(snapshot, le)} {cumulative}")
+            lines.append(f"{name}_bucket{_format_labels(snapshot, _INF_BUCKET)} {histogram.count}")
+            lines.append(f"{name}_sum{_format_labels(snapshot)} {histogram.sum}")
+            lines.append(f"{name}_count{_format_labels(snapshot)} {histogram.count}")
+    return "\n".join(lines) + "\n"
+
+
+def render_metric(name: str, help_text: str, kind: str, samples: Sequence[tuple[Mapping[str, str], float]]) -> str:
+    """Render one counter or gauge, given as (labels, value) samples, in the Prometheus text format."""
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+    for labels, value in samples:
+        formatted = ",".join(f'{key}="{_escape_label(label)}"' for key, label in labels.items())
+        lines.append(f"{name}{{{formatted}}} {value}" if formatted else f"{name} {value}")
+    return "\n".join(lines) + "\n"
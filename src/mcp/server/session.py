@@ -37,19 +37,24 @@ The ServerSession class is typically used internally by the Server class and sho
 be instantiated directly by users of the MCP framework.
 """
 
+import time
 from enum import Enum
-from typing import Any, TypeVar
+from typing import Any, TypeVar, get_args
 
 import anyio
 import anyio.lowlevel
 from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
 from pydantic import AnyUrl
+from typing_extensions import Self
 
 import mcp.types as types
+from mcp.server.metrics import MetricLabels, MetricsRegistry, request_labels
 from mcp.server.models import InitializationOptions
-from mcp.shared.message import ServerMessageMetadata, SessionMessage
+from mcp.shared.message import ServerMessageMetadata, SessionMessage, SessionMessageBatch
+from mcp.shared.progress import ProgressThrottle, ProgressThrottler, ProgressUpdate
 from mcp.shared.session import (
     BaseSession,
+    RequestId,
     RequestResponder,
 )
 from mcp.shared.version import SUPPORTED_PROTOCOL_VERSIONS
@@ -63,6 +68,11 @@ class InitializationState(Enum):
 
 ServerSessionT = TypeVar("ServerSessionT", bound="ServerSession")
 
+# LoggingLevel lists the levels from least to most severe
+_LOGGING_LEVEL_SEVERITY: dict[types.LoggingLevel, int] = {
+    level: severity for severity, level in enumerate(get_args(types.LoggingLevel))
+}
+
 ServerRequestResponder = (
     RequestResponder[types.ClientRequest, types.ServerResult] | types.ClientNotification | Exception
 )
@@ -79,18 +89,36 @@ class ServerSession(
 ):
     _initialized: InitializationState = InitializationState.NotInitialized
     _client_params: types.InitializeRequestParams | None = None
+    _logging_level: types.LoggingLevel | None = None
 
     def __init__(
         self,
-        read_stream: MemoryObjectReceiveStream[SessionMessage | Exception],
+        read_stream: MemoryObjectReceiveStream[SessionMessage | SessionMessageBatch | Exception],
         write_stream: MemoryObjectSendStream[SessionMessage],
         init_options: InitializationOptions,
         stateless: bool = False,
+        progress_throttle: ProgressThrottle | None = None,
+        metrics: MetricsRegistry | None = None,
+        supports_batches: bool = False,
     ) -> None:
-        super().__init__(read_stream, write_stream, types.ClientRequest, types.ClientNotification)
+        super().__init__(
+            read_stream,
+            write_stream,
+            types.ClientRequest,
+            types.ClientNotification,
+            supports_batches=supports_batches,
+        )
         self._initialization_state = (
             InitializationState.Initialized if stateless else InitializationState.NotInitialized
         )
+        self._progress_throttler = (
+            ProgressThrottler(progress_throttle, self._send_progress_update) if progress_throttle is not None else None
+        )
+        # Progress tokens of in-flight requests, so held back progress is sent before their response
+        self._request_progress_tokens: dict[RequestId, types.ProgressToken] = {}
+        self._metrics = metrics
+        # Labels of in-flight requests, so their responses are recorded under them
+        self._request_metric_labels: dict[RequestId, MetricLabels] = {}
 
         self._init_options = init_options
         self._incoming_message_stream_writer, self._incoming_message_stream_reader = anyio.create_memory_object_stream[
@@ -98,10 +126,28 @@ class ServerSession(
         ](0)
         self._exit_stack.push_async_callback(lambda: self._incoming_message_stream_reader.aclose())
 
+    async def __aenter__(self) -> Self:
+        await super().__aenter__()
+        if self._progress_throttler is not None:
+            # Runs the timers sending held back progress, and drops what is left on exit
+            await self._exit_stack.enter_async_context(self._progress_throttler)
+        return self
+
     @property
     def client_params(self) -> types.InitializeRequestParams | None:
         return self._client_params
 
+    @property
+    def logging_level(self) -> types.LoggingLevel | None:
+        """The minimum log level the client asked for with logging/setLevel, if it has."""
+        return self._logging_level
+
+    def is_log_level_enabled(self, level: types.LoggingLevel) -> bool:
+        """Check whether a log message at this level would be sent to the client."""
+        return self._logging_level is None or (
+            _LOGGING_LEVEL_SEVERITY[level] >= _LOGGING_LEVEL_SEVERITY[self._logging_level]
+        )
+
     def check_client_capability(self, capability: types.ClientCapabilities) -> bool:
         """Check if the client supports a specific capability."""
         if self._client_params is None:
@@ -139,7 +185,27 @@ class ServerSession(
         async with self._incoming_message_stream_writer:
             await super()._receive_loop()
 
+    async def receive_stateless_request(
+        self, message: SessionMessage
+    ) -> RequestResponder[types.ClientRequest, types.ServerResult] | None:
+        """Accept a request without running the receive loop, to handle it on its own.
+
+        Used by stateless transports that dispatch each request directly. Returns None if
+        the request has already been answered, because it was invalid or was initialize.
+        """
+        assert isinstance(message.message.root, types.JSONRPCRequest)
+        async with self._incoming_message_stream_writer, self._incoming_message_stream_reader:
+            return await self._receive_request(message, message.message.root)
+
     async def _received_request(self, responder: RequestResponder[types.ClientRequest, types.ServerResult]):
+        if self._progress_throttler is not None and responder.request_meta is not None:
+            progress_token = responder.request_meta.progressToken
+            if progress_token is not None:
+                self._request_progress_tokens[responder.request_id] = progress_token
+        # initialize is answered here rather than by a server handler, so it is not recorded
+        if self._metrics is not None and not isinstance(responder.request.root, types.InitializeRequest):
+            self._request_metric_labels[responder.request_id] = request_labels(responder.request.root)
+
         match responder.request.root:
             case types.InitializeRequest(params=params):
                 requested_version = params.protocolVersion
@@ -170,6 +236,9 @@ class ServerSession(
             case _:
                 if self._initialization_state != InitializationState.Initialized:
                     raise RuntimeError("Received request before initialization was complete")
+                if isinstance(responder.request.root, types.SetLevelRequest):
+                    # Enforced by send_log_message; the server's handler still responds
+                    self._logging_level = responder.request.root.params.level
 
     async def _received_notification(self, notification: types.ClientNotification) -> None:
         # Need this to avoid ASYNC910
@@ -188,7 +257,13 @@ class ServerSession(
         logger: str | None = None,
         related_request_id: types.RequestId | None = None,
     ) -> None:
-        """Send a log message notification."""
+        """Send a log message notification.
+
+        Messages below the level the client set with logging/setLevel are dropped.
+        """
+        if not self.is_log_level_enabled(level):
+            return
+
         await self.send_notification(
             types.ServerNotification(
                 types.LoggingMessageNotification(
@@ -297,21 +372,50 @@ class ServerSession(
         message: str | None = None,
         related_request_id: str | None = None,
     ) -> None:
-        """Send a progress notification."""
+        """Send a progress notification.
+
+        If the session was created with a progress throttle, the notification may be held
+        back and coalesced with later updates for the same progress token.
+        """
+        update = ProgressUpdate(progress_token, progress, total, message, related_request_id)
+        if self._progress_throttler is not None:
+            await self._progress_throttler.update(update)
+        else:
+            await self._send_progress_update(update)
+
+    async def _send_progress_update(self, update: ProgressUpdate) -> None:
         await self.send_notification(
             types.ServerNotification(
                 types.ProgressNotification(
                     params=types.ProgressNotificationParams(
-                        progressToken=progress_token,
-                        progress=progress,
-                        total=total,
-                        message=message,
+                        progressToken=update.progress_token,
+                        progress=update.progress,
+                        total=update.total,
+                        message=update.message,
                     ),
                 )
             ),
-            related_request_id,
+            update.related_request_id,
         )
 
+    async def _send_response(self, request_id: RequestId, response: types.ServerResult | types.ErrorData) -> None:
+        # Held back progress must reach the client before the response that ends the request
+        progress_token = self._request_progress_tokens.pop(request_id, None)
+        if progress_token is not None and self._progress_throttler is not None:
+            await self._progress_throttler.flush(progress_token)
+
+        labels = self._request_metric_labels.pop(request_id, None)
+        if self._metrics is None or labels is None:
+            await super()._send_response(request_id, response)
+            return
+
+        # Encode here to time serialization and measure the size; transports reuse the bytes
+        start = time.perf_counter()
+        session_message = self._response_message(request_id, response)
+        size = len(session_message.encode(self._metrics.codec))
+        self._metrics.record_response(labels, time.perf_counter() - start, size)
+        await self._write_stream.send(session_message)
+
     async def send_resource_list_changed(self) -> None:
         """Send a resource list changed notification."""
         await self.send_notification(types.ServerNotification(types.ResourceListChangedNotification()))
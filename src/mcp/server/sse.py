@@ -51,12 +51,12 @@ from starlette.requests import Request
 from starlette.responses import Response
 from starlette.types import Receive, Scope, Send
 
-import mcp.types as types
 from mcp.server.transport_security import (
     TransportSecurityMiddleware,
     TransportSecuritySettings,
 )
-from mcp.shared.message import ServerMessageMetadata, SessionMessage
+from mcp.shared.codec import DEFAULT_CODEC, Codec
+from mcp.shared.message import BatchResponses, ServerMessageMetadata, SessionMessage, SessionMessageBatch
 
 logger = logging.getLogger(__name__)
 
@@ -75,9 +75,16 @@ class SseServerTransport:
 
     _endpoint: str
     _read_stream_writers: dict[UUID, MemoryObjectSendStream[SessionMessage | Exception]]
+    _batch_responses: dict[UUID, BatchResponses]
     _security: TransportSecurityMiddleware
-
-    def __init__(self, endpoint: str, security_settings: TransportSecuritySettings | None = None) -> None:
+    _codec: Codec
+
+    def __init__(
+        self,
+        endpoint: str,
+        security_settings: TransportSecuritySettings | None = None,
+        codec: Codec = DEFAULT_CODEC,
+    ) -> None:
         """
         Creates a new SSE server transport, which will direct the client to POST
         messages to the relative path given.
@@ -86,6 +93,7 @@ class SseServerTransport:
             endpoint: A relative path where messages should be posted
                     (e.g., "/messages/").
             security_settings: Optional security settings for DNS rebinding protection.
+            codec: Codec used to encode and decode messages.
 
         Note:
             We use relative paths instead of full URLs for several reasons:
@@ -115,7 +123,9 @@ class SseServerTransport:
 
         self._endpoint = endpoint
         self._read_stream_writers = {}
+        self._batch_responses = {}
         self._security = TransportSecurityMiddleware(security_settings)
+        self._codec = codec
         logger.debug(f"SseServerTransport initialized with endpoint: {endpoint}")
 
     @asynccontextmanager
@@ -135,14 +145,15 @@ class SseServerTransport:
         read_stream: MemoryObjectReceiveStream[SessionMessage | Exception]
         read_stream_writer: MemoryObjectSendStream[SessionMessage | Exception]
 
-        write_stream: MemoryObjectSendStream[SessionMessage]
-        write_stream_reader: MemoryObjectReceiveStream[SessionMessage]
+        write_stream: MemoryObjectSendStream[SessionMessage | SessionMessageBatch]
+        write_stream_reader: MemoryObjectReceiveStream[SessionMessage | SessionMessageBatch]
 
         read_stream_writer, read_stream = anyio.create_memory_object_stream(0)
         write_stream, write_stream_reader = anyio.create_memory_object_stream(0)
 
         session_id = uuid4()
         self._read_stream_writers[session_id] = read_stream_writer
+        batch_responses = self._batch_responses[session_id] = BatchResponses()
         logger.debug(f"Created new session with ID: {session_id}")
 
         # Determine the full path for the message endpoint to be sent to the client.
@@ -168,12 +179,15 @@ class SseServerTransport:
                 await sse_stream_writer.send({"event": "endpoint", "data": client_post_uri_data})
                 logger.debug(f"Sent endpoint event: {client_post_uri_data}")
 
-                async for session_message in write_stream_reader:
+                async for item in write_stream_reader:
+                    session_message = batch_responses.collect(item)
+                    if session_message is None:
+                        continue
                     logger.debug(f"Sending message via SSE: {session_message}")
                     await sse_stream_writer.send(
                         {
                             "event": "message",
-                            "data": session_message.message.model_dump_json(by_alias=True, exclude_none=True),
+                            "data": session_message.encode(self._codec).decode(),
                         }
                     )
 
@@ -190,6 +204,7 @@ class SseServerTransport:
                 )
                 await read_stream_writer.aclose()
                 await write_stream_reader.aclose()
+                self._batch_responses.pop(session_id, None)
                 logging.debug(f"Client session disconnected {session_id}")
 
             logger.debug("Starting SSE response task")
@@ -231,8 +246,8 @@ class SseServerTransport:
         logger.debug(f"Received JSON: {body}")
 
         try:
-            message = types.JSONRPCMessage.model_validate_json(body)
-            logger.debug(f"Validated client message: {message}")
+            decoded = self._codec.decode(body)
+            logger.debug(f"Validated client message: {decoded}")
         except ValidationError as err:
             logger.exception("Failed to parse message")
             response = Response("Could not parse message", status_code=400)
@@ -242,8 +257,12 @@ class SseServerTransport:
 
         # Pass the ASGI scope for framework-agnostic access to request data
         metadata = ServerMessageMetadata(request_context=request)
-        session_message = SessionMessage(message, metadata=metadata)
-        logger.debug(f"Sending session message to writer: {session_message}")
         response = Response("Accepted", status_code=202)
         await response(scope, receive, send)
-        await writer.send(session_message)
+        # Messages in a batch are handled individually; their responses go out together on the SSE stream
+        if isinstance(decoded, list) and (batch_responses := self._batch_responses.get(session_id)) is not None:
+            batch_responses.expect(decoded)
+        for message in decoded if isinstance(decoded, list) else [decoded]:
+            session_message = SessionMessage(message, metadata=metadata)
+            logger.debug(f"Sending session message to writer: {session_message}")
+            await writer.send(session_message)
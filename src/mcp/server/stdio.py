@@ -26,18 +26,20 @@ import anyio
 import anyio.lowlevel
 from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
 
-import mcp.types as types
-from mcp.shared.message import SessionMessage
+from mcp.shared.codec import DEFAULT_CODEC, Codec
+from mcp.shared.message import BatchResponses, SessionMessage, SessionMessageBatch
 
 
 @asynccontextmanager
 async def stdio_server(
     stdin: anyio.AsyncFile[str] | None = None,
     stdout: anyio.AsyncFile[str] | None = None,
+    codec: Codec = DEFAULT_CODEC,
 ):
     """
     Server transport for stdio: this communicates with an MCP client by reading
-    from the current process' stdin and writing to stdout.
+    from the current process' stdin and writing to stdout. Messages are encoded and
+    decoded with `codec`.
     """
     # Purposely not using context managers for these, as we don't want to close
     # standard process handles. Encoding of stdin/stdout as text streams on
@@ -51,32 +53,39 @@ async def stdio_server(
     read_stream: MemoryObjectReceiveStream[SessionMessage | Exception]
     read_stream_writer: MemoryObjectSendStream[SessionMessage | Exception]
 
-    write_stream: MemoryObjectSendStream[SessionMessage]
-    write_stream_reader: MemoryObjectReceiveStream[SessionMessage]
+    write_stream: MemoryObjectSendStream[SessionMessage | SessionMessageBatch]
+    write_stream_reader: MemoryObjectReceiveStream[SessionMessage | SessionMessageBatch]
 
     read_stream_writer, read_stream = anyio.create_memory_object_stream(0)
     write_stream, write_stream_reader = anyio.create_memory_object_stream(0)
+    batch_responses = BatchResponses()
 
     async def stdin_reader():
         try:
             async with read_stream_writer:
                 async for line in stdin:
                     try:
-                        message = types.JSONRPCMessage.model_validate_json(line)
+                        decoded = codec.decode(line)
                     except Exception as exc:
                         await read_stream_writer.send(exc)
                         continue
 
-                    session_message = SessionMessage(message)
-                    await read_stream_writer.send(session_message)
+                    # Messages in a batch are handled individually; their responses go back together
+                    if isinstance(decoded, list):
+                        batch_responses.expect(decoded)
+                    for message in decoded if isinstance(decoded, list) else [decoded]:
+                        await read_stream_writer.send(SessionMessage(message))
         except anyio.ClosedResourceError:
             await anyio.lowlevel.checkpoint()
 
     async def stdout_writer():
         try:
             async with write_stream_reader:
-                async for session_message in write_stream_reader:
-                    json = session_message.message.model_dump_json(by_alias=True, exclude_none=True)
+                async for item in write_stream_reader:
+                    session_message = batch_responses.collect(item)
+                    if session_message is None:
+                        continue
+                    json = session_message.encode(codec).decode()
                     await stdout.write(json + "\n")
                     await stdout.flush()
         except anyio.ClosedResourceError:
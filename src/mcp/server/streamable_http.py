@@ -7,14 +7,16 @@ The transport handles bidirectional communication using HTTP requests and
 responses, with streaming support for long-running operations.
 """
 
-import json
 import logging
+import math
 import re
 from abc import ABC, abstractmethod
-from collections.abc import AsyncGenerator, Awaitable, Callable
+from collections import deque
+from collections.abc import AsyncGenerator, AsyncIterable, Awaitable, Callable, Coroutine, Iterator, Sequence
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from http import HTTPStatus
+from typing import Any, Literal
 
 import anyio
 from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
@@ -22,13 +24,18 @@ from pydantic import ValidationError
 from sse_starlette import EventSourceResponse
 from starlette.requests import Request
 from starlette.responses import Response
-from starlette.types import Receive, Scope, Send
+from starlette.types import Message, Receive, Scope, Send
 
 from mcp.server.transport_security import (
     TransportSecurityMiddleware,
     TransportSecuritySettings,
 )
-from mcp.shared.message import ServerMessageMetadata, SessionMessage
+from mcp.shared.codec import DEFAULT_CODEC, Codec
+from mcp.shared.message import (
+    ServerMessageMetadata,
+    SessionMessage,
+    SessionMessageBatch,
+)
 from mcp.shared.version import SUPPORTED_PROTOCOL_VERSIONS
 from mcp.types import (
     DEFAULT_NEGOTIATED_VERSION,
@@ -39,6 +46,7 @@ from mcp.types import (
     ErrorData,
     JSONRPCError,
     JSONRPCMessage,
+    JSONRPCNotification,
     JSONRPCRequest,
     JSONRPCResponse,
     RequestId,
@@ -63,6 +71,9 @@ GET_STREAM_KEY = "_GET_stream"
 # Pattern ensures entire string contains only valid characters by using ^ and $ anchors
 SESSION_ID_PATTERN = re.compile(r"^[\x21-\x7E]+$")
 
+# Bytes of a large response body sent at a time, so the body is never copied whole
+STREAM_CHUNK_SIZE = 64 * 1024
+
 # Type aliases
 StreamId = str
 EventId = str
@@ -76,10 +87,62 @@ class EventMessage:
 
     message: JSONRPCMessage
     event_id: str | None = None
+    encoded: bytes | None = None
+    """The message encoded as JSON, if it already has been. Set by `encode()`."""
+
+    def encode(self, codec: Codec = DEFAULT_CODEC) -> bytes:
+        """Return the message encoded as JSON, serializing it at most once."""
+        if self.encoded is None:
+            self.encoded = codec.encode(self.message)
+        return self.encoded
+
+    @staticmethod
+    def from_encoded(encoded: bytes, event_id: str | None = None, codec: Codec = DEFAULT_CODEC) -> "EventMessage":
+        """
+        Create an event from a message already encoded as JSON, e.g. by an event store.
+
+        The message is only decoded if `message` is read, so events replayed from
+        storage are sent without being validated again.
+        """
+        return _EncodedEventMessage(encoded, event_id, codec)
+
+
+class _EncodedEventMessage(EventMessage):
+    """An `EventMessage` whose message is decoded from its encoded form on first access."""
+
+    def __init__(self, encoded: bytes, event_id: str | None, codec: Codec) -> None:
+        # Does not call the dataclass __init__, which would set the message
+        self.encoded = encoded
+        self.event_id = event_id
+        self._codec = codec
+        self._message: JSONRPCMessage | None = None
+
+    @property
+    def message(self) -> JSONRPCMessage:  # pyright: ignore[reportIncompatibleVariableOverride]
+        if self._message is None:
+            assert self.encoded is not None
+            decoded = self._codec.decode(self.encoded)
+            assert not isinstance(decoded, list)
+            self._message = decoded
+        return self._message
 
 
 EventCallback = Callable[[EventMessage], Awaitable[None]]
 
+SlowConsumerPolicy = Literal["block", "drop_notifications", "disconnect"]
+"""What the message router does with a message for a stream whose buffer is full.
+
+- "block": wait until the client reads, holding up every other stream of the session.
+- "drop_notifications": drop notifications; wait for room for responses and requests.
+- "disconnect": end the stream. The client reconnects and replays the messages it
+  missed from the event store, so this policy requires one.
+"""
+
+DirectDispatch = Callable[
+    [SessionMessage, MemoryObjectSendStream[SessionMessage | SessionMessageBatch]], Awaitable[None]
+]
+"""Handles a request message, writing any notifications and then the response to the stream."""
+
 
 class EventStore(ABC):
     """
@@ -118,6 +181,160 @@ class EventStore(ABC):
         """
         pass
 
+    async def store_events(self, events: Sequence[tuple[StreamId, JSONRPCMessage]]) -> list[EventId]:
+        """
+        Stores several events, in order.
+
+        Used to store events in batches when write-behind is enabled on the transport.
+        By default, stores the events one by one; stores that can write a batch at
+        once, e.g. in one transaction, override it.
+
+        Args:
+            events: The stream ID and message of each event
+
+        Returns:
+            The generated event IDs, in the order of the events
+        """
+        return [await self.store_event(stream_id, message) for stream_id, message in events]
+
+    def for_session(self, session_id: str) -> "EventStore":
+        """
+        Returns the store to use for the events of one session.
+
+        By default, every session shares this store. Stores that track events per
+        session, e.g. to budget memory per session, return a view bound to it.
+        """
+        return self
+
+    async def remove_session(self, session_id: str) -> None:
+        """
+        Discards the events of a session that has been terminated.
+
+        Does nothing by default, leaving the events to the store's own expiry.
+        """
+        pass
+
+
+_LINE_SEPARATOR = re.compile(rb"\r\n|\r|\n")
+
+
+def _sse_event_parts(data: bytes, event_id: EventId | None) -> list[bytes]:
+    """
+    The parts of an SSE event framing encoded data, as EventSourceResponse frames it.
+
+    Encoded JSON has no line breaks unless it was pretty-printed, so the data is
+    usually one part, which is not copied.
+    """
+    head = b"event: message\r\n"
+    if event_id is not None:
+        head = b"id: " + _LINE_SEPARATOR.sub(b"", event_id.encode()) + b"\r\n" + head
+    if b"\n" not in data and b"\r" not in data:
+        return [head + b"data: ", data, b"\r\n\r\n"]
+    return [head, *(b"data: " + line + b"\r\n" for line in _LINE_SEPARATOR.split(data)), b"\r\n"]
+
+
+def _body_chunks(parts: Sequence[bytes]) -> Iterator[bytes]:
+    """
+    Split a body given as parts into chunks of at most STREAM_CHUNK_SIZE bytes.
+
+    Small parts are joined into one chunk, and large parts are sliced, so no more
+    than a chunk of the body is copied at a time.
+    """
+    if len(parts) == 1 and len(parts[0]) <= STREAM_CHUNK_SIZE:
+        yield parts[0]
+        return
+    buffer = bytearray()
+    for part in parts:
+        if len(buffer) + len(part) <= STREAM_CHUNK_SIZE:
+            buffer += part
+            continue
+        if buffer:
+            yield bytes(buffer)
+            buffer.clear()
+        if len(part) <= STREAM_CHUNK_SIZE:
+            buffer += part
+            continue
+        for start in range(0, len(part), STREAM_CHUNK_SIZE):
+            yield part[start : start + STREAM_CHUNK_SIZE]
+    if buffer:
+        yield bytes(buffer)
+
+
+class _ChunkedResponse(Response):
+    """
+    A response with a body given as parts, sent in chunks with _body_chunks().
+
+    Unlike Response, the parts are never joined into one bytes object, so a large
+    body is not copied; unlike StreamingResponse, the length is known up front.
+    """
+
+    def __init__(
+        self,
+        parts: Sequence[bytes],
+        status_code: int = 200,
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        self.parts = parts
+        headers = {**(headers or {}), "content-length": str(sum(len(part) for part in parts))}
+        super().__init__(None, status_code=status_code, headers=headers)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await send({"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers})
+        chunks = _body_chunks(self.parts)
+        chunk = next(chunks, b"")
+        for next_chunk in chunks:
+            await send({"type": "http.response.body", "body": chunk, "more_body": True})
+            chunk = next_chunk
+        await send({"type": "http.response.body", "body": chunk, "more_body": False})
+        if self.background is not None:
+            await self.background()
+
+
+class _SSEResponse(EventSourceResponse):
+    """
+    An EventSourceResponse whose content gives each event as the chunks of its body.
+
+    EventSourceResponse sends its pings from a separate task, so a ping could be written
+    between two chunks of an event, in the middle of a data line. The chunks of an event
+    are sent while holding a lock, and every send from another task waits for it.
+    """
+
+    def __init__(
+        self,
+        content: AsyncIterable[Iterator[bytes]],
+        headers: dict[str, str],
+        data_sender_callable: Callable[[], Coroutine[Any, Any, None]] | None = None,
+        ping: float | None = None,
+    ) -> None:
+        self._events = content
+        self._event_lock = anyio.Lock()
+        self._event_task: int | None = None
+        super().__init__(  # pyright: ignore[reportUnknownMemberType]
+            content=self._event_chunks(),
+            headers=headers,
+            data_sender_callable=data_sender_callable,
+        )
+        if ping is not None:
+            self.ping_interval = ping
+
+    async def _event_chunks(self) -> AsyncGenerator[bytes, None]:
+        self._event_task = anyio.get_current_task().id
+        async for chunks in self._events:
+            # The lock is released once the last chunk has been sent, when the next one is asked for
+            async with self._event_lock:
+                for chunk in chunks:
+                    yield chunk
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        async def send_between_events(message: Message) -> None:
+            if anyio.get_current_task().id == self._event_task:
+                await send(message)
+            else:
+                async with self._event_lock:
+                    await send(message)
+
+        await super().__call__(scope, receive, send_between_events)
+
 
 class StreamableHTTPServerTransport:
     """
@@ -130,8 +347,8 @@ class StreamableHTTPServerTransport:
     # Server notification streams for POST requests as well as standalone SSE stream
     _read_stream_writer: MemoryObjectSendStream[SessionMessage | Exception] | None = None
     _read_stream: MemoryObjectReceiveStream[SessionMessage | Exception] | None = None
-    _write_stream: MemoryObjectSendStream[SessionMessage] | None = None
-    _write_stream_reader: MemoryObjectReceiveStream[SessionMessage] | None = None
+    _write_stream: MemoryObjectSendStream[SessionMessage | SessionMessageBatch] | None = None
+    _write_stream_reader: MemoryObjectReceiveStream[SessionMessage | SessionMessageBatch] | None = None
     _security: TransportSecurityMiddleware
 
     def __init__(
@@ -140,6 +357,10 @@ class StreamableHTTPServerTransport:
         is_json_response_enabled: bool = False,
         event_store: EventStore | None = None,
         security_settings: TransportSecuritySettings | None = None,
+        codec: Codec = DEFAULT_CODEC,
+        event_store_queue_size: int | None = None,
+        request_stream_buffer_size: int = 32,
+        slow_consumer_policy: SlowConsumerPolicy = "block",
     ) -> None:
         """
         Initialize a new StreamableHTTP server transport.
@@ -153,17 +374,48 @@ class StreamableHTTPServerTransport:
                         resumability will be enabled, allowing clients to
                         reconnect and resume messages.
             security_settings: Optional security settings for DNS rebinding protection.
+            codec: Codec used to encode and decode messages.
+            event_store_queue_size: If set, outgoing messages are stored write-behind:
+                        instead of storing each message before routing the next one,
+                        the message router queues up to this many messages for a
+                        writer task, which stores them in batches with
+                        `EventStore.store_events()`. A message is still sent only
+                        once it is stored, with its event ID. None stores inline.
+            request_stream_buffer_size: Messages buffered for each response or GET
+                        stream, so a client reading slowly does not immediately hold
+                        up the other streams of the session.
+            slow_consumer_policy: What to do with a message for a stream whose buffer
+                        is full; see `SlowConsumerPolicy`.
 
         Raises:
-            ValueError: If the session ID contains invalid characters.
+            ValueError: If the session ID contains invalid characters,
+                event_store_queue_size is not positive, or slow_consumer_policy
+                is "disconnect" without an event store.
         """
         if mcp_session_id is not None and not SESSION_ID_PATTERN.fullmatch(mcp_session_id):
             raise ValueError("Session ID must only contain visible ASCII characters (0x21-0x7E)")
+        if event_store_queue_size is not None and event_store_queue_size < 1:
+            raise ValueError(f"event_store_queue_size must be at least 1, got {event_store_queue_size}")
+        if request_stream_buffer_size < 0:
+            raise ValueError(f"request_stream_buffer_size must not be negative, got {request_stream_buffer_size}")
+        if slow_consumer_policy == "disconnect" and event_store is None:
+            # A disconnected response stream could never be replayed, losing its response
+            raise ValueError('slow_consumer_policy "disconnect" requires an event store')
 
         self.mcp_session_id = mcp_session_id
         self.is_json_response_enabled = is_json_response_enabled
         self._event_store = event_store
+        self._event_store_queue_size = event_store_queue_size
+        # When each message queued for storing write-behind and not yet stored was queued, oldest first
+        self._store_pending: deque[float] = deque()
+        self._request_stream_buffer_size = request_stream_buffer_size
+        self._slow_consumer_policy: SlowConsumerPolicy = slow_consumer_policy
+        self.dropped_notifications = 0
+        """Notifications dropped because their stream's buffer was full."""
+        self.disconnected_streams = 0
+        """Streams ended because their buffer was full."""
         self._security = TransportSecurityMiddleware(security_settings)
+        self._codec = codec
         self._request_streams: dict[
             RequestId,
             tuple[
@@ -178,6 +430,22 @@ class StreamableHTTPServerTransport:
         """Check if this transport has been explicitly terminated."""
         return self._terminated
 
+    def stream_backlogs(self) -> dict[StreamId, int]:
+        """Messages waiting in the buffer of each stream the client is slow to read, by stream ID."""
+        backlogs: dict[StreamId, int] = {}
+        for stream_id, (send_stream, _) in self._request_streams.items():
+            buffered = send_stream.statistics().current_buffer_used
+            if buffered:
+                backlogs[str(stream_id)] = buffered
+        return backlogs
+
+    @property
+    def event_store_lag(self) -> float:
+        """Seconds the oldest message waiting to be stored write-behind has waited, or 0."""
+        if not self._store_pending:
+            return 0.0
+        return anyio.current_time() - self._store_pending[0]
+
     def _create_error_response(
         self,
         error_message: str,
@@ -204,18 +472,29 @@ class StreamableHTTPServerTransport:
         )
 
         return Response(
-            error_response.model_dump_json(by_alias=True, exclude_none=True),
+            self._codec.encode(JSONRPCMessage(error_response)),
             status_code=status_code,
             headers=response_headers,
         )
 
+    def _create_decode_error_response(self, error: ValidationError) -> Response:
+        """Create an error response for a body that could not be decoded as JSON-RPC."""
+        if any(e["type"] == "json_invalid" for e in error.errors()):
+            return self._create_error_response(f"Parse error: {str(error)}", HTTPStatus.BAD_REQUEST, PARSE_ERROR)
+        return self._create_error_response(
+            f"Validation error: {str(error)}",
+            HTTPStatus.BAD_REQUEST,
+            INVALID_PARAMS,
+        )
+
     def _create_json_response(
         self,
-        response_message: JSONRPCMessage | None,
+        response_message: EventMessage | list[EventMessage] | None,
         status_code: HTTPStatus = HTTPStatus.OK,
         headers: dict[str, str] | None = None,
     ) -> Response:
-        """Create a JSON response from a JSONRPCMessage"""
+        """Create a JSON response from an EventMessage carrying a JSONRPCMessage,
+        or a JSON-RPC batch response from a list of them"""
         response_headers = {"Content-Type": CONTENT_TYPE_JSON}
         if headers:
             response_headers.update(headers)
@@ -223,28 +502,32 @@ class StreamableHTTPServerTransport:
         if self.mcp_session_id:
             response_headers[MCP_SESSION_ID_HEADER] = self.mcp_session_id
 
-        return Response(
-            response_message.model_dump_json(by_alias=True, exclude_none=True) if response_message else None,
-            status_code=status_code,
-            headers=response_headers,
-        )
+        if response_message is None:
+            return Response(None, status_code=status_code, headers=response_headers)
+
+        # The encoded messages are sent as they are, rather than joined into one body
+        if isinstance(response_message, list):
+            parts = [b"["]
+            for message in response_message:
+                parts += (message.encode(self._codec), b",")
+            parts[-1] = b"]"
+        else:
+            parts = [response_message.encode(self._codec)]
+        return _ChunkedResponse(parts, status_code=status_code, headers=response_headers)
 
     def _get_session_id(self, request: Request) -> str | None:
         """Extract the session ID from request headers."""
         return request.headers.get(MCP_SESSION_ID_HEADER)
 
-    def _create_event_data(self, event_message: EventMessage) -> dict[str, str]:
-        """Create event data dictionary from an EventMessage."""
-        event_data = {
-            "event": "message",
-            "data": event_message.message.model_dump_json(by_alias=True, exclude_none=True),
-        }
-
-        # If an event ID was provided, include it
-        if event_message.event_id:
-            event_data["id"] = event_message.event_id
+    def _sse_event_chunks(self, event_message: EventMessage) -> Iterator[bytes]:
+        """Encode a message as an SSE event, as sent by EventSourceResponse, in chunks."""
+        return _body_chunks(_sse_event_parts(event_message.encode(self._codec), event_message.event_id))
 
-        return event_data
+    async def _send_sse_event(
+        self, sse_stream_writer: MemoryObjectSendStream[Iterator[bytes]], event_message: EventMessage
+    ) -> None:
+        """Send a message as an SSE event to the content stream of an _SSEResponse."""
+        await sse_stream_writer.send(self._sse_event_chunks(event_message))
 
     async def _clean_up_memory_streams(self, request_id: RequestId) -> None:
         """Clean up memory streams for a given request ID."""
@@ -334,23 +617,18 @@ class StreamableHTTPServerTransport:
             # Parse the body - only read it once
             body = await request.body()
 
+            # Decode and validate in a single pass; malformed JSON surfaces as a json_invalid error
             try:
-                raw_message = json.loads(body)
-            except json.JSONDecodeError as e:
-                response = self._create_error_response(f"Parse error: {str(e)}", HTTPStatus.BAD_REQUEST, PARSE_ERROR)
+                decoded = self._codec.decode(body)
+            except ValidationError as e:
+                response = self._create_decode_error_response(e)
                 await response(scope, receive, send)
                 return
 
-            try:
-                message = JSONRPCMessage.model_validate(raw_message)
-            except ValidationError as e:
-                response = self._create_error_response(
-                    f"Validation error: {str(e)}",
-                    HTTPStatus.BAD_REQUEST,
-                    INVALID_PARAMS,
-                )
-                await response(scope, receive, send)
+            if isinstance(decoded, list):
+                await self._handle_batch_post_request(scope, request, receive, send, writer, decoded)
                 return
+            message = decoded
 
             # Check if this is an initialization request
             is_initialization_request = isinstance(message.root, JSONRPCRequest) and message.root.method == "initialize"
@@ -391,8 +669,7 @@ class StreamableHTTPServerTransport:
             # Extract the request ID outside the try block for proper scope
             request_id = str(message.root.id)
             # Register this stream for the request ID
-            self._request_streams[request_id] = anyio.create_memory_object_stream[EventMessage](0)
-            request_stream_reader = self._request_streams[request_id][1]
+            request_stream_reader = self._create_request_stream(request_id)
 
             if self.is_json_response_enabled:
                 # Process the message
@@ -408,7 +685,7 @@ class StreamableHTTPServerTransport:
                     async for event_message in request_stream_reader:
                         # If it's a response, this is what we're waiting for
                         if isinstance(event_message.message.root, JSONRPCResponse | JSONRPCError):
-                            response_message = event_message.message
+                            response_message = event_message
                             break
                         # For notifications and request, keep waiting
                         else:
@@ -439,7 +716,7 @@ class StreamableHTTPServerTransport:
                     await self._clean_up_memory_streams(request_id)
             else:
                 # Create SSE stream
-                sse_stream_writer, sse_stream_reader = anyio.create_memory_object_stream[dict[str, str]](0)
+                sse_stream_writer, sse_stream_reader = anyio.create_memory_object_stream[Iterator[bytes]](0)
 
                 async def sse_writer():
                     # Get the request ID from the incoming request message
@@ -447,9 +724,7 @@ class StreamableHTTPServerTransport:
                         async with sse_stream_writer, request_stream_reader:
                             # Process messages from the request-specific stream
                             async for event_message in request_stream_reader:
-                                # Build the event data
-                                event_data = self._create_event_data(event_message)
-                                await sse_stream_writer.send(event_data)
+                                await self._send_sse_event(sse_stream_writer, event_message)
 
                                 # If response, remove from pending streams and close
                                 if isinstance(
@@ -472,7 +747,7 @@ class StreamableHTTPServerTransport:
                     "Content-Type": CONTENT_TYPE_SSE,
                     **({MCP_SESSION_ID_HEADER: self.mcp_session_id} if self.mcp_session_id else {}),
                 }
-                response = EventSourceResponse(
+                response = _SSEResponse(
                     content=sse_stream_reader,
                     data_sender_callable=sse_writer,
                     headers=headers,
@@ -490,8 +765,9 @@ class StreamableHTTPServerTransport:
                 except Exception:
                     logger.exception("SSE response error")
                     await sse_stream_writer.aclose()
-                    await sse_stream_reader.aclose()
                     await self._clean_up_memory_streams(request_id)
+                finally:
+                    await sse_stream_reader.aclose()
 
         except Exception as err:
             logger.exception("Error handling POST request")
@@ -505,6 +781,288 @@ class StreamableHTTPServerTransport:
                 await writer.send(Exception(err))
             return
 
+    async def _handle_batch_post_request(
+        self,
+        scope: Scope,
+        request: Request,
+        receive: Receive,
+        send: Send,
+        writer: MemoryObjectSendStream[SessionMessage | Exception],
+        messages: list[JSONRPCMessage],
+    ) -> None:
+        """
+        Handle a POST request containing a JSON-RPC batch.
+
+        The messages are handed to the server one by one and their requests are handled
+        concurrently. With JSON responses enabled, every response is returned in a single
+        JSON array; otherwise they are streamed on the POST's SSE stream, which closes once
+        every request in the batch has been answered.
+        """
+        jsonrpc_requests = [message.root for message in messages if isinstance(message.root, JSONRPCRequest)]
+
+        if any(jsonrpc_request.method == "initialize" for jsonrpc_request in jsonrpc_requests):
+            response = self._create_error_response(
+                "Invalid Request: initialize must not be part of a JSON-RPC batch",
+                HTTPStatus.BAD_REQUEST,
+            )
+            await response(scope, receive, send)
+            return
+
+        if not await self._validate_request_headers(request, send):
+            return
+
+        metadata = ServerMessageMetadata(request_context=request)
+
+        # For batches of notifications and responses only, return 202 Accepted
+        if not jsonrpc_requests:
+            response = self._create_json_response(None, HTTPStatus.ACCEPTED)
+            await response(scope, receive, send)
+            for message in messages:
+                await writer.send(SessionMessage(message, metadata=metadata))
+            return
+
+        request_ids = [str(jsonrpc_request.id) for jsonrpc_request in jsonrpc_requests]
+        if len(set(request_ids)) != len(request_ids):
+            response = self._create_error_response(
+                "Invalid Request: request IDs in a batch must be unique",
+                HTTPStatus.BAD_REQUEST,
+            )
+            await response(scope, receive, send)
+            return
+
+        # Register a stream for every request in the batch
+        for request_id in request_ids:
+            self._create_request_stream(request_id)
+
+        async def send_messages() -> None:
+            for message in messages:
+                await writer.send(SessionMessage(message, metadata=metadata))
+
+        if self.is_json_response_enabled:
+            await self._respond_to_batch_with_json(scope, receive, send, request_ids, send_messages)
+        else:
+            await self._respond_to_batch_with_sse(scope, receive, send, request_ids, send_messages)
+
+    async def _respond_to_batch_with_json(
+        self,
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+        request_ids: list[str],
+        send_messages: Callable[[], Awaitable[None]],
+    ) -> None:
+        """Send the messages of a batch, then respond with all of its responses in a JSON array."""
+        responses: dict[str, EventMessage] = {}
+
+        async def collect_response(request_id: str) -> None:
+            # Wait for the response, skipping notifications and requests related to it
+            async for event_message in self._request_streams[request_id][1]:
+                if isinstance(event_message.message.root, JSONRPCResponse | JSONRPCError):
+                    responses[request_id] = event_message
+                    break
+
+        try:
+            # Responses may arrive in any order, so wait for all of them at once
+            async with anyio.create_task_group() as tg:
+                for request_id in request_ids:
+                    tg.start_soon(collect_response, request_id)
+                await send_messages()
+
+            if len(responses) == len(request_ids):
+                response = self._create_json_response([responses[request_id] for request_id in request_ids])
+            else:
+                # This shouldn't happen in normal operation
+                logger.error("Not every response in the batch was received before streams closed")
+                response = self._create_error_response(
+                    "Error processing request: No response received",
+                    HTTPStatus.INTERNAL_SERVER_ERROR,
+                )
+            await response(scope, receive, send)
+        except Exception:
+            logger.exception("Error processing JSON batch response")
+            response = self._create_error_response(
+                "Error processing request",
+                HTTPStatus.INTERNAL_SERVER_ERROR,
+                INTERNAL_ERROR,
+            )
+            await response(scope, receive, send)
+        finally:
+            for request_id in request_ids:
+                await self._clean_up_memory_streams(request_id)
+
+    async def _respond_to_batch_with_sse(
+        self,
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+        request_ids: list[str],
+        send_messages: Callable[[], Awaitable[None]],
+    ) -> None:
+        """Send the messages of a batch and stream every related message back over SSE."""
+        sse_stream_writer, sse_stream_reader = anyio.create_memory_object_stream[Iterator[bytes]](0)
+
+        async def forward_events(request_id: str) -> None:
+            async for event_message in self._request_streams[request_id][1]:
+                await self._send_sse_event(sse_stream_writer, event_message)
+                if isinstance(event_message.message.root, JSONRPCResponse | JSONRPCError):
+                    break
+
+        async def sse_writer():
+            try:
+                async with sse_stream_writer, anyio.create_task_group() as tg:
+                    for request_id in request_ids:
+                        tg.start_soon(forward_events, request_id)
+            except Exception:
+                logger.exception("Error in SSE writer")
+            finally:
+                logger.debug("Closing SSE writer")
+                for request_id in request_ids:
+                    await self._clean_up_memory_streams(request_id)
+
+        headers = {
+            "Cache-Control": "no-cache, no-transform",
+            "Connection": "keep-alive",
+            "Content-Type": CONTENT_TYPE_SSE,
+            **({MCP_SESSION_ID_HEADER: self.mcp_session_id} if self.mcp_session_id else {}),
+        }
+        response = _SSEResponse(
+            content=sse_stream_reader,
+            data_sender_callable=sse_writer,
+            headers=headers,
+        )
+
+        try:
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(response, scope, receive, send)
+                await send_messages()
+        except Exception:
+            logger.exception("SSE response error")
+            await sse_stream_writer.aclose()
+            await sse_stream_reader.aclose()
+            for request_id in request_ids:
+                await self._clean_up_memory_streams(request_id)
+
+    async def handle_direct_request(
+        self,
+        request: Request,
+        send: Send,
+        message: JSONRPCMessage,
+        dispatch: DirectDispatch,
+    ) -> None:
+        """
+        Answer a POSTed JSON-RPC request by calling `dispatch` directly.
+
+        Used in stateless mode instead of connect() and handle_request(), so that no
+        streams, router task or session are set up per HTTP request. The body of
+        `request` has already been read and decoded into `message`, which must carry
+        a JSONRPCRequest. The response is written in one piece as soon as it is ready;
+        an SSE stream is only opened if notifications are sent before it.
+        """
+        assert isinstance(message.root, JSONRPCRequest)
+        error_response = await self._security.validate_request(request, is_post=True)
+        if error_response:
+            await error_response(request.scope, request.receive, send)
+            return
+
+        has_json, has_sse = self._check_accept_headers(request)
+        if not (has_json and has_sse):
+            response = self._create_error_response(
+                ("Not Acceptable: Client must accept both application/json and text/event-stream"),
+                HTTPStatus.NOT_ACCEPTABLE,
+            )
+            await response(request.scope, request.receive, send)
+            return
+
+        if not self._check_content_type(request):
+            response = self._create_error_response(
+                "Unsupported Media Type: Content-Type must be application/json",
+                HTTPStatus.UNSUPPORTED_MEDIA_TYPE,
+            )
+            await response(request.scope, request.receive, send)
+            return
+
+        if message.root.method != "initialize" and not await self._validate_request_headers(request, send):
+            return
+
+        # Unbounded, so that the handler never waits for the HTTP response to be written
+        writer, reader = anyio.create_memory_object_stream[SessionMessage | SessionMessageBatch](math.inf)
+        session_message = SessionMessage(message, metadata=ServerMessageMetadata(request_context=request))
+
+        async def run_dispatch() -> None:
+            async with writer:
+                try:
+                    await dispatch(session_message, writer)
+                except Exception:
+                    logger.exception("Stateless request crashed")
+
+        async with anyio.create_task_group() as tg, reader:
+            tg.start_soon(run_dispatch)
+
+            # Collect messages until the response, or until a notification has to be streamed
+            pending: list[EventMessage] = []
+            response_message: EventMessage | None = None
+            async for item in reader:
+                for sent in item.messages if isinstance(item, SessionMessageBatch) else (item,):
+                    event_message = EventMessage(sent.message, None, sent.encoded)
+                    if isinstance(sent.message.root, JSONRPCResponse | JSONRPCError):
+                        response_message = event_message
+                        break
+                    # JSON responses carry only the response, so notifications are dropped
+                    if not self.is_json_response_enabled:
+                        pending.append(event_message)
+                if response_message is not None or pending:
+                    break
+
+            if response_message is None and not pending:
+                logger.error("No response message received before stream closed")
+                response = self._create_error_response(
+                    "Error processing request: No response received",
+                    HTTPStatus.INTERNAL_SERVER_ERROR,
+                )
+            elif self.is_json_response_enabled:
+                response = self._create_json_response(response_message)
+            elif response_message is not None:
+                response = _ChunkedResponse(
+                    [
+                        part
+                        for event in (*pending, response_message)
+                        for part in _sse_event_parts(event.encode(self._codec), event.event_id)
+                    ],
+                    headers={
+                        "Cache-Control": "no-cache, no-transform",
+                        "Connection": "keep-alive",
+                        "Content-Type": CONTENT_TYPE_SSE,
+                    },
+                )
+            else:
+                response = self._create_direct_sse_response(pending, reader)
+            await response(request.scope, request.receive, send)
+
+    def _create_direct_sse_response(
+        self,
+        pending: list[EventMessage],
+        reader: MemoryObjectReceiveStream[SessionMessage | SessionMessageBatch],
+    ) -> _SSEResponse:
+        """Stream the notifications sent so far, then the rest of a direct request's messages."""
+
+        async def events() -> AsyncGenerator[Iterator[bytes], None]:
+            for event_message in pending:
+                yield self._sse_event_chunks(event_message)
+            async for item in reader:
+                for sent in item.messages if isinstance(item, SessionMessageBatch) else (item,):
+                    yield self._sse_event_chunks(EventMessage(sent.message, None, sent.encoded))
+                    if isinstance(sent.message.root, JSONRPCResponse | JSONRPCError):
+                        return
+
+        return _SSEResponse(
+            content=events(),
+            headers={
+                "Cache-Control": "no-cache, no-transform",
+                "Connection": "keep-alive",
+                "Content-Type": CONTENT_TYPE_SSE,
+            },
+        )
+
     async def _handle_get_request(self, request: Request, send: Send) -> None:
         """
         Handle GET request to establish SSE.
@@ -555,14 +1113,13 @@ class StreamableHTTPServerTransport:
             return
 
         # Create SSE stream
-        sse_stream_writer, sse_stream_reader = anyio.create_memory_object_stream[dict[str, str]](0)
+        sse_stream_writer, sse_stream_reader = anyio.create_memory_object_stream[Iterator[bytes]](0)
 
         async def standalone_sse_writer():
             try:
                 # Create a standalone message stream for server-initiated messages
 
-                self._request_streams[GET_STREAM_KEY] = anyio.create_memory_object_stream[EventMessage](0)
-                standalone_stream_reader = self._request_streams[GET_STREAM_KEY][1]
+                standalone_stream_reader = self._create_request_stream(GET_STREAM_KEY)
 
                 async with sse_stream_writer, standalone_stream_reader:
                     # Process messages from the standalone stream
@@ -573,8 +1130,7 @@ class StreamableHTTPServerTransport:
                         # We should NOT receive JSONRPCResponse
 
                         # Send the message via SSE
-                        event_data = self._create_event_data(event_message)
-                        await sse_stream_writer.send(event_data)
+                        await self._send_sse_event(sse_stream_writer, event_message)
             except Exception:
                 logger.exception("Error in standalone SSE writer")
             finally:
@@ -582,7 +1138,7 @@ class StreamableHTTPServerTransport:
                 await self._clean_up_memory_streams(GET_STREAM_KEY)
 
         # Create and start EventSourceResponse
-        response = EventSourceResponse(
+        response = _SSEResponse(
             content=sse_stream_reader,
             data_sender_callable=standalone_sse_writer,
             headers=headers,
@@ -638,6 +1194,9 @@ class StreamableHTTPServerTransport:
 
         # Clear the request streams dictionary immediately
         self._request_streams.clear()
+        if self._event_store is not None and self.mcp_session_id is not None:
+            # The session cannot be resumed anymore, so its events are not needed
+            await self._event_store.remove_session(self.mcp_session_id)
         try:
             if self._read_stream_writer is not None:
                 await self._read_stream_writer.aclose()
@@ -651,6 +1210,60 @@ class StreamableHTTPServerTransport:
             # During cleanup, we catch all exceptions since streams might be in various states
             logger.debug(f"Error closing streams: {e}")
 
+    def _create_request_stream(self, stream_id: StreamId) -> MemoryObjectReceiveStream[EventMessage]:
+        """Register the stream of a response or of the GET request, returning its receiving end."""
+        self._request_streams[stream_id] = anyio.create_memory_object_stream[EventMessage](
+            self._request_stream_buffer_size
+        )
+        return self._request_streams[stream_id][1]
+
+    async def _send_to_request_stream(self, request_stream_id: StreamId, event_message: EventMessage) -> None:
+        """Send an outgoing message to the request stream it belongs to, if a client is connected to it."""
+        if request_stream_id in self._request_streams:
+            send_stream = self._request_streams[request_stream_id][0]
+            try:
+                # Send both the message and the event ID
+                if self._slow_consumer_policy == "block":
+                    await send_stream.send(event_message)
+                    return
+                try:
+                    send_stream.send_nowait(event_message)
+                except anyio.WouldBlock:
+                    await self._handle_slow_consumer(request_stream_id, send_stream, event_message)
+            except (
+                anyio.BrokenResourceError,
+                anyio.ClosedResourceError,
+            ):
+                # Stream might be closed, remove from registry
+                self._request_streams.pop(request_stream_id, None)
+        else:
+            logging.debug(
+                f"""Request stream {request_stream_id} not found 
+                for message. Still processing message as the client
+                might reconnect and replay."""
+            )
+
+    async def _handle_slow_consumer(
+        self,
+        request_stream_id: StreamId,
+        send_stream: MemoryObjectSendStream[EventMessage],
+        event_message: EventMessage,
+    ) -> None:
+        """Apply the slow consumer policy to a message for a stream whose buffer is full."""
+        if self._slow_consumer_policy == "disconnect":
+            logger.warning(
+                f"Ending stream {request_stream_id} of session {self.mcp_session_id}: the client is not reading it"
+            )
+            self.disconnected_streams += 1
+            # The SSE writer sends what is buffered, then ends the response
+            self._request_streams.pop(request_stream_id, None)
+            send_stream.close()
+        elif isinstance(event_message.message.root, JSONRPCNotification):
+            self.dropped_notifications += 1
+            logger.debug(f"Dropped a notification for stream {request_stream_id}: the client is not reading it")
+        else:
+            await send_stream.send(event_message)
+
     async def _handle_unsupported_request(self, request: Request, send: Send) -> None:
         """Handle unsupported HTTP methods."""
         headers = {
@@ -745,35 +1358,31 @@ class StreamableHTTPServerTransport:
                 headers[MCP_SESSION_ID_HEADER] = self.mcp_session_id
 
             # Create SSE stream for replay
-            sse_stream_writer, sse_stream_reader = anyio.create_memory_object_stream[dict[str, str]](0)
+            sse_stream_writer, sse_stream_reader = anyio.create_memory_object_stream[Iterator[bytes]](0)
 
             async def replay_sender():
                 try:
                     async with sse_stream_writer:
                         # Define an async callback for sending events
                         async def send_event(event_message: EventMessage) -> None:
-                            event_data = self._create_event_data(event_message)
-                            await sse_stream_writer.send(event_data)
+                            await self._send_sse_event(sse_stream_writer, event_message)
 
                         # Replay past events and get the stream ID
                         stream_id = await event_store.replay_events_after(last_event_id, send_event)
 
                         # If stream ID not in mapping, create it
                         if stream_id and stream_id not in self._request_streams:
-                            self._request_streams[stream_id] = anyio.create_memory_object_stream[EventMessage](0)
-                            msg_reader = self._request_streams[stream_id][1]
+                            msg_reader = self._create_request_stream(stream_id)
 
                             # Forward messages to SSE
                             async with msg_reader:
                                 async for event_message in msg_reader:
-                                    event_data = self._create_event_data(event_message)
-
-                                    await sse_stream_writer.send(event_data)
+                                    await self._send_sse_event(sse_stream_writer, event_message)
                 except Exception:
                     logger.exception("Error in replay sender")
 
             # Create and start EventSourceResponse
-            response = EventSourceResponse(
+            response = _SSEResponse(
                 content=sse_stream_reader,
                 data_sender_callable=replay_sender,
                 headers=headers,
@@ -802,7 +1411,7 @@ class StreamableHTTPServerTransport:
     ) -> AsyncGenerator[
         tuple[
             MemoryObjectReceiveStream[SessionMessage | Exception],
-            MemoryObjectSendStream[SessionMessage],
+            MemoryObjectSendStream[SessionMessage | SessionMessageBatch],
         ],
         None,
     ]:
@@ -815,7 +1424,7 @@ class StreamableHTTPServerTransport:
         # Create the memory streams for this connection
 
         read_stream_writer, read_stream = anyio.create_memory_object_stream[SessionMessage | Exception](0)
-        write_stream, write_stream_reader = anyio.create_memory_object_stream[SessionMessage](0)
+        write_stream, write_stream_reader = anyio.create_memory_object_stream[SessionMessage | SessionMessageBatch](0)
 
         # Store the streams
         self._read_stream_writer = read_stream_writer
@@ -826,60 +1435,110 @@ class StreamableHTTPServerTransport:
         # Start a task group for message routing
         async with anyio.create_task_group() as tg:
             # Create a message router that distributes messages to request streams
+            event_store = self._event_store
+            queue_size = self._event_store_queue_size
+            # Messages waiting to be stored write-behind
+            store_queue: MemoryObjectSendStream[tuple[StreamId, SessionMessage]] | None = None
+            store_queue_reader: MemoryObjectReceiveStream[tuple[StreamId, SessionMessage]] | None = None
+            if event_store is not None and queue_size is not None:
+                store_queue, store_queue_reader = anyio.create_memory_object_stream[tuple[StreamId, SessionMessage]](
+                    queue_size
+                )
+
             async def message_router():
                 try:
-                    async for session_message in write_stream_reader:
-                        # Determine which request stream(s) should receive this message
-                        message = session_message.message
-                        target_request_id = None
-                        # Check if this is a response
-                        if isinstance(message.root, JSONRPCResponse | JSONRPCError):
-                            response_id = str(message.root.id)
-                            # If this response is for an existing request stream,
-                            # send it there
-                            target_request_id = response_id
-                        # Extract related_request_id from meta if it exists
-                        elif (
-                            session_message.metadata is not None
-                            and isinstance(
-                                session_message.metadata,
-                                ServerMessageMetadata,
-                            )
-                            and session_message.metadata.related_request_id is not None
-                        ):
-                            target_request_id = str(session_message.metadata.related_request_id)
-
-                        request_stream_id = target_request_id if target_request_id is not None else GET_STREAM_KEY
-
-                        # Store the event if we have an event store,
-                        # regardless of whether a client is connected
-                        # messages will be replayed on the re-connect
-                        event_id = None
-                        if self._event_store:
-                            event_id = await self._event_store.store_event(request_stream_id, message)
-                            logger.debug(f"Stored {event_id} from {request_stream_id}")
-
-                        if request_stream_id in self._request_streams:
-                            try:
-                                # Send both the message and the event ID
-                                await self._request_streams[request_stream_id][0].send(EventMessage(message, event_id))
-                            except (
-                                anyio.BrokenResourceError,
-                                anyio.ClosedResourceError,
+                    async for item in write_stream_reader:
+                        # Messages in a batch are routed one by one, each to its own stream
+                        for session_message in item.messages if isinstance(item, SessionMessageBatch) else (item,):
+                            # Determine which request stream(s) should receive this message
+                            message = session_message.message
+                            target_request_id = None
+                            # Check if this is a response
+                            if isinstance(message.root, JSONRPCResponse | JSONRPCError):
+                                response_id = str(message.root.id)
+                                # If this response is for an existing request stream,
+                                # send it there
+                                target_request_id = response_id
+                            # Extract related_request_id from meta if it exists
+                            elif (
+                                session_message.metadata is not None
+                                and isinstance(
+                                    session_message.metadata,
+                                    ServerMessageMetadata,
+                                )
+                                and session_message.metadata.related_request_id is not None
                             ):
-                                # Stream might be closed, remove from registry
-                                self._request_streams.pop(request_stream_id, None)
-                        else:
-                            logging.debug(
-                                f"""Request stream {request_stream_id} not found 
-                                for message. Still processing message as the client
-                                might reconnect and replay."""
+                                target_request_id = str(session_message.metadata.related_request_id)
+
+                            request_stream_id = target_request_id if target_request_id is not None else GET_STREAM_KEY
+
+                            if store_queue is not None:
+                                # The writer task stores the message, then sends it; waiting
+                                # for room in the queue counts towards the store lag
+                                self._store_pending.append(anyio.current_time())
+                                await store_queue.send((request_stream_id, session_message))
+                                continue
+
+                            # Store the event if we have an event store,
+                            # regardless of whether a client is connected
+                            # messages will be replayed on the re-connect
+                            event_id = None
+                            if event_store:
+                                event_id = await event_store.store_event(request_stream_id, message)
+                                logger.debug(f"Stored {event_id} from {request_stream_id}")
+
+                            await self._send_to_request_stream(
+                                request_stream_id, EventMessage(message, event_id, session_message.encoded)
                             )
                 except Exception:
                     logger.exception("Error in message router")
+                finally:
+                    if store_queue is not None:
+                        await store_queue.aclose()
+
+            async def event_store_writer(
+                event_store: EventStore,
+                queue_size: int,
+                store_queue_reader: MemoryObjectReceiveStream[tuple[StreamId, SessionMessage]],
+            ):
+                try:
+                    async with store_queue_reader:
+                        async for first in store_queue_reader:
+                            # Store whatever queued up while the previous batch was being stored
+                            batch = [first]
+                            while len(batch) < queue_size:
+                                try:
+                                    batch.append(store_queue_reader.receive_nowait())
+                                except (anyio.WouldBlock, anyio.EndOfStream):
+                                    break
+
+                            event_ids: list[EventId | None]
+                            try:
+                                event_ids = list(
+                                    await event_store.store_events(
+                                        [(stream_id, session_message.message) for stream_id, session_message in batch]
+                                    )
+                                )
+                            except Exception:
+                                # The messages are still sent, but cannot be replayed
+                                logger.exception("Error storing events")
+                                event_ids = [None] * len(batch)
+                            finally:
+                                for _ in batch:
+                                    self._store_pending.popleft()
+
+                            for (stream_id, session_message), event_id in zip(batch, event_ids):
+                                await self._send_to_request_stream(
+                                    stream_id, EventMessage(session_message.message, event_id, session_message.encoded)
+                                )
+                finally:
+                    # Forget messages the router stopped before queueing
+                    self._store_pending.clear()
 
             # Start the message router
             tg.start_soon(message_router)
+            if event_store is not None and queue_size is not None and store_queue_reader is not None:
+                tg.start_soon(event_store_writer, event_store, queue_size, store_queue_reader)
 
             try:
                 # Yield the streams for the caller to use
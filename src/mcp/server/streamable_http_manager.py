@@ -4,27 +4,142 @@ from __future__ import annotations
 
 import contextlib
 import logging
-from collections.abc import AsyncIterator
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Iterator
+from dataclasses import dataclass, field
 from http import HTTPStatus
-from typing import Any
+from typing import Any, Literal
 from uuid import uuid4
 
 import anyio
 from anyio.abc import TaskStatus
+from anyio.streams.memory import MemoryObjectSendStream
+from pydantic import ValidationError
 from starlette.requests import Request
 from starlette.responses import Response
-from starlette.types import Receive, Scope, Send
+from starlette.types import Message, Receive, Scope, Send
 
 from mcp.server.lowlevel.server import Server as MCPServer
+from mcp.server.metrics import render_metric
+from mcp.server.models import InitializationOptions
 from mcp.server.streamable_http import (
     MCP_SESSION_ID_HEADER,
     EventStore,
+    SlowConsumerPolicy,
     StreamableHTTPServerTransport,
 )
 from mcp.server.transport_security import TransportSecuritySettings
+from mcp.shared.codec import DEFAULT_CODEC, Codec
+from mcp.shared.message import SessionMessage, SessionMessageBatch
+from mcp.types import JSONRPCMessage, JSONRPCRequest
 
 logger = logging.getLogger(__name__)
 
+# Bounds on how often idle and expired sessions are looked for, in seconds
+_MIN_EVICTION_INTERVAL = 0.01
+_MAX_EVICTION_INTERVAL = 30.0
+
+
+@dataclass(frozen=True)
+class StreamBacklog:
+    """Messages waiting for a client that is slow to read one of its streams."""
+
+    session_id: str
+    """Session of the stream."""
+    stream_id: str
+    """ID of the stream: the ID of the request it responds to, or the GET stream."""
+    messages: int
+    """Messages buffered for the stream."""
+
+
+@dataclass(frozen=True)
+class SessionStats:
+    """Point-in-time session counts for a session manager."""
+
+    live: int
+    """Sessions currently tracked."""
+    evicted_idle: int
+    """Sessions terminated because they were idle for longer than `session_idle_timeout`."""
+    evicted_expired: int
+    """Sessions terminated because they were older than `session_ttl`."""
+    evicted_lru: int
+    """Sessions terminated to make room for a new session under `max_sessions`."""
+    rejected: int
+    """New sessions refused because `max_sessions` was reached and every session was busy."""
+    event_store_lag: float = 0.0
+    """Seconds the oldest message waiting to be stored write-behind, in any session, has waited."""
+    stream_backlogs: tuple[StreamBacklog, ...] = ()
+    """Streams with buffered messages, largest backlog first."""
+
+    def render_prometheus(self) -> str:
+        """
+        Render the session counts in the Prometheus text exposition format.
+
+        Stream backlogs are rendered in aggregate: a session ID lets whoever knows it
+        use the session, so session IDs are never exposed as labels.
+        """
+        evicted = [
+            ({"reason": "idle"}, self.evicted_idle),
+            ({"reason": "expired"}, self.evicted_expired),
+            ({"reason": "lru"}, self.evicted_lru),
+        ]
+        return (
+            render_metric("mcp_sessions", "Live streamable HTTP sessions.", "gauge", [({}, self.live)])
+            + render_metric("mcp_sessions_evicted_total", "Sessions terminated by the server.", "counter", evicted)
+            + render_metric(
+                "mcp_sessions_rejected_total", "Sessions refused at max_sessions.", "counter", [({}, self.rejected)]
+            )
+            + render_metric(
+                "mcp_event_store_lag_seconds",
+                "Age of the oldest message waiting to be stored write-behind.",
+                "gauge",
+                [({}, self.event_store_lag)],
+            )
+            + render_metric(
+                "mcp_stream_backlog_streams",
+                "Streams with messages buffered because the client is slow to read them.",
+                "gauge",
+                [({}, len(self.stream_backlogs))],
+            )
+            + render_metric(
+                "mcp_stream_backlog_messages",
+                "Messages buffered for streams the client is slow to read.",
+                "gauge",
+                [({}, sum(backlog.messages for backlog in self.stream_backlogs))],
+            )
+            + render_metric(
+                "mcp_stream_backlog_max",
+                "Messages buffered for the stream with the largest backlog.",
+                "gauge",
+                [({}, max((backlog.messages for backlog in self.stream_backlogs), default=0))],
+            )
+        )
+
+
+@dataclass
+class _ManagedSession:
+    transport: StreamableHTTPServerTransport
+    created_at: float
+    last_active: float
+    # Cancels the session's server task, and with it any in-flight handlers
+    cancel_scope: anyio.CancelScope = field(default_factory=anyio.CancelScope)
+    # HTTP requests currently being handled; a session is never idle while this is non-zero
+    active_requests: int = 0
+
+
+def _replay_body(body: bytes, receive: Receive) -> Receive:
+    """Wrap `receive` so that an already read request body is received again."""
+    replayed = False
+
+    async def replay() -> Message:
+        nonlocal replayed
+        if replayed:
+            return await receive()
+        replayed = True
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    return replay
+
 
 class StreamableHTTPSessionManager:
     """
@@ -51,6 +166,27 @@ class StreamableHTTPSessionManager:
         json_response: Whether to use JSON responses instead of SSE streams
         stateless: If True, creates a completely fresh transport for each request
                    with no session tracking or state persistence between requests.
+        codec: Codec used by every transport to encode and decode messages.
+        session_idle_timeout: Seconds a session may go without HTTP requests before it
+                   is terminated. A session is not idle while a request, including a
+                   GET stream, is open. None keeps idle sessions forever.
+        session_ttl: Seconds after which a session is terminated regardless of activity.
+                   None lets sessions live forever.
+        max_sessions: Maximum number of sessions. When a new session would exceed it,
+                   the least recently used session without open requests is terminated;
+                   if every session has open requests, the new session is refused with
+                   503 Service Unavailable. None means unlimited.
+        session_id_prefix: Prefix of every session ID, such as the worker that owns
+                   the session when several worker processes serve one endpoint.
+        event_store_queue_size: If set, each session stores outgoing messages in the
+                   event store write-behind, queueing up to this many messages and
+                   storing them in batches, so a slow store does not hold up routing.
+                   See `StreamableHTTPServerTransport`. None stores each message inline.
+        request_stream_buffer_size: Messages buffered for each response or GET stream.
+        slow_consumer_policy: What to do with a message for a stream whose buffer is
+                   full: wait ("block"), drop it if it is a notification
+                   ("drop_notifications"), or end the stream ("disconnect"), which
+                   requires an event store to replay what the client missed.
     """
 
     def __init__(
@@ -60,16 +196,49 @@ class StreamableHTTPSessionManager:
         json_response: bool = False,
         stateless: bool = False,
         security_settings: TransportSecuritySettings | None = None,
+        codec: Codec = DEFAULT_CODEC,
+        session_idle_timeout: float | None = None,
+        session_ttl: float | None = None,
+        max_sessions: int | None = None,
+        session_id_prefix: str = "",
+        event_store_queue_size: int | None = None,
+        request_stream_buffer_size: int = 32,
+        slow_consumer_policy: SlowConsumerPolicy = "block",
     ):
+        for name, value in (("session_idle_timeout", session_idle_timeout), ("session_ttl", session_ttl)):
+            if value is not None and value <= 0:
+                raise ValueError(f"{name} must be positive, got {value}")
+        if max_sessions is not None and max_sessions < 1:
+            raise ValueError(f"max_sessions must be at least 1, got {max_sessions}")
+        if event_store_queue_size is not None and event_store_queue_size < 1:
+            raise ValueError(f"event_store_queue_size must be at least 1, got {event_store_queue_size}")
+        if request_stream_buffer_size < 0:
+            raise ValueError(f"request_stream_buffer_size must not be negative, got {request_stream_buffer_size}")
+        if slow_consumer_policy == "disconnect" and event_store is None:
+            raise ValueError('slow_consumer_policy "disconnect" requires an event store')
+
         self.app = app
         self.event_store = event_store
         self.json_response = json_response
         self.stateless = stateless
         self.security_settings = security_settings
-
-        # Session tracking (only used if not stateless)
-        self._session_creation_lock = anyio.Lock()
-        self._server_instances: dict[str, StreamableHTTPServerTransport] = {}
+        self.codec = codec
+        self.session_idle_timeout = session_idle_timeout
+        self.session_ttl = session_ttl
+        self.max_sessions = max_sessions
+        self.session_id_prefix = session_id_prefix
+        self.event_store_queue_size = event_store_queue_size
+        self.request_stream_buffer_size = request_stream_buffer_size
+        self.slow_consumer_policy: SlowConsumerPolicy = slow_consumer_policy
+
+        # Session tracking (only used if not stateless), least recently used first
+        self._server_instances: OrderedDict[str, _ManagedSession] = OrderedDict()
+        # Built on first use, rather than for every session or stateless request
+        self._initialization_options: InitializationOptions | None = None
+        self._evicted_idle = 0
+        self._evicted_expired = 0
+        self._evicted_lru = 0
+        self._rejected = 0
 
         # The task group will be set during lifespan
         self._task_group = None
@@ -82,7 +251,8 @@ class StreamableHTTPSessionManager:
         """
         Run the session manager with proper lifecycle management.
 
-        This creates and manages the task group for all session operations.
+        This creates and manages the task group for all session operations, and runs
+        the server's lifespan once for all sessions (see `Server.app_lifespan()`).
 
         Important: This method can only be called once per instance. The same
         StreamableHTTPSessionManager instance cannot be reused after this
@@ -104,9 +274,11 @@ class StreamableHTTPSessionManager:
                 )
             self._has_started = True
 
-        async with anyio.create_task_group() as tg:
+        async with self.app.app_lifespan(), anyio.create_task_group() as tg:
             # Store the task group for later use
             self._task_group = tg
+            if not self.stateless and (self.session_idle_timeout is not None or self.session_ttl is not None):
+                tg.start_soon(self._evict_sessions_periodically)
             logger.info("StreamableHTTP session manager started")
             try:
                 yield  # Let the application run
@@ -118,6 +290,30 @@ class StreamableHTTPSessionManager:
                 # Clear any remaining server instances
                 self._server_instances.clear()
 
+    def session_stats(self) -> SessionStats:
+        """Live session count, how many sessions were evicted or refused, event store lag and stream backlogs."""
+        return SessionStats(
+            live=len(self._server_instances),
+            evicted_idle=self._evicted_idle,
+            evicted_expired=self._evicted_expired,
+            evicted_lru=self._evicted_lru,
+            rejected=self._rejected,
+            event_store_lag=max(
+                (session.transport.event_store_lag for session in self._server_instances.values()), default=0.0
+            ),
+            stream_backlogs=tuple(
+                sorted(
+                    (
+                        StreamBacklog(session_id, stream_id, messages)
+                        for session_id, session in self._server_instances.items()
+                        for stream_id, messages in session.transport.stream_backlogs().items()
+                    ),
+                    key=lambda backlog: backlog.messages,
+                    reverse=True,
+                )
+            ),
+        )
+
     async def handle_request(
         self,
         scope: Scope,
@@ -157,6 +353,24 @@ class StreamableHTTPSessionManager:
             receive: ASGI receive function
             send: ASGI send function
         """
+        if scope["method"] == "POST":
+            request = Request(scope, receive)
+            body = await request.body()
+            message = self._decode_single_request(body)
+            if message is not None:
+                # A single request is dispatched straight to the server, without a session
+                http_transport = StreamableHTTPServerTransport(
+                    mcp_session_id=None,
+                    is_json_response_enabled=self.json_response,
+                    event_store=None,
+                    security_settings=self.security_settings,
+                    codec=self.codec,
+                )
+                await http_transport.handle_direct_request(request, send, message, self._dispatch_stateless)
+                return
+            # Anything else takes the full path below, which reads the body again
+            receive = _replay_body(body, receive)
+
         logger.debug("Stateless mode: Creating new transport for this request")
         # No session ID needed in stateless mode
         http_transport = StreamableHTTPServerTransport(
@@ -164,6 +378,7 @@ class StreamableHTTPSessionManager:
             is_json_response_enabled=self.json_response,
             event_store=None,  # No event store in stateless mode
             security_settings=self.security_settings,
+            codec=self.codec,
         )
 
         # Start server in a new task
@@ -177,6 +392,7 @@ class StreamableHTTPSessionManager:
                         write_stream,
                         self.app.create_initialization_options(),
                         stateless=True,
+                        supports_batches=True,
                     )
                 except Exception:
                     logger.exception("Stateless session crashed")
@@ -192,6 +408,23 @@ class StreamableHTTPSessionManager:
         # Terminate the transport after the request is handled
         await http_transport.terminate()
 
+    def _decode_single_request(self, body: bytes) -> JSONRPCMessage | None:
+        """Decode a body holding a single JSON-RPC request, or return None for anything else."""
+        try:
+            decoded = self.codec.decode(body)
+        except ValidationError:
+            return None
+        if isinstance(decoded, list) or not isinstance(decoded.root, JSONRPCRequest):
+            return None
+        return decoded
+
+    async def _dispatch_stateless(
+        self,
+        message: SessionMessage,
+        write_stream: MemoryObjectSendStream[SessionMessage | SessionMessageBatch],
+    ) -> None:
+        await self.app.handle_stateless_request(message, write_stream, self._get_initialization_options())
+
     async def _handle_stateful_request(
         self,
         scope: Scope,
@@ -211,57 +444,81 @@ class StreamableHTTPSessionManager:
 
         # Existing session case
         if request_mcp_session_id is not None and request_mcp_session_id in self._server_instances:
-            transport = self._server_instances[request_mcp_session_id]
+            session = self._server_instances[request_mcp_session_id]
+            self._server_instances.move_to_end(request_mcp_session_id)
             logger.debug("Session already exists, handling request directly")
-            await transport.handle_request(scope, receive, send)
+            await self._handle_session_request(session, scope, receive, send)
             return
 
         if request_mcp_session_id is None:
             # New session case
             logger.debug("Creating new transport")
-            async with self._session_creation_lock:
-                new_session_id = uuid4().hex
-                http_transport = StreamableHTTPServerTransport(
-                    mcp_session_id=new_session_id,
-                    is_json_response_enabled=self.json_response,
-                    event_store=self.event_store,  # May be None (no resumability)
-                    security_settings=self.security_settings,
+            # The capacity check and the registry insertion happen without awaiting in
+            # between, so concurrent initialize requests need no lock and run in parallel
+            evicted = self._make_room_for_session()
+            if evicted is False:
+                self._rejected += 1
+                response = Response(
+                    "Service Unavailable: Too many sessions",
+                    status_code=HTTPStatus.SERVICE_UNAVAILABLE,
                 )
+                await response(scope, receive, send)
+                return
+
+            new_session_id = self.session_id_prefix + uuid4().hex
+            http_transport = StreamableHTTPServerTransport(
+                mcp_session_id=new_session_id,
+                is_json_response_enabled=self.json_response,
+                # May be None (no resumability)
+                event_store=self.event_store.for_session(new_session_id) if self.event_store else None,
+                security_settings=self.security_settings,
+                codec=self.codec,
+                event_store_queue_size=self.event_store_queue_size,
+                request_stream_buffer_size=self.request_stream_buffer_size,
+                slow_consumer_policy=self.slow_consumer_policy,
+            )
 
-                assert http_transport.mcp_session_id is not None
-                self._server_instances[http_transport.mcp_session_id] = http_transport
-                logger.info(f"Created new transport with session ID: {new_session_id}")
-
-                # Define the server runner
-                async def run_server(*, task_status: TaskStatus[None] = anyio.TASK_STATUS_IGNORED) -> None:
-                    async with http_transport.connect() as streams:
-                        read_stream, write_stream = streams
-                        task_status.started()
-                        try:
+            assert http_transport.mcp_session_id is not None
+            now = anyio.current_time()
+            session = _ManagedSession(http_transport, created_at=now, last_active=now)
+            self._server_instances[http_transport.mcp_session_id] = session
+            logger.info(f"Created new transport with session ID: {new_session_id}")
+
+            # Define the server runner
+            async def run_server(*, task_status: TaskStatus[None] = anyio.TASK_STATUS_IGNORED) -> None:
+                async with http_transport.connect() as streams:
+                    read_stream, write_stream = streams
+                    task_status.started()
+                    try:
+                        with session.cancel_scope:
                             await self.app.run(
                                 read_stream,
                                 write_stream,
-                                self.app.create_initialization_options(),
+                                self._get_initialization_options(),
                                 stateless=False,  # Stateful mode
+                                supports_batches=True,
                             )
-                        except Exception as e:
-                            logger.error(
-                                f"Session {http_transport.mcp_session_id} crashed: {e}",
-                                exc_info=True,
+                    except Exception as e:
+                        logger.error(
+                            f"Session {http_transport.mcp_session_id} crashed: {e}",
+                            exc_info=True,
+                        )
+                    finally:
+                        # Only remove from instances if not terminated
+                        if (
+                            http_transport.mcp_session_id
+                            and http_transport.mcp_session_id in self._server_instances
+                            and not http_transport.is_terminated
+                        ):
+                            logger.info(
+                                f"Cleaning up crashed session {http_transport.mcp_session_id} from active instances."
                             )
-                        finally:
-                            # Only remove from instances if not terminated
-                            if (
-                                http_transport.mcp_session_id
-                                and http_transport.mcp_session_id in self._server_instances
-                                and not http_transport.is_terminated
-                            ):
-                                logger.info(
-                                    "Cleaning up crashed session "
-                                    f"{http_transport.mcp_session_id} from "
-                                    "active instances."
-                                )
-                                del self._server_instances[http_transport.mcp_session_id]
+                            del self._server_instances[http_transport.mcp_session_id]
+
+            # Mark the session active before the first await, so it is not evicted while initializing
+            with self._active(session):
+                if evicted is not None:
+                    await self._stop_session(evicted)
 
                 # Assert task group is not None for type checking
                 assert self._task_group is not None
@@ -269,11 +526,86 @@ class StreamableHTTPSessionManager:
                 await self._task_group.start(run_server)
 
                 # Handle the HTTP request and return the response
-                await http_transport.handle_request(scope, receive, send)
+                await session.transport.handle_request(scope, receive, send)
         else:
-            # Invalid session ID
+            # Unknown, terminated or evicted session: the client should start a new one
             response = Response(
-                "Bad Request: No valid session ID provided",
-                status_code=HTTPStatus.BAD_REQUEST,
+                "Not Found: Invalid or expired session ID",
+                status_code=HTTPStatus.NOT_FOUND,
             )
             await response(scope, receive, send)
+
+    @contextlib.contextmanager
+    def _active(self, session: _ManagedSession) -> Iterator[None]:
+        """Track a request for a session, so the session is not idle while it is open."""
+        session.active_requests += 1
+        session.last_active = anyio.current_time()
+        try:
+            yield
+        finally:
+            session.active_requests -= 1
+            session.last_active = anyio.current_time()
+
+    async def _handle_session_request(
+        self,
+        session: _ManagedSession,
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+    ) -> None:
+        """Handle a request for a session, tracking its activity for idle eviction."""
+        with self._active(session):
+            await session.transport.handle_request(scope, receive, send)
+
+    def _make_room_for_session(self) -> _ManagedSession | Literal[False] | None:
+        """Remove the least recently used idle session if `max_sessions` is reached.
+
+        Returns the removed session, which the caller must stop, None if there was room
+        already, or False if the limit is reached and every session has open requests.
+        """
+        if self.max_sessions is None or len(self._server_instances) < self.max_sessions:
+            return None
+        for session_id, session in self._server_instances.items():
+            if session.active_requests == 0:
+                self._evicted_lru += 1
+                logger.info(f"Evicting least recently used session {session_id}")
+                return self._server_instances.pop(session_id)
+        return False
+
+    def _get_initialization_options(self) -> InitializationOptions:
+        """Initialization options for new sessions, built once rather than per session."""
+        if self._initialization_options is None:
+            self._initialization_options = self.app.create_initialization_options()
+        return self._initialization_options
+
+    async def _evict_sessions_periodically(self) -> None:
+        """Terminate sessions that are idle or older than their TTL."""
+        timeouts = [t for t in (self.session_idle_timeout, self.session_ttl) if t is not None]
+        interval = min(max(min(timeouts) / 4, _MIN_EVICTION_INTERVAL), _MAX_EVICTION_INTERVAL)
+        while True:
+            await anyio.sleep(interval)
+            now = anyio.current_time()
+            for session_id, session in list(self._server_instances.items()):
+                if self.session_ttl is not None and now - session.created_at > self.session_ttl:
+                    self._evicted_expired += 1
+                    await self._evict_session(session_id, "expired")
+                elif (
+                    self.session_idle_timeout is not None
+                    and session.active_requests == 0
+                    and now - session.last_active > self.session_idle_timeout
+                ):
+                    self._evicted_idle += 1
+                    await self._evict_session(session_id, "idle")
+
+    async def _evict_session(self, session_id: str, reason: str) -> None:
+        """Stop tracking a session, terminate its transport and cancel its handlers."""
+        session = self._server_instances.pop(session_id, None)
+        if session is None:
+            return
+        logger.info(f"Evicting {reason} session {session_id}")
+        await self._stop_session(session)
+
+    async def _stop_session(self, session: _ManagedSession) -> None:
+        """Terminate the transport of an untracked session and cancel its handlers."""
+        await session.transport.terminate()
+        session.cancel_scope.cancel()
@@ -0,0 +1,264 @@
+"""
+Multi-process serving of streamable HTTP with session affinity.
+
+A streamable HTTP session lives in the process that created it. To use more than one
+core without a sticky load balancer, `run_workers()` pre-forks worker processes that
+all accept connections from one shared listening socket, so any worker may receive any
+request. Each worker prefixes the IDs of the sessions it creates with its index (see
+`WorkerInfo.session_id_prefix`) and wraps its app in `SessionAffinityMiddleware`, which
+forwards a request carrying another worker's session ID to that worker over a Unix
+socket private to it.
+
+Pre-forking requires `os.fork()`, so multiple workers are not available on Windows.
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+import re
+import shutil
+import signal
+import socket
+import tempfile
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+import anyio
+import httpx
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from mcp.server.streamable_http import MCP_SESSION_ID_HEADER
+
+logger = logging.getLogger(__name__)
+
+_SESSION_OWNER_PATTERN = re.compile(r"w(\d+)-")
+_SESSION_ID_HEADER = MCP_SESSION_ID_HEADER.encode()
+
+# Headers that apply to one connection, and are not forwarded between workers
+_HOP_BY_HOP_HEADERS = frozenset(
+    {
+        b"connection",
+        b"keep-alive",
+        b"proxy-authenticate",
+        b"proxy-authorization",
+        b"te",
+        b"trailer",
+        b"transfer-encoding",
+        b"upgrade",
+    }
+)
+
+
+def session_owner(session_id: str) -> int | None:
+    """Return the index of the worker that created a session, or None if it is not encoded."""
+    match = _SESSION_OWNER_PATTERN.match(session_id)
+    return int(match.group(1)) if match else None
+
+
+class SessionAffinityMiddleware:
+    """
+    ASGI middleware that forwards requests for sessions owned by another worker.
+
+    A request is forwarded if its session ID header names another worker; everything
+    else, including requests without a session ID, is handled by the wrapped app.
+    The request body is read before it is forwarded, and the response is streamed
+    back as it arrives, so SSE responses work through the forwarder. The connections
+    to the other workers are closed when the lifespan of the app shuts down.
+
+    Args:
+        app: The app of this worker.
+        worker: Index of this worker.
+        worker_transports: HTTP transports reaching each worker, by worker index. The
+            entry of this worker is not used.
+    """
+
+    def __init__(self, app: ASGIApp, worker: int, worker_transports: Sequence[httpx.AsyncBaseTransport]) -> None:
+        self.app = app
+        self.worker = worker
+        self._clients = [
+            httpx.AsyncClient(transport=transport, base_url="http://mcp-worker", timeout=None)
+            for transport in worker_transports
+        ]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "lifespan":
+            await self.app(scope, receive, self._close_on_shutdown(send))
+            return
+        owner = self._owner(scope) if scope["type"] == "http" else None
+        if owner is None:
+            await self.app(scope, receive, send)
+        else:
+            await self._forward(self._clients[owner], scope, receive, send)
+
+    async def aclose(self) -> None:
+        """Close the connections to the other workers. Called when the app shuts down."""
+        for client in self._clients:
+            await client.aclose()
+
+    def _close_on_shutdown(self, send: Send) -> Send:
+        """Wrap the lifespan's send, closing the connections once the app has shut down."""
+
+        async def send_lifespan(message: Message) -> None:
+            if message["type"] in ("lifespan.shutdown.complete", "lifespan.shutdown.failed"):
+                await self.aclose()
+            await send(message)
+
+        return send_lifespan
+
+    def _owner(self, scope: Scope) -> int | None:
+        """The worker a request has to be forwarded to, or None to handle it here."""
+        for name, value in scope["headers"]:
+            if name == _SESSION_ID_HEADER:
+                owner = session_owner(value.decode("latin-1"))
+                if owner is not None and owner != self.worker and owner < len(self._clients):
+                    return owner
+                return None
+        return None
+
+    async def _forward(self, client: httpx.AsyncClient, scope: Scope, receive: Receive, send: Send) -> None:
+        body = bytearray()
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                return
+            body += message.get("body", b"")
+            if not message.get("more_body", False):
+                break
+
+        path = scope.get("raw_path") or scope["path"].encode()
+        if scope.get("query_string"):
+            path += b"?" + scope["query_string"]
+        headers = [(name, value) for name, value in scope["headers"] if name not in _HOP_BY_HOP_HEADERS]
+
+        async with anyio.create_task_group() as tg:
+
+            async def cancel_on_disconnect() -> None:
+                # Stops forwarding a long-lived SSE response once the client goes away
+                while (await receive())["type"] != "http.disconnect":
+                    pass
+                tg.cancel_scope.cancel()
+
+            tg.start_soon(cancel_on_disconnect)
+            started = False
+            try:
+                request = client.build_request(
+                    scope["method"], path.decode("latin-1"), headers=headers, content=bytes(body)
+                )
+                response = await client.send(request, stream=True)
+                try:
+                    await send(
+                        {
+                            "type": "http.response.start",
+                            "status": response.status_code,
+                            "headers": [
+                                (name, value)
+                                for name, value in response.headers.raw
+                                if name.lower() not in _HOP_BY_HOP_HEADERS
+                            ],
+                        }
+                    )
+                    started = True
+                    async for chunk in response.aiter_raw():
+                        await send({"type": "http.response.body", "body": chunk, "more_body": True})
+                    await send({"type": "http.response.body", "body": b"", "more_body": False})
+                finally:
+                    await response.aclose()
+            except httpx.TransportError as e:
+                logger.warning(f"Could not forward request to the worker owning its session: {e}")
+                if not started:
+                    await send({"type": "http.response.start", "status": 502, "headers": []})
+                    await send({"type": "http.response.body", "body": b"Bad Gateway", "more_body": False})
+            tg.cancel_scope.cancel()
+
+
+@dataclass(frozen=True)
+class WorkerInfo:
+    """What a worker process started by `run_workers()` needs to serve requests."""
+
+    index: int
+    """Index of this worker, encoded in the IDs of the sessions it creates."""
+    sockets: list[socket.socket]
+    """The shared listening socket and the Unix socket private to this worker."""
+    socket_paths: list[str]
+    """Paths of the private Unix sockets of all workers, by worker index."""
+
+    @property
+    def session_id_prefix(self) -> str:
+        """Prefix of the IDs of the sessions created by this worker."""
+        return f"w{self.index}-"
+
+    def affinity_middleware(self, app: ASGIApp) -> SessionAffinityMiddleware:
+        """Wrap the app of this worker so requests for other workers' sessions are forwarded."""
+        transports = [httpx.AsyncHTTPTransport(uds=path) for path in self.socket_paths]
+        return SessionAffinityMiddleware(app, self.index, transports)
+
+
+def run_workers(
+    serve: Callable[[WorkerInfo], None],
+    *,
+    host: str,
+    port: int,
+    workers: int,
+    backlog: int = 2048,
+) -> None:
+    """
+    Listen on host and port, and serve from several pre-forked worker processes.
+
+    `serve` runs in each worker and must serve HTTP on all of `WorkerInfo.sockets`,
+    for example with `uvicorn.Server(config).run(sockets=worker.sockets)`, until the
+    worker receives SIGINT or SIGTERM. Returns once every worker has exited; SIGINT
+    and SIGTERM received by this process are passed on to the workers.
+    """
+    if workers < 1:
+        raise ValueError(f"workers must be at least 1, got {workers}")
+    if not hasattr(os, "fork"):
+        raise RuntimeError("Multiple workers require os.fork(), which is not available on this platform")
+
+    listener = socket.create_server((host, port), backlog=backlog)
+    listener.set_inheritable(True)
+    socket_dir = tempfile.mkdtemp(prefix="mcp-workers-")
+    socket_paths = [os.path.join(socket_dir, f"worker-{index}.sock") for index in range(workers)]
+
+    context = multiprocessing.get_context("fork")
+    processes = [
+        context.Process(target=_worker_main, args=(serve, index, listener, socket_paths), name=f"mcp-worker-{index}")
+        for index in range(workers)
+    ]
+
+    def stop(signum: int, frame: Any) -> None:
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+
+    previous_handler = signal.signal(signal.SIGTERM, stop)
+    try:
+        for process in processes:
+            process.start()
+        logger.info(f"Started {workers} workers on {host}:{port}")
+        try:
+            for process in processes:
+                process.join()
+        except KeyboardInterrupt:
+            stop(signal.SIGINT, None)
+            for process in processes:
+                process.join()
+    finally:
+        signal.signal(signal.SIGTERM, previous_handler)
+        listener.close()
+        shutil.rmtree(socket_dir, ignore_errors=True)
+
+
+def _worker_main(
+    serve: Callable[[WorkerInfo], None],
+    index: int,
+    listener: socket.socket,
+    socket_paths: list[str],
+) -> None:
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    private = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    private.bind(socket_paths[index])
+    private.listen()
+    serve(WorkerInfo(index=index, sockets=[listener, private], socket_paths=socket_paths))
@@ -7,17 +7,19 @@ from pydantic_core import ValidationError
 from starlette.types import Receive, Scope, Send
 from starlette.websockets import WebSocket
 
-import mcp.types as types
-from mcp.shared.message import SessionMessage
+from mcp.shared.codec import DEFAULT_CODEC, Codec
+from mcp.shared.message import BatchResponses, SessionMessage, SessionMessageBatch
 
 logger = logging.getLogger(__name__)
 
 
 @asynccontextmanager
-async def websocket_server(scope: Scope, receive: Receive, send: Send):
+async def websocket_server(scope: Scope, receive: Receive, send: Send, codec: Codec = DEFAULT_CODEC):
     """
     WebSocket server transport for MCP. This is an ASGI application, suitable to be
     used with a framework like Starlette and a server like Hypercorn.
+
+    Messages are encoded and decoded with `codec`.
     """
 
     websocket = WebSocket(scope, receive, send)
@@ -26,33 +28,38 @@ async def websocket_server(scope: Scope, receive: Receive, send: Send):
     read_stream: MemoryObjectReceiveStream[SessionMessage | Exception]
     read_stream_writer: MemoryObjectSendStream[SessionMessage | Exception]
 
-    write_stream: MemoryObjectSendStream[SessionMessage]
-    write_stream_reader: MemoryObjectReceiveStream[SessionMessage]
+    write_stream: MemoryObjectSendStream[SessionMessage | SessionMessageBatch]
+    write_stream_reader: MemoryObjectReceiveStream[SessionMessage | SessionMessageBatch]
 
     read_stream_writer, read_stream = anyio.create_memory_object_stream(0)
     write_stream, write_stream_reader = anyio.create_memory_object_stream(0)
+    batch_responses = BatchResponses()
 
     async def ws_reader():
         try:
             async with read_stream_writer:
                 async for msg in websocket.iter_text():
                     try:
-                        client_message = types.JSONRPCMessage.model_validate_json(msg)
+                        decoded = codec.decode(msg)
                     except ValidationError as exc:
                         await read_stream_writer.send(exc)
                         continue
 
-                    session_message = SessionMessage(client_message)
-                    await read_stream_writer.send(session_message)
+                    # Messages in a batch are handled individually; their responses go back together
+                    if isinstance(decoded, list):
+                        batch_responses.expect(decoded)
+                    for client_message in decoded if isinstance(decoded, list) else [decoded]:
+                        await read_stream_writer.send(SessionMessage(client_message))
         except anyio.ClosedResourceError:
             await websocket.close()
 
     async def ws_writer():
         try:
             async with write_stream_reader:
-                async for session_message in write_stream_reader:
-                    obj = session_message.message.model_dump_json(by_alias=True, exclude_none=True)
-                    await websocket.send_text(obj)
+                async for item in write_stream_reader:
+                    session_message = batch_responses.collect(item)
+                    if session_message is not None:
+                        await websocket.send_text(session_message.encode(codec).decode())
         except anyio.ClosedResourceError:
             await websocket.close()
 
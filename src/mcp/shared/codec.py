@@ -0,0 +1,90 @@
+"""
+Wire codecs for JSON-RPC messages.
+
+Every transport in this package encodes and decodes messages through a `Codec`. The
+default, `PydanticCodec`, parses and serializes JSON with pydantic-core directly
+from and to bytes. `JSONLibraryCodec` plugs in another JSON library instead:
+
+```
+    import orjson
+
+    codec = JSONLibraryCodec(orjson.loads, orjson.dumps)
+    async with stdio_server(codec=codec) as (read_stream, write_stream):
+        ...
+```
+
+Both sides of a connection may use different codecs; the wire format is plain JSON.
+"""
+
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from typing import Any
+
+from pydantic import BaseModel
+
+from mcp.shared.message import decode_messages, encode_message, json_invalid_error, message_members, validate_messages
+from mcp.types import JSONRPCMessage
+
+
+class Codec(ABC):
+    """Encodes JSON-RPC messages to bytes and decodes them from the wire."""
+
+    @abstractmethod
+    def encode(self, message: JSONRPCMessage) -> bytes:
+        """Encode a message as UTF-8 JSON, without None-valued envelope members."""
+        ...
+
+    @abstractmethod
+    def decode(self, data: str | bytes) -> JSONRPCMessage | list[JSONRPCMessage]:
+        """Decode a message, or a batch of messages sent as a JSON array.
+
+        Raises:
+            pydantic.ValidationError: If the data is not valid JSON (with a `json_invalid`
+                error), is an empty batch, or contains something other than JSON-RPC
+                messages.
+        """
+        ...
+
+
+class PydanticCodec(Codec):
+    """The default codec, which validates JSON in a single pydantic-core pass."""
+
+    def encode(self, message: JSONRPCMessage) -> bytes:
+        return encode_message(message)
+
+    def decode(self, data: str | bytes) -> JSONRPCMessage | list[JSONRPCMessage]:
+        return decode_messages(data)
+
+
+class JSONLibraryCodec(Codec):
+    """A codec that parses and serializes JSON with another library, e.g. orjson.
+
+    Args:
+        loads: Parses JSON from bytes or str, like `json.loads`. Must raise ValueError on
+            malformed input.
+        dumps: Serializes plain JSON data to bytes or str, like `json.dumps`.
+    """
+
+    def __init__(self, loads: Callable[[str | bytes], Any], dumps: Callable[[Any], bytes | str]) -> None:
+        self._loads = loads
+        self._dumps = dumps
+
+    def encode(self, message: JSONRPCMessage) -> bytes:
+        members = {
+            name: value.model_dump(by_alias=True, mode="json", exclude_none=True)
+            if isinstance(value, BaseModel)
+            else value
+            for name, value in message_members(message).items()
+        }
+        encoded = self._dumps(members)
+        return encoded.encode() if isinstance(encoded, str) else encoded
+
+    def decode(self, data: str | bytes) -> JSONRPCMessage | list[JSONRPCMessage]:
+        try:
+            parsed = self._loads(data)
+        except ValueError as e:
+            raise json_invalid_error(data, e) from e
+        return validate_messages(parsed)
+
+
+DEFAULT_CODEC: Codec = PydanticCodec()
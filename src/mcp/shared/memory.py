@@ -16,9 +16,12 @@ import mcp.types as types
 from mcp.client.session import ClientSession, ElicitationFnT, ListRootsFnT, LoggingFnT, MessageHandlerFnT, SamplingFnT
 from mcp.server import Server
 from mcp.server.fastmcp import FastMCP
-from mcp.shared.message import SessionMessage
+from mcp.shared.message import SessionMessage, SessionMessageBatch
 
-MessageStream = tuple[MemoryObjectReceiveStream[SessionMessage | Exception], MemoryObjectSendStream[SessionMessage]]
+MessageStream = tuple[
+    MemoryObjectReceiveStream[SessionMessage | SessionMessageBatch | Exception],
+    MemoryObjectSendStream[SessionMessage | SessionMessageBatch],
+]
 
 
 @asynccontextmanager
@@ -31,8 +34,13 @@ async def create_client_server_memory_streams() -> AsyncGenerator[tuple[MessageS
         (read_stream, write_stream)
     """
     # Create streams for both directions
-    server_to_client_send, server_to_client_receive = anyio.create_memory_object_stream[SessionMessage | Exception](1)
-    client_to_server_send, client_to_server_receive = anyio.create_memory_object_stream[SessionMessage | Exception](1)
+    # Batches are passed on as they are, and split by the receiving session
+    server_to_client_send, server_to_client_receive = anyio.create_memory_object_stream[
+        SessionMessage | SessionMessageBatch | Exception
+    ](1)
+    client_to_server_send, client_to_server_receive = anyio.create_memory_object_stream[
+        SessionMessage | SessionMessageBatch | Exception
+    ](1)
 
     client_streams = (server_to_client_receive, client_to_server_send)
     server_streams = (client_to_server_receive, server_to_client_send)
@@ -77,6 +85,7 @@ async def create_connected_server_and_client_session(
                     server_write,
                     server.create_initialization_options(),
                     raise_exceptions=raise_exceptions,
+                    supports_batches=True,
                 )
             )
 
@@ -91,6 +100,7 @@ async def create_connected_server_and_client_session(
                     message_handler=message_handler,
                     client_info=client_info,
                     elicitation_callback=elicitation_callback,
+                    supports_batches=True,
                 ) as client_session:
                     await client_session.initialize()
                     yield client_session
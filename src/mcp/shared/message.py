@@ -6,9 +6,16 @@ to support transport-specific features like resumability.
 """
 
 from collections.abc import Awaitable, Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Annotated, Any
 
-from mcp.types import JSONRPCMessage, RequestId
+import pydantic_core
+from pydantic import Field, TypeAdapter, ValidationError
+
+from mcp.types import JSONRPCError, JSONRPCMessage, JSONRPCRequest, JSONRPCResponse, RequestId
+
+if TYPE_CHECKING:
+    from mcp.shared.codec import Codec
 
 ResumptionToken = str
 
@@ -35,9 +42,148 @@ class ServerMessageMetadata:
 MessageMetadata = ClientMessageMetadata | ServerMessageMetadata | None
 
 
+def message_members(message: JSONRPCMessage) -> dict[str, Any]:
+    """Return the members of a message's JSON-RPC envelope that are not None.
+
+    Payloads such as params and result are returned as they are, without being copied.
+    """
+    root = message.root
+    members: dict[str, Any] = {name: value for name, value in root.__dict__.items() if value is not None}
+    if root.model_extra:
+        members.update((name, value) for name, value in root.model_extra.items() if value is not None)
+    return members
+
+
+def encode_message(message: JSONRPCMessage) -> bytes:
+    """Encode a JSON-RPC message as UTF-8 JSON.
+
+    Produces the same output as `message.model_dump_json(by_alias=True, exclude_none=True)`.
+    The envelope's members are handed to pydantic-core as a plain dict, which serializes
+    the `dict[str, Any]` params/result payloads considerably faster than the model
+    serializer does.
+    """
+    # exclude_none only applies to nested models here (e.g. ErrorData), not to payload dicts
+    return pydantic_core.to_json(message_members(message), by_alias=True, exclude_none=True)
+
+
+_batch_adapter: TypeAdapter[list[JSONRPCMessage]] = TypeAdapter(Annotated[list[JSONRPCMessage], Field(min_length=1)])
+
+
+def json_invalid_error(data: str | bytes, error: ValueError) -> ValidationError:
+    """Build the validation error pydantic raises for malformed JSON."""
+    return ValidationError.from_exception_data(
+        "JSONRPCMessage", [{"type": "json_invalid", "input": data, "ctx": {"error": str(error)}}]
+    )
+
+
+def validate_messages(parsed: Any) -> JSONRPCMessage | list[JSONRPCMessage]:
+    """Validate parsed JSON as a JSON-RPC message, or as a batch if it is a list.
+
+    Raises:
+        pydantic.ValidationError: If the data is an empty batch, or contains something
+            other than JSON-RPC messages.
+    """
+    if isinstance(parsed, list):
+        return _batch_adapter.validate_python(parsed)
+    return JSONRPCMessage.model_validate(parsed)
+
+
+def decode_messages(data: str | bytes) -> JSONRPCMessage | list[JSONRPCMessage]:
+    """Decode a JSON-RPC message, or a batch of messages sent as a JSON array.
+
+    The JSON is parsed first and then validated, so a single parse tells a batch from a
+    single message; `JSONRPCMessage.model_validate_json()` accepts no arrays.
+
+    Raises:
+        pydantic.ValidationError: If the data is not valid JSON (with a `json_invalid`
+            error), is an empty batch, or contains something other than JSON-RPC messages.
+    """
+    try:
+        parsed = pydantic_core.from_json(data)
+    except ValueError as e:
+        raise json_invalid_error(data, e) from e
+    return validate_messages(parsed)
+
+
 @dataclass
 class SessionMessage:
     """A message with specific metadata for transport-specific features."""
 
     message: JSONRPCMessage
     metadata: MessageMetadata = None
+    encoded: bytes | None = None
+    """The message encoded as JSON, if it already has been. Set by `encode()`."""
+
+    def encode(self, codec: "Codec | None" = None) -> bytes:
+        """Return the message encoded as JSON, serializing it at most once.
+
+        Transports write these bytes as they are, so a message that is written more than
+        once (e.g. stored for resumability and sent over SSE) is only serialized once.
+        The message is serialized with `codec`, or with `encode_message()` if it is None.
+        """
+        if self.encoded is None:
+            self.encoded = codec.encode(self.message) if codec is not None else encode_message(self.message)
+        return self.encoded
+
+
+@dataclass
+class SessionMessageBatch:
+    """Messages that a transport writes together, as a single JSON-RPC batch.
+
+    Sessions send batches from `BaseSession.send_batch()` and `send_notifications()`, and
+    only when created with `supports_batches=True`. The write streams of the transports in
+    this package are typed to accept them. Transports split batches they read into
+    individual messages, except the in-memory transport, whose batches are split by the
+    receiving session.
+    """
+
+    messages: list[SessionMessage]
+
+    def encode(self, codec: "Codec | None" = None) -> bytes:
+        """Return the batch encoded as a JSON array."""
+        return b"[" + b",".join(message.encode(codec) for message in self.messages) + b"]"
+
+
+@dataclass
+class _PendingBatch:
+    request_ids: list[RequestId]
+    responses: dict[RequestId, SessionMessage] = field(default_factory=dict[RequestId, SessionMessage])
+
+
+class BatchResponses:
+    """Holds back the responses to the requests of a JSON-RPC batch until all have arrived.
+
+    JSON-RPC answers a batch with a single array. Transports that hand the messages of a
+    batch to the session one by one register the batch with `expect()` before doing so,
+    and pass everything the session writes through `collect()`.
+    """
+
+    def __init__(self) -> None:
+        self._pending: dict[RequestId, _PendingBatch] = {}
+
+    def expect(self, messages: list[JSONRPCMessage]) -> None:
+        """Register a batch read from the client, whose requests are to be answered together."""
+        request_ids = list(
+            dict.fromkeys(message.root.id for message in messages if isinstance(message.root, JSONRPCRequest))
+        )
+        batch = _PendingBatch(request_ids)
+        for request_id in request_ids:
+            self._pending[request_id] = batch
+
+    def collect(self, item: SessionMessage | SessionMessageBatch) -> SessionMessage | SessionMessageBatch | None:
+        """Return what to write for an item written by the session, or None to write nothing yet.
+
+        A response to a request of a batch is held back, and the batch's responses are
+        returned as a SessionMessageBatch, in request order, with the last of them.
+        Anything else is returned as it is.
+        """
+        if not isinstance(item, SessionMessage) or not isinstance(item.message.root, JSONRPCResponse | JSONRPCError):
+            return item
+        request_id = item.message.root.id
+        batch = self._pending.pop(request_id, None)
+        if batch is None:
+            return item
+        batch.responses[request_id] = item
+        if len(batch.responses) < len(batch.request_ids):
+            return None
+        return SessionMessageBatch([batch.responses[request_id] for request_id in batch.request_ids])
@@ -1,9 +1,13 @@
-from collections.abc import Generator
+from collections.abc import Awaitable, Callable, Generator
 from contextlib import contextmanager
 from dataclasses import dataclass, field
+from types import TracebackType
 from typing import Generic
 
+import anyio
+from anyio.abc import TaskGroup
 from pydantic import BaseModel
+from typing_extensions import Self
 
 from mcp.shared.context import LifespanContextT, RequestContext
 from mcp.shared.session import (
@@ -14,7 +18,7 @@ from mcp.shared.session import (
     SendRequestT,
     SendResultT,
 )
-from mcp.types import ProgressToken
+from mcp.types import ProgressToken, RequestId
 
 
 class Progress(BaseModel):
@@ -22,6 +26,122 @@ class Progress(BaseModel):
     total: float | None
 
 
+@dataclass(frozen=True)
+class ProgressThrottle:
+    """Limits how often progress notifications are sent for a single progress token.
+
+    An update is sent only if at least `min_interval` seconds have passed since the last
+    notification for its token and the progress moved by at least `min_delta`. Updates
+    that are held back are not queued: only the latest one is kept. It is sent once
+    `min_interval` has passed if it moved the progress by `min_delta`, and otherwise
+    before the response to the request that owns the token. The first update for a token
+    and updates that reach `total` are always sent.
+    """
+
+    min_interval: float = 0.0
+    min_delta: float = 0.0
+
+    def __post_init__(self) -> None:
+        if self.min_interval < 0:
+            raise ValueError(f"min_interval must not be negative, got {self.min_interval}")
+        if self.min_delta < 0:
+            raise ValueError(f"min_delta must not be negative, got {self.min_delta}")
+
+
+@dataclass
+class ProgressUpdate:
+    """A progress notification waiting to be sent."""
+
+    progress_token: ProgressToken
+    progress: float
+    total: float | None = None
+    message: str | None = None
+    related_request_id: RequestId | None = None
+
+
+@dataclass
+class _TokenState:
+    last_sent_at: float
+    last_sent_progress: float
+    pending: ProgressUpdate | None = None
+
+
+class ProgressThrottler:
+    """Coalesces progress updates per progress token according to a `ProgressThrottle`.
+
+    Held back updates are only sent when `min_interval` has passed while the throttler
+    is entered with `async with`, which runs the timers. Exiting it drops the updates
+    and tokens that were never flushed.
+    """
+
+    def __init__(self, throttle: ProgressThrottle, send: Callable[[ProgressUpdate], Awaitable[None]]) -> None:
+        self.throttle = throttle
+        self._send = send
+        self._tokens: dict[ProgressToken, _TokenState] = {}
+        self._task_group: TaskGroup | None = None
+
+    async def __aenter__(self) -> Self:
+        self._task_group = anyio.create_task_group()
+        await self._task_group.__aenter__()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> bool | None:
+        assert self._task_group is not None
+        task_group, self._task_group = self._task_group, None
+        self._tokens.clear()
+        task_group.cancel_scope.cancel()
+        return await task_group.__aexit__(exc_type, exc_val, exc_tb)
+
+    async def update(self, update: ProgressUpdate) -> None:
+        """Send an update now, or hold it back as the latest update for its token."""
+        now = anyio.current_time()
+        state = self._tokens.get(update.progress_token)
+        if state is not None and not self._due(state, update, now):
+            if state.pending is None and self._task_group is not None and self.throttle.min_interval > 0:
+                self._task_group.start_soon(self._send_when_due, update.progress_token, state)
+            state.pending = update
+            return
+
+        self._tokens[update.progress_token] = _TokenState(last_sent_at=now, last_sent_progress=update.progress)
+        await self._send(update)
+
+    async def flush(self, progress_token: ProgressToken) -> None:
+        """Send the held back update for a token, if any, and forget the token."""
+        state = self._tokens.pop(progress_token, None)
+        if state is not None and state.pending is not None:
+            await self._send(state.pending)
+
+    async def _send_when_due(self, progress_token: ProgressToken, state: _TokenState) -> None:
+        """Send the update held back for a token once `min_interval` has passed."""
+        await anyio.sleep_until(state.last_sent_at + self.throttle.min_interval)
+        pending = state.pending
+        # The token may have been flushed, or a later update sent, meanwhile
+        if self._tokens.get(progress_token) is not state or pending is None:
+            return
+        now = anyio.current_time()
+        if not self._due(state, pending, now):
+            return
+        self._tokens[progress_token] = _TokenState(last_sent_at=now, last_sent_progress=pending.progress)
+        try:
+            await self._send(pending)
+        except (anyio.BrokenResourceError, anyio.ClosedResourceError):
+            # The session is closing
+            pass
+
+    def _due(self, state: _TokenState, update: ProgressUpdate, now: float) -> bool:
+        if update.total is not None and update.progress >= update.total:
+            return True
+        return (
+            now - state.last_sent_at >= self.throttle.min_interval
+            and abs(update.progress - state.last_sent_progress) >= self.throttle.min_delta
+        )
+
+
 @dataclass
 class ProgressContext(Generic[SendRequestT, SendNotificationT, SendResultT, ReceiveRequestT, ReceiveNotificationT]):
     session: BaseSession[SendRequestT, SendNotificationT, SendResultT, ReceiveRequestT, ReceiveNotificationT]
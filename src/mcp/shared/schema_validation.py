@@ -0,0 +1,66 @@
+"""
+Compiled JSON Schema validators.
+
+`jsonschema.validate()` checks the schema and builds a new validator on every call.
+Tool input and output schemas are validated on every tool call, so both the server
+and the client keep compiled validators around instead.
+"""
+
+from typing import Any
+
+from jsonschema import ValidationError, exceptions, validators
+from jsonschema.protocols import Validator
+
+
+def compile_schema(schema: dict[str, Any]) -> Validator:
+    """Check a JSON Schema and build a reusable validator for it.
+
+    Raises:
+        jsonschema.SchemaError: If the schema itself is invalid.
+    """
+    cls = validators.validator_for(schema)
+    cls.check_schema(schema)
+    return cls(schema)
+
+
+def validate_instance(validator: Validator, instance: Any) -> None:
+    """Validate an instance with a compiled validator.
+
+    Raises the same error `jsonschema.validate()` would for the first failure.
+    """
+    # jsonschema does not annotate the return type of best_match
+    error: ValidationError | None = exceptions.best_match(  # type: ignore[reportUnknownMemberType]
+        validator.iter_errors(instance)
+    )
+    if error is not None:
+        raise error
+
+
+class SchemaValidatorCache:
+    """Compiled validators keyed by name (usually a tool name).
+
+    Entries must be invalidated by the owner whenever the schema for a name changes.
+    """
+
+    def __init__(self) -> None:
+        self._validators: dict[str, Validator] = {}
+
+    def get(self, name: str, schema: dict[str, Any]) -> Validator:
+        """Return the cached validator for `name`, compiling `schema` on a miss."""
+        validator = self._validators.get(name)
+        if validator is None:
+            validator = compile_schema(schema)
+            self._validators[name] = validator
+        return validator
+
+    def invalidate(self, name: str) -> None:
+        self._validators.pop(name, None)
+
+    def clear(self) -> None:
+        self._validators.clear()
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._validators
+
+    def __len__(self) -> int:
+        return len(self._validators)
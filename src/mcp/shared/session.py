@@ -1,9 +1,9 @@
 import logging
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from contextlib import AsyncExitStack
 from datetime import timedelta
 from types import TracebackType
-from typing import Any, Generic, Protocol, TypeVar
+from typing import Any, Generic, Protocol, TypeVar, cast
 
 import anyio
 import httpx
@@ -12,7 +12,12 @@ from pydantic import BaseModel
 from typing_extensions import Self
 
 from mcp.shared.exceptions import McpError
-from mcp.shared.message import MessageMetadata, ServerMessageMetadata, SessionMessage
+from mcp.shared.message import (
+    MessageMetadata,
+    ServerMessageMetadata,
+    SessionMessage,
+    SessionMessageBatch,
+)
 from mcp.types import (
     CONNECTION_CLOSED,
     INVALID_PARAMS,
@@ -43,6 +48,43 @@ ReceiveNotificationT = TypeVar("ReceiveNotificationT", ClientNotification, Serve
 RequestId = str | int
 
 
+def _decoded_fields(message: JSONRPCRequest | JSONRPCNotification) -> dict[str, Any]:
+    """Return the members of a decoded request or notification for typed validation.
+
+    This matches `message.model_dump(by_alias=True, mode="json", exclude_none=True)` for
+    messages decoded from the wire, but hands the already-decoded params over as they are
+    instead of serializing them again.
+    """
+    fields: dict[str, Any] = {"method": message.method, "jsonrpc": message.jsonrpc}
+    if message.params is not None:
+        fields["params"] = message.params
+    if isinstance(message, JSONRPCRequest):
+        fields["id"] = message.id
+    if message.model_extra:
+        fields.update((key, value) for key, value in message.model_extra.items() if value is not None)
+    return fields
+
+
+class _ResponseSlot:
+    """Where the receive loop delivers the response to a single outgoing request.
+
+    Cheaper than a memory object stream pair per request: one event and one attribute.
+    """
+
+    __slots__ = ("event", "response")
+
+    def __init__(self) -> None:
+        self.event = anyio.Event()
+        self.response: JSONRPCResponse | JSONRPCError | None = None
+
+    def resolve(self, response: JSONRPCResponse | JSONRPCError) -> None:
+        # Only the first response counts; later ones (e.g. a connection-closed error
+        # racing a real response) are dropped.
+        if self.response is None:
+            self.response = response
+            self.event.set()
+
+
 class ProgressFnT(Protocol):
     """Protocol for progress notification callbacks."""
 
@@ -93,7 +135,9 @@ class RequestResponder(Generic[ReceiveRequestT, SendResultT]):
     def __enter__(self) -> "RequestResponder[ReceiveRequestT, SendResultT]":
         """Enter the context manager, enabling request cancellation tracking."""
         self._entered = True
-        self._cancel_scope = anyio.CancelScope()
+        # A request cancelled before it was entered stays cancelled
+        if not self._cancel_scope.cancel_called:
+            self._cancel_scope = anyio.CancelScope()
         self._cancel_scope.__enter__()
         return self
 
@@ -133,14 +177,19 @@ class RequestResponder(Generic[ReceiveRequestT, SendResultT]):
             )
 
     async def cancel(self) -> None:
-        """Cancel this request and mark it as completed."""
-        if not self._entered:
-            raise RuntimeError("RequestResponder must be used as a context manager")
+        """Cancel this request and mark it as completed.
+
+        A request that is not being handled yet, e.g. because it is queued for
+        admission, is answered now and must not be handled afterwards.
+        """
         if not self._cancel_scope:
             raise RuntimeError("No active cancel scope")
 
         self._cancel_scope.cancel()
         self._completed = True  # Mark as completed so it's removed from in_flight
+        if not self._entered:
+            # __exit__ will not remove it from in_flight
+            self._on_complete(self)
         # Send an error response to indicate cancellation
         await self._session._send_response(  # type: ignore[reportPrivateUsage]
             request_id=self.request_id,
@@ -173,23 +222,27 @@ class BaseSession(
     messages when entered.
     """
 
-    _response_streams: dict[RequestId, MemoryObjectSendStream[JSONRPCResponse | JSONRPCError]]
+    _response_slots: dict[RequestId, _ResponseSlot]
     _request_id: int
     _in_flight: dict[RequestId, RequestResponder[ReceiveRequestT, SendResultT]]
     _progress_callbacks: dict[RequestId, ProgressFnT]
 
     def __init__(
         self,
-        read_stream: MemoryObjectReceiveStream[SessionMessage | Exception],
+        read_stream: MemoryObjectReceiveStream[SessionMessage | SessionMessageBatch | Exception],
         write_stream: MemoryObjectSendStream[SessionMessage],
         receive_request_type: type[ReceiveRequestT],
         receive_notification_type: type[ReceiveNotificationT],
         # If none, reading will never time out
         read_timeout_seconds: timedelta | None = None,
+        # Whether the write stream accepts SessionMessageBatch items, as those of the
+        # transports in this package do. If not, the messages of a batch are sent one by one.
+        supports_batches: bool = False,
     ) -> None:
         self._read_stream = read_stream
         self._write_stream = write_stream
-        self._response_streams = {}
+        self._supports_batches = supports_batches
+        self._response_slots = {}
         self._request_id = 0
         self._receive_request_type = receive_request_type
         self._receive_notification_type = receive_notification_type
@@ -236,11 +289,12 @@ class BaseSession(
         request_id = self._request_id
         self._request_id = request_id + 1
 
-        response_stream, response_stream_reader = anyio.create_memory_object_stream[JSONRPCResponse | JSONRPCError](1)
-        self._response_streams[request_id] = response_stream
+        slot = _ResponseSlot()
+        self._response_slots[request_id] = slot
 
-        # Set up progress token if progress callback is provided
+        # Converted to a dict once, as results are (see _response_message)
         request_data = request.model_dump(by_alias=True, mode="json", exclude_none=True)
+        # Set up progress token if progress callback is provided
         if progress_callback is not None:
             # Use request_id as progress token
             if "params" not in request_data:
@@ -252,7 +306,8 @@ class BaseSession(
             self._progress_callbacks[request_id] = progress_callback
 
         try:
-            jsonrpc_request = JSONRPCRequest(
+            # request_data was just dumped from a validated model, so skip validating it again
+            jsonrpc_request = JSONRPCRequest.model_construct(
                 jsonrpc="2.0",
                 id=request_id,
                 **request_data,
@@ -260,16 +315,10 @@ class BaseSession(
 
             await self._write_stream.send(SessionMessage(message=JSONRPCMessage(jsonrpc_request), metadata=metadata))
 
-            # request read timeout takes precedence over session read timeout
-            timeout = None
-            if request_read_timeout_seconds is not None:
-                timeout = request_read_timeout_seconds.total_seconds()
-            elif self._session_read_timeout_seconds is not None:
-                timeout = self._session_read_timeout_seconds.total_seconds()
-
+            timeout = self._read_timeout(request_read_timeout_seconds)
             try:
                 with anyio.fail_after(timeout):
-                    response_or_error = await response_stream_reader.receive()
+                    await slot.event.wait()
             except TimeoutError:
                 raise McpError(
                     ErrorData(
@@ -282,16 +331,97 @@ class BaseSession(
                     )
                 )
 
+            response_or_error = slot.response
+            assert response_or_error is not None
             if isinstance(response_or_error, JSONRPCError):
                 raise McpError(response_or_error.error)
             else:
                 return result_type.model_validate(response_or_error.result)
 
         finally:
-            self._response_streams.pop(request_id, None)
+            self._response_slots.pop(request_id, None)
             self._progress_callbacks.pop(request_id, None)
-            await response_stream.aclose()
-            await response_stream_reader.aclose()
+
+    async def send_batch(
+        self,
+        requests: Sequence[SendRequestT],
+        result_type: type[ReceiveResultT],
+        request_read_timeout_seconds: timedelta | None = None,
+        metadata: MessageMetadata = None,
+    ) -> list[ReceiveResultT | ErrorData]:
+        """
+        Sends several requests as a single JSON-RPC batch, which the transport
+        writes at once (e.g. in one HTTP POST), and waits for all of their
+        responses. If the session was not created with `supports_batches=True`,
+        the requests are sent one by one.
+
+        Returns one entry per request, in order: the validated result, or the
+        ErrorData the peer responded with. Raises an McpError if the responses
+        do not all arrive within the read timeout.
+        """
+        if not requests:
+            return []
+
+        request_ids: list[RequestId] = []
+        slots: list[_ResponseSlot] = []
+        messages: list[SessionMessage] = []
+        for request in requests:
+            request_id = self._request_id
+            self._request_id = request_id + 1
+            request_ids.append(request_id)
+
+            slot = _ResponseSlot()
+            self._response_slots[request_id] = slot
+            slots.append(slot)
+
+            jsonrpc_request = JSONRPCRequest.model_construct(
+                jsonrpc="2.0",
+                id=request_id,
+                **request.model_dump(by_alias=True, mode="json", exclude_none=True),
+            )
+            messages.append(SessionMessage(message=JSONRPCMessage(jsonrpc_request), metadata=metadata))
+
+        try:
+            await self._send_messages(messages)
+
+            timeout = self._read_timeout(request_read_timeout_seconds)
+            try:
+                with anyio.fail_after(timeout):
+                    for slot in slots:
+                        await slot.event.wait()
+            except TimeoutError:
+                raise McpError(
+                    ErrorData(
+                        code=httpx.codes.REQUEST_TIMEOUT,
+                        message=(
+                            f"Timed out while waiting for responses to a batch of {len(requests)} "
+                            f"requests. Waited {timeout} seconds."
+                        ),
+                    )
+                )
+
+            results: list[ReceiveResultT | ErrorData] = []
+            for slot in slots:
+                response_or_error = slot.response
+                assert response_or_error is not None
+                if isinstance(response_or_error, JSONRPCError):
+                    results.append(response_or_error.error)
+                else:
+                    results.append(result_type.model_validate(response_or_error.result))
+            return results
+
+        finally:
+            for request_id in request_ids:
+                self._response_slots.pop(request_id, None)
+
+    def _read_timeout(self, request_read_timeout_seconds: timedelta | None) -> float | None:
+        """The read timeout for a request, in seconds, or None to wait forever."""
+        # request read timeout takes precedence over session read timeout
+        if request_read_timeout_seconds is not None:
+            return request_read_timeout_seconds.total_seconds()
+        if self._session_read_timeout_seconds is not None:
+            return self._session_read_timeout_seconds.total_seconds()
+        return None
 
     async def send_notification(
         self,
@@ -302,31 +432,103 @@ class BaseSession(
         Emits a notification, which is a one-way message that does not expect
         a response.
         """
+        await self._write_stream.send(self._notification_message(notification, related_request_id))
+
+    async def send_notifications(
+        self,
+        notifications: Sequence[SendNotificationT],
+        related_request_id: RequestId | None = None,
+    ) -> None:
+        """
+        Emits several notifications at once. A transport that accepts batches
+        writes them together as a single JSON-RPC batch.
+        """
+        if len(notifications) == 1:
+            await self.send_notification(notifications[0], related_request_id)
+        elif notifications:
+            await self._send_messages(
+                [self._notification_message(notification, related_request_id) for notification in notifications]
+            )
+
+    async def _send_messages(self, messages: list[SessionMessage]) -> None:
+        """Write messages as one batch if the write stream accepts batches, or else one by one."""
+        if self._supports_batches:
+            write_stream = cast(MemoryObjectSendStream[SessionMessage | SessionMessageBatch], self._write_stream)
+            await write_stream.send(SessionMessageBatch(messages))
+        else:
+            for message in messages:
+                await self._write_stream.send(message)
+
+    def _notification_message(
+        self, notification: SendNotificationT, related_request_id: RequestId | None
+    ) -> SessionMessage:
         # Some transport implementations may need to set the related_request_id
         # to attribute to the notifications to the request that triggered them.
-        jsonrpc_notification = JSONRPCNotification(
+        jsonrpc_notification = JSONRPCNotification.model_construct(
             jsonrpc="2.0",
             **notification.model_dump(by_alias=True, mode="json", exclude_none=True),
         )
-        session_message = SessionMessage(
+        return SessionMessage(
             message=JSONRPCMessage(jsonrpc_notification),
             metadata=ServerMessageMetadata(related_request_id=related_request_id) if related_request_id else None,
         )
-        await self._write_stream.send(session_message)
 
     async def _send_response(self, request_id: RequestId, response: SendResultT | ErrorData) -> None:
+        await self._write_stream.send(self._response_message(request_id, response))
+
+    def _response_message(self, request_id: RequestId, response: SendResultT | ErrorData) -> SessionMessage:
         if isinstance(response, ErrorData):
             jsonrpc_error = JSONRPCError(jsonrpc="2.0", id=request_id, error=response)
-            session_message = SessionMessage(message=JSONRPCMessage(jsonrpc_error))
-            await self._write_stream.send(session_message)
-        else:
-            jsonrpc_response = JSONRPCResponse(
+            return SessionMessage(message=JSONRPCMessage(jsonrpc_error))
+        # The result is converted to a plain dict once, and serialized once when encoded.
+        # The envelope's params and result members are typed as dicts: with a model there,
+        # dumping a message read from a stream (as event stores do) warns and misserializes.
+        jsonrpc_response = JSONRPCResponse.model_construct(
+            jsonrpc="2.0",
+            id=request_id,
+            result=response.model_dump(by_alias=True, mode="json", exclude_none=True),
+        )
+        return SessionMessage(message=JSONRPCMessage(jsonrpc_response))
+
+    async def _receive_request(
+        self, message: SessionMessage, request: JSONRPCRequest
+    ) -> RequestResponder[ReceiveRequestT, SendResultT] | None:
+        """Validate a request and build its responder.
+
+        Returns None if the request was invalid, in which case an error response has
+        been sent, or if `_received_request` already responded to it.
+        """
+        try:
+            validated_request = self._receive_request_type.model_validate(_decoded_fields(request))
+            responder = RequestResponder(
+                request_id=request.id,
+                request_meta=validated_request.root.params.meta if validated_request.root.params else None,
+                request=validated_request,
+                session=self,
+                on_complete=lambda r: self._in_flight.pop(r.request_id, None),
+                message_metadata=message.metadata,
+            )
+            self._in_flight[responder.request_id] = responder
+            await self._received_request(responder)
+        except Exception as e:
+            # For request validation errors, send a proper JSON-RPC error
+            # response instead of crashing the server
+            logging.warning(f"Failed to validate request: {e}")
+            logging.debug(f"Message that failed validation: {request}")
+            error_response = JSONRPCError(
                 jsonrpc="2.0",
-                id=request_id,
-                result=response.model_dump(by_alias=True, mode="json", exclude_none=True),
+                id=request.id,
+                error=ErrorData(
+                    code=INVALID_PARAMS,
+                    message="Invalid request parameters",
+                    data="",
+                ),
             )
-            session_message = SessionMessage(message=JSONRPCMessage(jsonrpc_response))
+            session_message = SessionMessage(message=JSONRPCMessage(error_response))
             await self._write_stream.send(session_message)
+            return None
+
+        return None if responder._completed else responder  # type: ignore[reportPrivateUsage]
 
     async def _receive_loop(self) -> None:
         async with (
@@ -334,90 +536,61 @@ class BaseSession(
             self._write_stream,
         ):
             try:
-                async for message in self._read_stream:
-                    if isinstance(message, Exception):
-                        await self._handle_incoming(message)
-                    elif isinstance(message.message.root, JSONRPCRequest):
-                        try:
-                            validated_request = self._receive_request_type.model_validate(
-                                message.message.root.model_dump(by_alias=True, mode="json", exclude_none=True)
-                            )
-                            responder = RequestResponder(
-                                request_id=message.message.root.id,
-                                request_meta=validated_request.root.params.meta
-                                if validated_request.root.params
-                                else None,
-                                request=validated_request,
-                                session=self,
-                                on_complete=lambda r: self._in_flight.pop(r.request_id, None),
-                                message_metadata=message.metadata,
-                            )
-                            self._in_flight[responder.request_id] = responder
-                            await self._received_request(responder)
-
-                            if not responder._completed:  # type: ignore[reportPrivateUsage]
+                async for item in self._read_stream:
+                    # Batches are handled as if their messages had arrived one by one
+                    messages = item.messages if isinstance(item, SessionMessageBatch) else (item,)
+                    for message in messages:
+                        if isinstance(message, Exception):
+                            await self._handle_incoming(message)
+                        elif isinstance(message.message.root, JSONRPCRequest):
+                            responder = await self._receive_request(message, message.message.root)
+                            if responder is not None:
                                 await self._handle_incoming(responder)
-                        except Exception as e:
-                            # For request validation errors, send a proper JSON-RPC error
-                            # response instead of crashing the server
-                            logging.warning(f"Failed to validate request: {e}")
-                            logging.debug(f"Message that failed validation: {message.message.root}")
-                            error_response = JSONRPCError(
-                                jsonrpc="2.0",
-                                id=message.message.root.id,
-                                error=ErrorData(
-                                    code=INVALID_PARAMS,
-                                    message="Invalid request parameters",
-                                    data="",
-                                ),
-                            )
-                            session_message = SessionMessage(message=JSONRPCMessage(error_response))
-                            await self._write_stream.send(session_message)
-
-                    elif isinstance(message.message.root, JSONRPCNotification):
-                        try:
-                            notification = self._receive_notification_type.model_validate(
-                                message.message.root.model_dump(by_alias=True, mode="json", exclude_none=True)
-                            )
-                            # Handle cancellation notifications
-                            if isinstance(notification.root, CancelledNotification):
-                                cancelled_id = notification.root.params.requestId
-                                if cancelled_id in self._in_flight:
-                                    await self._in_flight[cancelled_id].cancel()
+
+                        elif isinstance(message.message.root, JSONRPCNotification):
+                            try:
+                                notification = self._receive_notification_type.model_validate(
+                                    _decoded_fields(message.message.root)
+                                )
+                                # Handle cancellation notifications
+                                if isinstance(notification.root, CancelledNotification):
+                                    cancelled_id = notification.root.params.requestId
+                                    if cancelled_id in self._in_flight:
+                                        await self._in_flight[cancelled_id].cancel()
+                                else:
+                                    # Handle progress notifications callback
+                                    if isinstance(notification.root, ProgressNotification):
+                                        progress_token = notification.root.params.progressToken
+                                        # If there is a progress callback for this token,
+                                        # call it with the progress information
+                                        if progress_token in self._progress_callbacks:
+                                            callback = self._progress_callbacks[progress_token]
+                                            try:
+                                                await callback(
+                                                    notification.root.params.progress,
+                                                    notification.root.params.total,
+                                                    notification.root.params.message,
+                                                )
+                                            except Exception as e:
+                                                logging.error(
+                                                    "Progress callback raised an exception: %s",
+                                                    e,
+                                                )
+                                    await self._received_notification(notification)
+                                    await self._handle_incoming(notification)
+                            except Exception as e:
+                                # For other validation errors, log and continue
+                                logging.warning(
+                                    f"Failed to validate notification: {e}. Message was: {message.message.root}"
+                                )
+                        else:  # Response or error
+                            slot = self._response_slots.pop(message.message.root.id, None)
+                            if slot is not None:
+                                slot.resolve(message.message.root)
                             else:
-                                # Handle progress notifications callback
-                                if isinstance(notification.root, ProgressNotification):
-                                    progress_token = notification.root.params.progressToken
-                                    # If there is a progress callback for this token,
-                                    # call it with the progress information
-                                    if progress_token in self._progress_callbacks:
-                                        callback = self._progress_callbacks[progress_token]
-                                        try:
-                                            await callback(
-                                                notification.root.params.progress,
-                                                notification.root.params.total,
-                                                notification.root.params.message,
-                                            )
-                                        except Exception as e:
-                                            logging.error(
-                                                "Progress callback raised an exception: %s",
-                                                e,
-                                            )
-                                await self._received_notification(notification)
-                                await self._handle_incoming(notification)
-                        except Exception as e:
-                            # For other validation errors, log and continue
-                            logging.warning(
-                                f"Failed to validate notification: {e}. Message was: {message.message.root}"
-                            )
-                    else:  # Response or error
-                        stream = self._response_streams.pop(message.message.root.id, None)
-                        if stream:
-                            await stream.send(message.message.root)
-                        else:
-                            await self._handle_incoming(
-                                RuntimeError(f"Received response with an unknown request ID: {message}")
-                            )
+                                await self._handle_incoming(
+                                    RuntimeError(f"Received response with an unknown request ID: {message}")
+                                )
 
             except anyio.ClosedResourceError:
                 # This is expected when the client disconnects abruptly.
@@ -431,15 +604,10 @@ class BaseSession(
             finally:
                 # after the read stream is closed, we need to send errors
                 # to any pending requests
-                for id, stream in self._response_streams.items():
-                    error = ErrorData(code=CONNECTION_CLOSED, message="Connection closed")
-                    try:
-                        await stream.send(JSONRPCError(jsonrpc="2.0", id=id, error=error))
-                        await stream.aclose()
-                    except Exception:
-                        # Stream might already be closed
-                        pass
-                self._response_streams.clear()
+                error = ErrorData(code=CONNECTION_CLOSED, message="Connection closed")
+                for id, slot in self._response_slots.items():
+                    slot.resolve(JSONRPCError(jsonrpc="2.0", id=id, error=error))
+                self._response_slots.clear()
 
     async def _received_request(self, responder: RequestResponder[ReceiveRequestT, SendResultT]) -> None:
         """
@@ -1,7 +1,7 @@
 from collections.abc import Callable
-from typing import Annotated, Any, Generic, Literal, TypeAlias, TypeVar
+from typing import Annotated, Any, Generic, Literal, TypeAlias, TypeVar, cast
 
-from pydantic import BaseModel, ConfigDict, Field, FileUrl, RootModel
+from pydantic import BaseModel, ConfigDict, Discriminator, Field, FileUrl, RootModel, Tag
 from pydantic.networks import AnyUrl, UrlConstraints
 from typing_extensions import deprecated
 
@@ -149,6 +149,7 @@ class JSONRPCResponse(BaseModel):
 # SDK error codes
 CONNECTION_CLOSED = -32000
 # REQUEST_TIMEOUT = -32001  # the typescript sdk uses this
+SERVER_BUSY = -32003
 
 # Standard JSON-RPC error codes
 PARSE_ERROR = -32700
@@ -188,7 +189,39 @@ class JSONRPCError(BaseModel):
     model_config = ConfigDict(extra="allow")
 
 
-class JSONRPCMessage(RootModel[JSONRPCRequest | JSONRPCNotification | JSONRPCResponse | JSONRPCError]):
+def _jsonrpc_message_kind(value: Any) -> str | None:
+    """Pick the JSON-RPC message type from the members present, so decoding takes a single pass."""
+    if isinstance(value, dict):
+        members = cast(dict[str, Any], value)
+        if "method" in members:
+            return "request" if members.get("id") is not None else "notification"
+        if "error" in members:
+            return "error"
+        if "result" in members:
+            return "response"
+        return None
+    if isinstance(value, JSONRPCRequest):
+        return "request"
+    if isinstance(value, JSONRPCNotification):
+        return "notification"
+    if isinstance(value, JSONRPCResponse):
+        return "response"
+    if isinstance(value, JSONRPCError):
+        return "error"
+    return None
+
+
+class JSONRPCMessage(
+    RootModel[
+        Annotated[
+            Annotated[JSONRPCRequest, Tag("request")]
+            | Annotated[JSONRPCNotification, Tag("notification")]
+            | Annotated[JSONRPCResponse, Tag("response")]
+            | Annotated[JSONRPCError, Tag("error")],
+            Discriminator(_jsonrpc_message_kind),
+        ]
+    ]
+):
     pass
 
 
@@ -1249,26 +1282,34 @@ class CancelledNotification(Notification[CancelledNotificationParams, Literal["n
 
 class ClientRequest(
     RootModel[
-        PingRequest
-        | InitializeRequest
-        | CompleteRequest
-        | SetLevelRequest
-        | GetPromptRequest
-        | ListPromptsRequest
-        | ListResourcesRequest
-        | ListResourceTemplatesRequest
-        | ReadResourceRequest
-        | SubscribeRequest
-        | UnsubscribeRequest
-        | CallToolRequest
-        | ListToolsRequest
+        Annotated[
+            PingRequest
+            | InitializeRequest
+            | CompleteRequest
+            | SetLevelRequest
+            | GetPromptRequest
+            | ListPromptsRequest
+            | ListResourcesRequest
+            | ListResourceTemplatesRequest
+            | ReadResourceRequest
+            | SubscribeRequest
+            | UnsubscribeRequest
+            | CallToolRequest
+            | ListToolsRequest,
+            Field(discriminator="method"),
+        ]
     ]
 ):
     pass
 
 
 class ClientNotification(
-    RootModel[CancelledNotification | ProgressNotification | InitializedNotification | RootsListChangedNotification]
+    RootModel[
+        Annotated[
+            CancelledNotification | ProgressNotification | InitializedNotification | RootsListChangedNotification,
+            Field(discriminator="method"),
+        ]
+    ]
 ):
     pass
 
@@ -1315,19 +1356,29 @@ class ClientResult(RootModel[EmptyResult | CreateMessageResult | ListRootsResult
     pass
 
 
-class ServerRequest(RootModel[PingRequest | CreateMessageRequest | ListRootsRequest | ElicitRequest]):
+class ServerRequest(
+    RootModel[
+        Annotated[
+            PingRequest | CreateMessageRequest | ListRootsRequest | ElicitRequest,
+            Field(discriminator="method"),
+        ]
+    ]
+):
     pass
 
 
 class ServerNotification(
     RootModel[
-        CancelledNotification
-        | ProgressNotification
-        | LoggingMessageNotification
-        | ResourceUpdatedNotification
-        | ResourceListChangedNotification
-        | ToolListChangedNotification
-        | PromptListChangedNotification
+        Annotated[
+            CancelledNotification
+            | ProgressNotification
+            | LoggingMessageNotification
+            | ResourceUpdatedNotification
+            | ResourceListChangedNotification
+            | ToolListChangedNotification
+            | PromptListChangedNotification,
+            Field(discriminator="method"),
+        ]
     ]
 ):
     pass
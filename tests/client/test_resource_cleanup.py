@@ -12,9 +12,9 @@ from mcp.types import ClientNotification, ClientRequest, ClientResult, EmptyResu
 @pytest.mark.anyio
 async def test_send_request_stream_cleanup():
     """
-    Test that send_request properly cleans up streams when an exception occurs.
+    Test that send_request properly cleans up response slots when an exception occurs.
 
-    This test mocks out most of the session functionality to focus on stream cleanup.
+    This test mocks out most of the session functionality to focus on response slot cleanup.
     """
 
     # Create a mock session with the minimal required functionality
@@ -41,17 +41,17 @@ async def test_send_request_stream_cleanup():
     async def mock_send(*args: Any, **kwargs: Any):
         raise RuntimeError("Simulated network error")
 
-    # Record the response streams before the test
-    initial_stream_count = len(session._response_streams)
+    # Record the response slots before the test
+    initial_slot_count = len(session._response_slots)
 
     # Run the test with the patched method
     with patch.object(session._write_stream, "send", mock_send):
         with pytest.raises(RuntimeError):
             await session.send_request(request, EmptyResult)
 
-    # Verify that no response streams were leaked
-    assert len(session._response_streams) == initial_stream_count, (
-        f"Expected {initial_stream_count} response streams after request, but found {len(session._response_streams)}"
+    # Verify that no response slots were leaked
+    assert len(session._response_slots) == initial_slot_count, (
+        f"Expected {initial_slot_count} response slots after request, but found {len(session._response_slots)}"
     )
 
     # Clean up
@@ -3,6 +3,7 @@ from typing import Any
 import pytest
 from pydantic import FileUrl
 
+from mcp.server.fastmcp import ProcessContext
 from mcp.server.fastmcp.prompts.base import AssistantMessage, Message, Prompt, TextContent, UserMessage
 from mcp.types import EmbeddedResource, TextResourceContents
 
@@ -16,6 +17,13 @@ class TestRenderPrompt:
         prompt = Prompt.from_function(fn)
         assert await prompt.render() == [UserMessage(content=TextContent(type="text", text="Hello, world!"))]
 
+    def test_fn_cannot_take_process_context(self):
+        def fn(ctx: ProcessContext) -> str:
+            return "Hello, world!"
+
+        with pytest.raises(ValueError, match="receives a Context"):
+            Prompt.from_function(fn)
+
     @pytest.mark.anyio
     async def test_async_fn(self):
         async def fn() -> str:
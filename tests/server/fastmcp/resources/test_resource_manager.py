@@ -4,7 +4,9 @@ from tempfile import NamedTemporaryFile
 import pytest
 from pydantic import AnyUrl, FileUrl
 
+from mcp.server.fastmcp import Context
 from mcp.server.fastmcp.resources import FileResource, FunctionResource, ResourceManager, ResourceTemplate
+from mcp.server.session import ServerSessionT
 
 
 @pytest.fixture
@@ -134,3 +136,26 @@ class TestResourceManager:
         resources = manager.list_resources()
         assert len(resources) == 2
         assert resources == [resource1, resource2]
+
+    def test_coalesces(self, temp_file: Path):
+        """Test which URIs are read once for identical concurrent reads."""
+        manager = ResourceManager()
+        manager.add_resource(FileResource(uri=FileUrl(f"file://{temp_file}"), name="test", path=temp_file))
+        manager.add_resource(
+            FunctionResource.from_function(lambda: "live", uri="live://now", name="now", coalesce=False)
+        )
+
+        def greet(name: str) -> str:
+            return f"Hello, {name}!"
+
+        def greet_with_context(name: str, ctx: Context[ServerSessionT, None]) -> str:
+            return f"Hello, {name}!"
+
+        manager.add_template(greet, uri_template="greet://{name}")
+        manager.add_template(greet_with_context, uri_template="context://{name}")
+
+        assert manager.coalesces(f"file://{temp_file}")
+        assert not manager.coalesces("live://now")
+        assert manager.coalesces("greet://world")
+        assert not manager.coalesces("context://world")
+        assert not manager.coalesces("unknown://test")
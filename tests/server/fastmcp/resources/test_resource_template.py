@@ -4,7 +4,7 @@ from typing import Any
 import pytest
 from pydantic import BaseModel
 
-from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp import FastMCP, ProcessContext
 from mcp.server.fastmcp.resources import FunctionResource, ResourceTemplate
 from mcp.types import Annotations
 
@@ -28,6 +28,13 @@ class TestResourceTemplate:
         assert template.mime_type == "text/plain"  # default
         assert template.fn(key="test", value=42) == my_func(key="test", value=42)
 
+    def test_template_cannot_take_process_context(self):
+        def my_func(key: str, ctx: ProcessContext) -> str:
+            return key
+
+        with pytest.raises(ValueError, match="receives a Context"):
+            ResourceTemplate.from_function(fn=my_func, uri_template="test://{key}", name="test")
+
     def test_template_matches(self):
         """Test matching URIs against a template."""
 
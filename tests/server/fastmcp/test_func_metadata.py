@@ -1094,3 +1094,50 @@ def test_basemodel_reserved_names_with_json_preparsing():
     assert result["json"] == {"nested": "data"}
     assert result["model_dump"] == [1, 2, 3]
     assert result["normal"] == "plain string"
+
+
+class _Inner(BaseModel):
+    x: int
+
+
+@pytest.mark.parametrize(
+    "arguments, expected",
+    [
+        # Nothing to pre-parse: validated as given
+        (
+            {"json": {"a": 1}, "model_dump": [1, 2], "normal": "[1, 2]", "inner": {"x": 1}},
+            {"json": {"a": 1}, "model_dump": [1, 2], "normal": "[1, 2]", "inner": _Inner(x=1), "maybe": None},
+        ),
+        # JSON strings in non-string fields, including aliased ones, but not in string fields
+        (
+            {"json": '{"a": 1}', "model_dump": "[1, 2]", "normal": "[1, 2]", "inner": '{"x": 1}', "maybe": "null"},
+            {"json": {"a": 1}, "model_dump": [1, 2], "normal": "[1, 2]", "inner": _Inner(x=1), "maybe": None},
+        ),
+        # JSON after whitespace, and strings that are not JSON for a list, dict or None
+        (
+            {"json": {}, "model_dump": " \n[1]", "normal": "null", "inner": {"x": "2"}, "maybe": "", "unknown": "[1]"},
+            {"json": {}, "model_dump": [1], "normal": "null", "inner": _Inner(x=2), "maybe": ""},
+        ),
+    ],
+)
+def test_parse_arguments_with_precomputed_plan(arguments: dict[str, Any], expected: dict[str, Any]):
+    """Test that arguments are pre-parsed, validated and dumped by the plan built with the argument model"""
+
+    def func(
+        json: dict[str, Any],
+        model_dump: list[int],
+        normal: str,
+        inner: _Inner,
+        maybe: list[int] | str | None = None,
+    ) -> str:
+        return "ok"
+
+    meta = func_metadata(func)
+    original = dict(arguments)
+
+    parsed = meta.parse_arguments(arguments)
+
+    assert arguments == original
+    assert parsed == meta.arg_model.model_validate(meta.pre_parse_json(arguments))
+    assert parsed.model_dump_one_level() == expected
+    assert meta.validate_arguments(arguments) == expected
@@ -1,12 +1,17 @@
 import base64
+import threading
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 from unittest.mock import patch
 
+import anyio
 import pytest
 from pydantic import AnyUrl, BaseModel
 from starlette.routing import Mount, Route
 
+from mcp.server.auth.middleware.auth_context import auth_context_var, get_access_token
+from mcp.server.auth.middleware.bearer_auth import AuthenticatedUser
+from mcp.server.auth.provider import AccessToken
 from mcp.server.fastmcp import Context, FastMCP
 from mcp.server.fastmcp.prompts.base import Message, UserMessage
 from mcp.server.fastmcp.resources import FileResource, FunctionResource
@@ -37,6 +42,10 @@ class TestServer:
         assert mcp.name == "FastMCP"
         assert mcp.instructions == "Server instructions"
 
+    def test_disconnect_policy_requires_an_event_store(self):
+        with pytest.raises(ValueError, match="requires an event store"):
+            FastMCP(slow_consumer_policy="disconnect")
+
     @pytest.mark.anyio
     async def test_normalize_path(self):
         """Test path normalization for mount paths."""
@@ -884,6 +893,89 @@ class TestServerResourceTemplates:
         result = await resource.read()
         assert result == "Data for test"
 
+    @pytest.mark.anyio
+    async def test_sync_template_runs_on_worker_thread(self):
+        """Test that a synchronous template function is called off the event loop."""
+        mcp = FastMCP()
+
+        @mcp.resource("resource://{name}/thread")
+        def get_thread(name: str) -> str:
+            return str(threading.get_ident())
+
+        resource = await mcp._resource_manager.get_resource("resource://test/thread")
+        assert resource is not None
+        assert await resource.read() != str(threading.get_ident())
+        assert mcp.thread_pool.stats().completed == 1
+
+    @pytest.mark.anyio
+    async def test_sync_resource_runs_on_worker_thread(self):
+        """Test that a synchronous resource function is called off the event loop."""
+        mcp = FastMCP()
+
+        @mcp.resource("resource://thread")
+        def get_thread() -> str:
+            return str(threading.get_ident())
+
+        contents = list(await mcp.read_resource("resource://thread"))
+        assert contents[0].content != str(threading.get_ident())
+        assert mcp.thread_pool.stats().completed == 1
+
+    @pytest.mark.anyio
+    @pytest.mark.parametrize("coalesce, expected_reads", [(None, 1), (False, 3)])
+    async def test_identical_concurrent_reads_are_coalesced(self, coalesce: bool | None, expected_reads: int):
+        """Test that concurrent reads of the same URI share one read unless disabled."""
+        mcp = FastMCP()
+        reads: list[str] = []
+        release = anyio.Event()
+
+        @mcp.resource("resource://{name}/slow", coalesce=coalesce)
+        async def get_slow(name: str) -> str:
+            reads.append(name)
+            await release.wait()
+            return f"Data for {name}"
+
+        contents: list[Any] = []
+
+        async def read() -> None:
+            contents.append(await mcp.read_resource("resource://test/slow"))
+
+        async with anyio.create_task_group() as tg:
+            for _ in range(3):
+                tg.start_soon(read)
+            await anyio.wait_all_tasks_blocked()
+            release.set()
+
+        assert reads == ["test"] * expected_reads
+        assert [list(content)[0].content for content in contents] == ["Data for test"] * 3
+        assert mcp._resource_manager.single_flight is not None
+        assert mcp._resource_manager.single_flight.coalesced == 3 - expected_reads
+
+    @pytest.mark.anyio
+    async def test_reads_of_different_principals_are_not_coalesced(self):
+        """Test that a resource read for one user is never given to another."""
+        mcp = FastMCP()
+        release = anyio.Event()
+
+        @mcp.resource("resource://me")
+        async def me() -> str:
+            await release.wait()
+            access_token = get_access_token()
+            return access_token.token if access_token else "anonymous"
+
+        contents: dict[str, str | bytes] = {}
+
+        async def read(token: str) -> None:
+            auth_context_var.set(AuthenticatedUser(AccessToken(token=token, client_id="client", scopes=[])))
+            contents[token] = list(await mcp.read_resource("resource://me"))[0].content
+
+        async with anyio.create_task_group() as tg:
+            for token in ("alice", "bob"):
+                tg.start_soon(read, token)
+            await anyio.wait_all_tasks_blocked()
+            release.set()
+
+        assert contents == {"alice": "alice", "bob": "bob"}
+
     @pytest.mark.anyio
     async def test_resource_template_includes_mime_type(self):
         """Test that list resource templates includes the correct mimeType."""
@@ -1266,6 +1358,20 @@ class TestServerPrompts:
             assert isinstance(content, TextContent)
             assert content.text == "Hello, World!"
 
+    @pytest.mark.anyio
+    async def test_sync_prompt_runs_on_worker_thread(self):
+        """Test that a synchronous prompt function is called off the event loop."""
+        mcp = FastMCP()
+
+        @mcp.prompt()
+        def fn() -> str:
+            return str(threading.get_ident())
+
+        messages = await mcp._prompt_manager.render_prompt("fn")
+        content = messages[0].content
+        assert isinstance(content, TextContent)
+        assert content.text != str(threading.get_ident())
+
     @pytest.mark.anyio
     async def test_get_prompt_with_description(self):
         """Test getting a prompt through MCP protocol."""
@@ -1,18 +1,34 @@
+import contextvars
 import json
 import logging
+import os
+import threading
+import time
+from collections.abc import Callable
 from dataclasses import dataclass
+from functools import partial
 from typing import Any, TypedDict
 
+import anyio
+import anyio.from_thread
+import pydantic_core
 import pytest
 from pydantic import BaseModel
 
+from mcp.server.auth.middleware.auth_context import auth_context_var, get_access_token
+from mcp.server.auth.middleware.bearer_auth import AuthenticatedUser
+from mcp.server.auth.provider import AccessToken
 from mcp.server.fastmcp import Context, FastMCP
 from mcp.server.fastmcp.exceptions import ToolError
-from mcp.server.fastmcp.tools import Tool, ToolManager
+from mcp.server.fastmcp.tools import Tool, ToolManager, ToolResultCache
 from mcp.server.fastmcp.utilities.func_metadata import ArgModelBase, FuncMetadata
+from mcp.server.fastmcp.utilities.process_pool import ProcessContext, WorkerProcessPool
+from mcp.server.fastmcp.utilities.single_flight import SingleFlight
+from mcp.server.fastmcp.utilities.thread_pool import WorkerThreadPool
 from mcp.server.session import ServerSessionT
 from mcp.shared.context import LifespanContextT, RequestT
-from mcp.types import TextContent, ToolAnnotations
+from mcp.shared.memory import create_connected_server_and_client_session as client_session
+from mcp.types import LoggingMessageNotification, ServerNotification, TextContent, ToolAnnotations
 
 
 class TestAddTools:
@@ -918,3 +934,534 @@ class TestRemoveTools:
         # Remove with correct case
         manager.remove_tool("test_func")
         assert manager.get_tool("test_func") is None
+
+
+class TestWorkerThreads:
+    """Test running synchronous tools on worker threads."""
+
+    @pytest.mark.anyio
+    async def test_sync_tools_run_on_worker_threads(self):
+        def thread_id() -> int:
+            return threading.get_ident()
+
+        manager = ToolManager(thread_pool=WorkerThreadPool(2))
+        manager.add_tool(thread_id, name="threaded")
+        manager.add_tool(thread_id, name="inline", executor="event_loop")
+
+        assert await manager.call_tool("threaded", {}) != threading.get_ident()
+        assert await manager.call_tool("inline", {}) == threading.get_ident()
+        # Without a pool, every tool is called on the event loop
+        tool = manager.get_tool("threaded")
+        assert tool is not None
+        assert await tool.run({}) == threading.get_ident()
+
+    @pytest.mark.anyio
+    async def test_saturated_pool_queues_calls(self):
+        release = threading.Event()
+
+        def block() -> str:
+            release.wait()
+            return "done"
+
+        pool = WorkerThreadPool(1)
+        manager = ToolManager(thread_pool=pool)
+        manager.add_tool(block)
+        results: list[str] = []
+
+        async def call() -> None:
+            results.append(await manager.call_tool("block", {}))
+
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(call)
+            tg.start_soon(call)
+            with anyio.fail_after(5):
+                while pool.stats().waiting < 1:
+                    await anyio.sleep(0.01)
+            stats = pool.stats()
+            assert (stats.max_threads, stats.busy, stats.waiting, stats.completed) == (1, 1, 1, 0)
+            release.set()
+
+        assert results == ["done", "done"]
+        assert pool.stats().completed == 2
+        assert "mcp_worker_threads_waiting 0" in pool.stats().render_prometheus()
+
+    @pytest.mark.anyio
+    async def test_context_is_usable_from_worker_thread(self):
+        mcp = FastMCP(sync_worker_threads=4)
+        messages: list[str] = []
+
+        @mcp.tool()
+        def log(ctx: Context[ServerSessionT, None]) -> str:
+            anyio.from_thread.run(ctx.info, "from a worker thread")
+            return str(ctx.request_id)
+
+        async def message_handler(message: Any) -> None:
+            if isinstance(message, ServerNotification) and isinstance(message.root, LoggingMessageNotification):
+                messages.append(message.root.params.data)
+
+        async with client_session(mcp._mcp_server, message_handler=message_handler) as client:
+            result = await client.call_tool("log", {})
+
+        assert not result.isError
+        content = result.content[0]
+        assert isinstance(content, TextContent) and content.text.isdigit()
+        assert messages == ["from a worker thread"]
+
+    def test_invalid_pool_size(self):
+        with pytest.raises(ValueError):
+            WorkerThreadPool(0)
+
+
+# Tools run in worker processes are pickled by name, so they are defined at module level
+def process_id(n: int) -> tuple[int, int]:
+    return os.getpid(), n * 2
+
+
+def process_with_context(ctx: ProcessContext) -> str:
+    ctx.report_progress(1, 2, "halfway")
+    ctx.info("from a worker process")
+    return "done"
+
+
+def process_sleep() -> None:
+    time.sleep(60)
+
+
+def process_fail() -> None:
+    raise ValueError("bad input")
+
+
+class TestWorkerProcesses:
+    """Test running tools in worker processes."""
+
+    @pytest.fixture
+    def process_pool(self):
+        pool = WorkerProcessPool(1)
+        yield pool
+        pool.close()
+
+    @pytest.mark.anyio
+    async def test_tool_runs_in_worker_process(self, process_pool: WorkerProcessPool):
+        manager = ToolManager(process_pool=process_pool)
+        manager.add_tool(process_id, executor="process")
+        manager.add_tool(process_fail, executor="process")
+
+        pid, doubled = await manager.call_tool("process_id", {"n": "21"})
+        assert (pid != os.getpid(), doubled) == (True, 42)
+        # The worker is reused, and survives errors raised by the tool
+        with pytest.raises(ToolError, match="bad input"):
+            await manager.call_tool("process_fail", {})
+        assert (await manager.call_tool("process_id", {"n": 1}))[0] == pid
+        stats = process_pool.stats()
+        assert (stats.processes, stats.completed, stats.terminated) == (1, 3, 0)
+
+    @pytest.mark.anyio
+    async def test_context_calls_are_forwarded(self):
+        mcp = FastMCP(process_workers=1)
+        mcp.add_tool(process_with_context, executor="process")
+        messages: list[str] = []
+        updates: list[tuple[float, float | None, str | None]] = []
+
+        async def message_handler(message: Any) -> None:
+            if isinstance(message, ServerNotification) and isinstance(message.root, LoggingMessageNotification):
+                messages.append(message.root.params.data)
+
+        async def progress_callback(progress: float, total: float | None, message: str | None) -> None:
+            updates.append((progress, total, message))
+
+        try:
+            async with client_session(mcp._mcp_server, message_handler=message_handler) as client:
+                result = await client.call_tool("process_with_context", {}, progress_callback=progress_callback)
+        finally:
+            mcp.process_pool.close()
+
+        assert not result.isError
+        assert messages == ["from a worker process"]
+        assert updates == [(1, 2, "halfway")]
+
+    @pytest.mark.anyio
+    async def test_cancelled_call_terminates_worker(self, process_pool: WorkerProcessPool):
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(partial(process_pool.run, process_sleep, {}))
+            with anyio.fail_after(30):
+                while process_pool.stats().processes < 1:
+                    await anyio.sleep(0.01)
+            tg.cancel_scope.cancel()
+
+        stats = process_pool.stats()
+        assert (stats.processes, stats.terminated, stats.busy) == (0, 1, 0)
+        # A new worker takes its place
+        assert (await process_pool.run(process_id, {"n": 1}))[1] == 2
+
+    @pytest.mark.anyio
+    async def test_app_shutdown_stops_worker_processes(self):
+        mcp = FastMCP(process_workers=1)
+        app = mcp.streamable_http_app()
+        async with app.router.lifespan_context(app):
+            assert (await mcp.process_pool.run(process_id, {"n": 1}))[1] == 2
+            worker = mcp.process_pool._idle[0]  # pyright: ignore[reportPrivateUsage]
+
+        assert not worker.process.is_alive()
+        assert mcp.process_pool.stats().processes == 0
+
+    def test_async_tools_cannot_run_in_processes(self):
+        async def tool() -> None:
+            pass
+
+        with pytest.raises(ValueError, match="must be synchronous"):
+            Tool.from_function(tool, executor="process")
+
+    def test_context_must_match_executor(self):
+        def thread_tool(ctx: ProcessContext) -> None:
+            pass
+
+        def process_tool(ctx: Context[ServerSessionT, None]) -> None:
+            pass
+
+        with pytest.raises(ValueError, match="receives a Context"):
+            Tool.from_function(thread_tool)
+        with pytest.raises(ValueError, match="receives a Context"):
+            Tool.from_function(thread_tool, executor="event_loop")
+        with pytest.raises(ValueError, match="receives a ProcessContext"):
+            Tool.from_function(process_tool, executor="process")
+        assert Tool.from_function(process_with_context, executor="process").context_kwarg == "ctx"
+
+
+def authenticated_as(token: str) -> contextvars.Token[AuthenticatedUser | None]:
+    """Authenticate the current context with an access token of client "client"."""
+    return auth_context_var.set(AuthenticatedUser(AccessToken(token=token, client_id="client", scopes=[])))
+
+
+def add_lookup_tool(
+    manager: ToolManager, *, gated: bool = False, **tool_args: Any
+) -> tuple[list[int], anyio.Event, list[str]]:
+    """Add a "lookup" tool doubling its argument.
+
+    Returns the arguments it was called with, the event a gated tool waits for before
+    returning, and whether each gated call finished or was cancelled.
+    """
+    calls: list[int] = []
+    release = anyio.Event()
+    outcomes: list[str] = []
+
+    async def lookup(n: int) -> int:
+        calls.append(n)
+        if gated:
+            try:
+                await release.wait()
+            except anyio.get_cancelled_exc_class():
+                outcomes.append("cancelled")
+                raise
+            outcomes.append("finished")
+        return n * 2
+
+    manager.add_tool(lookup, **tool_args)
+    return calls, release, outcomes
+
+
+@pytest.mark.parametrize("option, other", [("cache", "coalesce"), ("coalesce", "cache")])
+def test_reuse_defaults_to_read_only_idempotent_tools(option: str, other: str):
+    """Caching and coalescing default to tools whose result depends on their arguments alone."""
+
+    def lookup(n: int) -> int:
+        return n
+
+    def lookup_with_context(n: int, ctx: Context[ServerSessionT, None]) -> int:
+        return n
+
+    def reused(fn: Callable[..., Any], annotations: ToolAnnotations | None = None, disabled: str | None = None) -> bool:
+        tool = Tool.from_function(
+            fn,
+            annotations=annotations,
+            cache=False if disabled == "cache" else None,
+            coalesce=False if disabled == "coalesce" else None,
+        )
+        return getattr(tool, option)
+
+    read_only = ToolAnnotations(readOnlyHint=True, idempotentHint=True)
+    assert reused(lookup, read_only)
+    assert not reused(lookup, read_only, disabled=option)
+    # Each is chosen independently of the other
+    assert reused(lookup, read_only, disabled=other)
+    assert not reused(lookup_with_context, read_only)
+    assert not reused(lookup, ToolAnnotations(readOnlyHint=True))
+    assert not reused(lookup)
+
+
+class TestResultCache:
+    """Test caching tool results."""
+
+    @staticmethod
+    def counting_manager(**cache_args: Any) -> tuple[ToolManager, list[int]]:
+        manager = ToolManager(cache=ToolResultCache(**cache_args))
+        calls, _, _ = add_lookup_tool(manager, cache=True)
+        return manager, calls
+
+    @pytest.mark.anyio
+    async def test_equivalent_calls_are_answered_from_cache(self):
+        manager, calls = self.counting_manager()
+
+        first = await manager.call_tool("lookup", {"n": 1}, convert_result=True)
+        assert await manager.call_tool("lookup", {"n": "1"}, convert_result=True) is first
+        await manager.call_tool("lookup", {"n": 2}, convert_result=True)
+        # Unconverted results are not cached
+        assert await manager.call_tool("lookup", {"n": 1}) == 2
+
+        assert calls == [1, 2, 1]
+        assert manager.cache is not None
+        stats = manager.cache.stats()
+        assert (stats.entries, stats.hits, stats.misses) == (2, {"lookup": 1}, {"lookup": 2})
+        assert 'mcp_tool_cache_hits_total{tool="lookup"} 1' in stats.render_prometheus()
+
+    @pytest.mark.anyio
+    async def test_errors_are_not_cached(self):
+        calls: list[int] = []
+
+        def flaky(n: int) -> int:
+            calls.append(n)
+            if len(calls) == 1:
+                raise ValueError("try again")
+            return n
+
+        manager = ToolManager(cache=ToolResultCache())
+        manager.add_tool(flaky, cache=True)
+        with pytest.raises(ToolError):
+            await manager.call_tool("flaky", {"n": 1}, convert_result=True)
+        await manager.call_tool("flaky", {"n": 1}, convert_result=True)
+        await manager.call_tool("flaky", {"n": 1}, convert_result=True)
+
+        assert calls == [1, 1]
+
+    @pytest.mark.anyio
+    async def test_results_expire(self):
+        clock = [0.0]
+        manager, calls = self.counting_manager(ttl=10, clock=lambda: clock[0])
+
+        await manager.call_tool("lookup", {"n": 1}, convert_result=True)
+        clock[0] = 9
+        await manager.call_tool("lookup", {"n": 1}, convert_result=True)
+        clock[0] = 10
+        await manager.call_tool("lookup", {"n": 1}, convert_result=True)
+
+        assert calls == [1, 1]
+        assert manager.cache is not None
+        assert manager.cache.stats().expired == 1
+
+    @pytest.mark.anyio
+    async def test_least_recently_used_results_are_evicted(self):
+        manager, calls = self.counting_manager(max_entries=2)
+
+        for n in (1, 2, 1, 3, 1, 2):
+            await manager.call_tool("lookup", {"n": n}, convert_result=True)
+
+        # 2 is evicted by 3, since 1 was used more recently
+        assert calls == [1, 2, 3, 2]
+        assert manager.cache is not None
+        assert manager.cache.stats().evicted == 2
+
+    @pytest.mark.anyio
+    async def test_byte_budget(self):
+        manager, calls = self.counting_manager()
+        tool = manager.get_tool("lookup")
+        assert tool is not None
+        size = len(pydantic_core.to_json(tool.fn_metadata.convert_result(2)))
+        manager.cache = ToolResultCache(max_bytes=size)
+
+        await manager.call_tool("lookup", {"n": 1}, convert_result=True)
+        # Too large to cache
+        await manager.call_tool("lookup", {"n": 10}, convert_result=True)
+        await manager.call_tool("lookup", {"n": 10}, convert_result=True)
+        await manager.call_tool("lookup", {"n": 1}, convert_result=True)
+
+        assert calls == [1, 10, 10]
+        assert manager.cache is not None
+        assert manager.cache.stats().bytes == size
+
+    @pytest.mark.anyio
+    async def test_invalidation(self):
+        manager, calls = self.counting_manager()
+        for n in (1, 2):
+            await manager.call_tool("lookup", {"n": n}, convert_result=True)
+
+        assert manager.invalidate_cache("lookup", {"n": "1"}) == 1
+        assert manager.invalidate_cache("lookup", {"n": 1}) == 0
+        await manager.call_tool("lookup", {"n": 1}, convert_result=True)
+        await manager.call_tool("lookup", {"n": 2}, convert_result=True)
+        assert calls == [1, 2, 1]
+
+        assert manager.invalidate_cache("lookup") == 2
+        assert manager.invalidate_cache() == 0
+        with pytest.raises(ToolError):
+            manager.invalidate_cache("unknown", {})
+
+    @pytest.mark.anyio
+    async def test_results_are_not_shared_between_principals(self):
+        def whoami(n: int) -> str:
+            access_token = get_access_token()
+            return access_token.token if access_token else "anonymous"
+
+        manager = ToolManager(cache=ToolResultCache())
+        manager.add_tool(whoami, cache=True)
+
+        results: list[Any] = []
+        for token in ("alice", "bob", "alice", None):
+            reset = authenticated_as(token) if token is not None else None
+            try:
+                results.append(await manager.call_tool("whoami", {"n": 1}, convert_result=True))
+            finally:
+                if reset is not None:
+                    auth_context_var.reset(reset)
+
+        assert [result[1]["result"] for result in results] == ["alice", "bob", "alice", "anonymous"]
+        assert results[2] is results[0]
+        assert manager.invalidate_cache("whoami", {"n": 1}) == 3
+
+    @pytest.mark.anyio
+    async def test_fastmcp_caches_read_only_idempotent_tools(self):
+        mcp = FastMCP()
+        calls: list[int] = []
+
+        @mcp.tool(annotations=ToolAnnotations(readOnlyHint=True, idempotentHint=True))
+        def lookup(n: int) -> int:
+            calls.append(n)
+            return n
+
+        async with client_session(mcp._mcp_server) as client:
+            first = await client.call_tool("lookup", {"n": 1})
+            second = await client.call_tool("lookup", {"n": 1})
+
+        assert calls == [1]
+        assert first.structuredContent == second.structuredContent == {"result": 1}
+
+
+class TestCoalescing:
+    """Test sharing one execution among identical concurrent tool calls."""
+
+    @staticmethod
+    def gated_manager(**tool_args: Any) -> tuple[ToolManager, list[int], anyio.Event, list[str]]:
+        manager = ToolManager(single_flight=SingleFlight())
+        calls, release, outcomes = add_lookup_tool(manager, gated=True, **tool_args)
+        return manager, calls, release, outcomes
+
+    @pytest.mark.anyio
+    async def test_identical_concurrent_calls_share_one_execution(self):
+        manager, calls, release, _ = self.gated_manager(coalesce=True)
+        results: list[Any] = []
+
+        async def call(arguments: dict[str, Any]) -> None:
+            results.append(await manager.call_tool("lookup", arguments, convert_result=True))
+
+        async with anyio.create_task_group() as tg:
+            for arguments in ({"n": 1}, {"n": "1"}, {"n": 1}, {"n": 2}):
+                tg.start_soon(call, arguments)
+            await anyio.wait_all_tasks_blocked()
+            release.set()
+
+        assert sorted(calls) == [1, 2]
+        assert len(results) == 4
+        assert sum(result is results[0] for result in results) in (1, 3)
+        assert manager.single_flight is not None
+        assert manager.single_flight.coalesced == 2
+
+    @pytest.mark.anyio
+    async def test_cancelled_caller_does_not_cancel_shared_execution(self):
+        manager, calls, release, outcomes = self.gated_manager(coalesce=True)
+        results: list[Any] = []
+
+        async def call(scope: anyio.CancelScope) -> None:
+            with scope:
+                results.append(await manager.call_tool("lookup", {"n": 1}, convert_result=True))
+
+        starter, follower = anyio.CancelScope(), anyio.CancelScope()
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(call, starter)
+            await anyio.wait_all_tasks_blocked()
+            tg.start_soon(call, follower)
+            await anyio.wait_all_tasks_blocked()
+            # The caller that started the execution goes away
+            starter.cancel()
+            await anyio.wait_all_tasks_blocked()
+            release.set()
+
+        assert calls == [1]
+        assert outcomes == ["finished"]
+        assert len(results) == 1
+        assert results[0][1] == {"result": 2}
+
+    @pytest.mark.anyio
+    async def test_execution_is_cancelled_with_its_last_caller(self):
+        manager, calls, _, outcomes = self.gated_manager(coalesce=True)
+
+        async def call(scope: anyio.CancelScope) -> None:
+            with scope:
+                await manager.call_tool("lookup", {"n": 1}, convert_result=True)
+
+        scopes = [anyio.CancelScope(), anyio.CancelScope()]
+        async with anyio.create_task_group() as tg:
+            for scope in scopes:
+                tg.start_soon(call, scope)
+            await anyio.wait_all_tasks_blocked()
+            for scope in scopes:
+                scope.cancel()
+
+        assert calls == [1]
+        assert outcomes == ["cancelled"]
+        # A later call starts a new execution
+        assert manager.single_flight is not None
+        assert manager.single_flight._flights == {}  # pyright: ignore[reportPrivateUsage]
+
+    @pytest.mark.anyio
+    async def test_calls_of_different_principals_are_not_coalesced(self):
+        manager, calls, release, _ = self.gated_manager(coalesce=True)
+
+        async def call(token: str) -> None:
+            authenticated_as(token)
+            await manager.call_tool("lookup", {"n": 1}, convert_result=True)
+
+        async with anyio.create_task_group() as tg:
+            for token in ("alice", "bob", "alice"):
+                tg.start_soon(call, token)
+            await anyio.wait_all_tasks_blocked()
+            release.set()
+
+        assert calls == [1, 1]
+        assert manager.single_flight is not None
+        assert manager.single_flight.coalesced == 1
+
+    @pytest.mark.anyio
+    async def test_errors_are_shared(self):
+        calls: list[int] = []
+
+        async def failing(n: int) -> int:
+            calls.append(n)
+            await anyio.sleep(0.01)
+            raise ValueError("unavailable")
+
+        manager = ToolManager(single_flight=SingleFlight())
+        manager.add_tool(failing, coalesce=True)
+        errors: list[ToolError] = []
+
+        async def call() -> None:
+            try:
+                await manager.call_tool("failing", {"n": 1}, convert_result=True)
+            except ToolError as e:
+                errors.append(e)
+
+        async with anyio.create_task_group() as tg:
+            for _ in range(3):
+                tg.start_soon(call)
+
+        assert calls == [1]
+        assert [str(error) for error in errors] == ["Error executing tool failing: unavailable"] * 3
+
+    @pytest.mark.anyio
+    async def test_tools_can_opt_out(self):
+        manager, calls, release, _ = self.gated_manager(coalesce=False)
+
+        async with anyio.create_task_group() as tg:
+            for _ in range(2):
+                tg.start_soon(partial(manager.call_tool, "lookup", {"n": 1}, convert_result=True))
+            await anyio.wait_all_tasks_blocked()
+            release.set()
+
+        assert calls == [1, 1]
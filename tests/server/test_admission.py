@@ -0,0 +1,171 @@
+"""Tests for admission control in the low-level server."""
+
+from typing import Any
+
+import anyio
+import pytest
+
+from mcp.server.fastmcp import FastMCP
+from mcp.server.lowlevel import ConcurrencyLimits, Server
+from mcp.shared.exceptions import McpError
+from mcp.shared.memory import create_connected_server_and_client_session
+from mcp.types import (
+    SERVER_BUSY,
+    CallToolRequest,
+    CancelledNotification,
+    CancelledNotificationParams,
+    ClientNotification,
+    TextContent,
+    Tool,
+)
+
+
+async def wait_for(condition: Any) -> None:
+    with anyio.fail_after(5):
+        while not condition():
+            await anyio.sleep(0.01)
+
+
+def create_blocking_server(limits: ConcurrencyLimits) -> tuple[Server, anyio.Event, anyio.Event]:
+    server = Server("test", concurrency_limits=limits)
+    started = anyio.Event()
+    release = anyio.Event()
+
+    @server.list_tools()
+    async def list_tools() -> list[Tool]:
+        return [Tool(name="block", inputSchema={"type": "object"})]
+
+    @server.call_tool()
+    async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
+        started.set()
+        await release.wait()
+        return [TextContent(type="text", text="done")]
+
+    return server, started, release
+
+
+def test_invalid_limits():
+    with pytest.raises(ValueError):
+        ConcurrencyLimits(max_concurrent_requests=0)
+    with pytest.raises(ValueError):
+        ConcurrencyLimits(max_concurrent_requests_per_session=1, max_queued_requests_per_session=-1)
+
+
+def test_no_limits_by_default():
+    assert Server("test").admission_stats() is None
+
+
+@pytest.mark.anyio
+async def test_queue_overflow_is_rejected_and_ping_bypasses_queue():
+    server, started, release = create_blocking_server(
+        ConcurrencyLimits(max_concurrent_requests_per_session=1, max_queued_requests_per_session=1)
+    )
+    results: list[str] = []
+
+    async with create_connected_server_and_client_session(server) as client:
+        await client.list_tools()
+
+        async def call() -> None:
+            result = await client.call_tool("block", {})
+            assert isinstance(result.content[0], TextContent)
+            results.append(result.content[0].text)
+
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(call)
+            await started.wait()
+            tg.start_soon(call)
+            await wait_for(lambda: server.admission_stats().queued == 1)  # type: ignore[union-attr]
+
+            with pytest.raises(McpError) as exc_info:
+                await client.call_tool("block", {})
+            assert exc_info.value.error.code == SERVER_BUSY
+
+            # Pings are never queued behind tool calls
+            with anyio.fail_after(5):
+                await client.send_ping()
+
+            release.set()
+
+    assert results == ["done", "done"]
+    stats = server.admission_stats()
+    assert stats is not None
+    assert stats.active == 0
+    assert stats.queued == 0
+    assert stats.max_queued == 1
+    assert stats.rejected == 1
+    # list_tools and two tool calls were admitted
+    assert stats.admitted == 3
+    assert stats.wait_time_max > 0
+
+
+@pytest.mark.anyio
+async def test_process_limit_is_shared_between_sessions():
+    server, started, release = create_blocking_server(ConcurrencyLimits(max_concurrent_requests=1))
+
+    async with (
+        create_connected_server_and_client_session(server) as first,
+        create_connected_server_and_client_session(server) as second,
+    ):
+        await first.list_tools()
+        await second.list_tools()
+
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(first.call_tool, "block")
+            await started.wait()
+            tg.start_soon(second.call_tool, "block")
+            await wait_for(lambda: server.admission_stats().queued == 1)  # type: ignore[union-attr]
+            release.set()
+
+    stats = server.admission_stats()
+    assert stats is not None
+    assert stats.admitted == 4
+    assert stats.rejected == 0
+
+
+def test_fastmcp_settings_configure_limits():
+    mcp = FastMCP(max_concurrent_requests_per_session=4, max_queued_requests_per_session=8)
+    assert mcp._mcp_server._admission is not None
+    assert mcp._mcp_server._admission.limits == ConcurrencyLimits(
+        max_concurrent_requests_per_session=4, max_queued_requests_per_session=8
+    )
+    assert FastMCP()._mcp_server._admission is None
+
+
+@pytest.mark.anyio
+async def test_cancelled_queued_request_is_answered_and_never_handled():
+    server, started, release = create_blocking_server(
+        ConcurrencyLimits(max_concurrent_requests_per_session=1, max_queued_requests_per_session=1)
+    )
+    calls: list[str] = []
+    handler = server.request_handlers[CallToolRequest]
+
+    async def counting_handler(request: Any) -> Any:
+        calls.append(request.params.name)
+        return await handler(request)
+
+    server.request_handlers[CallToolRequest] = counting_handler
+
+    async with create_connected_server_and_client_session(server) as client:
+        await client.list_tools()
+
+        async def call_queued() -> None:
+            with pytest.raises(McpError) as exc_info:
+                await client.call_tool("queued", {})
+            assert exc_info.value.error.message == "Request cancelled"
+
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(client.call_tool, "block")
+            await started.wait()
+            tg.start_soon(call_queued)
+            await wait_for(lambda: server.admission_stats().queued == 1)  # type: ignore[union-attr]
+
+            # Request IDs count initialize, list_tools and the running call before the queued one
+            await client.send_notification(
+                ClientNotification(CancelledNotification(params=CancelledNotificationParams(requestId=3)))
+            )
+            release.set()
+
+    assert calls == ["block"]
+    stats = server.admission_stats()
+    assert stats is not None
+    assert (stats.active, stats.queued) == (0, 0)
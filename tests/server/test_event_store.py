@@ -0,0 +1,233 @@
+"""Tests for the in-memory event store."""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import anyio
+import pytest
+
+from mcp.server.event_store import MemoryEventStore, SQLiteEventStore
+from mcp.server.streamable_http import EventMessage, EventStore
+from mcp.shared.codec import DEFAULT_CODEC
+from mcp.types import JSONRPCMessage, JSONRPCNotification
+
+
+def notification(index: int) -> JSONRPCMessage:
+    return JSONRPCMessage(JSONRPCNotification(jsonrpc="2.0", method="notifications/message", params={"i": index}))
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+async def replay(store: EventStore, last_event_id: str) -> tuple[str | None, list[EventMessage]]:
+    events: list[EventMessage] = []
+
+    async def send(event: EventMessage) -> None:
+        events.append(event)
+
+    stream_id = await store.replay_events_after(last_event_id, send)
+    return stream_id, events
+
+
+@pytest.mark.anyio
+async def test_replays_events_after_the_last_one_received():
+    store = MemoryEventStore()
+    ids = [await store.store_event("stream", notification(i)) for i in range(5)]
+    await store.store_event("other", notification(99))
+
+    stream_id, events = await replay(store, ids[1])
+
+    assert stream_id == "stream"
+    assert [event.event_id for event in events] == ids[2:]
+    assert [event.message for event in events] == [notification(i) for i in range(2, 5)]
+    assert all(event.encoded is not None for event in events)
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("event_id", ["unknown", "0-x", "42-0", "0-5", "0--1"])
+async def test_unknown_event_ids_are_not_replayed(event_id: str):
+    store = MemoryEventStore()
+    await store.store_event("stream", notification(0))
+
+    assert await replay(store, event_id) == (None, [])
+
+
+@pytest.mark.anyio
+async def test_sessions_only_replay_their_own_events():
+    store = MemoryEventStore()
+    session_a, session_b = store.for_session("a"), store.for_session("b")
+    id_a = await session_a.store_event("1", notification(0))
+    await session_a.store_event("1", notification(1))
+    await session_b.store_event("1", notification(2))
+
+    assert (await replay(session_b, id_a)) == (None, [])
+    stream_id, events = await replay(session_a, id_a)
+    assert stream_id == "1"
+    assert [event.message for event in events] == [notification(1)]
+
+
+@pytest.mark.anyio
+async def test_session_budget_drops_the_sessions_oldest_events():
+    size = len(DEFAULT_CODEC.encode(notification(0)))
+    store = MemoryEventStore(max_bytes_per_session=3 * size)
+    session_a, session_b = store.for_session("a"), store.for_session("b")
+    ids = [await session_a.store_event("1", notification(i)) for i in range(5)]
+    await session_b.store_event("1", notification(9))
+
+    stats = store.stats()
+    assert (stats.events, stats.bytes, stats.evicted) == (4, 4 * size, 2)
+    # Events dropped after the last one received are skipped
+    stream_id, events = await replay(session_a, ids[0])
+    assert stream_id == "1"
+    assert [event.event_id for event in events] == ids[2:]
+
+
+@pytest.mark.anyio
+async def test_store_budget_drops_the_oldest_events():
+    size = len(DEFAULT_CODEC.encode(notification(0)))
+    store = MemoryEventStore(max_bytes=3 * size)
+    await store.for_session("a").store_event("1", notification(0))
+    await store.for_session("b").store_event("1", notification(1))
+    for i in range(2, 4):
+        await store.for_session("a").store_event("2", notification(i))
+
+    stats = store.stats()
+    assert (stats.events, stats.sessions, stats.streams, stats.evicted) == (3, 2, 2, 1)
+
+
+@pytest.mark.anyio
+async def test_events_expire():
+    clock = Clock()
+    store = MemoryEventStore(ttl=10, clock=clock)
+    first = await store.store_event("1", notification(0))
+    clock.now = 5
+    second = await store.store_event("1", notification(1))
+    clock.now = 12
+
+    stream_id, events = await replay(store, first)
+    assert stream_id == "1"
+    assert [event.event_id for event in events] == [second]
+    assert store.stats().expired == 1
+
+    clock.now = 16
+    assert await replay(store, second) == (None, [])
+    assert store.stats().expired == 2
+
+
+@pytest.mark.anyio
+async def test_removed_sessions_events_are_dropped():
+    store = MemoryEventStore()
+    session = store.for_session("a")
+    event_id = await session.store_event("1", notification(0))
+    await store.for_session("b").store_event("1", notification(1))
+
+    await session.remove_session("a")
+
+    assert await replay(session, event_id) == (None, [])
+    stats = store.stats()
+    assert (stats.events, stats.sessions, stats.streams) == (1, 1, 1)
+
+
+@pytest.mark.parametrize("kwargs", [{"max_bytes": 0}, {"max_bytes_per_session": -1}, {"ttl": 0}])
+def test_invalid_limits(kwargs: dict[str, float]):
+    with pytest.raises(ValueError):
+        MemoryEventStore(**kwargs)  # type: ignore[arg-type]
+
+
+@pytest.fixture
+def sqlite_path(tmp_path: Path) -> str:
+    return str(tmp_path / "events.db")
+
+
+@contextmanager
+def sqlite_store(path: str, **kwargs: Any) -> Iterator[SQLiteEventStore]:
+    store = SQLiteEventStore(path, **kwargs)
+    try:
+        yield store
+    finally:
+        store.close()
+
+
+@pytest.mark.anyio
+async def test_sqlite_events_survive_a_restart(sqlite_path: str):
+    with sqlite_store(sqlite_path) as store:
+        session = store.for_session("a")
+        ids = [await session.store_event("1", notification(i)) for i in range(3)]
+        await session.store_event("2", notification(9))
+
+    with sqlite_store(sqlite_path) as store:
+        stream_id, events = await replay(store.for_session("a"), ids[0])
+        assert stream_id == "1"
+        assert [event.event_id for event in events] == ids[1:]
+        assert [event.message for event in events] == [notification(1), notification(2)]
+        # Another session cannot replay them
+        assert await replay(store.for_session("b"), ids[0]) == (None, [])
+        assert await replay(store.for_session("a"), "unknown") == (None, [])
+
+
+@pytest.mark.anyio
+async def test_sqlite_concurrent_events_are_committed_together(sqlite_path: str):
+    with sqlite_store(sqlite_path) as store:
+        with patch.object(store, "_write", wraps=store._write) as write:  # pyright: ignore[reportPrivateUsage]
+            ids: list[str] = []
+
+            async def store_event(i: int) -> None:
+                ids.append(await store.store_event(str(i), notification(i)))
+
+            async with anyio.create_task_group() as tg:
+                for i in range(50):
+                    tg.start_soon(store_event, i)
+
+        assert len(set(ids)) == 50
+        assert write.call_count < 50
+
+
+@pytest.mark.anyio
+async def test_sqlite_store_is_shared_between_instances(sqlite_path: str):
+    with sqlite_store(sqlite_path) as first, sqlite_store(sqlite_path) as second:
+        event_id = await first.store_event("1", notification(0))
+        await second.store_event("1", notification(1))
+        await first.store_event("1", notification(2))
+
+        stream_id, events = await replay(second, event_id)
+        assert stream_id == "1"
+        assert [event.message for event in events] == [notification(1), notification(2)]
+
+
+@pytest.mark.anyio
+async def test_sqlite_removed_sessions_events_are_dropped(sqlite_path: str):
+    with sqlite_store(sqlite_path) as store:
+        event_id = await store.for_session("a").store_event("1", notification(0))
+        other_id = await store.for_session("b").store_event("1", notification(1))
+        await store.for_session("b").store_event("1", notification(2))
+
+        await store.remove_session("a")
+
+        assert await replay(store.for_session("a"), event_id) == (None, [])
+        assert len((await replay(store.for_session("b"), other_id))[1]) == 1
+
+
+@pytest.mark.anyio
+async def test_sqlite_compaction_by_age_and_size(sqlite_path: str):
+    clock = Clock()
+    size = len(DEFAULT_CODEC.encode(notification(0)))
+    with sqlite_store(sqlite_path, max_age=10, max_bytes=3 * size, compact_interval=0, clock=clock) as store:
+        first = await store.store_event("1", notification(0))
+        clock.now = 5
+        ids = [await store.store_event("1", notification(i)) for i in range(1, 5)]
+        # The budget drops the oldest events
+        assert (await replay(store, first))[0] is None
+        assert (await replay(store, ids[0]))[0] is None
+        assert len((await replay(store, ids[1]))[1]) == 2
+
+        clock.now = 20
+        await store.store_event("2", notification(5))
+        assert (await replay(store, ids[1]))[0] is None
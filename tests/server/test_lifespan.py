@@ -5,6 +5,7 @@ from contextlib import asynccontextmanager
 from typing import Any
 
 import anyio
+import httpx
 import pytest
 from pydantic import TypeAdapter
 
@@ -12,6 +13,7 @@ from mcp.server.fastmcp import Context, FastMCP
 from mcp.server.lowlevel.server import NotificationOptions, Server
 from mcp.server.models import InitializationOptions
 from mcp.server.session import ServerSession
+from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
 from mcp.shared.message import SessionMessage
 from mcp.types import (
     ClientCapabilities,
@@ -236,3 +238,39 @@ async def test_fastmcp_server_lifespan():
 
         # Cancel server task
         tg.cancel_scope.cancel()
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("lifespan_per_session, expected_entries", [(False, 1), (True, 3)])
+async def test_session_manager_runs_lifespan_once(lifespan_per_session: bool, expected_entries: int):
+    """Test that the session manager shares one lifespan between sessions unless asked not to."""
+    entries: list[int] = []
+
+    @asynccontextmanager
+    async def counting_lifespan(server: Server) -> AsyncIterator[dict[str, int]]:
+        entries.append(len(entries))
+        yield {"entry": len(entries)}
+
+    server = Server[dict[str, int]]("test", lifespan=counting_lifespan, lifespan_per_session=lifespan_per_session)
+    seen: list[int] = []
+
+    @server.call_tool()
+    async def check_lifespan(name: str, arguments: dict[str, Any]) -> list[TextContent]:
+        seen.append(server.request_context.lifespan_context["entry"])
+        return [TextContent(type="text", text="true")]
+
+    manager = StreamableHTTPSessionManager(app=server, stateless=True, json_response=True)
+    async with (
+        manager.run(),
+        httpx.AsyncClient(transport=httpx.ASGITransport(app=manager.handle_request), base_url="http://test") as client,
+    ):
+        for request_id in range(3):
+            response = await client.post(
+                "/mcp",
+                json={"jsonrpc": "2.0", "id": request_id, "method": "tools/call", "params": {"name": "check"}},
+                headers={"Accept": "application/json, text/event-stream"},
+            )
+            assert response.status_code == 200
+
+    assert len(entries) == expected_entries
+    assert seen == ([1, 1, 1] if not lifespan_per_session else [1, 2, 3])
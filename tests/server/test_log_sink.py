@@ -0,0 +1,122 @@
+"""Tests for session log level filtering and the buffered log sink."""
+
+import logging
+import threading
+
+import anyio
+import anyio.to_thread
+import pytest
+
+from mcp.server.fastmcp import Context, FastMCP
+from mcp.server.log_sink import LogSink
+from mcp.server.session import ServerSession
+from mcp.shared.memory import create_connected_server_and_client_session
+from mcp.types import LoggingMessageNotificationParams
+
+
+def create_server() -> FastMCP:
+    mcp = FastMCP()
+
+    @mcp.tool()
+    async def log_every_level(ctx: Context[ServerSession, None]) -> str:
+        for level in ("debug", "info", "warning", "error"):
+            await ctx.session.send_log_message(level, level)
+        return "done"
+
+    @mcp.tool()
+    async def log_through_sink(count: int, ctx: Context[ServerSession, None]) -> str:
+        async with LogSink(ctx.session, flush_interval=60) as sink:
+            for i in range(count):
+                sink.emit("info", i, related_request_id=ctx.request_id)
+        return "done"
+
+    @mcp.tool()
+    async def log_from_thread(ctx: Context[ServerSession, None]) -> str:
+        stdlib_logger = logging.getLogger("test_log_sink.worker")
+        stdlib_logger.setLevel(logging.DEBUG)
+        stdlib_logger.propagate = False
+        async with LogSink(ctx.session, flush_interval=0.01) as sink:
+            handler = sink.handler()
+            stdlib_logger.addHandler(handler)
+            try:
+
+                def work() -> None:
+                    stdlib_logger.debug("hidden")
+                    stdlib_logger.warning("visible %d", 1)
+
+                thread = threading.Thread(target=work)
+                thread.start()
+                await anyio.to_thread.run_sync(thread.join)
+            finally:
+                stdlib_logger.removeHandler(handler)
+        return "done"
+
+    return mcp
+
+
+class LogCollector:
+    def __init__(self) -> None:
+        self.messages: list[LoggingMessageNotificationParams] = []
+
+    async def __call__(self, params: LoggingMessageNotificationParams) -> None:
+        self.messages.append(params)
+
+
+@pytest.mark.anyio
+async def test_session_drops_messages_below_client_level():
+    collector = LogCollector()
+    async with create_connected_server_and_client_session(
+        create_server()._mcp_server, logging_callback=collector
+    ) as client:
+        await client.call_tool("log_every_level", {})
+        assert [m.data for m in collector.messages] == ["debug", "info", "warning", "error"]
+
+        collector.messages.clear()
+        await client.set_logging_level("warning")
+        await client.call_tool("log_every_level", {})
+        assert [m.data for m in collector.messages] == ["warning", "error"]
+
+
+@pytest.mark.anyio
+async def test_sink_sends_buffered_messages_on_exit():
+    collector = LogCollector()
+    async with create_connected_server_and_client_session(
+        create_server()._mcp_server, logging_callback=collector
+    ) as client:
+        result = await client.call_tool("log_through_sink", {"count": 50})
+        assert not result.isError
+    assert [m.data for m in collector.messages] == list(range(50))
+
+
+@pytest.mark.anyio
+async def test_sink_bridges_stdlib_logging_from_threads():
+    collector = LogCollector()
+    async with create_connected_server_and_client_session(
+        create_server()._mcp_server, logging_callback=collector
+    ) as client:
+        await client.set_logging_level("info")
+        result = await client.call_tool("log_from_thread", {})
+        assert not result.isError
+    assert [(m.level, m.data, m.logger) for m in collector.messages] == [
+        ("warning", "visible 1", "test_log_sink.worker")
+    ]
+
+
+@pytest.mark.anyio
+async def test_sink_drops_messages_when_full():
+    sent: list[int] = []
+
+    class FakeSession:
+        def is_log_level_enabled(self, level: str) -> bool:
+            return True
+
+        async def send_notifications(self, notifications: list[object], related_request_id: object = None) -> None:
+            sent.append(len(notifications))
+
+    sink = LogSink(FakeSession(), max_buffered=3)  # type: ignore[arg-type]
+    for i in range(5):
+        sink.emit("info", i)
+    assert sink.dropped == 2
+
+    await sink.flush()
+    assert sent == [3]
@@ -0,0 +1,143 @@
+"""Tests for request metrics."""
+
+from typing import Any
+
+import pytest
+from pydantic import AnyHttpUrl
+from starlette.testclient import TestClient
+
+from mcp.server.auth.provider import AccessToken
+from mcp.server.auth.settings import AuthSettings
+from mcp.server.fastmcp import FastMCP
+from mcp.server.lowlevel import Server
+from mcp.server.metrics import OVERFLOW_TOOL_LABEL, Histogram, MetricsRegistry, render_prometheus
+from mcp.shared.memory import create_connected_server_and_client_session
+from mcp.types import TextContent, Tool
+
+
+def test_histogram_buckets_are_upper_bounds():
+    histogram = Histogram((1.0, 2.0))
+    for value in (0.5, 1.0, 1.5, 3.0):
+        histogram.observe(value)
+
+    snapshot = histogram.snapshot()
+    assert snapshot.counts == (2, 1, 1)
+    assert snapshot.count == 4
+    assert snapshot.sum == 6.0
+
+
+def test_tool_labels_overflow():
+    registry = MetricsRegistry(max_label_sets=2)
+    registry.record_request(("tools/call", "a"), 0.0, 0.0, error=False)
+    registry.record_request(("tools/call", "b"), 0.0, 0.0, error=False)
+    registry.record_request(("tools/call", "c"), 0.0, 0.0, error=True)
+    registry.record_request(("tools/call", "a"), 0.0, 0.0, error=False)
+
+    counts = {(s.method, s.tool): (s.requests, s.errors) for s in registry.snapshot()}
+    assert counts == {
+        ("tools/call", "a"): (2, 0),
+        ("tools/call", "b"): (1, 0),
+        ("tools/call", OVERFLOW_TOOL_LABEL): (1, 1),
+    }
+
+
+def test_render_prometheus():
+    registry = MetricsRegistry(latency_buckets=(0.1,), size_buckets=(100,))
+    registry.record_request(("tools/call", 'say "hi"'), 0.0, 0.05, error=False)
+    registry.record_response(("tools/call", 'say "hi"'), 0.001, 150)
+
+    text = render_prometheus(registry.snapshot())
+    labels = 'method="tools/call",tool="say \\"hi\\""'
+    assert "# TYPE mcp_requests_total counter" in text
+    assert f"mcp_requests_total{{{labels}}} 1" in text
+    assert f"mcp_request_errors_total{{{labels}}} 0" in text
+    assert "# TYPE mcp_request_handler_seconds histogram" in text
+    assert f'mcp_request_handler_seconds_bucket{{{labels},le="0.1"}} 1' in text
+    assert f'mcp_request_handler_seconds_bucket{{{labels},le="+Inf"}} 1' in text
+    assert f'mcp_response_size_bytes_bucket{{{labels},le="100.0"}} 0' in text
+    assert f'mcp_response_size_bytes_bucket{{{labels},le="+Inf"}} 1' in text
+    assert f"mcp_response_size_bytes_sum{{{labels}}} 150" in text
+    assert f"mcp_response_size_bytes_count{{{labels}}} 1" in text
+
+
+@pytest.mark.anyio
+async def test_server_records_requests_per_method_and_tool():
+    server = Server("test", metrics=MetricsRegistry())
+
+    @server.list_tools()
+    async def list_tools() -> list[Tool]:
+        return [Tool(name="echo", inputSchema={"type": "object"}), Tool(name="fail", inputSchema={"type": "object"})]
+
+    @server.call_tool()
+    async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
+        if name == "fail":
+            raise ValueError("boom")
+        return [TextContent(type="text", text="x" * 1000)]
+
+    async with create_connected_server_and_client_session(server) as client:
+        await client.list_tools()
+        await client.call_tool("echo", {})
+        await client.call_tool("echo", {})
+        await client.call_tool("fail", {})
+        await client.send_ping()
+
+    assert server.metrics is not None
+    snapshots = {(s.method, s.tool): s for s in server.metrics.snapshot()}
+    assert set(snapshots) == {("ping", None), ("tools/call", "echo"), ("tools/call", "fail"), ("tools/list", None)}
+
+    echo = snapshots[("tools/call", "echo")]
+    assert (echo.requests, echo.errors) == (2, 0)
+    assert echo.handler_time.count == 2
+    assert echo.queue_wait.count == 2
+    assert echo.serialization_time.count == 2
+    assert echo.response_size.sum > 2000
+
+    fail = snapshots[("tools/call", "fail")]
+    assert (fail.requests, fail.errors) == (1, 1)
+
+
+def test_fastmcp_metrics_route():
+    mcp = FastMCP(metrics_enabled=True)
+    assert mcp.metrics is not None
+    mcp.metrics.record_request(("tools/list", None), 0.0, 0.01, error=False)
+
+    for app in (mcp.sse_app(), mcp.streamable_http_app()):
+        response = TestClient(app).get("/metrics")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert 'mcp_requests_total{method="tools/list"} 1' in response.text
+
+    assert "mcp_sessions 0" in TestClient(mcp.streamable_http_app()).get("/metrics").text
+
+
+class StaticTokenVerifier:
+    async def verify_token(self, token: str) -> AccessToken | None:
+        if token == "valid":
+            return AccessToken(token=token, client_id="client", scopes=["metrics"])
+        return None
+
+
+def test_fastmcp_metrics_route_requires_auth():
+    mcp = FastMCP(
+        metrics_enabled=True,
+        auth=AuthSettings(
+            issuer_url=AnyHttpUrl("https://auth.example.com"),
+            resource_server_url=AnyHttpUrl("https://mcp.example.com"),
+            required_scopes=["metrics"],
+        ),
+        token_verifier=StaticTokenVerifier(),
+    )
+
+    for app in (mcp.sse_app(), mcp.streamable_http_app()):
+        client = TestClient(app)
+        assert client.get("/metrics").status_code == 401
+        assert client.get("/metrics", headers={"Authorization": "Bearer invalid"}).status_code == 401
+        response = client.get("/metrics", headers={"Authorization": "Bearer valid"})
+        assert response.status_code == 200
+        assert "mcp_requests_total" in response.text
+
+
+def test_fastmcp_metrics_disabled_by_default():
+    mcp = FastMCP()
+    assert mcp.metrics is None
+    assert TestClient(mcp.sse_app()).get("/metrics").status_code == 404
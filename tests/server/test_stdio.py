@@ -4,8 +4,8 @@ import anyio
 import pytest
 
 from mcp.server.stdio import stdio_server
-from mcp.shared.message import SessionMessage
-from mcp.types import JSONRPCMessage, JSONRPCRequest, JSONRPCResponse
+from mcp.shared.message import SessionMessage, SessionMessageBatch, decode_messages
+from mcp.types import JSONRPCMessage, JSONRPCNotification, JSONRPCRequest, JSONRPCResponse
 
 
 @pytest.mark.anyio
@@ -59,3 +59,76 @@ async def test_stdio_server():
     assert len(received_responses) == 2
     assert received_responses[0] == JSONRPCMessage(root=JSONRPCRequest(jsonrpc="2.0", id=3, method="ping"))
     assert received_responses[1] == JSONRPCMessage(root=JSONRPCResponse(jsonrpc="2.0", id=4, result={}))
+
+
+@pytest.mark.anyio
+async def test_stdio_server_batches():
+    """A batch read from stdin is delivered message by message; a batch written goes out on one line."""
+    stdin = io.StringIO(
+        '[{"jsonrpc":"2.0","id":1,"method":"ping"},{"jsonrpc":"2.0","method":"notifications/initialized"}]\n'
+    )
+    stdout = io.StringIO()
+
+    async with stdio_server(stdin=anyio.AsyncFile(stdin), stdout=anyio.AsyncFile(stdout)) as (
+        read_stream,
+        write_stream,
+    ):
+        received_messages: list[JSONRPCMessage] = []
+        async with read_stream:
+            async for message in read_stream:
+                if isinstance(message, Exception):
+                    raise message
+                received_messages.append(message.message)
+                if len(received_messages) == 2:
+                    break
+
+        assert received_messages[0] == JSONRPCMessage(root=JSONRPCRequest(jsonrpc="2.0", id=1, method="ping"))
+        assert isinstance(received_messages[1].root, JSONRPCNotification)
+
+        batch = SessionMessageBatch(
+            [
+                SessionMessage(JSONRPCMessage(root=JSONRPCRequest(jsonrpc="2.0", id=3, method="ping"))),
+                SessionMessage(JSONRPCMessage(root=JSONRPCRequest(jsonrpc="2.0", id=4, method="ping"))),
+            ]
+        )
+        async with write_stream:
+            await write_stream.send(batch)
+
+    stdout.seek(0)
+    output_lines = stdout.readlines()
+    assert len(output_lines) == 1
+    assert decode_messages(output_lines[0]) == [message.message for message in batch.messages]
+
+
+@pytest.mark.anyio
+async def test_stdio_server_answers_a_batch_with_a_batch():
+    """The responses to a batch's requests go out together, as one array in request order."""
+    stdin = io.StringIO(
+        '[{"jsonrpc":"2.0","id":1,"method":"ping"},{"jsonrpc":"2.0","id":2,"method":"ping"},'
+        '{"jsonrpc":"2.0","method":"notifications/initialized"}]\n'
+    )
+    stdout = io.StringIO()
+    notification = JSONRPCMessage(root=JSONRPCNotification(jsonrpc="2.0", method="notifications/message"))
+
+    async with stdio_server(stdin=anyio.AsyncFile(stdin), stdout=anyio.AsyncFile(stdout)) as (
+        read_stream,
+        write_stream,
+    ):
+        async with read_stream:
+            for _ in range(3):
+                await read_stream.receive()
+
+        async with write_stream:
+            # Answered out of order, with a notification in between
+            await write_stream.send(SessionMessage(JSONRPCMessage(JSONRPCResponse(jsonrpc="2.0", id=2, result={}))))
+            await write_stream.send(SessionMessage(notification))
+            await write_stream.send(SessionMessage(JSONRPCMessage(JSONRPCResponse(jsonrpc="2.0", id=1, result={}))))
+
+    stdout.seek(0)
+    output_lines = stdout.readlines()
+    assert len(output_lines) == 2
+    assert decode_messages(output_lines[0]) == notification
+    assert decode_messages(output_lines[1]) == [
+        JSONRPCMessage(JSONRPCResponse(jsonrpc="2.0", id=1, result={})),
+        JSONRPCMessage(JSONRPCResponse(jsonrpc="2.0", id=2, result={})),
+    ]
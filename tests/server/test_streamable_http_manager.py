@@ -1,16 +1,31 @@
 """Tests for StreamableHTTPSessionManager."""
 
+import contextlib
+import json
+from collections.abc import AsyncIterator, Sequence
+from functools import partial
 from typing import Any
 from unittest.mock import AsyncMock, patch
 
 import anyio
+import httpx
 import pytest
-from starlette.types import Message
+from starlette.types import Message, Receive, Scope, Send
 
 from mcp.server import streamable_http_manager
+from mcp.server.event_store import MemoryEventStore
 from mcp.server.lowlevel import Server
-from mcp.server.streamable_http import MCP_SESSION_ID_HEADER, StreamableHTTPServerTransport
-from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
+from mcp.server.streamable_http import (
+    MCP_SESSION_ID_HEADER,
+    STREAM_CHUNK_SIZE,
+    EventCallback,
+    EventId,
+    EventStore,
+    StreamableHTTPServerTransport,
+    StreamId,
+)
+from mcp.server.streamable_http_manager import SessionStats, StreamableHTTPSessionManager, StreamBacklog
+from mcp.types import JSONRPCMessage, TextContent, Tool
 
 
 @pytest.mark.anyio
@@ -262,3 +277,468 @@ async def test_stateless_requests_memory_cleanup():
 
             # Verify internal state is cleaned up
             assert len(transport._request_streams) == 0, "Transport should have no active request streams"
+
+
+async def _create_session(manager: StreamableHTTPSessionManager) -> str:
+    """Open a session with an empty POST and return its ID."""
+    sent_messages: list[Message] = []
+
+    async def mock_send(message: Message):
+        sent_messages.append(message)
+
+    async def mock_receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "path": "/mcp",
+        "headers": [(b"content-type", b"application/json")],
+    }
+    await manager.handle_request(scope, mock_receive, mock_send)
+    start = next(msg for msg in sent_messages if msg["type"] == "http.response.start")
+    if start["status"] == 503:
+        return ""
+    headers = {name.decode().lower(): value.decode() for name, value in start["headers"]}
+    return headers[MCP_SESSION_ID_HEADER.lower()]
+
+
+def _server_running_until_cancelled(cancelled: list[bool]) -> Server:
+    app = Server("test-eviction-server")
+
+    async def run(*args: Any, **kwargs: Any) -> None:
+        try:
+            await anyio.sleep_forever()
+        finally:
+            cancelled.append(True)
+
+    app.run = run  # type: ignore[method-assign]
+    return app
+
+
+@pytest.mark.anyio
+async def test_idle_sessions_are_evicted():
+    cancelled: list[bool] = []
+    manager = StreamableHTTPSessionManager(app=_server_running_until_cancelled(cancelled), session_idle_timeout=0.05)
+    async with manager.run():
+        session_id = await _create_session(manager)
+        transport = manager._server_instances[session_id].transport
+        await anyio.sleep(0.03)
+        assert session_id in manager._server_instances
+
+        with anyio.fail_after(2):
+            while session_id in manager._server_instances:
+                await anyio.sleep(0.01)
+        await anyio.sleep(0.01)
+
+        assert transport.is_terminated
+        assert cancelled == [True]
+        stats = manager.session_stats()
+        assert (stats.live, stats.evicted_idle, stats.evicted_expired) == (0, 1, 0)
+
+
+@pytest.mark.anyio
+async def test_sessions_with_open_requests_are_not_idle():
+    manager = StreamableHTTPSessionManager(app=_server_running_until_cancelled([]), session_idle_timeout=0.05)
+    async with manager.run():
+        session_id = await _create_session(manager)
+        manager._server_instances[session_id].active_requests += 1
+        await anyio.sleep(0.2)
+        assert session_id in manager._server_instances
+        manager._server_instances[session_id].active_requests -= 1
+
+
+@pytest.mark.anyio
+async def test_expired_sessions_are_evicted_even_if_active():
+    manager = StreamableHTTPSessionManager(app=_server_running_until_cancelled([]), session_ttl=0.05)
+    async with manager.run():
+        session_id = await _create_session(manager)
+        manager._server_instances[session_id].active_requests += 1
+
+        with anyio.fail_after(2):
+            while session_id in manager._server_instances:
+                await anyio.sleep(0.01)
+        assert manager.session_stats().evicted_expired == 1
+
+
+@pytest.mark.anyio
+async def test_max_sessions_evicts_least_recently_used():
+    cancelled: list[bool] = []
+    manager = StreamableHTTPSessionManager(app=_server_running_until_cancelled(cancelled), max_sessions=2)
+    async with manager.run():
+        first = await _create_session(manager)
+        second = await _create_session(manager)
+        manager._server_instances.move_to_end(first)  # first is now the most recently used
+
+        third = await _create_session(manager)
+        await anyio.sleep(0.01)
+
+        assert list(manager._server_instances) == [first, third]
+        assert cancelled == [True]
+        assert manager.session_stats().evicted_lru == 1
+        assert second not in manager._server_instances
+
+
+@pytest.mark.anyio
+async def test_evicted_session_is_not_found():
+    manager = StreamableHTTPSessionManager(app=_server_running_until_cancelled([]), max_sessions=1)
+    async with manager.run():
+        evicted = await _create_session(manager)
+        await _create_session(manager)
+        assert evicted not in manager._server_instances
+
+        sent_messages: list[Message] = []
+
+        async def mock_send(message: Message):
+            sent_messages.append(message)
+
+        async def mock_receive():
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        scope = {
+            "type": "http",
+            "method": "POST",
+            "path": "/mcp",
+            "headers": [(b"content-type", b"application/json"), (MCP_SESSION_ID_HEADER.encode(), evicted.encode())],
+        }
+        await manager.handle_request(scope, mock_receive, mock_send)
+        start = next(msg for msg in sent_messages if msg["type"] == "http.response.start")
+        assert start["status"] == 404
+
+
+@pytest.mark.anyio
+async def test_max_sessions_rejects_when_all_sessions_are_busy():
+    manager = StreamableHTTPSessionManager(app=_server_running_until_cancelled([]), max_sessions=1)
+    async with manager.run():
+        session_id = await _create_session(manager)
+        manager._server_instances[session_id].active_requests += 1
+
+        assert await _create_session(manager) == ""
+        assert list(manager._server_instances) == [session_id]
+
+        stats = manager.session_stats()
+        assert (stats.live, stats.rejected) == (1, 1)
+        assert "mcp_sessions 1" in stats.render_prometheus()
+        assert "mcp_sessions_rejected_total 1" in stats.render_prometheus()
+        manager._server_instances[session_id].active_requests -= 1
+
+
+def test_invalid_session_limits():
+    with pytest.raises(ValueError):
+        StreamableHTTPSessionManager(app=Server("test"), session_idle_timeout=0)
+    with pytest.raises(ValueError):
+        StreamableHTTPSessionManager(app=Server("test"), max_sessions=0)
+    with pytest.raises(ValueError, match="requires an event store"):
+        StreamableHTTPSessionManager(app=Server("test"), slow_consumer_policy="disconnect")
+
+
+def _stateless_server() -> Server:
+    app = Server("test-stateless-direct")
+
+    @app.list_tools()
+    async def list_tools() -> list[Tool]:
+        return [Tool(name="echo", inputSchema={"type": "object"}), Tool(name="log", inputSchema={"type": "object"})]
+
+    @app.call_tool()
+    async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
+        if name == "log":
+            ctx = app.request_context
+            await ctx.session.send_log_message("info", "working", related_request_id=ctx.request_id)
+        return [TextContent(type="text", text=name)]
+
+    return app
+
+
+async def _post_stateless(manager: StreamableHTTPSessionManager, body: Any) -> httpx.Response:
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=manager.handle_request), base_url="http://testserver"
+    ) as client:
+        return await client.post(
+            "/mcp", json=body, headers={"Accept": "application/json, text/event-stream", "Host": "testserver"}
+        )
+
+
+def _call_tool(request_id: int, name: str) -> dict[str, Any]:
+    return {"jsonrpc": "2.0", "id": request_id, "method": "tools/call", "params": {"name": name, "arguments": {}}}
+
+
+@pytest.mark.anyio
+async def test_stateless_request_is_dispatched_directly():
+    manager = StreamableHTTPSessionManager(app=_stateless_server(), stateless=True, json_response=True)
+    async with manager.run():
+        with patch.object(streamable_http_manager.StreamableHTTPServerTransport, "connect") as connect:
+            response = await _post_stateless(manager, _call_tool(1, "log"))
+        connect.assert_not_called()
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    # JSON responses carry only the response, not the log notification
+    assert response.json() == {
+        "jsonrpc": "2.0",
+        "id": 1,
+        "result": {"content": [{"type": "text", "text": "log"}], "isError": False},
+    }
+
+
+@pytest.mark.anyio
+async def test_stateless_sse_response_includes_notifications():
+    manager = StreamableHTTPSessionManager(app=_stateless_server(), stateless=True)
+    async with manager.run():
+        quiet = await _post_stateless(manager, _call_tool(1, "echo"))
+        chatty = await _post_stateless(manager, _call_tool(2, "log"))
+
+    assert quiet.headers["content-type"].startswith("text/event-stream")
+    assert quiet.text.count("event: message") == 1
+    assert '"id":1' in quiet.text
+
+    events = [line for line in chatty.text.splitlines() if line.startswith("data: ")]
+    assert len(events) == 2
+    assert '"method":"notifications/message"' in events[0]
+    assert '"id":2' in events[1]
+
+
+@pytest.mark.anyio
+async def test_stateless_batch_takes_full_path():
+    manager = StreamableHTTPSessionManager(app=_stateless_server(), stateless=True, json_response=True)
+    async with manager.run():
+        response = await _post_stateless(manager, [_call_tool(1, "echo"), _call_tool(2, "echo")])
+
+    assert response.status_code == 200
+    assert sorted(item["id"] for item in response.json()) == [1, 2]
+
+
+def _large_result_server(size: int) -> Server:
+    app = Server("test-large-result")
+
+    @app.call_tool()
+    async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
+        return [TextContent(type="text", text="x" * size)]
+
+    return app
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    ("stateless", "json_response", "batch"),
+    [(True, True, False), (True, False, False), (False, True, False), (False, False, False), (False, True, True)],
+)
+async def test_large_results_are_sent_in_chunks(stateless: bool, json_response: bool, batch: bool):
+    size = 3 * STREAM_CHUNK_SIZE
+    manager = StreamableHTTPSessionManager(
+        app=_large_result_server(size), stateless=stateless, json_response=json_response
+    )
+    chunks: list[int] = []
+
+    async def app(scope: Scope, receive: Receive, send: Send) -> None:
+        async def record(message: Message) -> None:
+            if message["type"] == "http.response.body":
+                chunks.append(len(message.get("body", b"")))
+            await send(message)
+
+        await manager.handle_request(scope, receive, record)
+
+    async with (
+        manager.run(),
+        httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://testserver") as client,
+    ):
+        headers = {"Accept": "application/json, text/event-stream"}
+        if not stateless:
+            headers = await _initialize(client)
+        chunks.clear()
+        body = [_call_tool(1, "large"), _call_tool(2, "large")] if batch else _call_tool(1, "large")
+        response = await client.post("/mcp", json=body, headers=headers)
+
+    assert response.status_code == 200
+    assert max(chunks) <= STREAM_CHUNK_SIZE
+    assert sum(chunks) == len(response.content) > size
+    if json_response:
+        assert response.headers["content-length"] == str(len(response.content))
+        results = response.json() if batch else [response.json()]
+    else:
+        results = [json.loads(line[6:]) for line in response.text.splitlines() if line.startswith("data: ")]
+    assert [result["result"]["content"][0]["text"] for result in results] == ["x" * size] * (2 if batch else 1)
+
+
+@pytest.mark.anyio
+async def test_sessions_initialize_concurrently():
+    """Initialize handshakes of new sessions are not serialized behind each other."""
+    entered = 0
+    both_entered = anyio.Event()
+
+    @contextlib.asynccontextmanager
+    async def session_setup(server: Server) -> AsyncIterator[dict[str, Any]]:
+        nonlocal entered
+        entered += 1
+        if entered == 2:
+            both_entered.set()
+        # Only completes once another session is being set up at the same time
+        await both_entered.wait()
+        yield {}
+
+    app = Server("test-concurrent-init", lifespan=session_setup, lifespan_per_session=True)
+    manager = StreamableHTTPSessionManager(app=app, json_response=True)
+    initialize = {
+        "jsonrpc": "2.0",
+        "id": 0,
+        "method": "initialize",
+        "params": {"protocolVersion": "2025-06-18", "capabilities": {}, "clientInfo": {"name": "t", "version": "0"}},
+    }
+    session_ids: list[str] = []
+
+    async with (
+        manager.run(),
+        httpx.AsyncClient(transport=httpx.ASGITransport(app=manager.handle_request), base_url="http://test") as client,
+    ):
+
+        async def initialize_session() -> None:
+            response = await client.post(
+                "/mcp", json=initialize, headers={"Accept": "application/json, text/event-stream"}
+            )
+            assert response.status_code == 200
+            session_ids.append(response.headers[MCP_SESSION_ID_HEADER])
+
+        with anyio.fail_after(5):
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(initialize_session)
+                tg.start_soon(initialize_session)
+
+        assert len(set(session_ids)) == 2
+        assert manager.session_stats().live == 2
+
+
+@pytest.mark.anyio
+async def test_terminated_sessions_events_are_removed_from_store():
+    event_store = MemoryEventStore()
+    manager = StreamableHTTPSessionManager(app=Server("test-event-store"), event_store=event_store)
+    initialize = {
+        "jsonrpc": "2.0",
+        "id": 0,
+        "method": "initialize",
+        "params": {"protocolVersion": "2025-06-18", "capabilities": {}, "clientInfo": {"name": "t", "version": "0"}},
+    }
+
+    async with (
+        manager.run(),
+        httpx.AsyncClient(transport=httpx.ASGITransport(app=manager.handle_request), base_url="http://test") as client,
+    ):
+        response = await client.post("/mcp", json=initialize, headers={"Accept": "application/json, text/event-stream"})
+        assert response.status_code == 200
+        assert event_store.stats().sessions == 1
+
+        response = await client.delete(
+            "/mcp",
+            headers={
+                MCP_SESSION_ID_HEADER: response.headers[MCP_SESSION_ID_HEADER],
+                "mcp-protocol-version": "2025-06-18",
+            },
+        )
+        assert response.status_code == 200
+        assert event_store.stats().sessions == 0
+
+
+class RecordingEventStore(EventStore):
+    """Numbers events, recording the size of each batch and optionally holding writes."""
+
+    def __init__(self) -> None:
+        self.batches: list[int] = []
+        self.release = anyio.Event()
+        self.release.set()
+        self._next_id = 0
+
+    async def store_event(self, stream_id: StreamId, message: JSONRPCMessage) -> EventId:
+        return (await self.store_events([(stream_id, message)]))[0]
+
+    async def store_events(self, events: Sequence[tuple[StreamId, JSONRPCMessage]]) -> list[EventId]:
+        await self.release.wait()
+        await anyio.sleep(0.01)
+        self.batches.append(len(events))
+        self._next_id += len(events)
+        return [str(event_id) for event_id in range(self._next_id - len(events), self._next_id)]
+
+    async def replay_events_after(self, last_event_id: EventId, send_callback: EventCallback) -> StreamId | None:
+        return None
+
+
+def _chatty_server() -> Server:
+    app = Server("test-write-behind")
+
+    @app.call_tool()
+    async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
+        ctx = app.request_context
+        for i in range(5):
+            await ctx.session.send_log_message("info", f"step {i}", related_request_id=ctx.request_id)
+        return [TextContent(type="text", text=name)]
+
+    return app
+
+
+async def _initialize(client: httpx.AsyncClient) -> dict[str, str]:
+    initialize = {
+        "jsonrpc": "2.0",
+        "id": 0,
+        "method": "initialize",
+        "params": {"protocolVersion": "2025-06-18", "capabilities": {}, "clientInfo": {"name": "t", "version": "0"}},
+    }
+    headers = {"Accept": "application/json, text/event-stream", "mcp-protocol-version": "2025-06-18"}
+    response = await client.post("/mcp", json=initialize, headers=headers)
+    headers[MCP_SESSION_ID_HEADER] = response.headers[MCP_SESSION_ID_HEADER]
+    await client.post("/mcp", json={"jsonrpc": "2.0", "method": "notifications/initialized"}, headers=headers)
+    return headers
+
+
+@pytest.mark.anyio
+async def test_write_behind_stores_events_in_batches():
+    event_store = RecordingEventStore()
+    manager = StreamableHTTPSessionManager(app=_chatty_server(), event_store=event_store, event_store_queue_size=10)
+
+    async with (
+        manager.run(),
+        httpx.AsyncClient(transport=httpx.ASGITransport(app=manager.handle_request), base_url="http://test") as client,
+    ):
+        headers = await _initialize(client)
+        response = await client.post("/mcp", json=_call_tool(1, "chatty"), headers=headers)
+
+    event_ids = [line.removeprefix("id: ") for line in response.text.splitlines() if line.startswith("id: ")]
+    events = [line for line in response.text.splitlines() if line.startswith("data: ")]
+    # Every message is sent with its event ID, in order
+    assert len(event_ids) == len(events) == 6
+    assert [int(event_id) for event_id in event_ids] == sorted(int(event_id) for event_id in event_ids)
+    assert '"id":1' in events[-1]
+    # The initialize response, then the tool's messages in fewer batches than messages
+    assert sum(event_store.batches) == 7
+    assert len(event_store.batches) < 7
+
+
+@pytest.mark.anyio
+async def test_write_behind_reports_store_lag():
+    event_store = RecordingEventStore()
+    manager = StreamableHTTPSessionManager(app=_chatty_server(), event_store=event_store, event_store_queue_size=10)
+
+    async with (
+        manager.run(),
+        httpx.AsyncClient(transport=httpx.ASGITransport(app=manager.handle_request), base_url="http://test") as client,
+    ):
+        headers = await _initialize(client)
+        assert manager.session_stats().event_store_lag == 0
+        event_store.release = anyio.Event()
+
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(partial(client.post, "/mcp", json=_call_tool(1, "chatty"), headers=headers))
+            with anyio.fail_after(2):
+                while manager.session_stats().event_store_lag < 0.05:
+                    await anyio.sleep(0.01)
+            event_store.release.set()
+
+        assert manager.session_stats().event_store_lag == 0
+
+
+def test_stream_backlogs_are_rendered_without_session_ids():
+    stats = SessionStats(
+        0, 0, 0, 0, 0, stream_backlogs=(StreamBacklog("abc", "_GET_stream", 7), StreamBacklog("def", "1", 2))
+    )
+    text = stats.render_prometheus()
+    assert "mcp_stream_backlog_streams 2" in text
+    assert "mcp_stream_backlog_messages 9" in text
+    assert "mcp_stream_backlog_max 7" in text
+    assert "abc" not in text
+    assert "def" not in text
@@ -0,0 +1,138 @@
+"""Tests for multi-worker streamable HTTP serving."""
+
+import multiprocessing
+import os
+import socket
+import time
+from collections.abc import Generator
+
+import httpx
+import pytest
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse
+from starlette.types import Message, Receive, Scope, Send
+
+from mcp.client.session import ClientSession
+from mcp.client.streamable_http import streamablehttp_client
+from mcp.server.fastmcp import FastMCP
+from mcp.server.streamable_http import MCP_SESSION_ID_HEADER
+from mcp.server.streamable_http_workers import SessionAffinityMiddleware, session_owner
+from mcp.types import TextContent
+
+
+def test_session_owner():
+    assert session_owner("w0-abc") == 0
+    assert session_owner("w12-abc") == 12
+    assert session_owner("abc") is None
+    assert session_owner("wx-abc") is None
+
+
+def worker_app(name: str):
+    async def app(scope: Scope, receive: Receive, send: Send) -> None:
+        request = Request(scope, receive)
+        body = await request.body()
+        text = f"{name} {request.method} {request.url.path}?{request.url.query} {body.decode()}"
+        await PlainTextResponse(text, headers={"x-worker": name})(scope, receive, send)
+
+    return app
+
+
+def affinity_client(worker: int) -> httpx.AsyncClient:
+    apps = [worker_app("worker0"), worker_app("worker1")]
+    middleware = SessionAffinityMiddleware(apps[worker], worker, [httpx.ASGITransport(app=app) for app in apps])
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=middleware), base_url="http://test")
+
+
+@pytest.mark.anyio
+async def test_requests_for_other_workers_sessions_are_forwarded():
+    async with affinity_client(0) as client:
+        response = await client.post("/mcp?x=1", content=b"payload", headers={MCP_SESSION_ID_HEADER: "w1-abc"})
+
+    assert response.status_code == 200
+    assert response.headers["x-worker"] == "worker1"
+    assert response.text == "worker1 POST /mcp?x=1 payload"
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("session_id", [None, "w0-abc", "w7-abc", "abc"])
+async def test_other_requests_are_handled_locally(session_id: str | None):
+    headers = {MCP_SESSION_ID_HEADER: session_id} if session_id else {}
+    async with affinity_client(0) as client:
+        response = await client.get("/mcp", headers=headers)
+
+    assert response.headers["x-worker"] == "worker0"
+
+
+@pytest.mark.anyio
+async def test_connections_are_closed_when_the_app_shuts_down():
+    app = Starlette()
+    middleware = SessionAffinityMiddleware(app, 0, [httpx.ASGITransport(app=app) for _ in range(2)])
+    clients = middleware._clients  # pyright: ignore[reportPrivateUsage]
+    messages = [{"type": "lifespan.startup"}, {"type": "lifespan.shutdown"}]
+    sent: list[str] = []
+
+    async def receive() -> Message:
+        return messages.pop(0)
+
+    async def send(message: Message) -> None:
+        sent.append(message["type"])
+        assert all(client.is_closed for client in clients) == (message["type"] == "lifespan.shutdown.complete")
+
+    await middleware({"type": "lifespan", "asgi": {"version": "3.0"}, "state": {}}, receive, send)
+
+    assert sent == ["lifespan.startup.complete", "lifespan.shutdown.complete"]
+
+
+def run_worker_server(port: int) -> None:
+    mcp = FastMCP(port=port, workers=2)
+
+    @mcp.tool()
+    def pid() -> str:
+        return str(os.getpid())
+
+    mcp.run(transport="streamable-http")
+
+
+@pytest.fixture
+def worker_server_port() -> Generator[int, None, None]:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+
+    # Not a daemon, as daemon processes cannot start the worker processes
+    proc = multiprocessing.Process(target=run_worker_server, args=(port,))
+    proc.start()
+    for _ in range(50):
+        try:
+            with socket.create_connection(("127.0.0.1", port)):
+                break
+        except ConnectionRefusedError:
+            time.sleep(0.1)
+    else:
+        proc.kill()
+        raise RuntimeError("Server failed to start")
+
+    yield port
+
+    proc.terminate()
+    proc.join(timeout=5)
+    assert proc.exitcode is not None
+
+
+@pytest.mark.anyio
+async def test_sessions_stay_with_their_worker(worker_server_port: int):
+    for _ in range(4):
+        async with streamablehttp_client(f"http://127.0.0.1:{worker_server_port}/mcp") as (read, write, get_id):
+            async with ClientSession(read, write) as session:
+                await session.initialize()
+                session_id = get_id()
+                assert session_id is not None
+                assert session_owner(session_id) in (0, 1)
+
+                pids: set[str] = set()
+                for _ in range(3):
+                    result = await session.call_tool("pid", {})
+                    assert isinstance(result.content[0], TextContent)
+                    pids.add(result.content[0].text)
+                assert len(pids) == 1
@@ -0,0 +1,93 @@
+"""Tests for wire codecs."""
+
+import io
+import json
+
+import anyio
+import pytest
+from pydantic import ValidationError
+
+from mcp.server.stdio import stdio_server
+from mcp.shared.codec import Codec, JSONLibraryCodec, PydanticCodec
+from mcp.shared.message import SessionMessage
+from mcp.types import (
+    INTERNAL_ERROR,
+    ErrorData,
+    JSONRPCError,
+    JSONRPCMessage,
+    JSONRPCNotification,
+    JSONRPCRequest,
+    JSONRPCResponse,
+)
+
+CODECS: list[Codec] = [PydanticCodec(), JSONLibraryCodec(json.loads, json.dumps)]
+
+MESSAGES = [
+    JSONRPCMessage(
+        JSONRPCRequest(jsonrpc="2.0", id=1, method="tools/call", params={"name": "echo", "arguments": {"x": None}})
+    ),
+    JSONRPCMessage(JSONRPCNotification(jsonrpc="2.0", method="notifications/progress", params={"progress": 0.5})),
+    JSONRPCMessage(JSONRPCResponse(jsonrpc="2.0", id="a", result={"content": [{"type": "text", "text": "héllo"}]})),
+    JSONRPCMessage(JSONRPCError(jsonrpc="2.0", id=2, error=ErrorData(code=INTERNAL_ERROR, message="boom"))),
+]
+
+
+@pytest.mark.parametrize("codec", CODECS, ids=lambda codec: type(codec).__name__)
+@pytest.mark.parametrize("message", MESSAGES)
+def test_codecs_encode_the_same_json(codec: Codec, message: JSONRPCMessage):
+    encoded = codec.encode(message)
+    assert isinstance(encoded, bytes)
+    assert json.loads(encoded) == json.loads(message.model_dump_json(by_alias=True, exclude_none=True))
+    assert codec.decode(encoded) == message
+    assert codec.decode(encoded.decode()) == message
+
+
+@pytest.mark.parametrize("codec", CODECS, ids=lambda codec: type(codec).__name__)
+def test_codecs_decode_batches(codec: Codec):
+    data = b"[" + b",".join(codec.encode(message) for message in MESSAGES) + b"]"
+    assert codec.decode(data) == MESSAGES
+
+    with pytest.raises(ValidationError):
+        codec.decode(b"[]")
+
+
+@pytest.mark.parametrize("codec", CODECS, ids=lambda codec: type(codec).__name__)
+def test_codecs_report_malformed_json_as_json_invalid(codec: Codec):
+    with pytest.raises(ValidationError) as exc_info:
+        codec.decode(b'{"jsonrpc": "2.0",')
+    assert exc_info.value.errors()[0]["type"] == "json_invalid"
+
+    with pytest.raises(ValidationError) as exc_info:
+        codec.decode(b'{"jsonrpc": "2.0"}')
+    assert all(error["type"] != "json_invalid" for error in exc_info.value.errors())
+
+
+@pytest.mark.anyio
+async def test_stdio_server_uses_codec():
+    calls: list[str] = []
+
+    class RecordingCodec(PydanticCodec):
+        def encode(self, message: JSONRPCMessage) -> bytes:
+            calls.append("encode")
+            return super().encode(message)
+
+        def decode(self, data: str | bytes) -> JSONRPCMessage | list[JSONRPCMessage]:
+            calls.append("decode")
+            return super().decode(data)
+
+    stdin = io.StringIO(MESSAGES[0].model_dump_json() + "\n")
+    stdout = io.StringIO()
+
+    async with stdio_server(stdin=anyio.AsyncFile(stdin), stdout=anyio.AsyncFile(stdout), codec=RecordingCodec()) as (
+        read_stream,
+        write_stream,
+    ):
+        async with read_stream:
+            received = await read_stream.receive()
+        assert isinstance(received, SessionMessage)
+        assert received.message == MESSAGES[0]
+        async with write_stream:
+            await write_stream.send(SessionMessage(MESSAGES[2]))
+
+    assert calls == ["decode", "encode"]
+    assert JSONRPCMessage.model_validate_json(stdout.getvalue()) == MESSAGES[2]
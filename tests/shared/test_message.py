@@ -0,0 +1,73 @@
+"""Tests for outbound message encoding."""
+
+import pytest
+from pydantic import ValidationError
+
+from mcp.shared.message import SessionMessage, SessionMessageBatch, decode_messages, encode_message
+from mcp.types import (
+    INTERNAL_ERROR,
+    ErrorData,
+    JSONRPCError,
+    JSONRPCMessage,
+    JSONRPCNotification,
+    JSONRPCRequest,
+    JSONRPCResponse,
+)
+
+
+@pytest.mark.parametrize(
+    "message",
+    [
+        JSONRPCRequest(jsonrpc="2.0", id=1, method="tools/call", params={"name": "echo", "arguments": {"x": None}}),
+        JSONRPCRequest(jsonrpc="2.0", id="abc", method="ping"),
+        JSONRPCNotification(jsonrpc="2.0", method="notifications/progress", params={"progress": 0.5}),
+        JSONRPCResponse(jsonrpc="2.0", id=1, result={"content": [{"type": "text", "text": "héllo"}]}),
+        JSONRPCError(jsonrpc="2.0", id=2, error=ErrorData(code=INTERNAL_ERROR, message="boom")),
+    ],
+)
+def test_encode_message_matches_model_dump_json(
+    message: JSONRPCRequest | JSONRPCNotification | JSONRPCResponse | JSONRPCError,
+):
+    wrapped = JSONRPCMessage(message)
+    assert encode_message(wrapped) == wrapped.model_dump_json(by_alias=True, exclude_none=True).encode()
+
+
+def test_encode_message_accepts_constructed_envelopes():
+    """Sessions build outbound envelopes with model_construct, skipping validation."""
+    message = JSONRPCMessage(JSONRPCResponse.model_construct(jsonrpc="2.0", id=3, result={"ok": True}))
+    assert encode_message(message) == b'{"jsonrpc":"2.0","id":3,"result":{"ok":true}}'
+
+
+def test_session_message_encodes_once():
+    session_message = SessionMessage(JSONRPCMessage(JSONRPCRequest(jsonrpc="2.0", id=1, method="ping")))
+    assert session_message.encoded is None
+
+    encoded = session_message.encode()
+    assert session_message.encoded is encoded
+    assert session_message.encode() is encoded
+
+
+def test_decode_messages_accepts_single_messages_and_batches():
+    single = decode_messages('{"jsonrpc":"2.0","id":1,"method":"ping"}')
+    assert isinstance(single, JSONRPCMessage)
+
+    batch = decode_messages(b' [{"jsonrpc":"2.0","id":1,"method":"ping"},{"jsonrpc":"2.0","id":1,"result":{}}]')
+    assert isinstance(batch, list)
+    assert isinstance(batch[0].root, JSONRPCRequest)
+    assert isinstance(batch[1].root, JSONRPCResponse)
+
+
+@pytest.mark.parametrize("data", ["[]", "[1]", "[{}", '{"jsonrpc":"2.0"}'])
+def test_decode_messages_rejects_invalid_input(data: str):
+    with pytest.raises(ValidationError):
+        decode_messages(data)
+
+
+def test_session_message_batch_encodes_as_array():
+    messages = [
+        JSONRPCMessage(JSONRPCRequest(jsonrpc="2.0", id=1, method="ping")),
+        JSONRPCMessage(JSONRPCNotification(jsonrpc="2.0", method="notifications/initialized")),
+    ]
+    batch = SessionMessageBatch([SessionMessage(message) for message in messages])
+    assert batch.encode() == b"[%s,%s]" % tuple(encode_message(message) for message in messages)
+    assert decode_messages(batch.encode()) == messages
@@ -7,12 +7,13 @@ import pytest
 import mcp.types as types
 from mcp.client.session import ClientSession
 from mcp.server import Server
+from mcp.server.fastmcp import Context, FastMCP
 from mcp.server.lowlevel import NotificationOptions
 from mcp.server.models import InitializationOptions
 from mcp.server.session import ServerSession
 from mcp.shared.context import RequestContext
 from mcp.shared.memory import create_connected_server_and_client_session
-from mcp.shared.progress import progress
+from mcp.shared.progress import ProgressThrottle, ProgressThrottler, ProgressUpdate, progress
 from mcp.shared.session import BaseSession, RequestResponder, SessionMessage
 
 
@@ -388,3 +389,103 @@ async def test_progress_callback_exception_logging():
             # Check that a warning was logged for the progress callback exception
             assert len(logged_errors) > 0
             assert any("Progress callback raised an exception" in warning for warning in logged_errors)
+
+
+@pytest.mark.anyio
+async def test_progress_throttler_coalesces_updates():
+    """Held back updates keep only the latest value and are sent on flush."""
+    sent: list[ProgressUpdate] = []
+
+    async def send(update: ProgressUpdate) -> None:
+        sent.append(update)
+
+    throttler = ProgressThrottler(ProgressThrottle(min_interval=60, min_delta=0), send)
+
+    for i in range(1, 1001):
+        await throttler.update(ProgressUpdate("token", float(i), total=2000, message=f"row {i}"))
+    # The first update goes out immediately, the rest are held back
+    assert [update.progress for update in sent] == [1]
+
+    await throttler.flush("token")
+    assert [update.progress for update in sent] == [1, 1000]
+    assert sent[-1].message == "row 1000"
+
+    # Nothing is left to flush, and reaching the total is never held back
+    await throttler.flush("token")
+    await throttler.update(ProgressUpdate("token", 0, total=2000))
+    await throttler.update(ProgressUpdate("token", 2000, total=2000))
+    assert [update.progress for update in sent] == [1, 1000, 0, 2000]
+
+
+@pytest.mark.anyio
+async def test_progress_throttler_min_delta():
+    sent: list[float] = []
+
+    async def send(update: ProgressUpdate) -> None:
+        sent.append(update.progress)
+
+    throttler = ProgressThrottler(ProgressThrottle(min_delta=10), send)
+    for i in range(0, 35):
+        await throttler.update(ProgressUpdate("token", float(i)))
+
+    assert sent == [0, 10, 20, 30]
+    await throttler.flush("token")
+    assert sent == [0, 10, 20, 30, 34]
+
+
+@pytest.mark.anyio
+async def test_progress_throttler_sends_held_back_update_when_interval_passes():
+    sent: list[float] = []
+
+    async def send(update: ProgressUpdate) -> None:
+        sent.append(update.progress)
+
+    async with ProgressThrottler(ProgressThrottle(min_interval=0.05), send) as throttler:
+        for i in range(1, 4):
+            await throttler.update(ProgressUpdate("token", float(i)))
+        await throttler.update(ProgressUpdate("other", 1))
+        await throttler.update(ProgressUpdate("other", 2))
+        assert sent == [1, 1]
+
+        with anyio.fail_after(2):
+            while len(sent) < 4:
+                await anyio.sleep(0.01)
+        # Only the latest held back update of each token is sent
+        assert sorted(sent[2:]) == [2, 3]
+        await throttler.update(ProgressUpdate("token", 4))
+        await throttler.update(ProgressUpdate("token", 5))
+
+    # Tokens never flushed are dropped on exit, with their held back updates
+    assert throttler._tokens == {}  # pyright: ignore[reportPrivateUsage]
+    assert sorted(sent) == [1, 1, 2, 3]
+
+
+def test_progress_throttle_validation():
+    with pytest.raises(ValueError):
+        ProgressThrottle(min_interval=-1)
+    with pytest.raises(ValueError):
+        ProgressThrottle(min_delta=-1)
+
+
+@pytest.mark.anyio
+async def test_throttled_progress_is_flushed_before_response():
+    """A tool reporting progress per row sends few notifications, the last of which precedes the result."""
+    mcp = FastMCP(progress_min_interval=60)
+
+    @mcp.tool()
+    async def scan(ctx: Context[ServerSession, None]) -> str:
+        for row in range(1, 501):
+            await ctx.report_progress(row, 1000)
+        return "done"
+
+    updates: list[float] = []
+
+    async def progress_callback(progress: float, total: float | None, message: str | None) -> None:
+        updates.append(progress)
+
+    async with create_connected_server_and_client_session(mcp._mcp_server) as client:
+        result = await client.call_tool("scan", {}, progress_callback=progress_callback)
+        # The progress callback runs before the response is delivered
+        assert updates == [1, 500]
+        assert isinstance(result.content[0], types.TextContent)
+        assert result.content[0].text == "done"
@@ -0,0 +1,89 @@
+"""Tests for compiled JSON Schema validators."""
+
+from typing import Any
+
+import jsonschema
+import pytest
+
+from mcp.server.lowlevel import Server
+from mcp.shared.memory import create_connected_server_and_client_session
+from mcp.shared.schema_validation import SchemaValidatorCache, compile_schema, validate_instance
+from mcp.types import TextContent, Tool
+
+SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {"a": {"type": "number"}, "b": {"type": "string", "minLength": 2}},
+    "required": ["a"],
+}
+
+
+@pytest.mark.parametrize(
+    "instance",
+    [
+        {"a": 1, "b": "ok"},
+        {"b": "ok"},
+        {"a": "not a number"},
+        {"a": 1, "b": "x"},
+        {"a": "x", "b": "y"},
+        [],
+    ],
+)
+def test_validate_instance_matches_jsonschema_validate(instance: Any):
+    """The compiled path must raise exactly what jsonschema.validate raises."""
+    validator = compile_schema(SCHEMA)
+
+    try:
+        jsonschema.validate(instance=instance, schema=SCHEMA)
+    except jsonschema.ValidationError as e:
+        with pytest.raises(jsonschema.ValidationError) as exc_info:
+            validate_instance(validator, instance)
+        assert exc_info.value.message == e.message
+    else:
+        validate_instance(validator, instance)
+
+
+def test_compile_schema_rejects_invalid_schema():
+    with pytest.raises(jsonschema.SchemaError):
+        compile_schema({"type": "not-a-type"})
+
+
+def test_cache_reuses_and_invalidates_validators():
+    cache = SchemaValidatorCache()
+
+    first = cache.get("tool", SCHEMA)
+    assert cache.get("tool", SCHEMA) is first
+    assert "tool" in cache
+
+    cache.invalidate("tool")
+    assert "tool" not in cache
+    assert cache.get("tool", SCHEMA) is not first
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+@pytest.mark.anyio
+async def test_server_refreshes_validators_when_tools_are_relisted():
+    """A tool whose schema changes between list_tools calls is validated against the new schema."""
+    server = Server("test")
+    tools = [Tool(name="echo", inputSchema={"type": "object", "properties": {"x": {"type": "integer"}}})]
+
+    @server.list_tools()
+    async def list_tools() -> list[Tool]:
+        return tools
+
+    @server.call_tool()
+    async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
+        return [TextContent(type="text", text=str(arguments["x"]))]
+
+    async with create_connected_server_and_client_session(server) as client:
+        result = await client.call_tool("echo", {"x": "text"})
+        assert result.isError
+        assert "echo" in server._input_validators
+
+        tools[0] = Tool(name="echo", inputSchema={"type": "object", "properties": {"x": {"type": "string"}}})
+        await client.list_tools()
+        assert "echo" not in server._input_validators
+
+        result = await client.call_tool("echo", {"x": "text"})
+        assert not result.isError
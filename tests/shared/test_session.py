@@ -1,4 +1,5 @@
 from collections.abc import AsyncGenerator
+from datetime import timedelta
 from typing import Any
 
 import anyio
@@ -9,6 +10,7 @@ from mcp.client.session import ClientSession
 from mcp.server.lowlevel.server import Server
 from mcp.shared.exceptions import McpError
 from mcp.shared.memory import create_client_server_memory_streams, create_connected_server_and_client_session
+from mcp.shared.message import SessionMessage
 from mcp.types import (
     CancelledNotification,
     CancelledNotificationParams,
@@ -168,3 +170,127 @@ async def test_connection_closed():
                 await ev_closed.wait()
             with anyio.fail_after(1):
                 await ev_response.wait()
+
+
+@pytest.mark.anyio
+async def test_concurrent_requests_release_response_slots(
+    client_connected_to_server: ClientSession,
+):
+    """Each concurrent request gets its own response, and no response slots are left behind."""
+    results: list[EmptyResult] = []
+
+    async def ping() -> None:
+        results.append(await client_connected_to_server.send_ping())
+
+    async with anyio.create_task_group() as tg:
+        for _ in range(50):
+            tg.start_soon(ping)
+
+    assert len(results) == 50
+    assert len(client_connected_to_server._response_slots) == 0
+
+
+@pytest.mark.anyio
+async def test_request_timeout_releases_response_slot():
+    """A timed out request frees its slot, and a late response for it is reported as unknown."""
+    unknown_responses: list[Exception] = []
+
+    async def message_handler(message: Any) -> None:
+        if isinstance(message, Exception):
+            unknown_responses.append(message)
+
+    async with create_client_server_memory_streams() as (client_streams, server_streams):
+        client_read, client_write = client_streams
+        server_read, server_write = server_streams
+
+        async with ClientSession(
+            read_stream=client_read, write_stream=client_write, message_handler=message_handler
+        ) as client_session:
+            with pytest.raises(McpError) as exc_info:
+                await client_session.send_request(
+                    ClientRequest(types.PingRequest()),
+                    EmptyResult,
+                    request_read_timeout_seconds=timedelta(milliseconds=50),
+                )
+            assert "Timed out" in exc_info.value.error.message
+            assert len(client_session._response_slots) == 0
+
+            request = await server_read.receive()
+            assert isinstance(request, SessionMessage)
+            assert isinstance(request.message.root, types.JSONRPCRequest)
+            late = types.JSONRPCResponse(jsonrpc="2.0", id=request.message.root.id, result={})
+            await server_write.send(SessionMessage(types.JSONRPCMessage(late)))
+
+            with anyio.fail_after(1):
+                while not unknown_responses:
+                    await anyio.sleep(0.01)
+            assert "unknown request ID" in str(unknown_responses[0])
+
+
+@pytest.mark.anyio
+async def test_send_batch_returns_results_and_errors_in_order():
+    """A batch sent over the in-memory transport is split by the receiving session."""
+    server = Server(name="batch server")
+
+    @server.list_tools()
+    async def list_tools() -> list[types.Tool]:
+        return [types.Tool(name="echo", inputSchema={"type": "object"})]
+
+    @server.call_tool()
+    async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
+        return [TextContent(type="text", text=str(arguments["value"]))]
+
+    async with create_connected_server_and_client_session(server) as client:
+        results = await client.call_tools_batch([("echo", {"value": i}) for i in range(5)])
+        texts = [
+            content.text
+            for result in results
+            if isinstance(result, types.CallToolResult)
+            for content in result.content
+            if isinstance(content, TextContent)
+        ]
+        assert texts == ["0", "1", "2", "3", "4"]
+
+        mixed = await client.send_batch(
+            [
+                ClientRequest(types.PingRequest()),
+                ClientRequest(types.ListPromptsRequest()),
+            ],
+            EmptyResult,
+        )
+        assert isinstance(mixed[0], EmptyResult)
+        assert isinstance(mixed[1], types.ErrorData)
+        assert mixed[1].code == types.METHOD_NOT_FOUND
+        assert len(client._response_slots) == 0
+
+        assert await client.send_batch([], EmptyResult) == []
+
+
+@pytest.mark.anyio
+async def test_send_batch_to_stream_without_batch_support():
+    """A session created without supports_batches sends the messages of a batch one by one."""
+    server_writer, client_read = anyio.create_memory_object_stream[SessionMessage | Exception](2)
+    client_write, server_reader = anyio.create_memory_object_stream[SessionMessage](2)
+
+    async def answer_pings() -> None:
+        for _ in range(2):
+            item = await server_reader.receive()
+            assert isinstance(item, SessionMessage)
+            assert isinstance(item.message.root, types.JSONRPCRequest)
+            response = types.JSONRPCResponse(jsonrpc="2.0", id=item.message.root.id, result={})
+            await server_writer.send(SessionMessage(types.JSONRPCMessage(response)))
+
+    async with (
+        server_writer,
+        client_read,
+        client_write,
+        server_reader,
+        ClientSession(client_read, client_write) as client,
+        anyio.create_task_group() as tg,
+    ):
+        tg.start_soon(answer_pings)
+        with anyio.fail_after(2):
+            results = await client.send_batch(
+                [ClientRequest(types.PingRequest()), ClientRequest(types.PingRequest())], EmptyResult
+            )
+        assert results == [EmptyResult(), EmptyResult()]
@@ -180,6 +180,28 @@ async def test_raw_sse_connection(http_client: httpx.AsyncClient) -> None:
             await connection_test()
 
 
+@pytest.mark.anyio
+async def test_raw_sse_batch_is_answered_with_a_batch(http_client: httpx.AsyncClient) -> None:
+    """The responses to a batch POSTed to the server go out in one SSE event, as a JSON array."""
+    with anyio.fail_after(3):
+        async with http_client.stream("GET", "/sse") as response:
+            lines = response.aiter_lines()
+            assert await anext(lines) == "event: endpoint"
+            endpoint = (await anext(lines)).removeprefix("data: ")
+
+            batch = [{"jsonrpc": "2.0", "id": request_id, "method": "ping"} for request_id in (1, 2)]
+            post = await http_client.post(endpoint, json=batch)
+            assert post.status_code == 202
+
+            async for line in lines:
+                if line.startswith("data: "):
+                    assert json.loads(line.removeprefix("data: ")) == [
+                        {"jsonrpc": "2.0", "id": 1, "result": {}},
+                        {"jsonrpc": "2.0", "id": 2, "result": {}},
+                    ]
+                    break
+
+
 @pytest.mark.anyio
 async def test_sse_client_basic_connection(server: None, server_url: str) -> None:
     async with sse_client(server_url + "/sse") as streams:
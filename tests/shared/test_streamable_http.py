@@ -8,7 +8,7 @@ import json
 import multiprocessing
 import socket
 import time
-from collections.abc import Generator
+from collections.abc import Generator, Iterator
 from typing import Any
 
 import anyio
@@ -17,9 +17,11 @@ import pytest
 import requests
 import uvicorn
 from pydantic import AnyUrl
+from sse_starlette import ServerSentEvent
 from starlette.applications import Starlette
 from starlette.requests import Request
 from starlette.routing import Mount
+from starlette.types import Message
 
 import mcp.types as types
 from mcp.client.session import ClientSession
@@ -29,18 +31,22 @@ from mcp.server.streamable_http import (
     MCP_PROTOCOL_VERSION_HEADER,
     MCP_SESSION_ID_HEADER,
     SESSION_ID_PATTERN,
+    STREAM_CHUNK_SIZE,
     EventCallback,
     EventId,
     EventMessage,
     EventStore,
     StreamableHTTPServerTransport,
     StreamId,
+    _body_chunks,  # pyright: ignore[reportPrivateUsage]
+    _sse_event_parts,  # pyright: ignore[reportPrivateUsage]
+    _SSEResponse,  # pyright: ignore[reportPrivateUsage]
 )
 from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
 from mcp.server.transport_security import TransportSecuritySettings
 from mcp.shared.context import RequestContext
 from mcp.shared.exceptions import McpError
-from mcp.shared.message import ClientMessageMetadata
+from mcp.shared.message import ClientMessageMetadata, SessionMessage
 from mcp.shared.session import RequestResponder
 from mcp.types import InitializeResult, TextContent, TextResourceContents, Tool
 
@@ -693,6 +699,62 @@ def test_json_response(json_response_server: None, json_server_url: str):
     assert response.headers.get("Content-Type") == "application/json"
 
 
+def test_json_response_batch(json_response_server: None, json_server_url: str):
+    """Test that a JSON-RPC batch is answered with a JSON array of responses in request order."""
+    mcp_url = f"{json_server_url}/mcp"
+    headers = {
+        "Accept": "application/json, text/event-stream",
+        "Content-Type": "application/json",
+    }
+    init_response = requests.post(mcp_url, headers=headers, json=INIT_REQUEST)
+    assert init_response.status_code == 200
+    headers[MCP_SESSION_ID_HEADER] = init_response.headers[MCP_SESSION_ID_HEADER]
+    headers[MCP_PROTOCOL_VERSION_HEADER] = init_response.json()["result"]["protocolVersion"]
+
+    response = requests.post(
+        mcp_url,
+        headers=headers,
+        json=[
+            {"jsonrpc": "2.0", "method": "notifications/initialized"},
+            {"jsonrpc": "2.0", "method": "tools/call", "params": {"name": "test_tool", "arguments": {}}, "id": 1},
+            {"jsonrpc": "2.0", "method": "resources/read", "params": {"uri": "foobar://batch"}, "id": 2},
+            {"jsonrpc": "2.0", "method": "resources/read", "params": {"uri": "unknown://batch"}, "id": 3},
+        ],
+    )
+    assert response.status_code == 200
+    assert response.headers.get("Content-Type") == "application/json"
+    body = response.json()
+    assert [message["id"] for message in body] == [1, 2, 3]
+    assert body[0]["result"]["content"][0]["text"] == "Called test_tool"
+    assert body[1]["result"]["contents"][0]["text"] == "Read batch"
+    assert "Unknown resource" in body[2]["error"]["message"]
+
+    # Batches of notifications only are accepted without a body
+    response = requests.post(
+        mcp_url,
+        headers=headers,
+        json=[{"jsonrpc": "2.0", "method": "notifications/roots/list_changed"}],
+    )
+    assert response.status_code == 202
+
+
+def test_batch_validation(basic_server: None, basic_server_url: str):
+    """Test that invalid batches are rejected."""
+    mcp_url = f"{basic_server_url}/mcp"
+    headers = {
+        "Accept": "application/json, text/event-stream",
+        "Content-Type": "application/json",
+    }
+
+    response = requests.post(mcp_url, headers=headers, json=[])
+    assert response.status_code == 400
+    assert "Validation error" in response.text
+
+    response = requests.post(mcp_url, headers=headers, json=[INIT_REQUEST])
+    assert response.status_code == 400
+    assert "initialize must not be part of a JSON-RPC batch" in response.text
+
+
 def test_get_sse_stream(basic_server: None, basic_server_url: str):
     """Test establishing an SSE stream via GET request."""
     # First, we need to initialize a session
@@ -938,6 +1000,44 @@ async def test_streamablehttp_client_json_response(json_response_server: None, j
             assert result.content[0].text == "Called test_tool"
 
 
+@pytest.mark.anyio
+@pytest.mark.parametrize("json_response", [False, True])
+async def test_streamablehttp_client_batch(
+    basic_server: None, basic_server_url: str, json_response_server: None, json_server_url: str, json_response: bool
+):
+    """Test that batched tool calls are sent in one POST and answered over SSE or JSON."""
+    server_url = json_server_url if json_response else basic_server_url
+    async with streamablehttp_client(f"{server_url}/mcp") as (read_stream, write_stream, _):
+        async with ClientSession(read_stream, write_stream, supports_batches=True) as session:
+            await session.initialize()
+            await session.list_tools()
+
+            results = await session.call_tools_batch(
+                [("test_tool", {}), ("long_running_with_checkpoints", {}), ("test_tool", {})]
+            )
+            texts = [
+                content.text
+                for result in results
+                if isinstance(result, types.CallToolResult)
+                for content in result.content
+                if isinstance(content, TextContent)
+            ]
+            assert texts == ["Called test_tool", "Completed!", "Called test_tool"]
+
+            resources = await session.send_batch(
+                [
+                    types.ClientRequest(
+                        types.ReadResourceRequest(params=types.ReadResourceRequestParams(uri=AnyUrl(uri)))
+                    )
+                    for uri in ("foobar://one", "unknown://two")
+                ],
+                types.ReadResourceResult,
+            )
+            assert isinstance(resources[0], types.ReadResourceResult)
+            assert isinstance(resources[1], types.ErrorData)
+            assert "Unknown resource" in resources[1].message
+
+
 @pytest.mark.anyio
 async def test_streamablehttp_client_get_stream(basic_server: None, basic_server_url: str):
     """Test GET stream functionality for server-initiated messages."""
@@ -1597,3 +1697,150 @@ async def test_client_crash_handled(basic_server: None, basic_server_url: str):
             assert isinstance(result, InitializeResult)
             tools = await session.list_tools()
             assert tools.tools
+
+
+def _event(method: str | None = None, response_id: int | None = None) -> EventMessage:
+    if method is not None:
+        message = types.JSONRPCMessage(types.JSONRPCNotification(jsonrpc="2.0", method=method))
+    else:
+        assert response_id is not None
+        message = types.JSONRPCMessage(types.JSONRPCResponse(jsonrpc="2.0", id=response_id, result={}))
+    return EventMessage(message)
+
+
+@pytest.mark.anyio
+async def test_slow_stream_notifications_are_dropped():
+    transport = StreamableHTTPServerTransport(
+        mcp_session_id=None, request_stream_buffer_size=2, slow_consumer_policy="drop_notifications"
+    )
+    stalled = transport._create_request_stream("1")
+    other = transport._create_request_stream("2")
+
+    with anyio.fail_after(1):
+        for _ in range(3):
+            await transport._send_to_request_stream("1", _event("notifications/message"))
+        await transport._send_to_request_stream("2", _event("notifications/message"))
+
+    assert transport.dropped_notifications == 1
+    assert transport.stream_backlogs() == {"1": 2, "2": 1}
+    # Responses are not dropped, but wait for room
+    with anyio.move_on_after(0.05) as scope:
+        await transport._send_to_request_stream("1", _event(response_id=1))
+    assert scope.cancelled_caught
+    for stream in (stalled, other):
+        await stream.aclose()
+    await transport.terminate()
+
+
+@pytest.mark.anyio
+async def test_slow_stream_is_disconnected():
+    transport = StreamableHTTPServerTransport(
+        mcp_session_id=None,
+        event_store=SimpleEventStore(),
+        request_stream_buffer_size=1,
+        slow_consumer_policy="disconnect",
+    )
+    stalled = transport._create_request_stream("1")
+
+    with anyio.fail_after(1):
+        await transport._send_to_request_stream("1", _event("notifications/message"))
+        await transport._send_to_request_stream("1", _event(response_id=1))
+
+    assert transport.disconnected_streams == 1
+    assert "1" not in transport._request_streams
+    # The buffered message is still delivered, then the stream ends
+    async with stalled:
+        event = await stalled.receive()
+        assert isinstance(event.message.root, types.JSONRPCNotification)
+        with pytest.raises(anyio.EndOfStream):
+            await stalled.receive()
+
+
+def test_disconnect_policy_requires_an_event_store():
+    with pytest.raises(ValueError, match="requires an event store"):
+        StreamableHTTPServerTransport(mcp_session_id=None, slow_consumer_policy="disconnect")
+
+
+@pytest.mark.anyio
+async def test_slow_stream_blocks_by_default():
+    transport = StreamableHTTPServerTransport(mcp_session_id=None, request_stream_buffer_size=1)
+    stalled = transport._create_request_stream("1")
+
+    await transport._send_to_request_stream("1", _event("notifications/message"))
+    with anyio.move_on_after(0.05) as scope:
+        await transport._send_to_request_stream("1", _event("notifications/message"))
+    assert scope.cancelled_caught
+    await stalled.aclose()
+    await transport.terminate()
+
+
+@pytest.mark.anyio
+async def test_store_lag_includes_messages_queued_behind_a_slow_stream():
+    transport = StreamableHTTPServerTransport(
+        mcp_session_id=None, event_store=SimpleEventStore(), event_store_queue_size=1, request_stream_buffer_size=0
+    )
+    stalled = transport._create_request_stream("1")
+
+    async with transport.connect() as (_, write_stream):
+        # The first response is stored, then waits for the stalled stream; the second waits to be stored
+        for message in (_event(response_id=1), _event(response_id=1)):
+            await write_stream.send(SessionMessage(message.message))
+        with anyio.fail_after(2):
+            while transport.event_store_lag < 0.05:
+                await anyio.sleep(0.01)
+        async with stalled:
+            for _ in range(2):
+                assert (await stalled.receive()).event_id is not None
+        assert transport.event_store_lag == 0
+
+
+@pytest.mark.parametrize("data", ['{"a":1}', '{\n  "a": 1\r\n}\r', "x" * (STREAM_CHUNK_SIZE + 1)])
+@pytest.mark.parametrize("event_id", [None, "42"])
+def test_sse_events_are_framed_like_event_source_response(data: str, event_id: str | None):
+    expected = ServerSentEvent(data=data, event="message", id=event_id).encode()
+    parts = _sse_event_parts(data.encode(), event_id)
+    chunks = list(_body_chunks(parts))
+
+    assert b"".join(parts) == b"".join(chunks) == expected
+    assert all(len(chunk) <= STREAM_CHUNK_SIZE for chunk in chunks)
+
+
+@pytest.mark.anyio
+async def test_pings_are_not_sent_within_an_event():
+    """A ping that falls due while a multi-chunk event is being sent waits for the event."""
+    data = json.dumps({"text": "x" * (4 * STREAM_CHUNK_SIZE)}).encode()
+    events = [_body_chunks(_sse_event_parts(data, str(i))) for i in range(2)]
+    content_writer, content_reader = anyio.create_memory_object_stream[Iterator[bytes]](0)
+
+    async def send_events() -> None:
+        async with content_writer:
+            for chunks in events:
+                await content_writer.send(chunks)
+
+    body: list[bytes] = []
+    done = anyio.Event()
+
+    async def send(message: Message) -> None:
+        # A slow client: every chunk of an event takes longer than the ping interval
+        await anyio.sleep(0.02)
+        if message["type"] == "http.response.body":
+            body.append(message["body"])
+            if not message.get("more_body", False):
+                done.set()
+
+    async def receive() -> Message:
+        await done.wait()
+        return {"type": "http.disconnect"}
+
+    async with content_reader:
+        response = _SSEResponse(content=content_reader, headers={}, data_sender_callable=send_events, ping=0.01)
+        await response({"type": "http"}, receive, send)
+
+    stream = b"".join(body).decode()
+    assert ": ping" in stream
+    sent_events = [event for event in stream.split("\r\n\r\n") if "data: " in event]
+    assert len(sent_events) == 2
+    for event in sent_events:
+        data_lines = [line for line in event.split("\r\n") if line.startswith("data: ")]
+        assert len(data_lines) == 1
+        assert json.loads(data_lines[0].removeprefix("data: ")) == {"text": "x" * (4 * STREAM_CHUNK_SIZE)}
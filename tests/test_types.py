@@ -1,14 +1,22 @@
 import pytest
+from pydantic import ValidationError
 
+from mcp.shared.session import _decoded_fields
 from mcp.types import (
     LATEST_PROTOCOL_VERSION,
+    CallToolRequest,
     ClientCapabilities,
+    ClientNotification,
     ClientRequest,
     Implementation,
     InitializeRequest,
     InitializeRequestParams,
+    JSONRPCError,
     JSONRPCMessage,
+    JSONRPCNotification,
     JSONRPCRequest,
+    JSONRPCResponse,
+    ProgressNotification,
 )
 
 
@@ -56,3 +64,60 @@ async def test_method_initialization():
     assert initialize_request.method == "initialize", "method should be set to 'initialize'"
     assert initialize_request.params is not None
     assert initialize_request.params.protocolVersion == LATEST_PROTOCOL_VERSION
+
+
+@pytest.mark.parametrize(
+    "raw, expected_type",
+    [
+        ('{"jsonrpc": "2.0", "id": 1, "method": "ping"}', JSONRPCRequest),
+        ('{"jsonrpc": "2.0", "id": "abc", "method": "tools/list", "params": {}}', JSONRPCRequest),
+        ('{"jsonrpc": "2.0", "method": "notifications/initialized"}', JSONRPCNotification),
+        ('{"jsonrpc": "2.0", "id": null, "method": "notifications/initialized"}', JSONRPCNotification),
+        ('{"jsonrpc": "2.0", "id": 1, "result": {}}', JSONRPCResponse),
+        ('{"jsonrpc": "2.0", "id": 1, "error": {"code": -32601, "message": "Method not found"}}', JSONRPCError),
+    ],
+)
+def test_jsonrpc_message_discriminates_on_members(raw: str, expected_type: type):
+    assert isinstance(JSONRPCMessage.model_validate_json(raw).root, expected_type)
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        '{"jsonrpc": "2.0", "id": 1}',
+        '{"jsonrpc": "2.0", "id": 1.5, "method": "ping"}',
+        '{"jsonrpc": "1.0", "id": 1, "method": "ping"}',
+        "[]",
+    ],
+)
+def test_jsonrpc_message_rejects_invalid_messages(raw: str):
+    with pytest.raises(ValidationError):
+        JSONRPCMessage.model_validate_json(raw)
+
+
+def test_decoded_fields_match_model_dump():
+    """Typed validation from decoded fields must match the previous dump-and-validate path."""
+    raw = (
+        '{"jsonrpc": "2.0", "id": 7, "method": "tools/call", "extra": null,'
+        ' "params": {"name": "echo", "arguments": {"a": null, "b": [1, "x"]}, "_meta": {"progressToken": 3}}}'
+    )
+    message = JSONRPCMessage.model_validate_json(raw).root
+    assert isinstance(message, JSONRPCRequest)
+
+    assert _decoded_fields(message) == message.model_dump(by_alias=True, mode="json", exclude_none=True)
+    request = ClientRequest.model_validate(_decoded_fields(message))
+    assert isinstance(request.root, CallToolRequest)
+    assert request.root.params.arguments == {"a": None, "b": [1, "x"]}
+    assert request.root.params.meta is not None
+    assert request.root.params.meta.progressToken == 3
+
+
+def test_typed_unions_discriminate_on_method():
+    notification = JSONRPCMessage.model_validate_json(
+        '{"jsonrpc": "2.0", "method": "notifications/progress", "params": {"progressToken": 1, "progress": 0.5}}'
+    ).root
+    assert isinstance(notification, JSONRPCNotification)
+    assert isinstance(ClientNotification.model_validate(_decoded_fields(notification)).root, ProgressNotification)
+
+    with pytest.raises(ValidationError):
+        ClientRequest.model_validate({"jsonrpc": "2.0", "id": 1, "method": "unknown/method"})